@@ -0,0 +1,145 @@
+import sys
+import time
+import random
+from decimal import Decimal, ROUND_HALF_EVEN
+
+from constants.currencyConstants import minorUnitDigits
+from constants.benchmarkConstants import arithmeticBenchmarkAmounts, arithmeticBenchmarkRates, benchmarkRepeats
+
+from utils.fixedPointUtils import parseMinorUnits, parseRate, multiplyMinorUnits
+from utils.vectorUtils import isVectorBackendAvailable, multiplyMinorUnitsVectorized
+
+
+def generateAmounts(totalAmounts: int, seed: int = 0) -> list:
+    """
+    This function generates source amounts as text with two fraction digits, same as currency values of CSV file without symbol and grouping
+
+    @type totalAmounts: Integer
+    @param totalAmounts: Number of Amounts
+    @type seed: Integer
+    @param seed: Random Seed, same seed gives same amounts
+
+    @rtype: List of String
+    @returns: Amounts. Example: 1234.56
+    """
+    generator = random.Random(seed)
+    return [f"{cents // 100}.{cents % 100:02d}" for cents in (generator.randint(1, 100000000) for i in range(totalAmounts))]
+
+
+def convertFloat(amounts: list, rate: str) -> list:
+    """
+    This function parses and converts amounts with float arithmetic and round(amount * multiplier, 2)
+
+    @type amounts: List of String
+    @param amounts: Source Amounts
+    @type rate: String
+    @param rate: Conversion Rate
+
+    @rtype: List of Integer
+    @returns: Converted Amounts in minor units
+    """
+    multiplier = float(rate)
+    convertedAmounts = [round(float(amount) * multiplier, 2) for amount in amounts]
+    return [round(convertedAmount * 100) for convertedAmount in convertedAmounts]
+
+
+def convertDecimal(amounts: list, rate: str) -> list:
+    """
+    This function parses and converts amounts with decimal.Decimal arithmetic, rounded half to even
+
+    @type amounts: List of String
+    @param amounts: Source Amounts
+    @type rate: String
+    @param rate: Conversion Rate
+
+    @rtype: List of Integer
+    @returns: Converted Amounts in minor units
+    """
+    multiplier = Decimal(rate)
+    minorUnit = Decimal(1).scaleb(-minorUnitDigits)
+    convertedAmounts = [(Decimal(amount) * multiplier).quantize(minorUnit, ROUND_HALF_EVEN) for amount in amounts]
+    return [int(convertedAmount.scaleb(minorUnitDigits)) for convertedAmount in convertedAmounts]
+
+
+def convertFixedPoint(amounts: list, rate: str) -> list:
+    """
+    This function parses and converts amounts with integer minor units and scaled rate, rounded half to even
+
+    @type amounts: List of String
+    @param amounts: Source Amounts
+    @type rate: String
+    @param rate: Conversion Rate
+
+    @rtype: List of Integer
+    @returns: Converted Amounts in minor units
+    """
+    return multiplyMinorUnits([parseMinorUnits(amount) for amount in amounts], parseRate(rate))
+
+
+def convertFixedPointVectorized(amounts: list, rate: str) -> list:
+    """
+    This function parses amounts into integer minor units and converts them with vectorized NumPy integer operations, rounded half to even.
+    Products which do not fit in 64 bit integers (large amounts with large rates) are converted with python integers.
+
+    @type amounts: List of String
+    @param amounts: Source Amounts
+    @type rate: String
+    @param rate: Conversion Rate
+
+    @rtype: List of Integer
+    @returns: Converted Amounts in minor units
+    """
+    return multiplyMinorUnitsVectorized([parseMinorUnits(amount) for amount in amounts], parseRate(rate))
+
+
+def timeConversion(convertFunction, amounts: list, rate: str) -> list:
+    """
+    This function runs a conversion benchmarkRepeats times and returns its fastest time
+
+    @type convertFunction: Function
+    @param convertFunction: Conversion to time
+    @type amounts: List of String
+    @param amounts: Source Amounts
+    @type rate: String
+    @param rate: Conversion Rate
+
+    @rtype: List
+    @returns: Fastest Time in seconds and Converted Amounts of last run
+    """
+    fastestSeconds = None
+    for i in range(benchmarkRepeats):
+        startTime = time.perf_counter()
+        convertedAmounts = convertFunction(amounts, rate)
+        seconds = time.perf_counter() - startTime
+        fastestSeconds = seconds if fastestSeconds is None else min(fastestSeconds, seconds)
+    return [fastestSeconds, convertedAmounts]
+
+
+def main():
+    """
+    This function times float, Decimal and fixed point conversion of generated amounts with each benchmark rate and compares results with Decimal.
+    Exit status is 1 if fixed point result is not same as Decimal result.
+    """
+    amounts = generateAmounts(arithmeticBenchmarkAmounts)
+    conversions = {"float": convertFloat, "decimal": convertDecimal, "fixedPoint": convertFixedPoint}
+    if isVectorBackendAvailable():
+        conversions["fixedPointNumpy"] = convertFixedPointVectorized
+
+    exact = True
+    for rate in arithmeticBenchmarkRates:
+        results = {name: timeConversion(convertFunction, amounts, rate) for name, convertFunction in conversions.items()}
+        exactAmounts = results["decimal"][1]
+        report = []
+        for name, (seconds, convertedAmounts) in results.items():
+            mismatches = sum(1 for amount, exactAmount in zip(convertedAmounts, exactAmounts) if amount != exactAmount)
+            report.append(f"{name} {seconds:.4f} s ({len(amounts) / seconds / 1e6:.2f} M/s, {mismatches} wrong)")
+            if name.startswith("fixedPoint") and mismatches:
+                exact = False
+        print(f"rate {rate}: " + ", ".join(report))
+
+    print("Fixed point results are same as Decimal" if exact else "Fixed point results are not same as Decimal")
+    sys.exit(0 if exact else 1)
+
+
+if __name__ == "__main__":
+    main()
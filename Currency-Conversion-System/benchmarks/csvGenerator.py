@@ -0,0 +1,58 @@
+import os
+import random
+
+from constants.currencyConstants import currencyNameToSymbol, currencyNameToLocale, localeToCurrencyFormat
+from constants.csvConstants import csvSeprator, csvDefaultEncoding, csvChunkRows
+
+from utils.formatUtils import formatCurrencyAmount
+
+# Column Names of data.csv
+generatorColumns = ["Feed Name", "Price Per Month", "Source Name", "Last Update", "Remote Name", "Local Name"]
+
+
+def generateCSVRow(rowNumber: int, amount: float, currencyName: str) -> list:
+    """
+    This function returns one synthetic CSV row with data.csv columns
+
+    @type rowNumber: Integer
+    @param rowNumber: Row Number, used to make unique row data
+    @type amount: Float
+    @param amount: Price Per Month amount
+    @type currencyName: String
+    @param currencyName: Currency of price - an abbreviated form Example: USD for US Dollar
+
+    @rtype: List of String
+    @returns: CSV Row Data
+    """
+    # Price is saved in locale number formatting with supported currency symbol and trailing space, same as Excel currency column
+    localeOption = currencyNameToLocale[currencyName]
+    price = formatCurrencyAmount(amount, localeOption).replace(localeToCurrencyFormat[localeOption]["symbol"], currencyNameToSymbol[currencyName]) + " "
+    return [f"feed{rowNumber}", price, f"Feed Source {rowNumber}", str(1483800000 + rowNumber),
+            f"/mirror/feed{rowNumber}/feed.tgz", f"/r/f{rowNumber}.tgz"]
+
+
+def generateCSVFile(filePath: str, totalRows: int, currencyName: str, seed: int = 0) -> int:
+    """
+    This function writes a synthetic CSV file with data.csv columns: pipe seprated, UTF-8-SIG encoded and CRLF line seprated
+
+    @type filePath: String
+    @param filePath: Output CSV File Path
+    @type totalRows: Integer
+    @param totalRows: Number of Rows
+    @type currencyName: String
+    @param currencyName: Currency of price column - an abbreviated form Example: USD for US Dollar
+    @type seed: Integer
+    @param seed: Random Seed, same seed generates same file
+
+    @rtype: Integer
+    @returns: Size of CSV file in bytes
+    """
+    generator = random.Random(seed)
+    lineSeprator = "\r\n"
+    with open(filePath, "w", encoding=csvDefaultEncoding, newline="") as csvFile:
+        csvFile.write(csvSeprator.join(generatorColumns) + lineSeprator)
+        # Rows are written in chunks, so memory usage does not grow with number of rows
+        for chunkStart in range(0, totalRows, csvChunkRows):
+            csvFile.write("".join(csvSeprator.join(generateCSVRow(rowNumber, round(generator.uniform(0.01, 250000), 2), currencyName)) + lineSeprator
+                                  for rowNumber in range(chunkStart, min(chunkStart + csvChunkRows, totalRows))))
+    return os.path.getsize(filePath)
@@ -0,0 +1,291 @@
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import platform
+import statistics
+import tempfile
+import subprocess
+
+from constants.currencyConstants import supportedCurrencies
+from constants.benchmarkConstants import benchmarkRows, benchmarkRepeats, benchmarkCalibrationLoops, benchmarkMultiplier, benchmarkTolerance, benchmarkNoiseFloorSeconds
+
+from utils.csvUtils import csvFileEncodingCache, getCSVFileEncoding, validateCSVFile, readCSVFile, writeCSVFile
+from utils.currencyUtils import convertCurrency
+
+from benchmarks.csvGenerator import generateCSVFile
+
+projectPath = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+defaultBaselinePath = os.path.join(projectPath, "benchmarks", "pipelineBaseline.json")
+
+# Stages timed for each generated CSV file, cli is the end-to-end run of currency_convert.py
+benchmarkStages = ["getCSVFileEncoding", "validateCSVFile", "readCSVFile", "convertCurrency", "writeCSVFile", "cli"]
+
+
+def calibrationLoop(loops: int) -> int:
+    """
+    This function does fixed python work which does not use program code: string formatting, integer parsing and list building like pipeline stages
+
+    @type loops: Integer
+    @param loops: Number of Loops
+
+    @rtype: Integer
+    @returns: Sum of parsed values
+    """
+    values = []
+    for i in range(loops):
+        values.append(int(f"{i:,}".replace(",", "")) * 3 // 2)
+    return sum(values)
+
+
+def timeCalibration() -> float:
+    """
+    This function times one run of calibration loop
+
+    @rtype: Float
+    @returns: Time of calibration loop in seconds
+    """
+    startTime = time.perf_counter()
+    calibrationLoop(benchmarkCalibrationLoops)
+    return time.perf_counter() - startTime
+
+
+def timeStage(stageFunction, *args, repeats: int = None) -> list:
+    """
+    This function runs a stage benchmarkRepeats times (or given repeats) and returns its median time. Calibration loop is timed
+    just before and after each run, and stage time of the run is also divided by mean of these two calibration times (calibrated time),
+    so machines of different speed, or the same machine under different load, give about the same calibrated time.
+    Spread of calibrated times (interquartile range) tells how noisy runs of the stage are.
+
+    @type stageFunction: Function
+    @param stageFunction: Stage to time
+    @type args: Arguments
+    @param args: Arguments of stage
+    @type repeats: Integer
+    @param repeats: Runs of stage, benchmarkRepeats when not given
+
+    @rtype: List
+    @returns: Median Time in seconds, Median Calibrated Time, Spread of Calibrated Times, Median Calibration Time in seconds and Result of last run
+    """
+    runSeconds = []
+    calibratedRuns = []
+    calibrationSeconds = []
+    for i in range(repeats or benchmarkRepeats):
+        calibrationBefore = timeCalibration()
+        startTime = time.perf_counter()
+        result = stageFunction(*args)
+        seconds = time.perf_counter() - startTime
+        calibrationAfter = timeCalibration()
+        runSeconds.append(seconds)
+        calibratedRuns.append(seconds * 2 / (calibrationBefore + calibrationAfter))
+        calibrationSeconds += [calibrationBefore, calibrationAfter]
+    calibratedQuartiles = statistics.quantiles(calibratedRuns, n=4) if len(calibratedRuns) > 1 else [0, 0, 0]
+    return [statistics.median(runSeconds), statistics.median(calibratedRuns), calibratedQuartiles[2] - calibratedQuartiles[0], statistics.median(calibrationSeconds), result]
+
+
+def detectEncoding(filePath: str) -> str:
+    """
+    This function detects CSV file encoding without cached result of previous run
+
+    @type filePath: String
+    @param filePath: CSV File Path
+
+    @rtype: String
+    @returns: Encoding Type of CSV file
+    """
+    csvFileEncodingCache.clear()
+    return getCSVFileEncoding(filePath)
+
+
+def convertCSVRows(csvRows: list, destinationCurrency: str) -> list:
+    """
+    This function converts price column of each row with convertCurrency, same as conversion loop of program
+
+    @type csvRows: List of List
+    @param csvRows: CSV Rows Data
+    @type destinationCurrency: String
+    @param destinationCurrency: Destination Currency Symbol - an abbreviated form Example: EUR for Euro
+
+    @rtype: List of List
+    @returns: Converted CSV Rows Data
+    """
+    return [csvRow[:1] + [convertCurrency(csvRow[1], destinationCurrency, benchmarkMultiplier)] + csvRow[2:] for csvRow in csvRows]
+
+
+def runCLI(workPath: str, fileName: str, destinationCurrency: str) -> str:
+    """
+    This function runs currency_convert.py for a generated CSV file
+
+    @type workPath: String
+    @param workPath: Working Directory which has CSV file
+    @type fileName: String
+    @param fileName: Input CSV File Name
+    @type destinationCurrency: String
+    @param destinationCurrency: Destination Currency Symbol - an abbreviated form Example: EUR for Euro
+
+    @rtype: String
+    @returns: Standard Output of run. Raises RuntimeError if conversion is not successful
+    """
+    process = subprocess.run([sys.executable, os.path.join(projectPath, "currency_convert.py"), "--field", "2", "--multiplier", str(benchmarkMultiplier),
+                              "--symbol", destinationCurrency, "-i", fileName, "-o", "output-cli.csv"],
+                             cwd=workPath, capture_output=True, text=True)
+    if "Successfully Created Output CSV file" not in process.stdout:
+        raise RuntimeError(f"currency_convert.py failed for {fileName}: {process.stdout.strip()} {process.stderr.strip()}")
+    return process.stdout
+
+
+def benchmarkCSVFile(workPath: str, currencyName: str, totalRows: int) -> dict:
+    """
+    This function generates CSV file of a currency and times each stage of conversion pipeline
+
+    @type workPath: String
+    @param workPath: Working Directory for generated and output CSV files
+    @type currencyName: String
+    @param currencyName: Source Currency - an abbreviated form Example: USD for US Dollar
+    @type totalRows: Integer
+    @param totalRows: Number of Rows of generated CSV file
+
+    @rtype: Dictionary
+    @returns: Rows, Bytes, and Seconds, Calibrated Time, Spread of Calibrated Times and Calibration Seconds of each stage
+    """
+    fileName = f"benchmark-{currencyName}-{totalRows}.csv"
+    filePath = os.path.join(workPath, fileName)
+    fileBytes = generateCSVFile(filePath, totalRows, currencyName)
+    destinationCurrency = "EUR" if currencyName != "EUR" else "USD"
+
+    stageSeconds = {}
+    calibratedSeconds = {}
+    calibratedSpread = {}
+    calibrationSeconds = {}
+
+    def runStage(stage: str, stageFunction, *args):
+        stageSeconds[stage], calibratedSeconds[stage], calibratedSpread[stage], calibrationSeconds[stage], result = timeStage(stageFunction, *args)
+        return result
+
+    encoding = runStage("getCSVFileEncoding", detectEncoding, filePath)
+    result = runStage("validateCSVFile", validateCSVFile, filePath, [1], encoding)
+    if not result[0]:
+        raise RuntimeError(f"Generated CSV file is not valid: {result[1]}")
+    csvData = runStage("readCSVFile", readCSVFile, filePath, -1, encoding)
+    convertedRows = runStage("convertCurrency", convertCSVRows, csvData[1], destinationCurrency)
+    result = runStage("writeCSVFile", writeCSVFile, [csvData[0], convertedRows], os.path.join(workPath, "output-stages.csv"))
+    if not result[0]:
+        raise RuntimeError(f"Output CSV file is not written: {result[1]}")
+    runStage("cli", runCLI, workPath, fileName, destinationCurrency)
+
+    os.remove(filePath)
+    return {"rows": totalRows, "bytes": fileBytes, "seconds": stageSeconds, "calibratedSeconds": calibratedSeconds, "calibratedSpread": calibratedSpread,
+            "calibrationSeconds": calibrationSeconds}
+
+
+def compareWithBaseline(results: dict, baseline: dict, tolerance: float) -> list:
+    """
+    This function compares stage times with baseline times. When both have calibrated times, calibrated times are compared and shown
+    in seconds of this run (calibrated time multiplied by calibration time of the stage in this run), so a faster, slower or busier
+    machine than the one of baseline is not a regression. Noise floor is also raised to spread of calibrated times of the stage in this run
+    and baseline, so noisy stages need a larger slowdown. Results without calibrated times are compared in seconds as they are.
+
+    @type results: Dictionary
+    @param results: Benchmark Results of this run
+    @type baseline: Dictionary
+    @param baseline: Stored Benchmark Results
+    @type tolerance: Float
+    @param tolerance: Allowed slowdown ratio over baseline
+
+    @rtype: List of String
+    @returns: Message for each stage which is slower than baseline
+    """
+    regressions = []
+    for benchmarkName, result in results["benchmarks"].items():
+        baselineResult = baseline.get("benchmarks", {}).get(benchmarkName)
+        if not baselineResult:
+            continue
+        for stage, seconds in result["seconds"].items():
+            baselineSeconds = baselineResult["seconds"].get(stage)
+            if baselineSeconds is None:
+                continue
+            noiseFloorSeconds = benchmarkNoiseFloorSeconds
+            calibrated = result.get("calibratedSeconds", {}).get(stage)
+            baselineCalibrated = baselineResult.get("calibratedSeconds", {}).get(stage)
+            if calibrated is not None and baselineCalibrated is not None:
+                calibrationSeconds = result["calibrationSeconds"][stage]
+                seconds, baselineSeconds = calibrated * calibrationSeconds, baselineCalibrated * calibrationSeconds
+                spread = result.get("calibratedSpread", {}).get(stage, 0) + baselineResult.get("calibratedSpread", {}).get(stage, 0)
+                noiseFloorSeconds = max(noiseFloorSeconds, spread * calibrationSeconds)
+            if seconds > baselineSeconds * (1 + tolerance) and seconds - baselineSeconds > noiseFloorSeconds:
+                regressions.append(f"{benchmarkName} {stage}: {seconds:.4f} s, baseline {baselineSeconds:.4f} s (+{(seconds / baselineSeconds - 1) * 100:.0f}%)")
+    return regressions
+
+
+def parseBenchmarkArgs() -> dict:
+    """
+    This function parses command line arguments of pipeline benchmark
+
+    @rtype: Dictionary
+    @returns: Dictionary of Command-Line Arguments Key-Value pairs
+    """
+    parser = argparse.ArgumentParser(description="Benchmark each stage of currency conversion pipeline with generated CSV files and compare with baseline")
+    parser.add_argument("--rows", metavar="N", dest="rows", type=str, default=",".join(str(rows) for rows in benchmarkRows),
+                        help="Comma seprated rows of generated CSV files. Example: 1000,10000,100000,1000000,10000000")
+    parser.add_argument("--currencies", metavar="currency", dest="currencies", type=str, default=",".join(supportedCurrencies),
+                        help="Comma seprated source currencies of generated CSV files (all supported currencies when not given)")
+    parser.add_argument("--output", metavar="output", dest="output", type=str, default="benchmark-results.json",
+                        help="Write benchmark results to JSON file")
+    parser.add_argument("--baseline", metavar="baseline", dest="baseline", type=str, default=defaultBaselinePath,
+                        help="Baseline JSON file to compare with")
+    parser.add_argument("--tolerance", metavar="ratio", dest="tolerance", type=float, default=benchmarkTolerance,
+                        help="Allowed slowdown ratio over baseline. Example: 0.25 for 25%%")
+    parser.add_argument("--update-baseline", dest="updateBaseline", action="store_true",
+                        help="Save results as new baseline instead of comparing with it")
+    return vars(parser.parse_args())
+
+
+def main():
+    """
+    This function runs pipeline benchmark, writes results as JSON and compares them with baseline.
+    Exit status is 1 if a stage is slower than baseline.
+    """
+    args = parseBenchmarkArgs()
+    rowsList = [int(rows) for rows in args["rows"].split(",")]
+    currencies = [currency.strip().upper() for currency in args["currencies"].split(",")]
+
+    results = {"python": platform.python_version(), "platform": platform.platform(), "benchmarks": {}}
+    workPath = tempfile.mkdtemp()
+    try:
+        for totalRows in rowsList:
+            for currencyName in currencies:
+                benchmarkName = f"{currencyName}-{totalRows}"
+                result = benchmarkCSVFile(workPath, currencyName, totalRows)
+                results["benchmarks"][benchmarkName] = result
+                print(f"{benchmarkName}: calibration {statistics.median(result['calibrationSeconds'].values()):.4f} s, " + ", ".join(f"{stage} {seconds:.4f} s" for stage, seconds in result["seconds"].items()))
+    finally:
+        shutil.rmtree(workPath)
+
+    with open(args["output"], "w") as resultsFile:
+        json.dump(results, resultsFile, indent=2)
+    print(f"Benchmark results are written to {args['output']}")
+
+    # Save new baseline or compare with stored baseline
+    if args["updateBaseline"]:
+        shutil.copy(args["output"], args["baseline"])
+        print(f"Baseline is updated: {args['baseline']}")
+        return
+    if not os.path.exists(args["baseline"]):
+        print(f"Baseline does not exist: {args['baseline']}. Run with --update-baseline to create it")
+        return
+    with open(args["baseline"]) as baselineFile:
+        baseline = json.load(baselineFile)
+    if baseline.get("python", "").split(".")[:2] != results["python"].split(".")[:2]:
+        print(f"Note: baseline is recorded with Python {baseline.get('python')}. Calibration does not cover changes between Python versions, update baseline with this Python")
+    regressions = compareWithBaseline(results, baseline, args["tolerance"])
+    for regression in regressions:
+        print(f"Slower than baseline: {regression}")
+    print("Benchmark is within baseline" if not regressions else f"Benchmark is slower than baseline in {len(regressions)} stages")
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
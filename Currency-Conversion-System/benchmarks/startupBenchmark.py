@@ -0,0 +1,113 @@
+import os
+import sys
+import shutil
+import tempfile
+import statistics
+import subprocess
+import time
+
+from constants.benchmarkConstants import startupImportBudgetMs, startupDeferredModules, startupBenchmarkRuns
+
+projectPath = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Command line arguments of each startup scenario, input and output files are in a temporary directory
+startupScenarios = {
+    "help": ["--help"],
+    "convert": ["--field", "2", "--multiplier", "0.5", "--symbol", "inr", "-i", "data.csv", "-o", "output.csv", "--encoding", "UTF-8-SIG"]
+}
+
+
+def parseImportTime(importTimeOutput: str) -> list:
+    """
+    This function reads python -X importtime output and returns import time of project modules and all imported modules
+
+    @type importTimeOutput: String
+    @param importTimeOutput: Standard Error of python -X importtime run
+
+    @rtype: List
+    @returns: Import Time of project modules in milliseconds and List of imported module names
+    """
+    importMs = 0
+    importedModules = []
+    for line in importTimeOutput.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        selfTime, cumulativeTime, moduleName = line[len("import time:"):].split("|")
+        if not cumulativeTime.strip().isdigit():
+            continue
+        # Top-level imports of project packages include all modules they import
+        isTopLevel = moduleName[1:] == moduleName.strip()
+        moduleName = moduleName.strip()
+        importedModules.append(moduleName)
+        if isTopLevel and moduleName.split(".")[0] in ["utils", "constants"]:
+            importMs += int(cumulativeTime) / 1000
+    return [importMs, importedModules]
+
+
+def runStartupScenario(args: list, workPath: str) -> list:
+    """
+    This function runs currency_convert.py once with python -X importtime
+
+    @type args: List of String
+    @param args: Command Line Arguments of currency_convert.py
+    @type workPath: String
+    @param workPath: Working Directory of run
+
+    @rtype: List
+    @returns: Wall Time in milliseconds, Import Time of project modules in milliseconds and List of imported module names
+    """
+    startTime = time.perf_counter()
+    process = subprocess.run([sys.executable, "-X", "importtime", os.path.join(projectPath, "currency_convert.py")] + args,
+                             cwd=workPath, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    wallMs = (time.perf_counter() - startTime) * 1000
+    return [wallMs] + parseImportTime(process.stderr)
+
+
+def runInterpreterStartup() -> float:
+    """
+    This function runs python interpreter once without any program
+
+    @rtype: Float
+    @returns: Wall Time in milliseconds
+    """
+    startTime = time.perf_counter()
+    subprocess.run([sys.executable, "-c", "pass"])
+    return (time.perf_counter() - startTime) * 1000
+
+
+def main():
+    """
+    This function measures startup time of each scenario and checks it against startup budget (constants/benchmarkConstants.py).
+    Exit status is 1 if import time is over budget or a deferred module is imported at startup.
+    """
+    withinBudget = True
+    workPath = tempfile.mkdtemp()
+    try:
+        shutil.copy(os.path.join(projectPath, "data.csv"), workPath)
+
+        # Interpreter startup without program, to show program startup separately
+        interpreterMs = statistics.median(runInterpreterStartup() for i in range(startupBenchmarkRuns))
+        print(f"Interpreter startup: {interpreterMs:.1f} ms")
+
+        for scenarioName, args in startupScenarios.items():
+            runs = [runStartupScenario(args, workPath) for i in range(startupBenchmarkRuns)]
+            wallMs = statistics.median(run[0] for run in runs)
+            importMs = statistics.median(run[1] for run in runs)
+            deferredModules = [moduleName for moduleName in runs[0][2]
+                               if any(moduleName == deferred or moduleName.startswith(deferred + ".") for deferred in startupDeferredModules)]
+            print(f"{scenarioName}: wall {wallMs:.1f} ms (program {wallMs - interpreterMs:.1f} ms), project imports {importMs:.1f} ms (budget {startupImportBudgetMs} ms)")
+            if importMs > startupImportBudgetMs:
+                withinBudget = False
+                print(f"  Over budget: project imports take {importMs - startupImportBudgetMs:.1f} ms more than budget")
+            if deferredModules:
+                withinBudget = False
+                print(f"  Deferred modules imported at startup: {', '.join(sorted(set(deferredModules)))}")
+    finally:
+        shutil.rmtree(workPath)
+
+    print("Startup time is within budget" if withinBudget else "Startup time is over budget")
+    sys.exit(0 if withinBudget else 1)
+
+
+if __name__ == "__main__":
+    main()
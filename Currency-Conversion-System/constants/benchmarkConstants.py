@@ -0,0 +1,34 @@
+# Startup time budget of currency_convert.py, checked by benchmarks/startupBenchmark.py
+# Import time of project modules (milliseconds) measured with python -X importtime, median of runs
+startupImportBudgetMs = 30
+
+# Modules which must not be imported at startup, they are imported only on the paths that use them
+startupDeferredModules = ["chardet", "numpy", "asyncio", "concurrent.futures.process", "http.client"]
+
+# Runs of each startup scenario
+startupBenchmarkRuns = 10
+
+# Rows of generated CSV files of each currency for pipeline benchmark (1e3 to 1e7 rows can be given with --rows)
+benchmarkRows = [1000, 10000, 100000]
+
+# Runs of each stage, median run is kept so one run slowed down (or sped up) by other programs does not move stage time
+benchmarkRepeats = 7
+
+# Loops of calibration work (pure python, no program code) timed just before and after each run of a stage
+# Stage times are compared with baseline in units of calibration time, so a machine which is faster, slower or busier than the one of baseline is not a regression
+benchmarkCalibrationLoops = 20000
+
+# Multiplier used for conversion in benchmark
+benchmarkMultiplier = 0.5
+
+# Stage is slower than baseline if it takes more than tolerance ratio and noise floor seconds over calibrated baseline time
+# Gate is meant for one machine (developer machine or dedicated benchmark machine, idle) which records baseline with --update-baseline and runs benchmark again after changes
+benchmarkTolerance = 0.25
+
+# Noise floor is raised to spread of calibrated times of a stage when runs of the stage are noisier than this
+benchmarkNoiseFloorSeconds = 0.005
+
+# Amounts converted with each rate by arithmetic benchmark (float, Decimal and fixed point conversion)
+arithmeticBenchmarkAmounts = 200000
+
+arithmeticBenchmarkRates = ["0.73", "0.000712", "83.123456", "1304.5"]
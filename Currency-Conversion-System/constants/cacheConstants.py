@@ -0,0 +1,13 @@
+# Directory of parsed column cache when --cache is given without directory
+cacheDefaultDirectory = ".currency-cache"
+
+# Maximum total size of cache files in megabytes, least recently used entries are removed when cache is larger
+cacheDefaultMaxMegabytes = 1024
+
+# Each cache entry has a metadata file and a binary file with int64 amounts and row offsets
+cacheMetadataSuffix = ".json"
+
+cacheDataSuffix = ".bin"
+
+# Content hash of input file is computed from blocks of cacheHashBlockSize bytes, so file is never read whole
+cacheHashBlockSize = 1048576
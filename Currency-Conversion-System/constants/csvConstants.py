@@ -1,7 +1,66 @@
 import os
+import codecs
 
 csvSeprator = "|"
 
 csvDefaultEncoding = "UTF-8-SIG"
 
-csvFileBasePath = os.path.abspath(os.getcwd())
\ No newline at end of file
+# Byte Order Marks checked before running encoding detection (UTF-32 is checked before UTF-16 as they share prefix)
+csvEncodingBOMs = [
+    (codecs.BOM_UTF8, "UTF-8-SIG"),
+    (codecs.BOM_UTF32_LE, "UTF-32"),
+    (codecs.BOM_UTF32_BE, "UTF-32"),
+    (codecs.BOM_UTF16_LE, "UTF-16"),
+    (codecs.BOM_UTF16_BE, "UTF-16")
+]
+
+# Encoding detection reads file in chunks and stops once detector is confident or max bytes are read
+csvEncodingDetectChunkSize = 65536
+
+csvEncodingDetectMaxBytes = 10000000
+
+csvFileBasePath = os.path.abspath(os.getcwd())
+# Number of rows validated and converted together in streaming mode
+csvChunkRows = 65536
+
+# Parallel mode (--workers) moves each boundary of byte ranges to end of its row with reads of csvRangeReadSize bytes
+csvRangeReadSize = 65536
+
+# Pipe mode (-i - / -o -) reads standard input in chunks of at most csvPipeReadSize bytes, and converts and writes csvPipeChunkRows rows together
+csvPipeReadSize = 65536
+
+csvPipeChunkRows = 4096
+
+# Streaming mode memory-maps plain input files of csvMappedEncodings and reads blocks of about csvMappedBlockSize bytes (whole rows), only currency fields are parsed from decoded text
+csvMappedEncodings = ["utf-8", "utf-8-sig", "ascii"]
+
+csvMappedBlockSize = 4194304
+
+# Cache mode reads decoded text of input file in blocks of about csvTextBlockSize characters (whole rows)
+csvTextBlockSize = 4194304
+
+# Pipeline mode (--pipeline) keeps at most csvPipelineQueueChunks blocks of rows between reader and converter, and converted chunks between converter and writer
+csvPipelineQueueChunks = 4
+
+# Column with epoch time of each row, used to find rate of each row from rates file
+csvTimestampColumnName = "Last Update"
+
+# Incremental mode keeps a checkpoint file next to output file and converts appended rows in ranges of at most csvIncrementalRangeSize bytes
+csvCheckpointSuffix = ".checkpoint.json"
+
+csvIncrementalRangeSize = 16777216
+
+# Seconds between checks of input file size in watch mode
+csvWatchInterval = 1.0
+
+# Compressed CSV files (file-name.csv.gz, file-name.csv.bz2, file-name.csv.xz) are read and written through python module of their extention
+csvCompressionModules = {"gz": "gzip", "bz2": "bz2", "xz": "lzma"}
+
+# Compressed files are read and written with buffers of csvCompressedBufferSize bytes on both compressed and decompressed side
+csvCompressedBufferSize = 1048576
+
+# Quarantine mode (--on-error quarantine) writes invalid rows with line number and reason to reject file next to output file (output-rejects.csv)
+# and aborts when more than --max-errors rows are invalid (csvDefaultMaxErrors when not given)
+csvRejectSuffix = "-rejects.csv"
+
+csvDefaultMaxErrors = 1000
@@ -57,3 +57,62 @@ currencyNameToLocale = {
     "GBP": "en_GB",
     "HKD": "zh_HK"
 }
+
+# Currency formatting rules of each locale, taken from glibc LC_MONETARY and LC_NUMERIC locale data
+# Formatting uses monetary values (same as locale.currency with grouping) and parsing uses numeric values (same as locale.atof)
+# grouping: digits in each group from right, last group size repeats (3, 2 is Indian lakh grouping 12,34,567)
+# signPosition: position of negative sign for positive and negative values (0: parentheses, 1: before value and symbol, 2: after value and symbol, 3: before symbol, 4: after symbol)
+# en_MY does not exist in glibc, its rules are same as ms_MY
+localeToCurrencyFormat = {
+    "en_US": {"symbol": "$", "decimalPoint": ".", "thousandsSep": ",", "grouping": [3], "fracDigits": 2, "symbolPrecedes": True, "symbolSpace": False,
+              "signPosition": [1, 1], "numericDecimalPoint": ".", "numericThousandsSep": ","},
+    "fr_FR": {"symbol": "€", "decimalPoint": ",", "thousandsSep": "\u202f", "grouping": [3], "fracDigits": 2, "symbolPrecedes": False, "symbolSpace": True,
+              "signPosition": [1, 1], "numericDecimalPoint": ",", "numericThousandsSep": "\u202f"},
+    "pt_BR": {"symbol": "R$", "decimalPoint": ",", "thousandsSep": ".", "grouping": [3], "fracDigits": 2, "symbolPrecedes": True, "symbolSpace": True,
+              "signPosition": [1, 1], "numericDecimalPoint": ",", "numericThousandsSep": "."},
+    "zh_CN": {"symbol": "￥", "decimalPoint": ".", "thousandsSep": ",", "grouping": [3], "fracDigits": 2, "symbolPrecedes": True, "symbolSpace": False,
+              "signPosition": [4, 4], "numericDecimalPoint": ".", "numericThousandsSep": ","},
+    "en_IN": {"symbol": "₹", "decimalPoint": ".", "thousandsSep": ",", "grouping": [3, 2], "fracDigits": 2, "symbolPrecedes": True, "symbolSpace": True,
+              "signPosition": [1, 1], "numericDecimalPoint": ".", "numericThousandsSep": ","},
+    "en_MY": {"symbol": "RM", "decimalPoint": ".", "thousandsSep": ",", "grouping": [3], "fracDigits": 2, "symbolPrecedes": True, "symbolSpace": False,
+              "signPosition": [1, 1], "numericDecimalPoint": ".", "numericThousandsSep": ","},
+    "pl_PL": {"symbol": "zł", "decimalPoint": ",", "thousandsSep": "\u202f", "grouping": [3], "fracDigits": 2, "symbolPrecedes": False, "symbolSpace": True,
+              "signPosition": [1, 1], "numericDecimalPoint": ",", "numericThousandsSep": "\u202f"},
+    "ko_KR": {"symbol": "₩", "decimalPoint": ".", "thousandsSep": ",", "grouping": [3], "fracDigits": 0, "symbolPrecedes": True, "symbolSpace": False,
+              "signPosition": [1, 1], "numericDecimalPoint": ".", "numericThousandsSep": ","},
+    "th_TH": {"symbol": "฿", "decimalPoint": ".", "thousandsSep": ",", "grouping": [3], "fracDigits": 2, "symbolPrecedes": True, "symbolSpace": False,
+              "signPosition": [4, 4], "numericDecimalPoint": ".", "numericThousandsSep": ","},
+    "en_GB": {"symbol": "£", "decimalPoint": ".", "thousandsSep": ",", "grouping": [3], "fracDigits": 2, "symbolPrecedes": True, "symbolSpace": False,
+              "signPosition": [1, 1], "numericDecimalPoint": ".", "numericThousandsSep": ","},
+    "zh_HK": {"symbol": "HK$", "decimalPoint": ".", "thousandsSep": ",", "grouping": [3], "fracDigits": 2, "symbolPrecedes": True, "symbolSpace": False,
+              "signPosition": [1, 0], "numericDecimalPoint": ".", "numericThousandsSep": ","}
+}
+
+# Number of recently looked up (rates file, currency pair, timestamp) rates of rates file kept in memory
+ratesLookupCacheSize = 65536
+
+# Fixed point arithmetic: amounts are integer minor units (cents) and multipliers and rates are integers scaled by 10 ** rateDigits
+# Multipliers and rates with more fraction digits than rateDigits are rounded with rounding mode of conversion
+minorUnitDigits = 2
+
+rateDigits = 8
+
+# Rounding modes of converted amounts, half-even is default (same as Python round and Decimal)
+# half-up and half-down round halves away from and towards zero, up and down round away from and towards zero, floor and ceiling round towards negative and positive infinity
+roundingModes = ["half-even", "half-up", "half-down", "up", "down", "floor", "ceiling"]
+
+defaultRoundingMode = "half-even"
+
+# Converted value of recently seen amounts is kept for each (destination currency, multiplier, rounding mode) of at most currencyMemoMaxTables conversions
+# Each table and memo of parsed source amount strings keep at most currencyMemoMaxEntries values, oldest values are evicted first (first in, first out)
+currencyMemoMaxEntries = 65536
+
+currencyMemoMaxTables = 16
+
+# Memo of parsed source amount strings is turned off for rest of operation when less than currencyMemoMinHitRate of first currencyMemoProbeValues strings are repeated
+currencyMemoProbeValues = 4096
+
+currencyMemoMinHitRate = 0.1
+
+# NumPy backend formats converted amounts in batches of at most vectorFormatBatchSize amounts with character arrays of fixed width
+vectorFormatBatchSize = 65536
@@ -0,0 +1,14 @@
+# Rate provider (--rate-provider) responses are kept in cache directory for providerDefaultTTL seconds when --rates-ttl is not given
+# Later runs and batch workers use cached rates, and last known rates are used when provider is not reachable
+providerDefaultTTL = 3600
+
+# Each rate provider has a rates file in cache directory named with hash of its URL
+providerCachePrefix = "rates-"
+
+providerCacheSuffix = ".json"
+
+# Seconds to wait for rate provider to connect and respond
+providerTimeout = 10
+
+# Headers of each rate provider request, connections of each host are kept open and reused
+providerRequestHeaders = {"Accept": "application/json", "Connection": "keep-alive", "User-Agent": "currency-convert"}
@@ -0,0 +1,20 @@
+# Address of conversion server when only port is given
+serverDefaultHost = "127.0.0.1"
+
+# Bytes read from request body (or input file) at a time, reader is paused until rows of previous bytes are converted
+serverReadChunkSize = 65536
+
+# Maximum size of request line and headers
+serverMaxHeaderBytes = 65536
+
+# Rows converted and sent back to client together
+serverChunkRows = 8192
+
+# Converted data of an upload kept in memory until upload is received, larger data is spooled to a temporary file
+serverSpoolMaxBytes = 8388608
+
+# Requests converted at a time, other requests wait and their uploads are not read until a conversion is finished
+serverMaxConcurrentConversions = 4
+
+# Seconds an idle keep-alive connection is kept open
+serverKeepAliveTimeout = 30
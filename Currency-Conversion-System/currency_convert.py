@@ -2,6 +2,7 @@ import sys
 
 from utils.argUtils import parseArgs, validateArgs
 from utils.currencyUtils import currencyConvertOperation
+from utils.statsUtils import startStats, finishStats, statsStage, addStatsHook, writeStats
 
 
 def main():
@@ -11,21 +12,45 @@ def main():
     # Step 1: Parsing Command Line Arguments
     argsDict = parseArgs()
 
-    # Step 2: Validate Command Line Arguments to ensure proper formatting
-    result = validateArgs(**argsDict)
+    # Server Mode: conversion arguments are given with each request
+    serveAddress = argsDict.pop("serve")
+    if serveAddress:
+        # asyncio is only imported for server mode
+        from utils.serverUtils import serveCurrencyConversion
+        result = serveCurrencyConversion(serveAddress)
+        print(result[1])
+        return
+
+    # Stats: time of each stage is reported as a JSON line when operation is finished
+    statsOutput = argsDict.pop("stats")
+    if statsOutput:
+        addStatsHook(lambda stats: writeStats(statsOutput, stats))
+        startStats()
+
+    # Pipe Output: standard output only has converted CSV data, messages are written to stderr and failure sets exit status
+    pipeOutput = argsDict["output"].strip() == "-"
+    messageFile = sys.stderr if pipeOutput else sys.stdout
+
+    # Step 2: Validate Command Line Arguments to ensure proper formatting, other arguments are options of conversion modes
+    conversionArgs = [argsDict.pop(name) for name in ["field", "multiplier", "currencySymbol", "input", "output"]]
+    with statsStage("validateArgs"):
+        result = validateArgs(*conversionArgs, options=argsDict)
     if not result[0]:
         messages = result[1]
         for i, message in enumerate(messages if isinstance(messages, list) else [messages]):
-            print(f"Error Message {i+1}: {message}")
-        sys.exit(0)
+            print(f"Error Message {i+1}: {message}", file=messageFile)
+        finishStats(False)
+        sys.exit(1 if pipeOutput else 0)
     else:
         argsDict = result[2]
 
     # Step 3: Process Currency Conversion Operation and output the result
     result = currencyConvertOperation(**argsDict)
-    print(result[1])
-    if not result[0]:
-        print(result[1])
+    if not (pipeOutput and result[0]):
+        print(result[1], file=messageFile)
+    finishStats(result[0])
+    if pipeOutput and not result[0]:
+        sys.exit(1)
 
 
 if __name__ == "__main__":
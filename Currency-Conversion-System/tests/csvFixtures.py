@@ -0,0 +1,85 @@
+import os
+import tempfile
+import unittest
+
+from constants.csvConstants import csvSeprator, csvDefaultEncoding
+
+from benchmarks.csvGenerator import generatorColumns, generateCSVRow
+
+
+class CSVFileTestCase(unittest.TestCase):
+    """
+    Test case with a temporary directory for input and output CSV files. File names are absolute paths in that directory,
+    so conversion operations do not read or write files of current directory
+    """
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def getPath(self, fileName: str) -> str:
+        """
+        This function returns path of a file in temporary directory
+
+        @type fileName: String
+        @param fileName: File Name
+
+        @rtype: String
+        @returns: Absolute File Path
+        """
+        return os.path.join(self.directory.name, fileName)
+
+    def writeCSVFile(self, fileName: str, csvRows: list, csvColumns: list = generatorColumns, mode: str = "w") -> str:
+        """
+        This function writes CSV rows in input file format: pipe seprated, UTF-8-SIG encoded and CRLF line seprated
+
+        @type fileName: String
+        @param fileName: CSV File Name
+        @type csvRows: List of List
+        @param csvRows: CSV Rows Data
+        @type csvColumns: List of String
+        @param csvColumns: CSV Column Names, only written with mode w
+        @type mode: String
+        @param mode: File Mode, w writes new file and a appends rows to file
+
+        @rtype: String
+        @returns: Absolute CSV File Path
+        """
+        lineSeprator = "\r\n"
+        filePath = self.getPath(fileName)
+        with open(filePath, mode, encoding=csvDefaultEncoding if mode == "w" else "utf-8", newline="") as csvFile:
+            if mode == "w":
+                csvFile.write(csvSeprator.join(csvColumns) + lineSeprator)
+            csvFile.write("".join(csvSeprator.join(csvRow) + lineSeprator for csvRow in csvRows))
+        return filePath
+
+    def generateCSVRows(self, start: int, end: int, currencyName: str = "USD") -> list:
+        """
+        This function returns synthetic CSV rows with data.csv columns and different prices
+
+        @type start: Integer
+        @param start: First Row Number
+        @type end: Integer
+        @param end: Row Number after last row
+        @type currencyName: String
+        @param currencyName: Currency of price - an abbreviated form Example: USD for US Dollar
+
+        @rtype: List of List
+        @returns: CSV Rows Data
+        """
+        return [generateCSVRow(rowNumber, rowNumber * 7919 % 250000 + rowNumber % 100 / 100, currencyName) for rowNumber in range(start, end)]
+
+    def readFile(self, fileName: str) -> bytes:
+        """
+        This function reads data of a file in temporary directory
+
+        @type fileName: String
+        @param fileName: File Name
+
+        @rtype: Bytes
+        @returns: File Data
+        """
+        with open(self.getPath(fileName), "rb") as dataFile:
+            return dataFile.read()
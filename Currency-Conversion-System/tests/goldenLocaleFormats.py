@@ -0,0 +1,122 @@
+import os
+import sys
+import json
+import locale
+import argparse
+
+from constants.currencyConstants import localeToCurrencyFormat
+
+
+# Outputs of locale.currency (with grouping) and locale.atof recorded for each locale of localeToCurrencyFormat
+goldenFormatsPath = os.path.join(os.path.dirname(__file__), "golden", "localeFormats.json")
+
+# Amounts in minor units which are formatted and parsed, they cover rounding of halves, lakh grouping and negative values
+goldenMinorUnits = [0, 1, 5, 50, 99, 100, 150, 250, 12345, 123456, 1234567, 12345678, 123456789, 1234567890, 12345678901, 100000000000,
+                    -1, -50, -150, -123456, -12345678901]
+
+# glibc locale name of each locale of localeToCurrencyFormat which does not exist in glibc
+glibcLocaleNames = {"en_MY": "ms_MY"}
+
+
+def recordLocaleFormats() -> dict:
+    """
+    This function records outputs of locale.currency (with grouping) and locale.atof of golden amounts with current locale
+
+    @rtype: Dictionary
+    @returns: Minor Units and Currency Text of each amount (currency), and Number Text and its Float Value of each amount (atof)
+    """
+    localeFormats = {"currency": [], "atof": []}
+    for minorUnits in goldenMinorUnits:
+        localeFormats["currency"].append([minorUnits, locale.currency(minorUnits / 100, grouping=True)])
+        numberText = locale.format_string("%.2f", minorUnits / 100, grouping=True)
+        localeFormats["atof"].append([numberText, locale.atof(numberText)])
+    return localeFormats
+
+
+def setGlibcLocale(localeOption: str) -> bool:
+    """
+    This function sets process locale to installed glibc UTF-8 locale of a locale of localeToCurrencyFormat
+
+    @type localeOption: String
+    @param localeOption: Locale of localeToCurrencyFormat. Example: en_IN
+
+    @rtype: Boolean
+    @returns: True if locale is installed and set, False if it is not installed
+    """
+    try:
+        locale.setlocale(locale.LC_ALL, glibcLocaleNames.get(localeOption, localeOption) + ".UTF-8")
+        return True
+    except locale.Error:
+        return False
+
+
+def recordInstalledLocaleFormats() -> dict:
+    """
+    This function records outputs of each locale of localeToCurrencyFormat with installed glibc locales.
+    Raises ValueError if a locale is not installed
+
+    @rtype: Dictionary
+    @returns: Recorded Outputs of each locale (recordLocaleFormats)
+    """
+    goldenFormats = {}
+    previousLocale = locale.setlocale(locale.LC_ALL)
+    try:
+        for localeOption in localeToCurrencyFormat:
+            if not setGlibcLocale(localeOption):
+                raise ValueError(f"Locale {glibcLocaleNames.get(localeOption, localeOption)}.UTF-8 is not installed")
+            goldenFormats[localeOption] = recordLocaleFormats()
+    finally:
+        locale.setlocale(locale.LC_ALL, previousLocale)
+    return goldenFormats
+
+
+def recordConventionFormats() -> dict:
+    """
+    This function records outputs of each locale with conventions of localeToCurrencyFormat given to locale.localeconv instead of glibc locales.
+    Outputs only check formatting and parsing of locale module with same conventions, so installed locales are preferred when they are available
+
+    @rtype: Dictionary
+    @returns: Recorded Outputs of each locale (recordLocaleFormats)
+    """
+    goldenFormats = {}
+    localeconv = locale.localeconv
+    try:
+        for localeOption, currencyFormat in localeToCurrencyFormat.items():
+            # glibc repeats last group size (0 at end of list), one group size is repeated for all groups
+            grouping = currencyFormat["grouping"] + [0] if len(currencyFormat["grouping"]) > 1 else [currencyFormat["grouping"][0], currencyFormat["grouping"][0], 0]
+            conventions = {"currency_symbol": currencyFormat["symbol"], "int_curr_symbol": "", "mon_decimal_point": currencyFormat["decimalPoint"],
+                           "mon_thousands_sep": currencyFormat["thousandsSep"], "mon_grouping": grouping, "frac_digits": currencyFormat["fracDigits"],
+                           "int_frac_digits": currencyFormat["fracDigits"], "p_cs_precedes": int(currencyFormat["symbolPrecedes"]),
+                           "n_cs_precedes": int(currencyFormat["symbolPrecedes"]), "p_sep_by_space": int(currencyFormat["symbolSpace"]),
+                           "n_sep_by_space": int(currencyFormat["symbolSpace"]), "p_sign_posn": currencyFormat["signPosition"][0],
+                           "n_sign_posn": currencyFormat["signPosition"][1], "positive_sign": "", "negative_sign": "-",
+                           "decimal_point": currencyFormat["numericDecimalPoint"], "thousands_sep": currencyFormat["numericThousandsSep"], "grouping": grouping}
+            locale.localeconv = lambda conventions=conventions: dict(conventions)
+            goldenFormats[localeOption] = recordLocaleFormats()
+    finally:
+        locale.localeconv = localeconv
+    return goldenFormats
+
+
+def main():
+    """
+    This function records outputs of each locale and writes them to golden file of test_formatUtils.py
+    """
+    parser = argparse.ArgumentParser(description="Record outputs of locale.currency and locale.atof of each locale of localeToCurrencyFormat into tests/golden/localeFormats.json")
+    parser.add_argument("--conventions", dest="conventions", action="store_true",
+                        help="Use conventions of localeToCurrencyFormat instead of installed glibc locales")
+    args = parser.parse_args()
+
+    try:
+        goldenFormats = recordConventionFormats() if args.conventions else recordInstalledLocaleFormats()
+    except ValueError as e:
+        print(f"{e}. Install glibc locales (locales-all package) or use --conventions", file=sys.stderr)
+        sys.exit(1)
+    with open(goldenFormatsPath, "w", encoding="utf-8", newline="\r\n") as goldenFile:
+        json.dump(goldenFormats, goldenFile, ensure_ascii=False, indent=2)
+        goldenFile.write("\n")
+    print(f"Recorded outputs of {len(goldenFormats)} locales are written to {goldenFormatsPath}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+import io
+import os
+import unittest
+from unittest import mock
+from contextlib import redirect_stdout, redirect_stderr
+
+from utils.argUtils import validateArgs, validateRequestArgs
+from utils.fixedPointUtils import parseRate
+
+from tests.csvFixtures import CSVFileTestCase
+
+
+class CurrentDirectoryTestCase(CSVFileTestCase):
+
+    def setUp(self):
+        super().setUp()
+        # Input file must be in current directory
+        self.writeCSVFile("input.csv", self.generateCSVRows(0, 10))
+        self.currentDirectory = os.getcwd()
+        os.chdir(self.directory.name)
+        self.basePath = mock.patch("utils.argUtils.csvFileBasePath", self.directory.name)
+        self.basePath.start()
+
+    def tearDown(self):
+        self.basePath.stop()
+        os.chdir(self.currentDirectory)
+        super().tearDown()
+
+
+class MultiplierArgTest(CurrentDirectoryTestCase):
+
+    def validateMultiplier(self, multiplier: str) -> list:
+        return validateArgs("2", multiplier, "EUR", "input.csv", "output.csv")
+
+    def testValidMultipliers(self):
+        for multiplier, scaledMultiplier in [("0.5", parseRate("0.5")), ("83", parseRate("83")), (" 1.37 ", parseRate("1.37")),
+                                             ("0.000712", 71200), (".5", parseRate("0.5"))]:
+            result = self.validateMultiplier(multiplier)
+            self.assertTrue(result[0], result[1])
+            self.assertEqual(result[2]["multipliers"], [scaledMultiplier])
+
+    def testInvalidMultipliers(self):
+        for multiplier in ["-1", "+2", "1e3", "abc", "1.2.3", ".", "0x10"]:
+            self.assertEqual(self.validateMultiplier(multiplier), [False, "Multiplier must be an integer or float value"], multiplier)
+
+    def testMultiplierMustBeGreaterThanZero(self):
+        # 0.000000001 is rounded to 0 with rateDigits fraction digits
+        for multiplier in ["0", "0.00", "0.000000001"]:
+            self.assertEqual(self.validateMultiplier(multiplier), [False, "Multiplier must be greater than 0"], multiplier)
+        self.assertEqual(validateArgs("2", "0.5,0", "EUR,INR", "input.csv", "output.csv"), [False, "Multiplier must be greater than 0"])
+
+    def testRequestMultiplier(self):
+        # Conversion server and CurrencyConverter check multiplier same as command line
+        self.assertEqual(validateRequestArgs({"field": "2", "symbol": "EUR", "multiplier": "0.5"})[2]["multipliers"], [parseRate("0.5")])
+        for multiplier, message in [("-1", "multiplier parameter must be an integer or float value"), ("1e3", "multiplier parameter must be an integer or float value"),
+                                    ("0", "multiplier parameter must be greater than 0")]:
+            self.assertEqual(validateRequestArgs({"field": "2", "symbol": "EUR", "multiplier": multiplier}), [False, message])
+
+
+class SymbolArgTest(CurrentDirectoryTestCase):
+
+    def testInvalidSymbol(self):
+        # Supported currencies are listed on stderr, standard output only has CSV data with -o -
+        with redirect_stdout(io.StringIO()) as stdout, redirect_stderr(io.StringIO()) as stderr:
+            result = validateArgs("2", "0.5", "EUR,ABC", "input.csv", "-")
+        self.assertEqual(result, [False, "Currency Symbol is not valid. It must be from list of above supported options"])
+        self.assertEqual(stdout.getvalue(), "")
+        self.assertTrue(stderr.getvalue().startswith("Supported Currencies: "))
+
+
+class ModeOptionsTest(CurrentDirectoryTestCase):
+
+    def testIncompatibleModes(self):
+        for input, output, options, message in [
+                ("input.csv", "-", {"workers": "2"}, "Workers can not be used with standard input or output pipe (-)"),
+                ("input.csv", "stdout", {"incremental": True}, "Incremental mode needs input CSV file and output CSV file"),
+                ("input.csv", "output.csv", {"watch": True, "workers": "2"}, "Workers can not be used with incremental mode"),
+                ("input.csv", "output.csv", {"cacheDirectory": "cache", "stream": True}, "Cache can not be used with stdin, pipe (-), batch, incremental, --stream, --workers or --rates-file"),
+                ("input.csv", "output.csv.gz", {"incremental": True}, "Compressed output file can not be used with incremental mode"),
+                ("input.csv", "output.csv", {"pipeline": True, "incremental": True}, "Pipeline mode can not be used with incremental mode or cache"),
+                ("input.csv", "output.csv", {"onError": "quarantine", "workers": "2"}, "Quarantine mode can not be used with stdin, incremental mode, cache or --workers"),
+                ("stdin", "output.csv", {"ratesFile": "rates.csv"}, "Rates File can only be used with input CSV file"),
+                ("input.csv", "output.csv", {"baseRatesFile": "base.csv", "rateProvider": "http://127.0.0.1:1"}, "Rate Provider and Base Rates File can not be used together")]:
+            self.assertEqual(validateArgs("2", "0.5", "EUR", input, output, options), [False, message], options)
+
+    def testModeOptions(self):
+        result = validateArgs("2", "0.5", "EUR", "input.csv", "output.csv", {"onError": "quarantine", "maxErrors": "5", "workers": "1", "roundingMode": "Half-Up"})
+        self.assertTrue(result[0], result[1])
+        # Quarantine mode is always streamed, options which are not given keep their default values
+        self.assertEqual(result[2]["options"], {"stream": True, "encoding": None, "backend": "scalar", "workers": 1, "rates": None, "batchFiles": None, "roundingMode": "half-up",
+                                                "incremental": False, "watch": False, "cache": None, "pipeline": False, "quarantine": {"maxErrors": 5}})
+
+    def testUnknownOption(self):
+        self.assertEqual(validateArgs("2", "0.5", "EUR", "input.csv", "output.csv", {"workers": "2", "wokers": "2"}), [False, "Unknown options: wokers"])
+
+
+class BatchArgTest(CurrentDirectoryTestCase):
+
+    def setUp(self):
+        super().setUp()
+        os.mkdir(self.getPath("batch"))
+        for fileName in ["b.csv", "a.CSV", "c.csv.gz", "notes.txt"]:
+            with open(self.getPath(os.path.join("batch", fileName)), "wb"):
+                pass
+        os.mkdir(self.getPath(os.path.join("batch", "nested.csv")))
+
+    def testDirectoryAndGlobPattern(self):
+        # Files are sorted, only CSV files (and compressed CSV files) are converted
+        for input, batchFiles in [("batch", ["a.CSV", "b.csv", "c.csv.gz"]), ("batch/*.csv", ["b.csv"]), ("batch/[ab].*", ["a.CSV", "b.csv"])]:
+            result = validateArgs("2", "0.5", "EUR", input, "converted", {"workers": "2"})
+            self.assertTrue(result[0], result[1])
+            self.assertEqual(result[2]["options"]["batchFiles"], [os.path.join("batch", fileName) for fileName in batchFiles], input)
+            self.assertEqual(result[2]["options"]["workers"], 2)
+
+    def testInvalidBatch(self):
+        for input, output, message in [("batch/*.xlsx", "converted", "Input directory or pattern does not match any CSV file"),
+                                       ("batch", "converted.csv", "Output must be a directory for batch input"),
+                                       ("batch", "input.csv", "Output must be a directory for batch input"),
+                                       ("batch", "-", "Output must be a directory for batch input")]:
+            self.assertEqual(validateArgs("2", "0.5", "EUR", input, output), [False, message], input)
+        with open(self.getPath("converted"), "wb"):
+            pass
+        self.assertEqual(validateArgs("2", "0.5", "EUR", "batch", "converted"), [False, "Output directory is an existing file"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+import os
+import unittest
+from unittest import mock
+
+from constants.cacheConstants import cacheMetadataSuffix, cacheDataSuffix
+
+from utils.cacheUtils import getCacheEntryPath
+from utils.currencyUtils import currencyConvertOperation, currencyConvertCachedOperation
+from utils.fixedPointUtils import parseRate
+
+from tests.csvFixtures import CSVFileTestCase
+
+
+class ParsedColumnCacheTest(CSVFileTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.fields, self.currencySymbols = [1], ["INR"]
+        self.cacheDirectory = self.getPath("cache")
+        self.input = self.writeCSVFile("input.csv", self.generateCSVRows(0, 200))
+
+    def convertCached(self, input: str = None, multiplier: str = "0.73", cacheMaxBytes: int = 1 << 30) -> list:
+        result = currencyConvertCachedOperation(self.fields, [parseRate(multiplier)], self.currencySymbols, input or self.input,
+                                                self.getPath("output.csv"), cache={"cacheDirectory": self.cacheDirectory, "cacheMaxBytes": cacheMaxBytes})
+        self.assertTrue(result[0], result[1])
+        return result
+
+    def assertSameAsUncachedConversion(self, multiplier: str = "0.73"):
+        result = currencyConvertOperation(self.fields, [parseRate(multiplier)], self.currencySymbols, self.input, self.getPath("full.csv"))
+        self.assertTrue(result[0], result[1])
+        self.assertEqual(self.readFile("output.csv"), self.readFile("full.csv"))
+
+    def getEntryPath(self, input: str) -> str:
+        return getCacheEntryPath(self.cacheDirectory, input, self.fields)
+
+    def testCacheHitIsSameAsUncachedConversion(self):
+        self.assertIn("parsed columns are written to cache", self.convertCached()[1])
+        self.assertSameAsUncachedConversion()
+        self.assertIn("parsed columns are read from cache", self.convertCached(multiplier="1.37")[1])
+        self.assertSameAsUncachedConversion("1.37")
+
+    def testCacheHitReadsRowsInBlocks(self):
+        self.convertCached()
+        # Blocks and chunks smaller than a few rows split rows of chunk between blocks
+        with mock.patch("utils.csvUtils.csvTextBlockSize", 97), mock.patch("utils.currencyUtils.csvChunkRows", 7):
+            self.assertIn("parsed columns are read from cache", self.convertCached()[1])
+        self.assertSameAsUncachedConversion()
+
+    def testChangedContentWithSameSizeAndTimeIsNotUsed(self):
+        self.convertCached()
+        fileStat = os.stat(self.input)
+        with open(self.input, "r+b") as csvFile:
+            csvFile.seek(-10, os.SEEK_END)
+            csvFile.write(b"x")
+        os.utime(self.input, ns=(fileStat.st_atime_ns, fileStat.st_mtime_ns))
+        self.assertIn("parsed columns are written to cache", self.convertCached()[1])
+        self.assertSameAsUncachedConversion()
+
+    def testAppendedRowsAreNotReadFromCache(self):
+        self.convertCached()
+        self.writeCSVFile("input.csv", self.generateCSVRows(200, 210), mode="a")
+        self.assertIn("parsed columns are written to cache", self.convertCached()[1])
+        self.assertSameAsUncachedConversion()
+        self.assertIn("parsed columns are read from cache", self.convertCached()[1])
+
+    def testEntryLargerThanCacheIsNotWritten(self):
+        self.assertIn("parsed columns are too large to cache", self.convertCached(cacheMaxBytes=1024)[1])
+        self.assertFalse(os.path.exists(self.getEntryPath(self.input) + cacheMetadataSuffix))
+        self.assertSameAsUncachedConversion()
+
+    def testLeastRecentlyUsedEntryIsEvicted(self):
+        inputs = [self.writeCSVFile(f"input{i}.csv", self.generateCSVRows(0, 200)) for i in range(3)]
+        self.convertCached(inputs[0])
+        entrySize = sum(os.path.getsize(self.getEntryPath(inputs[0]) + suffix) for suffix in [cacheMetadataSuffix, cacheDataSuffix])
+        cacheMaxBytes = entrySize * 5 // 2
+        self.convertCached(inputs[1], cacheMaxBytes=cacheMaxBytes)
+        # First entry is older than second entry until it is read from cache
+        for input, usedTime in zip(inputs, [1000, 2000]):
+            os.utime(self.getEntryPath(input) + cacheMetadataSuffix, (usedTime, usedTime))
+        self.assertIn("parsed columns are read from cache", self.convertCached(inputs[0], cacheMaxBytes=cacheMaxBytes)[1])
+        self.convertCached(inputs[2], cacheMaxBytes=cacheMaxBytes)
+        self.assertEqual([os.path.exists(self.getEntryPath(input) + cacheDataSuffix) for input in inputs], [True, False, True])
+
+
+if __name__ == "__main__":
+    unittest.main()
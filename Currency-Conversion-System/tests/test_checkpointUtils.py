@@ -0,0 +1,78 @@
+import os
+import unittest
+
+from utils.checkpointUtils import getCheckpointPath, readCheckpoint
+from utils.currencyUtils import currencyConvertOperation, convertCSVFileIncrement
+from utils.fixedPointUtils import parseRate
+
+from tests.csvFixtures import CSVFileTestCase
+
+
+class IncrementalResumeTest(CSVFileTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.fields, self.multipliers, self.currencySymbols = [1], [parseRate("0.73")], ["INR"]
+        self.input = self.writeCSVFile("input.csv", self.generateCSVRows(0, 100))
+        self.output = self.getPath("output.csv")
+
+    def convertIncrement(self, multipliers: list = None) -> list:
+        return convertCSVFileIncrement(self.fields, multipliers or self.multipliers, self.currencySymbols, self.input, self.output)
+
+    def assertSameAsFullConversion(self):
+        result = currencyConvertOperation(self.fields, self.multipliers, self.currencySymbols, self.input, self.getPath("full.csv"))
+        self.assertTrue(result[0], result[1])
+        self.assertEqual(self.readFile("output.csv"), self.readFile("full.csv"))
+
+    def testAppendedRowsAreResumedFromCheckpoint(self):
+        result = self.convertIncrement()
+        self.assertTrue(result[0], result[1])
+        self.assertIn("100 rows converted from start of input file (no checkpoint of previous run)", result[1])
+        self.writeCSVFile("input.csv", self.generateCSVRows(100, 120), mode="a")
+        result = self.convertIncrement()
+        self.assertIn("20 new rows appended (120 rows converted)", result[1])
+        self.assertEqual(readCheckpoint(getCheckpointPath(self.output))["inputOffset"], os.path.getsize(self.input))
+        self.assertSameAsFullConversion()
+
+    def testRowBeingAppendedIsConvertedByNextRun(self):
+        self.convertIncrement()
+        newRow = "|".join(self.generateCSVRows(100, 101)[0])
+        with open(self.input, "a", encoding="utf-8", newline="") as csvFile:
+            csvFile.write(newRow[:20])
+        self.assertIn("0 new rows appended (100 rows converted)", self.convertIncrement()[1])
+        with open(self.input, "a", encoding="utf-8", newline="") as csvFile:
+            csvFile.write(newRow[20:] + "\r\n")
+        self.assertIn("1 new rows appended (101 rows converted)", self.convertIncrement()[1])
+        self.assertSameAsFullConversion()
+
+    def testChangedRowsAreConvertedFromStart(self):
+        self.convertIncrement()
+        with open(self.input, "r+b") as csvFile:
+            csvFile.seek(-10, os.SEEK_END)
+            csvFile.write(b"x")
+        self.assertIn("100 rows converted from start of input file (converted rows of input file are changed)", self.convertIncrement()[1])
+        self.assertSameAsFullConversion()
+
+    def testChangedParametersAreConvertedFromStart(self):
+        self.convertIncrement()
+        result = self.convertIncrement([parseRate("0.5")])
+        self.assertIn("from start of input file (conversion parameters are changed)", result[1])
+
+    def testChangedOutputIsConvertedFromStart(self):
+        self.convertIncrement()
+        with open(self.output, "a") as outputFile:
+            outputFile.write("edited\n")
+        self.assertIn("from start of input file (output file is changed after previous run)", self.convertIncrement()[1])
+        self.assertSameAsFullConversion()
+
+    def testFailedAppendKeepsOutputOfCheckpoint(self):
+        self.convertIncrement()
+        outputData = self.readFile("output.csv")
+        self.writeCSVFile("input.csv", self.generateCSVRows(100, 110) + [["bad", "$abc ", "x", "1", "y", "z"]], mode="a")
+        self.assertFalse(self.convertIncrement()[0])
+        self.assertEqual(self.readFile("output.csv"), outputData)
+        self.assertEqual(readCheckpoint(getCheckpointPath(self.output))["rows"], 100)
+
+
+if __name__ == "__main__":
+    unittest.main()
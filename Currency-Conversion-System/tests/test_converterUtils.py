@@ -0,0 +1,90 @@
+import os
+import sys
+import unittest
+import subprocess
+from unittest import mock
+from concurrent.futures import ThreadPoolExecutor
+
+from constants.benchmarkConstants import startupDeferredModules
+from constants.csvConstants import csvSeprator, csvDefaultEncoding
+
+from utils.converterUtils import CurrencyConverter
+from utils.memoUtils import clearConversionMemos
+from utils.rateUtils import rateLookups
+
+from tests.csvFixtures import CSVFileTestCase
+from benchmarks.csvGenerator import generatorColumns
+
+
+class ConverterImportTest(unittest.TestCase):
+
+    def testImportDoesNotLoadDeferredModules(self):
+        # Programs importing CurrencyConverter do not pay for asyncio of server mode (or other deferred modules)
+        process = subprocess.run([sys.executable, "-c", "import sys, utils.converterUtils; print(*sorted(sys.modules), sep=chr(10))"],
+                                 cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))), stdout=subprocess.PIPE, text=True, check=True)
+        importedModules = process.stdout.splitlines()
+        self.assertNotIn("utils.serverUtils", importedModules)
+        self.assertEqual([moduleName for moduleName in importedModules
+                          if any(moduleName == deferred or moduleName.startswith(deferred + ".") for deferred in startupDeferredModules)], [])
+
+
+class ConverterThreadsTest(CSVFileTestCase):
+
+    def setUp(self):
+        super().setUp()
+        clearConversionMemos()
+        rateLookups.clear()
+        # Tiny memos and lookups, so threads evict values which other threads are converting
+        for patcher in [mock.patch("utils.memoUtils.currencyMemoMaxEntries", 16), mock.patch("utils.currencyUtils.currencyMemoMaxEntries", 16),
+                        mock.patch("utils.rateUtils.ratesLookupCacheSize", 16)]:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        clearConversionMemos()
+        rateLookups.clear()
+        super().tearDown()
+
+    def getCSVData(self, start: int, end: int) -> bytes:
+        # Prices repeat within each block of rows, so memos have hits as well as misses
+        csvRows = [csvRow[:1] + priceRow[1:2] + csvRow[2:] for csvRow, priceRow in zip(self.generateCSVRows(start, end), self.generateCSVRows(0, 40) * 100)]
+        return "".join(csvSeprator.join(csvRow) + "\r\n" for csvRow in [generatorColumns] + csvRows).encode(csvDefaultEncoding)
+
+    def assertThreadedConversionIsSameAsSerial(self, converters: list):
+        csvDatas = [self.getCSVData(start, start + 500) for start in range(0, 8000, 500)]
+        tasks = [(converter, csvData) for converter in converters for csvData in csvDatas]
+        serialData = [converter.convertBytes(csvData) for converter, csvData in tasks]
+        for _ in range(3):
+            clearConversionMemos()
+            with ThreadPoolExecutor(8) as executor:
+                threadedData = list(executor.map(lambda task: task[0].convertBytes(task[1]), tasks))
+            self.assertEqual(threadedData, serialData)
+
+    def testSharedConverterIsSameAsSerialConversion(self):
+        self.assertThreadedConversionIsSameAsSerial([CurrencyConverter("EUR", multiplier="0.9313")])
+
+    def testConvertersOfSameMemoAreSameAsSerialConversion(self):
+        # Converters with same destination currency and multiplier share one memo of converted amounts
+        self.assertThreadedConversionIsSameAsSerial([CurrencyConverter("EUR", multiplier="0.9313", roundingMode=roundingMode)
+                                                     for roundingMode in ["half-even", "half-even", "down"]])
+
+    def testRatesFileConverterIsSameAsSerialConversion(self):
+        self.writeCSVFile("rates.csv", [["USD", "EUR", str(1483800000 + timestamp), f"0.{9000 + timestamp}"] for timestamp in range(0, 8000, 7)],
+                          ["Source", "Destination", "Timestamp", "Rate"])
+        with mock.patch("utils.argUtils.csvFileBasePath", self.directory.name):
+            converter = CurrencyConverter("EUR", ratesFile="rates.csv")
+        self.assertThreadedConversionIsSameAsSerial([converter])
+
+    def testConvertRowsIsSameAsSerialConversion(self):
+        converter = CurrencyConverter("INR", multiplier="73.5")
+        rowsBlocks = [self.generateCSVRows(start, start + 300) for start in range(0, 4800, 300)]
+        serialRows = [list(converter.convertRows(csvRows)) for csvRows in rowsBlocks]
+        with ThreadPoolExecutor(8) as executor:
+            threadedRows = list(executor.map(lambda csvRows: list(converter.convertRows(csvRows)), rowsBlocks))
+        self.assertEqual(threadedRows, serialRows)
+        # Rows of caller are not changed
+        self.assertEqual(rowsBlocks[0], self.generateCSVRows(0, 300))
+
+
+if __name__ == "__main__":
+    unittest.main()
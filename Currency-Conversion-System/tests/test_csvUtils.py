@@ -0,0 +1,162 @@
+import os
+import sys
+import codecs
+import unittest
+from unittest import mock
+
+from utils.csvUtils import csvFileEncodingCache, getCSVFileEncoding, detectCSVFileEncoding, readCSVFileHeader, iterCSVFileBlocks, splitCSVFileRanges
+from utils.currencyUtils import currencyConvertOperation, currencyConvertStreamOperation
+from utils.fixedPointUtils import parseRate
+
+from tests.csvFixtures import CSVFileTestCase
+
+
+class MappedFileBlocksTest(CSVFileTestCase):
+
+    def setUp(self):
+        super().setUp()
+        csvRows = self.generateCSVRows(0, 300)
+        # Rows of different length with multi-byte characters around currency field
+        for rowNumber, csvRow in enumerate(csvRows):
+            csvRow[0] = csvRow[0] + "é" * (rowNumber % 7)
+            csvRow[2] = csvRow[2] + " Fast Niche® Markets ₹" * (rowNumber % 3)
+        self.input = self.writeCSVFile("input.csv", csvRows)
+        self.rowsOffset = readCSVFileHeader(self.input, "utf-8-sig")[1]
+
+    def assertBlocksEndAtRowBoundaries(self, blockSize: int):
+        blocks = list(iterCSVFileBlocks(self.input, self.rowsOffset, blockSize))
+        self.assertEqual(b"".join(blocks), self.readFile("input.csv")[self.rowsOffset:])
+        for block in blocks[:-1]:
+            self.assertTrue(block.endswith(b"\r\n"), blockSize)
+            # A row longer than block size is one block
+            self.assertTrue(len(block) <= blockSize or block.count(b"\r\n") == 1, blockSize)
+
+    def testBlocksEndAtRowBoundaries(self):
+        for blockSize in [1, 2, 3, 50, 64, 101, 4096, 1 << 22]:
+            self.assertBlocksEndAtRowBoundaries(blockSize)
+
+    def testLastRowWithoutRowSeprator(self):
+        with open(self.input, "ab") as csvFile:
+            csvFile.write(b"feed|$1.00 |x|1|y|z")
+        for blockSize in [2, 64, 4096]:
+            self.assertBlocksEndAtRowBoundaries(blockSize)
+            self.assertTrue(list(iterCSVFileBlocks(self.input, self.rowsOffset, blockSize))[-1].endswith(b"|z"))
+
+    def testNoBlocksAfterEndOfFile(self):
+        self.writeCSVFile("header.csv", [])
+        self.assertEqual(list(iterCSVFileBlocks(self.getPath("header.csv"), readCSVFileHeader(self.getPath("header.csv"))[1])), [])
+
+    def testFileRangesEndAtRowBoundaries(self):
+        fileData = self.readFile("input.csv")
+        # Row seprator may be split between two reads of small read size
+        for readSize in [1, 2, 3, 4096]:
+            for totalRanges in [1, 3, 50, 10 ** 6]:
+                with mock.patch("utils.csvUtils.csvRangeReadSize", readSize):
+                    csvRanges = splitCSVFileRanges(self.input, self.rowsOffset, totalRanges)
+                self.assertEqual([start for start, end in csvRanges], [self.rowsOffset] + [end for start, end in csvRanges[:-1]], (readSize, totalRanges))
+                self.assertEqual(csvRanges[-1][1], len(fileData))
+                self.assertTrue(all(fileData[start:end].endswith(b"\r\n") for start, end in csvRanges), (readSize, totalRanges))
+                # Each boundary is end of first row which ends after range size from previous boundary
+                rangeSize = (len(fileData) - self.rowsOffset) // totalRanges or 1
+                self.assertEqual([end for start, end in csvRanges[:-1]], [fileData.index(b"\r\n", start + rangeSize - 1) + 2 for start, end in csvRanges[:-1]], (readSize, totalRanges))
+        # One range of whole file and one range for each of 300 rows
+        self.assertEqual(splitCSVFileRanges(self.input, self.rowsOffset, 1), [[self.rowsOffset, len(fileData)]])
+        self.assertEqual(len(splitCSVFileRanges(self.input, self.rowsOffset, 10 ** 6)), 300)
+
+    def testMappedConversionIsSameForEveryBlockSize(self):
+        fields, multipliers, currencySymbols = [1], [parseRate("83.2")], ["INR"]
+        result = currencyConvertOperation(fields, multipliers, currencySymbols, self.input, self.getPath("decoded.csv"))
+        self.assertTrue(result[0], result[1])
+        for blockSize in [1, 64, 101, 4096]:
+            with mock.patch("utils.currencyUtils.csvMappedBlockSize", blockSize):
+                result = currencyConvertStreamOperation(fields, multipliers, currencySymbols, self.input, self.getPath("mapped.csv"))
+            self.assertTrue(result[0], result[1])
+            self.assertEqual(self.readFile("mapped.csv"), self.readFile("decoded.csv"), blockSize)
+
+    def testInvalidRowOfLaterBlock(self):
+        self.writeCSVFile("input.csv", [["bad", "$1.0x ", "x", "1", "y", "z"]], mode="a")
+        fields, multipliers, currencySymbols = [1], [parseRate("0.5")], ["EUR"]
+        # Pipeline mode converts decoded rows
+        expected = currencyConvertStreamOperation(fields, multipliers, currencySymbols, self.input, self.getPath("decoded.csv"), pipeline=True)
+        self.assertFalse(expected[0])
+        with mock.patch("utils.currencyUtils.csvMappedBlockSize", 64):
+            result = currencyConvertStreamOperation(fields, multipliers, currencySymbols, self.input, self.getPath("mapped.csv"))
+        self.assertFalse(result[0])
+        self.assertEqual(str(result[1]), str(expected[1]))
+
+    def testInvalidBytesFailSameAsDecodedRows(self):
+        fields, multipliers, currencySymbols = [1], [parseRate("0.5")], ["EUR"]
+        inputData = self.readFile("input.csv")
+        # Bytes of other columns are checked with file encoding though only currency fields are parsed
+        for invalidRow in [b"feed\xff|$1.00 |x|1|y|z\r\n", b"feed|$1.0\xff |x|1|y|z\r\n"]:
+            with open(self.input, "wb") as csvFile:
+                csvFile.write(inputData + invalidRow)
+            expected = currencyConvertStreamOperation(fields, multipliers, currencySymbols, self.input, self.getPath("decoded.csv"), pipeline=True)
+            self.assertFalse(expected[0])
+            self.assertIsInstance(expected[1], UnicodeDecodeError)
+            for blockSize in [64, 4096]:
+                with mock.patch("utils.currencyUtils.csvMappedBlockSize", blockSize):
+                    result = currencyConvertStreamOperation(fields, multipliers, currencySymbols, self.input, self.getPath("mapped.csv"))
+                self.assertFalse(result[0])
+                self.assertIsInstance(result[1], UnicodeDecodeError)
+                self.assertFalse(os.path.exists(self.getPath("mapped.csv")))
+
+class EncodingDetectionTest(CSVFileTestCase):
+
+    def setUp(self):
+        super().setUp()
+        csvFileEncodingCache.clear()
+        self.csvRows = self.generateCSVRows(0, 200, "EUR")
+        # Non ASCII text in other columns, so file without Byte Order Mark is detected by its content
+        for csvRow in self.csvRows:
+            csvRow[2] = csvRow[2] + " Société Générale"
+        self.input = self.writeCSVFile("input.csv", self.csvRows)
+
+    def tearDown(self):
+        csvFileEncodingCache.clear()
+        super().tearDown()
+
+    def testByteOrderMarkDoesNotImportDetector(self):
+        with open(self.input, encoding="utf-8-sig", newline="") as csvFile:
+            csvData = csvFile.read()
+        # Import of chardet fails, so detection with chardet is not tried
+        with mock.patch.dict(sys.modules, {"chardet": None, "chardet.universaldetector": None}):
+            for encoding, expected in [("utf-8-sig", "UTF-8-SIG"), ("utf-16", "UTF-16"), ("utf-32", "UTF-32")]:
+                with open(self.getPath(f"{encoding}.csv"), "w", encoding=encoding, newline="") as csvFile:
+                    csvFile.write(csvData)
+                self.assertEqual(getCSVFileEncoding(self.getPath(f"{encoding}.csv")), expected)
+
+    def testEncodingIsDetectedAgainOnlyWhenFileIsModified(self):
+        with mock.patch("utils.csvUtils.detectCSVFileEncoding", wraps=detectCSVFileEncoding) as detectMock:
+            for _ in range(3):
+                self.assertEqual(getCSVFileEncoding(self.input), "UTF-8-SIG")
+            self.assertEqual(detectMock.call_count, 1)
+            # Appended rows change size and rewritten file with same size changes modified time
+            self.writeCSVFile("input.csv", self.generateCSVRows(200, 201), mode="a")
+            self.assertEqual(getCSVFileEncoding(self.input), "UTF-8-SIG")
+            self.assertEqual(detectMock.call_count, 2)
+            with open(self.input, "r+b") as csvFile:
+                csvFile.write(codecs.BOM_UTF16_LE + b"\x00")
+            os.utime(self.input, ns=(1, 1))
+            self.assertEqual(getCSVFileEncoding(self.input), "UTF-16")
+            self.assertEqual(detectMock.call_count, 3)
+            # Explicit encoding skips detection
+            self.assertEqual(getCSVFileEncoding(self.input, "UTF-8"), "UTF-8")
+            self.assertEqual(detectMock.call_count, 3)
+
+    def testDetectedEncodingConversionIsSameAsByteOrderMark(self):
+        fields, multipliers, currencySymbols = [1], [parseRate("1.0845")], ["USD"]
+        expected = currencyConvertOperation(fields, multipliers, currencySymbols, self.input, self.getPath("expected.csv"))
+        self.assertTrue(expected[0], expected[1])
+        with open(self.input, "rb") as csvFile:
+            csvData = csvFile.read()[len(codecs.BOM_UTF8):]
+        with open(self.getPath("plain.csv"), "wb") as csvFile:
+            csvFile.write(csvData)
+        for options in [{}, {"stream": True}]:
+            result = currencyConvertOperation(fields, multipliers, currencySymbols, self.getPath("plain.csv"), self.getPath("output.csv"), options)
+            self.assertTrue(result[0], result[1])
+            self.assertEqual(self.readFile("output.csv"), self.readFile("expected.csv"), options)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,288 @@
+import io
+import os
+import bz2
+import gzip
+import lzma
+import unittest
+from unittest import mock
+from contextlib import redirect_stderr
+
+from utils.csvUtils import splitCSVFileRanges, validateCSVFile
+from utils.currencyUtils import getOutputFileName, currencyConvertOperation
+from utils.fixedPointUtils import parseRate
+
+from tests.csvFixtures import CSVFileTestCase
+from benchmarks.csvGenerator import generatorColumns
+
+
+class ParallelOperationTest(CSVFileTestCase):
+
+    def setUp(self):
+        super().setUp()
+        csvRows = self.generateCSVRows(0, 120)
+        # Rows of different length with multi-byte characters, rows after empty row are not part of CSV data
+        for rowNumber, csvRow in enumerate(csvRows):
+            csvRow[0] = csvRow[0] + "é" * (rowNumber % 5)
+            csvRow[2] = csvRow[2] + " Fast Niche® Markets ₹" * (rowNumber % 3)
+        self.input = self.writeCSVFile("input.csv", csvRows + [[""]] + self.generateCSVRows(120, 130))
+        self.fields, self.multipliers, self.currencySymbols = [1], [parseRate("83.2"), parseRate("0.5")], ["INR", "EUR"]
+
+    def convertWithRanges(self, output: str, workers: int, totalRanges: int) -> list:
+        # Input is split into given number of ranges instead of 4 ranges for each worker
+        with mock.patch("utils.currencyUtils.splitCSVFileRanges", lambda filePath, startOffset, workerRanges: splitCSVFileRanges(filePath, startOffset, totalRanges)):
+            return currencyConvertOperation(self.fields, self.multipliers, self.currencySymbols, self.input, self.getPath(output), {"workers": workers})
+
+    def testWorkersOutputIsSameAsSingleProcess(self):
+        expected = currencyConvertOperation(self.fields, self.multipliers, self.currencySymbols, self.input, self.getPath("expected.csv"))
+        self.assertTrue(expected[0], expected[1])
+        # One range, ranges of many rows and ranges of one row (range size of 1 byte is moved to end of row)
+        for workers, totalRanges in [(2, 1), (2, 2), (3, 5), (2, 37), (3, 10 ** 6)]:
+            result = self.convertWithRanges("output.csv", workers, totalRanges)
+            self.assertTrue(result[0], result[1])
+            for currencySymbol in self.currencySymbols:
+                self.assertEqual(self.readFile(f"output-{currencySymbol}.csv"), self.readFile(f"expected-{currencySymbol}.csv"), (workers, totalRanges, currencySymbol))
+
+    def testInvalidRowOfLastRange(self):
+        self.writeCSVFile("input.csv", self.generateCSVRows(0, 50) + [["bad", "$1.0x ", "x", "1", "y", "z"]])
+        expected = currencyConvertOperation(self.fields, self.multipliers, self.currencySymbols, self.input, self.getPath("expected.csv"), {"stream": True})
+        self.assertFalse(expected[0])
+        for totalRanges in [1, 7, 10 ** 6]:
+            result = self.convertWithRanges("output.csv", 2, totalRanges)
+            self.assertFalse(result[0])
+            self.assertEqual(str(result[1]), str(expected[1]), totalRanges)
+
+    def testUTF16FileIsConvertedInStreamingMode(self):
+        with open(self.input, encoding="utf-8-sig", newline="") as csvFile:
+            csvData = csvFile.read()
+        with open(self.getPath("utf16.csv"), "w", encoding="utf-16", newline="") as csvFile:
+            csvFile.write(csvData)
+        expected = currencyConvertOperation(self.fields, self.multipliers, self.currencySymbols, self.getPath("utf16.csv"), self.getPath("expected.csv"))
+        self.assertTrue(expected[0], expected[1])
+        stderr = io.StringIO()
+        with redirect_stderr(stderr):
+            result = currencyConvertOperation(self.fields, self.multipliers, self.currencySymbols, self.getPath("utf16.csv"), self.getPath("output.csv"), {"workers": 2})
+        # Note is written to stderr, so it is not part of result message (or CSV data of standard output pipe)
+        self.assertTrue(result[0], result[1])
+        self.assertNotIn("Note", result[1])
+        self.assertEqual(stderr.getvalue(), "Note: UTF-16 file can not be split into chunks. streaming mode is used for conversion\n")
+        for currencySymbol in self.currencySymbols:
+            self.assertEqual(self.readFile(f"output-{currencySymbol}.csv"), self.readFile(f"expected-{currencySymbol}.csv"), currencySymbol)
+
+
+class StreamOperationTest(CSVFileTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.input = self.writeCSVFile("input.csv", self.generateCSVRows(0, 300))
+        self.fields, self.multipliers, self.currencySymbols = [1], [parseRate("0.5")], ["EUR"]
+
+    def convert(self, output: str, options: dict = None) -> list:
+        return currencyConvertOperation(self.fields, self.multipliers, self.currencySymbols, self.input, self.getPath(output), options)
+
+    def testStreamOutputIsSameAsDefault(self):
+        expected = self.convert("expected.csv")
+        self.assertTrue(expected[0], expected[1])
+        # Memory mapped UTF-8 blocks and decoded rows of UTF-16 file, in chunks of a few rows
+        with open(self.input, encoding="utf-8-sig", newline="") as csvFile:
+            csvData = csvFile.read()
+        with open(self.getPath("utf16.csv"), "w", encoding="utf-16", newline="") as csvFile:
+            csvFile.write(csvData)
+        for inputFile in [self.input, self.getPath("utf16.csv")]:
+            self.input = inputFile
+            with mock.patch("utils.currencyUtils.csvMappedBlockSize", 512), mock.patch("utils.currencyUtils.csvChunkRows", 7):
+                result = self.convert("output.csv", {"stream": True})
+            self.assertTrue(result[0], result[1])
+            self.assertEqual(self.readFile("output.csv"), self.readFile("expected.csv"), inputFile)
+
+    def testInvalidRowDoesNotReplaceOutput(self):
+        result = self.convert("output.csv", {"stream": True})
+        self.assertTrue(result[0], result[1])
+        previousOutput = self.readFile("output.csv")
+        # Invalid row after rows which are already written to temporary file
+        self.writeCSVFile("input.csv", self.generateCSVRows(300, 600) + [["bad", "$1.0x ", "x", "1", "y", "z"]])
+        for encoding in [None, "utf-16"]:
+            if encoding:
+                with open(self.input, encoding="utf-8-sig", newline="") as csvFile:
+                    csvData = csvFile.read()
+                with open(self.input, "w", encoding=encoding, newline="") as csvFile:
+                    csvFile.write(csvData)
+            with mock.patch("utils.currencyUtils.csvMappedBlockSize", 512), mock.patch("utils.currencyUtils.csvChunkRows", 7):
+                result = self.convert("output.csv", {"stream": True})
+            self.assertFalse(result[0])
+            self.assertIn("Currency Value Formatting is not according to locale number formatting", str(result[1]))
+            self.assertEqual(self.readFile("output.csv"), previousOutput)
+            self.assertEqual(sorted(os.listdir(self.directory.name)), ["input.csv", "output.csv"])
+
+
+class FanOutOperationTest(CSVFileTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.input = self.writeCSVFile("input.csv", self.generateCSVRows(0, 200))
+        self.currencies = {"EUR": parseRate("0.93"), "INR": parseRate("83.2"), "KRW": parseRate("1330.5")}
+
+    def testOutputFileNames(self):
+        self.assertEqual(getOutputFileName("out.csv", "EUR", True), "out-EUR.csv")
+        self.assertEqual(getOutputFileName("out.csv", "EUR", False), "out.csv")
+        self.assertEqual(getOutputFileName("out.csv.gz", "EUR", True), "out-EUR.csv.gz")
+        self.assertEqual(getOutputFileName("stdout", "EUR", True), "data-EUR.csv")
+
+    def testEachOutputIsSameAsSingleCurrencyConversion(self):
+        for currencySymbol, multiplier in self.currencies.items():
+            expected = currencyConvertOperation([1], [multiplier], [currencySymbol], self.input, self.getPath(f"expected-{currencySymbol}.csv"))
+            self.assertTrue(expected[0], expected[1])
+        # Input is read once for all currencies in each mode
+        for options in [{}, {"stream": True}, {"stream": True, "pipeline": True}, {"workers": 2}]:
+            result = currencyConvertOperation([1], list(self.currencies.values()), list(self.currencies), self.input, self.getPath("out.csv"), options)
+            self.assertTrue(result[0], result[1])
+            self.assertFalse(os.path.exists(self.getPath("out.csv")))
+            for currencySymbol in self.currencies:
+                self.assertEqual(self.readFile(f"out-{currencySymbol}.csv"), self.readFile(f"expected-{currencySymbol}.csv"), (options, currencySymbol))
+                os.remove(self.getPath(f"out-{currencySymbol}.csv"))
+
+    def testInvalidRowWritesNoOutput(self):
+        self.writeCSVFile("input.csv", [["bad", "$1.0x ", "x", "1", "y", "z"]], mode="a")
+        for options in [{}, {"stream": True}]:
+            result = currencyConvertOperation([1], list(self.currencies.values()), list(self.currencies), self.input, self.getPath("out.csv"), options)
+            self.assertFalse(result[0])
+            self.assertEqual(sorted(os.listdir(self.directory.name)), ["input.csv"], options)
+
+
+class MultipleFieldsOperationTest(CSVFileTestCase):
+
+    def setUp(self):
+        super().setUp()
+        # Setup Fee is second currency column after other columns
+        csvRows = [csvRow + [priceRow[1]] for csvRow, priceRow in zip(self.generateCSVRows(0, 200), self.generateCSVRows(5000, 5200))]
+        self.input = self.writeCSVFile("input.csv", csvRows, generatorColumns + ["Setup Fee"])
+        self.multipliers, self.currencySymbols = [parseRate("83.2")], ["INR"]
+
+    def testEachFieldIsSameAsSingleFieldConversion(self):
+        convertedColumns = {}
+        for field in [1, 6]:
+            result = currencyConvertOperation([field], self.multipliers, self.currencySymbols, self.input, self.getPath(f"field{field}.csv"))
+            self.assertTrue(result[0], result[1])
+            convertedColumns[field] = [row.split("|")[field] for row in self.readFile(f"field{field}.csv").decode("utf-8-sig").splitlines()]
+        for options in [{}, {"stream": True}, {"stream": True, "pipeline": True}, {"workers": 2}, {"backend": "numpy"}]:
+            result = currencyConvertOperation([1, 6], self.multipliers, self.currencySymbols, self.input, self.getPath("output.csv"), options)
+            self.assertTrue(result[0], result[1])
+            outputRows = [row.split("|") for row in self.readFile("output.csv").decode("utf-8-sig").splitlines()]
+            self.assertEqual([row[1] for row in outputRows], convertedColumns[1], options)
+            self.assertEqual([row[6] for row in outputRows], convertedColumns[6], options)
+            # Other columns are not changed
+            self.assertEqual([row[:1] + row[2:6] for row in outputRows],
+                             [row.split("|")[:1] + row.split("|")[2:6] for row in self.readFile("field1.csv").decode("utf-8-sig").splitlines()], options)
+
+    def testColumnsOfDifferentCurrencies(self):
+        csvRows = [csvRow + [priceRow[1]] for csvRow, priceRow in zip(self.generateCSVRows(0, 20), self.generateCSVRows(0, 20, "EUR"))]
+        self.writeCSVFile("input.csv", csvRows, generatorColumns + ["Setup Fee"])
+        # Default mode validates file before conversion, streaming mode validates each row while it is converted
+        expected = validateCSVFile(self.input, [1, 6])
+        self.assertFalse(expected[0])
+        for options in [{"stream": True}, {"stream": True, "pipeline": True}, {"workers": 2}]:
+            result = currencyConvertOperation([1, 6], self.multipliers, self.currencySymbols, self.input, self.getPath("output.csv"), options)
+            self.assertFalse(result[0])
+            self.assertEqual(str(result[1]), expected[1], options)
+
+
+class BatchOperationTest(CSVFileTestCase):
+
+    def setUp(self):
+        super().setUp()
+        os.mkdir(self.getPath("batch"))
+        self.batchFiles = [self.writeCSVFile(os.path.join("batch", f"feeds{fileNumber}.csv"), self.generateCSVRows(fileNumber * 100, fileNumber * 100 + 150))
+                           for fileNumber in range(3)]
+        self.fields, self.multipliers, self.currencySymbols = [1], [parseRate("0.93"), parseRate("83.2")], ["EUR", "INR"]
+
+    def convertBatch(self, workers: int) -> list:
+        return currencyConvertOperation(self.fields, self.multipliers, self.currencySymbols, None, self.getPath("converted"),
+                                        {"batchFiles": self.batchFiles, "workers": workers})
+
+    def testEachFileIsSameAsSingleFileConversion(self):
+        for filePath in self.batchFiles:
+            result = currencyConvertOperation(self.fields, self.multipliers, self.currencySymbols, filePath, self.getPath(os.path.basename(filePath)))
+            self.assertTrue(result[0], result[1])
+        for workers in [1, 2]:
+            result = self.convertBatch(workers)
+            self.assertTrue(result[0], result[1])
+            self.assertEqual(result[1].splitlines()[-1], f"Batch Currency Conversion Operation is completed: 3 of 3 files converted to {self.getPath('converted')}")
+            for filePath in self.batchFiles:
+                for currencySymbol in self.currencySymbols:
+                    fileName = getOutputFileName(os.path.basename(filePath), currencySymbol, True)
+                    self.assertEqual(self.readFile(os.path.join("converted", fileName)), self.readFile(fileName), (workers, fileName))
+
+    def testFailedFileDoesNotStopBatch(self):
+        self.writeCSVFile(os.path.join("batch", "feeds1.csv"), [["bad", "$1.0x ", "x", "1", "y", "z"]], mode="a")
+        for workers in [1, 2]:
+            result = self.convertBatch(workers)
+            self.assertFalse(result[0])
+            # Each file has a summary line, message of failed file may have more lines
+            summary = result[1].splitlines()
+            self.assertEqual([line.split(": ")[:2] for line in summary if line.startswith(("Success: ", "Failure: "))],
+                             [["Success", self.batchFiles[0]], ["Failure", self.batchFiles[1]], ["Success", self.batchFiles[2]]])
+            self.assertIn("Currency Value Formatting is not according to locale number formatting", result[1])
+            self.assertEqual(summary[-1], f"Batch Currency Conversion Operation is completed: 2 of 3 files converted to {self.getPath('converted')}")
+            self.assertEqual(sorted(os.listdir(self.getPath("converted"))), ["feeds0-EUR.csv", "feeds0-INR.csv", "feeds2-EUR.csv", "feeds2-INR.csv"])
+
+
+class CompressedFileOperationTest(CSVFileTestCase):
+
+    compressionModules = {"gz": gzip, "bz2": bz2, "xz": lzma}
+
+    def setUp(self):
+        super().setUp()
+        self.input = self.writeCSVFile("input.csv", self.generateCSVRows(0, 300))
+        self.currencies = {"EUR": parseRate("0.93"), "INR": parseRate("83.2")}
+        result = currencyConvertOperation([1], [self.currencies["EUR"]], ["EUR"], self.input, self.getPath("expected.csv"))
+        self.assertTrue(result[0], result[1])
+
+    def writeCompressedFile(self, fileName: str, data: bytes) -> str:
+        with self.compressionModules[fileName.rsplit(".", 1)[1]].open(self.getPath(fileName), "wb") as dataFile:
+            dataFile.write(data)
+        return self.getPath(fileName)
+
+    def readCompressedFile(self, fileName: str) -> bytes:
+        with self.compressionModules[fileName.rsplit(".", 1)[1]].open(self.getPath(fileName), "rb") as dataFile:
+            return dataFile.read()
+
+    def testCompressedInputIsSameAsPlainInput(self):
+        for compression in self.compressionModules:
+            input = self.writeCompressedFile(f"input.csv.{compression}", self.readFile("input.csv"))
+            # Compressed input is always streamed, pipeline mode reads it in reader thread
+            for options in [{}, {"pipeline": True}]:
+                result = currencyConvertOperation([1], [self.currencies["EUR"]], ["EUR"], input, self.getPath("out.csv"), options)
+                self.assertTrue(result[0], result[1])
+                self.assertEqual(self.readFile("out.csv"), self.readFile("expected.csv"), (compression, options))
+
+    def testCompressedOutputIsSameAsPlainOutput(self):
+        for compression in self.compressionModules:
+            for options in [{}, {"stream": True}, {"workers": 2}]:
+                result = currencyConvertOperation([1], [self.currencies["EUR"]], ["EUR"], self.input, self.getPath(f"out.csv.{compression}"), options)
+                self.assertTrue(result[0], result[1])
+                self.assertEqual(self.readCompressedFile(f"out.csv.{compression}"), self.readFile("expected.csv"), (compression, options))
+
+    def testCompressedFanOutOutputs(self):
+        input = self.writeCompressedFile("input.csv.gz", self.readFile("input.csv"))
+        result = currencyConvertOperation([1], list(self.currencies.values()), list(self.currencies), input, self.getPath("out.csv.xz"))
+        self.assertTrue(result[0], result[1])
+        for currencySymbol, multiplier in self.currencies.items():
+            expected = currencyConvertOperation([1], [multiplier], [currencySymbol], self.input, self.getPath(f"expected-{currencySymbol}.csv"))
+            self.assertTrue(expected[0], expected[1])
+            self.assertEqual(self.readCompressedFile(f"out-{currencySymbol}.csv.xz"), self.readFile(f"expected-{currencySymbol}.csv"), currencySymbol)
+
+    def testInvalidCompressedInputWritesNoOutput(self):
+        invalidRow = "bad|$1.0x |x|1|y|z\r\n".encode()
+        inputFiles = [self.writeCompressedFile("invalid.csv.bz2", self.readFile("input.csv") + invalidRow)]
+        # Compressed data which ends before end of stream fails while it is decompressed
+        with open(self.getPath("truncated.csv.gz"), "wb") as dataFile:
+            dataFile.write(gzip.compress(self.readFile("input.csv"))[:-100])
+        inputFiles.append(self.getPath("truncated.csv.gz"))
+        for input in inputFiles:
+            for output in ["out.csv", "out.csv.gz"]:
+                result = currencyConvertOperation([1], [self.currencies["EUR"]], ["EUR"], input, self.getPath(output))
+                self.assertFalse(result[0], (input, output))
+                self.assertEqual(sorted(os.listdir(self.directory.name)), ["expected.csv", "input.csv", "invalid.csv.bz2", "truncated.csv.gz"], (input, output))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import os
+import sys
+import unittest
+import subprocess
+
+from tests.csvFixtures import CSVFileTestCase
+
+
+programPath = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "currency_convert.py")
+
+
+class PipeModeTest(CSVFileTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.input = self.writeCSVFile("input.csv", self.generateCSVRows(0, 300))
+        self.convertArgs = [sys.executable, programPath, "--field", "2", "--multiplier", "0.5", "--symbol", "EUR"]
+
+    def runProgram(self, args: list, inputData: bytes = b"") -> subprocess.CompletedProcess:
+        return subprocess.run(self.convertArgs + args, cwd=self.directory.name, input=inputData, capture_output=True)
+
+    def testPipeOutputIsSameAsOutputFile(self):
+        expected = self.runProgram(["-i", "input.csv", "-o", "expected.csv"])
+        self.assertEqual(expected.returncode, 0)
+        # Standard output only has CSV data, so it can be read by next program in pipeline
+        for args, inputData in [(["-i", "-", "-o", "-"], self.readFile("input.csv")), (["-i", "input.csv", "-o", "-"], b""),
+                                (["-i", "-", "-o", "output.csv"], self.readFile("input.csv"))]:
+            process = self.runProgram(args, inputData)
+            self.assertEqual(process.returncode, 0, args)
+            outputData = process.stdout if args[3] == "-" else self.readFile("output.csv")
+            self.assertEqual(outputData, self.readFile("expected.csv"), args)
+            if args[3] == "-":
+                self.assertEqual(process.stderr, b"", args)
+
+    def testFailureSetsExitStatus(self):
+        invalidData = self.readFile("input.csv") + "bad|$1.0x |x|1|y|z\r\n".encode()
+        for args, inputData, message in [(["-i", "-", "-o", "-"], invalidData, b"Currency Value Formatting is not according to locale number formatting"),
+                                         (["-i", "-", "-o", "-", "--workers", "2"], b"", b"Error Message 1: Workers can not be used with standard input or output pipe (-)"),
+                                         (["-i", "-", "-o", "-"], b"", b"CSV File is Empty")]:
+            process = self.runProgram(args, inputData)
+            self.assertEqual(process.returncode, 1, args)
+            self.assertIn(message, process.stderr, args)
+            self.assertNotIn(b"Traceback", process.stderr, args)
+        # Output file mode keeps exit status 0 and prints messages on standard output
+        process = self.runProgram(["-i", "input.csv", "-o", "output.csv", "--workers", "2", "--stream", "--incremental"])
+        self.assertEqual(process.returncode, 0)
+        self.assertIn(b"Error Message 1", process.stdout)
+
+    def testClosedOutputPipe(self):
+        self.writeCSVFile("input.csv", self.generateCSVRows(300, 100000), mode="a")
+        process = subprocess.Popen(self.convertArgs + ["-i", "input.csv", "-o", "-"], cwd=self.directory.name, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        # Next program reads first rows and exits, like head
+        self.assertTrue(process.stdout.read(4096).startswith("﻿Feed Name|".encode()))
+        process.stdout.close()
+        stderr = process.stderr.read()
+        process.stderr.close()
+        self.assertEqual(process.wait(), 1)
+        self.assertEqual(stderr.decode().strip(), "Output pipe is closed before all rows are written")
+
+
+if __name__ == "__main__":
+    unittest.main()
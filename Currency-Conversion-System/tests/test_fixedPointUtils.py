@@ -0,0 +1,136 @@
+import random
+import unittest
+from fractions import Fraction
+from decimal import Decimal, localcontext, ROUND_HALF_EVEN, ROUND_HALF_UP, ROUND_HALF_DOWN, ROUND_UP, ROUND_DOWN, ROUND_FLOOR, ROUND_CEILING
+
+from constants.currencyConstants import roundingModes, rateDigits
+
+from utils.fixedPointUtils import roundingFunctions, parseMinorUnits, parseRate, multiplyMinorUnit, multiplyMinorUnits
+
+
+# Decimal rounding of each rounding mode
+decimalRoundings = {"half-even": ROUND_HALF_EVEN, "half-up": ROUND_HALF_UP, "half-down": ROUND_HALF_DOWN, "up": ROUND_UP,
+                    "down": ROUND_DOWN, "floor": ROUND_FLOOR, "ceiling": ROUND_CEILING}
+
+# Quotients of 25, 15, -25, -15, 26, -26, 24 and -24 divided by 10 in each rounding mode
+roundedQuotients = {
+    "half-even": [2, 2, -2, -2, 3, -3, 2, -2],
+    "half-up": [3, 2, -3, -2, 3, -3, 2, -2],
+    "half-down": [2, 1, -2, -1, 3, -3, 2, -2],
+    "up": [3, 2, -3, -2, 3, -3, 3, -3],
+    "down": [2, 1, -2, -1, 2, -2, 2, -2],
+    "floor": [2, 1, -3, -2, 2, -3, 2, -3],
+    "ceiling": [3, 2, -2, -1, 3, -2, 3, -2]
+}
+
+
+def roundDecimal(value, divisor: int, roundingMode: str) -> int:
+    """
+    This function divides value by divisor and rounds result with Decimal, as reference of rounding functions
+
+    @type value: Integer or Fraction
+    @param value: Scaled Value
+    @type divisor: Integer
+    @param divisor: Positive Divisor
+    @type roundingMode: String
+    @param roundingMode: Rounding Mode
+
+    @rtype: Integer
+    @returns: Rounded Quotient
+    """
+    value = Fraction(value)
+    with localcontext() as context:
+        context.prec = 100
+        quotient = Decimal(value.numerator) / Decimal(value.denominator * divisor)
+        return int(quotient.quantize(Decimal(1), rounding=decimalRoundings[roundingMode]))
+
+
+class RoundingTest(unittest.TestCase):
+
+    def testRoundingModes(self):
+        self.assertEqual(sorted(roundingFunctions), sorted(roundingModes))
+        for roundingMode, quotients in roundedQuotients.items():
+            self.assertEqual([roundingFunctions[roundingMode](value, 10) for value in [25, 15, -25, -15, 26, -26, 24, -24]], quotients, roundingMode)
+
+    def testRoundingIsSameAsDecimal(self):
+        randomValues = random.Random(15)
+        for _ in range(2000):
+            divisor = 10 ** randomValues.randint(0, 12)
+            # Exact halves and their neighbours are most of the values
+            value = randomValues.choice([divisor // 2, divisor // 2 + 1, divisor // 2 - 1, 0, randomValues.randint(0, 10 ** 15)]) + divisor * randomValues.randint(-1000, 1000)
+            for roundingMode in roundingModes:
+                self.assertEqual(roundingFunctions[roundingMode](value, divisor), roundDecimal(value, divisor, roundingMode), (value, divisor, roundingMode))
+
+    def testRoundingOfFraction(self):
+        for value in [Fraction(7999, 10), Fraction(-7999, 10), Fraction(7995, 10), Fraction(-7995, 10), Fraction(1, 3), Fraction(-2, 3)]:
+            for roundingMode in roundingModes:
+                self.assertEqual(roundingFunctions[roundingMode](value, 1), roundDecimal(value, 1, roundingMode), (value, roundingMode))
+
+
+class ParseTest(unittest.TestCase):
+
+    def testMinorUnits(self):
+        for value, minorUnits in [("1234.56", 123456), ("-12.50", -1250), ("-12.5", -1250), ("7", 700), (".5", 50), ("7.990", 799), ("0.00", 0)]:
+            self.assertEqual(parseMinorUnits(value), minorUnits, value)
+            self.assertIs(type(parseMinorUnits(value)), int, value)
+
+    def testMinorUnitsWithMoreFractionDigits(self):
+        # Value is kept exact as Fraction of minor units, so it is rounded only when it is converted
+        for value, minorUnits in [("7.999", Fraction(7999, 10)), ("-7.995", Fraction(-7995, 10)), ("0.0001", Fraction(1, 100))]:
+            self.assertEqual(parseMinorUnits(value), minorUnits, value)
+            self.assertIsInstance(parseMinorUnits(value), Fraction, value)
+
+    def testInvalidMinorUnits(self):
+        for value in ["", ".", "abc", "1.2.3", "1,234.56", "12.5x", "--1"]:
+            with self.assertRaises(ValueError, msg=value):
+                parseMinorUnits(value)
+
+    def testRates(self):
+        for value, scaledRate in [("0.000712", 71200), ("83.2", 8320000000), ("1", 10 ** rateDigits), ("7.12e-4", 71200), ("7.12E+2", 71200000000), ("0.5", 50000000)]:
+            self.assertEqual(parseRate(value), scaledRate, value)
+
+    def testRatesWithMoreFractionDigitsAreRounded(self):
+        self.assertEqual(parseRate("0.123456789"), 12345679)
+        self.assertEqual(parseRate("0.123456781"), 12345678)
+        # Exact halves are rounded with rounding mode
+        for value, roundingMode, scaledRate in [("0.000000005", "half-even", 0), ("0.000000015", "half-even", 2), ("0.000000005", "half-up", 1),
+                                                ("0.000000015", "half-down", 1), ("0.000000001", "up", 1), ("0.000000019", "down", 1)]:
+            self.assertEqual(parseRate(value, roundingMode), scaledRate, (value, roundingMode))
+
+    def testInvalidRates(self):
+        for value in ["", "abc", "1.2.3", "1e", "1e+", "1e-x", "0x10"]:
+            with self.assertRaises(ValueError, msg=value):
+                parseRate(value)
+
+
+class MultiplyTest(unittest.TestCase):
+
+    def testConvertedAmountIsRoundedOnce(self):
+        # 7.99 * 0.5 = 3.995 is rounded half to even
+        self.assertEqual(multiplyMinorUnit(799, parseRate("0.5")), 400)
+        self.assertEqual(multiplyMinorUnit(-799, parseRate("0.5")), -400)
+        self.assertEqual(multiplyMinorUnit(797, parseRate("0.5"), roundingMode="half-down"), 398)
+        # 7.989 * 0.5 = 3.9945 is rounded once, it would be 4.00 if 7.989 was rounded to 7.99 first
+        self.assertEqual(multiplyMinorUnit(parseMinorUnits("7.989"), parseRate("0.5")), 399)
+        self.assertEqual(multiplyMinorUnit(parseMinorUnits("7.999"), parseRate("0.5"), roundingMode="down"), 399)
+        # Destination currency without minor units (KRW) is rounded to whole units: 1234.56 * 1330 = 1641964.8
+        self.assertEqual(multiplyMinorUnit(123456, parseRate("1330"), 0), 164196500)
+
+    def testMultipliedAmountsAreSameAsDecimal(self):
+        randomValues = random.Random(150)
+        amounts = [randomValues.randint(-10 ** 12, 10 ** 12) for _ in range(500)] + [Fraction(randomValues.randint(-10 ** 9, 10 ** 9), 10 ** randomValues.randint(1, 4)) for _ in range(500)]
+        for roundingMode in roundingModes:
+            for fracDigits in [0, 2]:
+                multiplier = randomValues.randint(1, 10 ** 12)
+                expectedAmounts = [roundDecimal(amount * multiplier, 10 ** (rateDigits + 2 - fracDigits), roundingMode) * 10 ** (2 - fracDigits) for amount in amounts]
+                self.assertEqual(multiplyMinorUnits(amounts, multiplier, fracDigits, roundingMode), expectedAmounts, (roundingMode, fracDigits))
+                self.assertEqual([multiplyMinorUnit(amount, multiplier, fracDigits, roundingMode) for amount in amounts], expectedAmounts, (roundingMode, fracDigits))
+
+    def testExactCrossRates(self):
+        # Cross rate 83.2 / 92 is not an integer of rateDigits fraction digits, its denominator is part of divisor
+        crossRate = (8320000000, 92)
+        self.assertEqual(multiplyMinorUnits([100000000, 100], [crossRate, parseRate("2")]), [roundDecimal(Fraction(100000000 * 8320000000, 92), 10 ** rateDigits, "half-even"), 200])
+
+
+if __name__ == "__main__":
+    unittest.main()
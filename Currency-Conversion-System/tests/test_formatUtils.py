@@ -0,0 +1,79 @@
+import os
+import json
+import locale
+import unittest
+
+from constants.currencyConstants import localeToCurrencyFormat
+
+from utils.formatUtils import formatCurrencyMinorUnits, parseCurrencyAmount, parseCurrencyMinorUnits
+
+from tests.goldenLocaleFormats import goldenFormatsPath, goldenMinorUnits, glibcLocaleNames, recordLocaleFormats, setGlibcLocale
+
+
+# Environment variable which makes installed locales test fail instead of skip when a locale is not installed (CI with locales-all package)
+requireLocalesVariable = "CURRENCY_TESTS_REQUIRE_LOCALES"
+
+
+def readGoldenFormats() -> dict:
+    """
+    This function reads recorded outputs of each locale
+
+    @rtype: Dictionary
+    @returns: Recorded Outputs of each locale (recordLocaleFormats)
+    """
+    with open(goldenFormatsPath, encoding="utf-8") as goldenFile:
+        return json.load(goldenFile)
+
+
+class LocaleFormatGoldenTest(unittest.TestCase):
+
+    def setUp(self):
+        self.goldenFormats = readGoldenFormats()
+
+    def testEveryLocaleIsRecorded(self):
+        self.assertEqual(sorted(self.goldenFormats), sorted(localeToCurrencyFormat))
+        for localeOption, localeFormats in self.goldenFormats.items():
+            self.assertEqual([minorUnits for minorUnits, currencyText in localeFormats["currency"]], goldenMinorUnits, localeOption)
+
+    def testFormatCurrencyMinorUnits(self):
+        for localeOption, localeFormats in self.goldenFormats.items():
+            for minorUnits, currencyText in localeFormats["currency"]:
+                self.assertEqual(formatCurrencyMinorUnits(minorUnits, localeOption).encode("utf-8"), currencyText.encode("utf-8"),
+                                 f"{localeOption} {minorUnits}")
+
+    def testParseCurrencyAmount(self):
+        for localeOption, localeFormats in self.goldenFormats.items():
+            for numberText, value in localeFormats["atof"]:
+                self.assertEqual(parseCurrencyAmount(numberText, localeOption), value, f"{localeOption} {numberText}")
+
+    def testParseCurrencyMinorUnits(self):
+        for localeOption, localeFormats in self.goldenFormats.items():
+            for (minorUnits, currencyText), (numberText, value) in zip(localeFormats["currency"], localeFormats["atof"]):
+                self.assertEqual(parseCurrencyMinorUnits(numberText, localeOption), minorUnits, f"{localeOption} {numberText}")
+
+    def testIndianLakhGrouping(self):
+        localeFormats = dict((minorUnits, currencyText) for minorUnits, currencyText in self.goldenFormats["en_IN"]["currency"])
+        self.assertEqual(localeFormats[12345678901], "₹ 12,34,56,789.01")
+        self.assertEqual(formatCurrencyMinorUnits(12345678901, "en_IN"), "₹ 12,34,56,789.01")
+        self.assertEqual(parseCurrencyMinorUnits("12,34,56,789.01", "en_IN"), 12345678901)
+
+    def testRecordedFormatsOfInstalledLocales(self):
+        # Recorded outputs are checked again with glibc locales when they are installed
+        missingLocales = []
+        previousLocale = locale.setlocale(locale.LC_ALL)
+        try:
+            for localeOption, localeFormats in self.goldenFormats.items():
+                if not setGlibcLocale(localeOption):
+                    missingLocales.append(glibcLocaleNames.get(localeOption, localeOption) + ".UTF-8")
+                    continue
+                self.assertEqual(recordLocaleFormats(), localeFormats, localeOption)
+        finally:
+            locale.setlocale(locale.LC_ALL, previousLocale)
+        if os.environ.get(requireLocalesVariable) == "1":
+            self.assertEqual(missingLocales, [], f"Locales are not installed and {requireLocalesVariable}=1")
+        elif len(missingLocales) == len(self.goldenFormats):
+            self.skipTest(f"No locale of localeToCurrencyFormat is installed (set {requireLocalesVariable}=1 to fail)")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+import unittest
+from unittest import mock
+
+from constants.currencyConstants import currencyMemoMaxTables
+
+from utils.memoUtils import conversionMemos, getConversionMemo, clearConversionMemos, convertMemoizedValues
+from utils.currencyUtils import convertCurrencyAmounts, convertCurrencyAmount, iterConvertedCSVRows
+from utils.fixedPointUtils import parseRate
+from utils.statsUtils import startStats, finishStats
+
+from benchmarks.csvGenerator import generatorColumns, generateCSVRow
+
+
+class ConversionMemoTest(unittest.TestCase):
+
+    def setUp(self):
+        clearConversionMemos()
+
+    def tearDown(self):
+        clearConversionMemos()
+
+    def testMemoTablesAreBounded(self):
+        for multiplier in range(currencyMemoMaxTables + 5):
+            getConversionMemo("INR", multiplier, "half-even")
+            # First memo is used again, so it is not least recently used
+            getConversionMemo("INR", 0, "half-even")
+        self.assertEqual(len(conversionMemos), currencyMemoMaxTables)
+        self.assertIn(("INR", 0, "half-even"), conversionMemos)
+        self.assertNotIn(("INR", 1, "half-even"), conversionMemos)
+        self.assertIn(("INR", currencyMemoMaxTables + 4, "half-even"), conversionMemos)
+
+    def testMemoEntriesAreBounded(self):
+        memo = {}
+        with mock.patch("utils.memoUtils.currencyMemoMaxEntries", 100):
+            for chunkStart in range(0, 1000, 30):
+                values = [value % 400 for value in range(chunkStart, chunkStart + 60)]
+                self.assertEqual(convertMemoizedValues(memo, values, lambda distinctValues: [value * 2 for value in distinctValues]),
+                                 [value * 2 for value in values])
+                self.assertLessEqual(len(memo), 100)
+        # Oldest values are evicted together until memo is 3/4 full
+        self.assertGreaterEqual(len(memo), 60)
+        self.assertIn(values[-1], memo)
+
+    def testMemoizedConversionIsSameAsDirectConversion(self):
+        amounts = [(amount * 7919) % 500 * 101 - 20000 for amount in range(3000)]
+        multiplier = parseRate("1.3333")
+        with mock.patch("utils.memoUtils.currencyMemoMaxEntries", 64):
+            for chunkStart in range(0, len(amounts), 250):
+                chunkAmounts = amounts[chunkStart:chunkStart + 250]
+                self.assertEqual(convertCurrencyAmounts(chunkAmounts, "EUR", multiplier),
+                                 [convertCurrencyAmount(amount, "EUR", multiplier) for amount in chunkAmounts])
+            self.assertLessEqual(len(getConversionMemo("EUR", multiplier, "half-even")), 64)
+
+    def testParseMemoIsBounded(self):
+        for memoEntries, parseMemoHits in [(30, 180), (10, 0)]:
+            # Rows repeat 20 prices, they are parsed again when memo keeps less than 20 prices (rows are converted in place)
+            csvRows = [generateCSVRow(rowNumber, rowNumber % 20 + 0.25, "USD") for rowNumber in range(200)]
+            with mock.patch("utils.currencyUtils.currencyMemoMaxEntries", memoEntries):
+                startStats()
+                try:
+                    for convertedChunk in iterConvertedCSVRows(iter(csvRows), len(generatorColumns), [1], [parseRate("0.5")], ["EUR"], [[]]):
+                        pass
+                finally:
+                    stats = finishStats()
+            self.assertEqual(stats["memo"]["parse"]["hits"], parseMemoHits)
+            self.assertEqual(stats["memo"]["parse"]["misses"], 200 - parseMemoHits)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+import os
+import unittest
+from unittest import mock
+
+from constants.currencyConstants import supportedCurrencies
+from constants.benchmarkConstants import benchmarkNoiseFloorSeconds
+
+from utils.csvUtils import validateCSVFile, readCSVFile
+
+from benchmarks.csvGenerator import generatorColumns, generateCSVFile
+from benchmarks.pipelineBenchmark import benchmarkStages, timeStage, benchmarkCSVFile, compareWithBaseline
+from tests.csvFixtures import CSVFileTestCase
+
+
+class CSVGeneratorTest(CSVFileTestCase):
+
+    def testSameSeedGeneratesSameFile(self):
+        fileSizes = [generateCSVFile(self.getPath(f"seed{seed}-{run}.csv"), 300, "INR", seed) for seed, run in [(0, 0), (0, 1), (1, 0)]]
+        self.assertEqual(fileSizes[0], os.path.getsize(self.getPath("seed0-0.csv")))
+        self.assertEqual(self.readFile("seed0-0.csv"), self.readFile("seed0-1.csv"))
+        self.assertNotEqual(self.readFile("seed0-0.csv"), self.readFile("seed1-0.csv"))
+
+    def testGeneratedFilesAreValid(self):
+        # Rows of more than one chunk in each supported currency
+        for currencyName in supportedCurrencies:
+            filePath = self.getPath(f"{currencyName}.csv")
+            generateCSVFile(filePath, 5000, currencyName)
+            self.assertEqual(validateCSVFile(filePath, [1]), [True, "Valid CSV File. It is ready to be processed"], currencyName)
+            csvColumns, csvRows = readCSVFile(filePath)
+            self.assertEqual(csvColumns, generatorColumns)
+            self.assertEqual(len(csvRows), 5000)
+
+
+class PipelineBenchmarkTest(CSVFileTestCase):
+
+    def getResults(self, seconds: float, stage: str = "cli", calibrationSeconds: float = 0.05, spread: float = 0) -> dict:
+        stageSeconds = {"readCSVFile": calibrationSeconds * 2, stage: seconds}
+        return {"benchmarks": {"USD-1000": {"rows": 1000, "seconds": stageSeconds,
+                                            "calibratedSeconds": {name: value / calibrationSeconds for name, value in stageSeconds.items()},
+                                            "calibratedSpread": {name: spread for name in stageSeconds},
+                                            "calibrationSeconds": {name: calibrationSeconds for name in stageSeconds}}}}
+
+    def testStageTimeIsMedianOfRepeats(self):
+        # Start and end time of each run: runs take 1, 0.5 and 3 seconds
+        # Calibration times before and after each run: calibrated times are 1, 2 and 2, their quartiles are 1 and 2
+        with mock.patch("benchmarks.pipelineBenchmark.timeCalibration", side_effect=[1, 1, 0.25, 0.25, 1, 2]):
+            with mock.patch("benchmarks.pipelineBenchmark.time.perf_counter", side_effect=[0, 1, 1, 1.5, 2, 5]):
+                self.assertEqual(timeStage(sum, [1, 2], repeats=3), [1, 2, 1, 1, 3])
+
+    def testSlowerStagesAreRegressions(self):
+        baseline = self.getResults(0.1)
+        # Slower than tolerance and noise floor
+        self.assertEqual(compareWithBaseline(self.getResults(0.2), baseline, 0.25), ["USD-1000 cli: 0.2000 s, baseline 0.1000 s (+100%)"])
+        self.assertEqual(compareWithBaseline(self.getResults(0.12), baseline, 0.25), [])
+        self.assertEqual(compareWithBaseline(self.getResults(0.001), self.getResults(0.0001), 0.25), [])
+        self.assertEqual(compareWithBaseline(self.getResults(0.0001 + benchmarkNoiseFloorSeconds * 2), self.getResults(0.0001), 0.25)[0].split(":")[0], "USD-1000 cli")
+        # Benchmarks and stages which are not in baseline are not compared
+        self.assertEqual(compareWithBaseline(self.getResults(0.2, "parse"), baseline, 0.25), [])
+        self.assertEqual(compareWithBaseline(self.getResults(0.2), {"benchmarks": {}}, 0.25), [])
+
+    def testStageTimesAreComparedInCalibrationTime(self):
+        # Machine or load which makes calibration loop twice as slow makes stages twice as slow too
+        baseline = self.getResults(0.1, calibrationSeconds=0.05)
+        self.assertEqual(compareWithBaseline(self.getResults(0.2, calibrationSeconds=0.1), baseline, 0.25), [])
+        self.assertEqual(compareWithBaseline(self.getResults(0.06, calibrationSeconds=0.025), baseline, 0.25), [])
+        self.assertEqual(compareWithBaseline(self.getResults(0.1, calibrationSeconds=0.025), baseline, 0.25), ["USD-1000 cli: 0.1000 s, baseline 0.0500 s (+100%)"])
+        # Noise floor is raised to spread of calibrated times of this run and baseline
+        self.assertEqual(compareWithBaseline(self.getResults(0.2, spread=1.5), self.getResults(0.1, spread=1.5), 0.25), [])
+        self.assertEqual(compareWithBaseline(self.getResults(0.2, spread=0.5), self.getResults(0.1, spread=0.5), 0.25), ["USD-1000 cli: 0.2000 s, baseline 0.1000 s (+100%)"])
+        # Baseline without calibrated times is compared in seconds as it is
+        self.assertEqual(compareWithBaseline(self.getResults(0.2, calibrationSeconds=0.1), {"benchmarks": {"USD-1000": {"seconds": {"cli": 0.1}}}}, 0.25),
+                         ["USD-1000 cli: 0.2000 s, baseline 0.1000 s (+100%)"])
+
+    def testStagesOutputIsSameAsProgram(self):
+        with mock.patch("benchmarks.pipelineBenchmark.benchmarkRepeats", 1):
+            result = benchmarkCSVFile(self.directory.name, "HKD", 200)
+        self.assertEqual(result["rows"], 200)
+        self.assertEqual(list(result["seconds"]), benchmarkStages)
+        self.assertEqual(list(result["calibratedSeconds"]), benchmarkStages)
+        self.assertGreater(min(result["calibrationSeconds"].values()), 0)
+        # Generated file is removed, converted rows of stages are same as output of currency_convert.py
+        self.assertEqual(sorted(os.listdir(self.directory.name)), ["output-cli.csv", "output-stages.csv"])
+        self.assertEqual(self.readFile("output-stages.csv"), self.readFile("output-cli.csv"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,155 @@
+import os
+import threading
+import unittest
+from unittest import mock
+
+from utils.pipelineUtils import iterThreadedItems, consumeThreadedItems
+from utils.currencyUtils import currencyConvertStreamOperation
+from utils.csvUtils import writeCSVFilesChunks
+from utils.fixedPointUtils import parseRate
+
+from tests.csvFixtures import CSVFileTestCase
+
+
+class ThreadedItemsTest(unittest.TestCase):
+
+    def joinThreads(self, threadName: str):
+        for thread in threading.enumerate():
+            if thread.name == threadName:
+                thread.join(5)
+                self.assertFalse(thread.is_alive(), threadName)
+
+    def iterItems(self, count: int, failAt: int = None, closed: list = None):
+        try:
+            for item in range(count):
+                if item == failAt:
+                    raise ValueError(f"Item {item} is invalid")
+                yield item
+        finally:
+            if closed is not None:
+                closed.append(True)
+
+    def testProducerErrorIsRaisedAfterEarlierItems(self):
+        consumed = []
+        with self.assertRaisesRegex(ValueError, "Item 10 is invalid"):
+            for item in iterThreadedItems(self.iterItems(100, 10), 2):
+                consumed.append(item)
+        self.assertEqual(consumed, list(range(10)))
+        self.joinThreads("reader")
+
+    def testClosedConsumerStopsProducer(self):
+        closed = []
+        items = iterThreadedItems(self.iterItems(100000, closed=closed), 2)
+        self.assertEqual([next(items) for item in range(5)], list(range(5)))
+        items.close()
+        self.joinThreads("reader")
+        self.assertEqual(closed, [True])
+
+    def testProducerErrorIsReturnedByConsumer(self):
+        consumed = []
+
+        def consumeItems(items):
+            consumed.extend(items)
+            return [True, "Consumed"]
+
+        result = consumeThreadedItems(consumeItems, self.iterItems(100, 10), 2)
+        self.assertFalse(result[0])
+        self.assertEqual(str(result[1]), "Item 10 is invalid")
+        self.assertEqual(consumed, list(range(10)))
+        self.joinThreads("writer")
+
+    def testConsumerFailureStopsProducer(self):
+        closed = []
+        items = self.iterItems(100000, closed=closed)
+
+        def consumeItems(queueItems):
+            next(queueItems)
+            return [False, "Output file can not be written"]
+
+        # Calling thread stops producing items when consumer thread is not running, instead of waiting on full queue
+        result = consumeThreadedItems(consumeItems, items, 2)
+        self.assertEqual(result, [False, "Output file can not be written"])
+        items.close()
+        self.assertEqual(closed, [True])
+        self.joinThreads("writer")
+
+
+class PipelineOperationTest(CSVFileTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.input = self.writeCSVFile("input.csv", self.generateCSVRows(0, 2000))
+        self.convertArgs = [[1], [parseRate("0.5")], ["EUR"]]
+        # Small blocks, so reader thread is several blocks ahead of converter when an error is raised
+        self.patchers = [mock.patch("utils.currencyUtils.csvChunkRows", 16)]
+        for patcher in self.patchers:
+            patcher.start()
+
+    def tearDown(self):
+        for patcher in self.patchers:
+            patcher.stop()
+        super().tearDown()
+
+    def convert(self, output: str, pipeline: bool) -> list:
+        return currencyConvertStreamOperation(*self.convertArgs, self.input, self.getPath(output), pipeline=pipeline)
+
+    def assertThreadsStopped(self):
+        for thread in threading.enumerate():
+            if thread.name in ["reader", "writer"]:
+                thread.join(5)
+                self.assertFalse(thread.is_alive(), thread.name)
+
+    def testInvalidRowFailsSameAsStreamMode(self):
+        inputData = self.readFile("input.csv")
+        # Invalid row is in first block, in a later block and last row of input
+        for rowNumber in [1, 1000, 2000]:
+            csvRows = inputData.split(b"\r\n")
+            csvRows[rowNumber] = b"bad|$1.0x |x|1|y|z"
+            with open(self.input, "wb") as csvFile:
+                csvFile.write(b"\r\n".join(csvRows))
+            expected = self.convert("stream.csv", False)
+            self.assertFalse(expected[0])
+            result = self.convert("pipeline.csv", True)
+            self.assertFalse(result[0])
+            self.assertEqual(str(result[1]), str(expected[1]), rowNumber)
+            self.assertEqual(os.listdir(self.directory.name), ["input.csv"], rowNumber)
+            self.assertThreadsStopped()
+
+    def testReaderErrorIsReturned(self):
+        with open(self.input, "ab") as csvFile:
+            csvFile.write(b"feed\xff|$1.00 |x|1|y|z\r\n")
+        result = self.convert("pipeline.csv", True)
+        self.assertFalse(result[0])
+        self.assertIsInstance(result[1], UnicodeDecodeError)
+        self.assertEqual(os.listdir(self.directory.name), ["input.csv"])
+        self.assertThreadsStopped()
+
+    def testWriterErrorIsReturned(self):
+        # Output directory does not exist, so writer thread fails before first chunk
+        expected = self.convert(os.path.join("missing", "stream.csv"), False)
+        self.assertFalse(expected[0])
+        result = self.convert(os.path.join("missing", "stream.csv"), True)
+        self.assertFalse(result[0])
+        self.assertEqual(str(result[1]), str(expected[1]))
+        self.assertThreadsStopped()
+
+        # Writer thread fails after some chunks are written
+        def iterWrittenChunks(csvChunks):
+            for chunkNumber, csvChunk in enumerate(csvChunks):
+                if chunkNumber == 3:
+                    raise OSError("No space left on device")
+                yield csvChunk
+
+        def writeFirstChunks(csvColumns, csvChunks, fileNames):
+            return writeCSVFilesChunks(csvColumns, iterWrittenChunks(csvChunks), fileNames)
+
+        with mock.patch("utils.currencyUtils.writeCSVFilesChunks", writeFirstChunks):
+            result = self.convert("pipeline.csv", True)
+        self.assertFalse(result[0])
+        self.assertEqual(str(result[1]), "No space left on device")
+        self.assertEqual(os.listdir(self.directory.name), ["input.csv"])
+        self.assertThreadsStopped()
+
+
+if __name__ == "__main__":
+    unittest.main()
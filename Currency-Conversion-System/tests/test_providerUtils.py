@@ -0,0 +1,115 @@
+import io
+import os
+import json
+import tempfile
+import threading
+import unittest
+from contextlib import redirect_stderr
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from utils.rateUtils import parseBaseRates
+from utils.providerUtils import providerConnections, getProviderRates, getProviderCachePath
+
+
+# Response of test rate provider and base rates parsed from it
+providerResponse = {"base": "USD", "rates": {"EUR": 0.92, "INR": 83.2, "KRW": 1312.5}}
+
+providerRates = parseBaseRates([["USD", "1"], ["EUR", "0.92"], ["INR", "83.2"], ["KRW", "1312.5"]], "Test Rates")
+
+
+class RatesRequestHandler(BaseHTTPRequestHandler):
+    # Keep-alive connections are only kept open with HTTP/1.1
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        self.server.connections += 1
+
+    def do_GET(self):
+        self.server.requests += 1
+        responseData = json.dumps(providerResponse).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(responseData)))
+        self.end_headers()
+        self.wfile.write(responseData)
+        # Connection is closed without "Connection: close" header, same as server closing idle keep-alive connection
+        if self.server.closeAfterResponse:
+            self.close_connection = True
+
+    def log_message(self, format, *args):
+        pass
+
+
+class ProviderRatesTest(unittest.TestCase):
+
+    def setUp(self):
+        self.closeConnections()
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), RatesRequestHandler)
+        self.server.connections = 0
+        self.server.requests = 0
+        self.server.closeAfterResponse = False
+        self.serverThread = threading.Thread(target=self.server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+        self.serverThread.start()
+        self.provider = f"http://127.0.0.1:{self.server.server_address[1]}/rates.json"
+        self.cacheDirectory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.closeConnections()
+        self.stopServer()
+        self.cacheDirectory.cleanup()
+
+    def closeConnections(self):
+        for connection in providerConnections.values():
+            connection.close()
+        providerConnections.clear()
+
+    def stopServer(self):
+        if self.serverThread.is_alive():
+            self.server.shutdown()
+            self.server.server_close()
+            self.serverThread.join()
+
+    def testFetchRates(self):
+        self.assertEqual(getProviderRates(self.provider, 3600, self.cacheDirectory.name), providerRates)
+        self.assertEqual(self.server.requests, 1)
+        self.assertTrue(os.path.exists(getProviderCachePath(self.cacheDirectory.name, self.provider)))
+
+    def testCachedRatesWithinTTLSendNoRequest(self):
+        getProviderRates(self.provider, 3600, self.cacheDirectory.name)
+        self.assertEqual(getProviderRates(self.provider, 3600, self.cacheDirectory.name), providerRates)
+        self.assertEqual(self.server.requests, 1)
+        # Rates are fetched again when they are older than TTL
+        self.assertEqual(getProviderRates(self.provider, 0, self.cacheDirectory.name), providerRates)
+        self.assertEqual(self.server.requests, 2)
+
+    def testKeepAliveConnectionIsReused(self):
+        for i in range(3):
+            self.assertEqual(getProviderRates(self.provider, 0, self.cacheDirectory.name), providerRates)
+        self.assertEqual(self.server.requests, 3)
+        self.assertEqual(self.server.connections, 1)
+
+    def testClosedKeepAliveConnectionIsRetried(self):
+        self.server.closeAfterResponse = True
+        getProviderRates(self.provider, 0, self.cacheDirectory.name)
+        self.assertEqual(len(providerConnections), 1)
+        self.assertEqual(getProviderRates(self.provider, 0, self.cacheDirectory.name), providerRates)
+        self.assertEqual(self.server.requests, 2)
+        self.assertEqual(self.server.connections, 2)
+
+    def testLastKnownRatesAreUsedWhenProviderIsDown(self):
+        getProviderRates(self.provider, 0, self.cacheDirectory.name)
+        self.closeConnections()
+        self.stopServer()
+        with redirect_stderr(io.StringIO()) as stderr:
+            self.assertEqual(getProviderRates(self.provider, 0, self.cacheDirectory.name), providerRates)
+        self.assertIn("Last known rates", stderr.getvalue())
+
+    def testProviderDownWithoutCachedRates(self):
+        self.stopServer()
+        with self.assertRaisesRegex(ValueError, "no last known rates are cached"):
+            getProviderRates(self.provider, 3600, self.cacheDirectory.name)
+
+
+if __name__ == "__main__":
+    unittest.main()
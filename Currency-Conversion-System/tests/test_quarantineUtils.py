@@ -0,0 +1,83 @@
+import os
+import unittest
+
+from constants.csvConstants import csvSeprator
+
+from utils.currencyUtils import currencyConvertStreamOperation
+from utils.fixedPointUtils import parseRate
+
+from tests.csvFixtures import CSVFileTestCase
+
+
+# Invalid rows and their index in input rows: null element, wrong number of columns and invalid currency value
+invalidRows = [(4, ["bad1", "", "Source", "1483800000", "/mirror", "/r"]), (20, ["bad2", "$1.00 "]),
+               (41, ["bad3", "$1.0x ", "Source", "1483800000", "/mirror", "/r"])]
+
+
+class QuarantineTest(CSVFileTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.validRows = self.generateCSVRows(0, 50)
+        csvRows = list(self.validRows)
+        for rowIndex, invalidRow in invalidRows:
+            csvRows.insert(rowIndex, invalidRow)
+        self.input = self.writeCSVFile("input.csv", csvRows)
+        self.writeCSVFile("valid.csv", self.validRows)
+        self.output = self.getPath("output.csv")
+        self.rejectFile = self.getPath("output-rejects.csv")
+
+    def convertQuarantined(self, maxErrors: int, pipeline: bool = False, input: str = None) -> list:
+        return currencyConvertStreamOperation([1], [parseRate("0.73")], ["INR"], input or self.input, self.output, pipeline=pipeline,
+                                              quarantine={"maxErrors": maxErrors})
+
+    def testInvalidRowsAreRejectedWithLineNumbers(self):
+        # Memory mapped file blocks and decoded rows of pipeline mode reject same rows
+        for pipeline in [False, True]:
+            result = self.convertQuarantined(1000, pipeline)
+            self.assertTrue(result[0], result[1])
+            self.assertIn(f"Converted Rows: 50, Rejected Rows: 3 ({self.rejectFile})", result[1])
+            rejectRows = self.readFile("output-rejects.csv").decode("utf-8-sig").split("\r\n")
+            self.assertEqual(rejectRows[0], "Line|Reason|Feed Name|Price Per Month|Source Name|Last Update|Remote Name|Local Name")
+            self.assertEqual([rejectRow.split(csvSeprator, 2)[0] for rejectRow in rejectRows[1:-1]], [str(rowIndex + 2) for rowIndex, invalidRow in invalidRows])
+            self.assertEqual([rejectRow.split(csvSeprator, 2)[2] for rejectRow in rejectRows[1:-1]], [csvSeprator.join(invalidRow) for rowIndex, invalidRow in invalidRows])
+            self.assertIn("null element", rejectRows[1])
+            self.assertIn("total number of columns", rejectRows[2])
+
+            # Valid rows are converted same as file without invalid rows
+            expected = currencyConvertStreamOperation([1], [parseRate("0.73")], ["INR"], self.getPath("valid.csv"), self.getPath("expected.csv"))
+            self.assertTrue(expected[0], expected[1])
+            self.assertEqual(self.readFile("output.csv"), self.readFile("expected.csv"))
+
+    def testMaxErrorsInvalidRowsAreAccepted(self):
+        result = self.convertQuarantined(3)
+        self.assertTrue(result[0], result[1])
+        self.assertIn("Rejected Rows: 3", result[1])
+
+    def testMoreThanMaxErrorsInvalidRowsAbort(self):
+        for pipeline in [False, True]:
+            result = self.convertQuarantined(2, pipeline)
+            self.assertFalse(result[0])
+            self.assertIn("More than 2 rows are invalid (--max-errors), last invalid row is at line 43", str(result[1]))
+            self.assertFalse(os.path.exists(self.output))
+            # Reject file keeps rows found before conversion is aborted
+            self.assertEqual(len(self.readFile("output-rejects.csv").decode("utf-8-sig").split("\r\n")), 5)
+
+    def testZeroMaxErrorsAbortsOnFirstInvalidRow(self):
+        result = self.convertQuarantined(0)
+        self.assertFalse(result[0])
+        self.assertIn("More than 0 rows are invalid (--max-errors), last invalid row is at line 6", str(result[1]))
+        self.assertTrue(self.readFile("output-rejects.csv").decode("utf-8-sig").split("\r\n")[1].startswith("6|"))
+
+    def testRejectFileIsOnlyCreatedForInvalidRows(self):
+        self.convertQuarantined(1000)
+        self.assertTrue(os.path.exists(self.rejectFile))
+        # Reject file of previous run is removed
+        result = self.convertQuarantined(0, input=self.getPath("valid.csv"))
+        self.assertTrue(result[0], result[1])
+        self.assertIn("Converted Rows: 50, Rejected Rows: 0", result[1])
+        self.assertFalse(os.path.exists(self.rejectFile))
+
+
+if __name__ == "__main__":
+    unittest.main()
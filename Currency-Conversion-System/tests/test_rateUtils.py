@@ -0,0 +1,141 @@
+import os
+import unittest
+from unittest import mock
+from bisect import bisect_right
+from fractions import Fraction
+
+from constants.currencyConstants import rateDigits
+
+from utils.formatUtils import currencySymbolMatcher, formatCurrencyMinorUnits
+from utils.csvUtils import validateCSVCurrency
+from utils.rateUtils import parseBaseRates, getCrossRates, getAmountsCurrencies, getAmountsCrossRates, getRowsRates, readRatesFile, getRate, rateLookups
+from utils.currencyUtils import currencyConvertStreamOperation
+from utils.fixedPointUtils import parseRate
+
+from tests.csvFixtures import CSVFileTestCase
+
+
+# Base rates of base rates file, cross rate of EUR to INR has more than rateDigits fraction digits
+baseRatesRows = [["USD", "1"], ["EUR", "0.92"], ["INR", "83.2"], ["HKD", "7.8"], ["BRL", "5.0"], ["KRW", "1330"]]
+
+
+class MixedCurrencyTest(CSVFileTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.baseRates = parseBaseRates(baseRatesRows, "Test Base Rates")
+        self.crossRates = getCrossRates(self.baseRates)
+
+    def testLongestSymbolIsMatched(self):
+        for currencyData, currencySymbol in [("HK$1,234.50 ", "HK$"), ("R$ 1.234,50 ", "R$"), ("$1,234.50 ", "$"), ("1 234,50 €", "€"), ("₩1,234 ", "₩")]:
+            self.assertEqual(currencySymbolMatcher.search(currencyData).group(), currencySymbol)
+        # A symbol is not matched as part of longer symbol which is not supported
+        self.assertIsNone(currencySymbolMatcher.search("C$ 1,234.50"))
+
+    def testCurrencyOfEachAmount(self):
+        csvRows = [["a", "HK$1,234.50 ", "R$ 1.234,50 "], ["b", "$1,234.50 ", "₹ 1,234.50"]]
+        self.assertEqual(getAmountsCurrencies(csvRows, [1, 2]), ["HKD", "BRL", "USD", "INR"])
+        self.assertEqual(validateCSVCurrency("R$ 1.234,50 ", "", True)[2:], ["R$", 123450])
+        self.assertEqual(validateCSVCurrency("HK$1,234.50 ", "", True)[2:], ["HK$", 123450])
+
+    def testCrossRatesAreExact(self):
+        self.assertEqual(self.crossRates[("USD", "EUR")], parseRate("0.92"))
+        self.assertEqual(self.crossRates[("EUR", "EUR")], parseRate("1"))
+        numerator, denominator = self.crossRates[("EUR", "INR")]
+        self.assertEqual(Fraction(numerator, denominator * 10 ** rateDigits), Fraction("83.2") / Fraction("0.92"))
+        with self.assertRaisesRegex(ValueError, "Base Rates do not contain rate of GBP"):
+            getAmountsCrossRates(["USD", "GBP"], self.crossRates, "INR")
+
+    def testConvertedAmountsAreRoundedOnce(self):
+        csvRows = self.generateCSVRows(0, 4, "HKD") + self.generateCSVRows(4, 8, "BRL") + self.generateCSVRows(8, 12, "USD") + self.generateCSVRows(12, 16, "EUR")
+        # Rounding cross rate to rateDigits before multiplying gives 9,04,34,78,610 rupees
+        csvRows[-1][1] = formatCurrencyMinorUnits(1000000000, "fr_FR")
+        self.writeCSVFile("mixed.csv", csvRows)
+        sourceCurrencies = getAmountsCurrencies(csvRows, [1])
+        sourceAmounts = [validateCSVCurrency(csvRow[1], "", True)[3] for csvRow in csvRows]
+
+        result = currencyConvertStreamOperation([1], [parseRate("1")], ["INR"], self.getPath("mixed.csv"), self.getPath("output.csv"),
+                                                rates={"crossRates": self.crossRates})
+        self.assertTrue(result[0], result[1])
+        convertedRows = self.readFile("output.csv").decode("utf-8-sig").splitlines()[1:]
+        for convertedRow, sourceCurrency, sourceAmount in zip(convertedRows, sourceCurrencies, sourceAmounts):
+            exactAmount = Fraction(sourceAmount) * Fraction(baseRatesRows[2][1]) / Fraction(dict(baseRatesRows)[sourceCurrency])
+            self.assertEqual(convertedRow.split("|")[1], formatCurrencyMinorUnits(round(exactAmount), "en_IN"))
+        self.assertEqual(convertedRows[-1].split("|")[1], "₹ 90,43,47,826.09")
+
+
+# Rate changes of USD to EUR of rates file
+ratesPoints = [(1483800000 + 600 * point, f"0.{90 + point % 9}") for point in range(40)]
+
+
+class HistoricalRatesTest(CSVFileTestCase):
+
+    def setUp(self):
+        super().setUp()
+        rateLookups.clear()
+        self.writeRatesFile(ratesPoints)
+        # Rows with 300 distinct timestamps (3rd column) between rate changes
+        self.csvRows = [["feed", "$1.00 ", str(1483800000 + 79 * rowNumber)] for rowNumber in range(300)]
+        self.rates = {"ratesFile": self.getPath("rates.csv"), "timestampField": 2}
+
+    def writeRatesFile(self, points: list):
+        self.writeCSVFile("rates.csv", [["USD", "EUR", str(timestamp), rate] for timestamp, rate in points], ["Source", "Destination", "Timestamp", "Rate"])
+
+    def getExpectedRates(self, points: list) -> list:
+        timestamps = [timestamp for timestamp, rate in points]
+        return [parseRate(points[bisect_right(timestamps, int(csvRow[2])) - 1][1]) for csvRow in self.csvRows]
+
+    def testRatesFileIsCheckedOncePerChunk(self):
+        readRatesFile(self.rates["ratesFile"])
+        with mock.patch("utils.rateUtils.os.stat", wraps=os.stat) as statMock:
+            self.assertEqual(getRowsRates(self.csvRows, self.rates, "USD", "EUR"), self.getExpectedRates(ratesPoints))
+            self.assertEqual(statMock.call_count, 1)
+            # Repeated timestamps of next chunk are found in lookups
+            self.assertEqual(getRowsRates(self.csvRows, self.rates, "USD", "EUR", 2), [rate for rate in self.getExpectedRates(ratesPoints) for _ in range(2)])
+            self.assertEqual(statMock.call_count, 2)
+        self.assertEqual(len(rateLookups), 300)
+
+    def testEditedRatesFileIsUsedByNextChunk(self):
+        getRowsRates(self.csvRows, self.rates, "USD", "EUR")
+        editedPoints = [(timestamp, rate + "5") for timestamp, rate in ratesPoints]
+        self.writeRatesFile(editedPoints)
+        os.utime(self.rates["ratesFile"], ns=(1, 1))
+        self.assertEqual(getRowsRates(self.csvRows, self.rates, "USD", "EUR"), self.getExpectedRates(editedPoints))
+
+    def testLookupsAreBounded(self):
+        with mock.patch("utils.rateUtils.ratesLookupCacheSize", 100):
+            for _ in range(3):
+                self.assertEqual(getRowsRates(self.csvRows, self.rates, "USD", "EUR"), self.getExpectedRates(ratesPoints))
+                self.assertLessEqual(len(rateLookups), 100)
+
+    def testRecentlyUsedLookupsAreNotEvicted(self):
+        hotRows = self.csvRows[:10]
+        with mock.patch("utils.rateUtils.ratesLookupCacheSize", 100), mock.patch("utils.rateUtils.getRate", wraps=getRate) as getRateMock:
+            for chunkStart in range(10, 300, 40):
+                self.assertEqual(getRowsRates(hotRows, self.rates, "USD", "EUR"), self.getExpectedRates(ratesPoints)[:10])
+                getRowsRates(self.csvRows[chunkStart:chunkStart + 40], self.rates, "USD", "EUR")
+        # Timestamps used by each chunk are searched once, though oldest lookups are evicted many times
+        self.assertEqual(getRateMock.call_count, 300)
+        self.assertLessEqual(len(rateLookups), 100)
+
+    def testEditedRatesFileIsUsedByNextConversion(self):
+        self.writeCSVFile("input.csv", self.csvRows, ["Feed Name", "Price Per Month", "Last Update"])
+        for points in [ratesPoints, [(timestamp, rate + "5") for timestamp, rate in ratesPoints]]:
+            self.writeRatesFile(points)
+            # Same size and modified time as previous rates file on file systems with coarse timestamps, only content is changed
+            os.utime(self.rates["ratesFile"], ns=(1, 1))
+            result = currencyConvertStreamOperation([1], [None], ["EUR"], self.getPath("input.csv"), self.getPath("output.csv"), rates=self.rates)
+            self.assertTrue(result[0], result[1])
+            convertedPrices = [convertedRow.split("|")[1] for convertedRow in self.readFile("output.csv").decode("utf-8-sig").splitlines()[1:]]
+            self.assertEqual(convertedPrices, [formatCurrencyMinorUnits(round(Fraction(100 * rate, 10 ** rateDigits)), "fr_FR")
+                                               for rate in self.getExpectedRates(points)])
+
+    def testMissingRates(self):
+        with self.assertRaisesRegex(ValueError, "Rates File does not contain rates from USD to INR"):
+            getRowsRates(self.csvRows, self.rates, "USD", "INR")
+        with self.assertRaisesRegex(ValueError, "Rates File does not contain rate from USD to EUR at timestamp 1483799999"):
+            getRowsRates([["feed", "$1.00 ", "1483799999"]], self.rates, "USD", "EUR")
+
+
+if __name__ == "__main__":
+    unittest.main()
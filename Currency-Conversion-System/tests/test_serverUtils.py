@@ -0,0 +1,107 @@
+import os
+import asyncio
+import tempfile
+import threading
+import unittest
+from unittest import mock
+from functools import partial
+from http.client import HTTPConnection
+from urllib.parse import urlencode
+
+from utils.serverUtils import handleConnection
+from utils.currencyUtils import currencyConvertStreamOperation
+from utils.fixedPointUtils import parseRate
+
+from tests.csvFixtures import CSVFileTestCase
+
+
+class ServerFilesTest(CSVFileTestCase):
+
+    def setUp(self):
+        super().setUp()
+        # Current directory of server is a subdirectory, secret files are next to it
+        self.basePath = self.getPath("server")
+        os.mkdir(self.basePath)
+        self.writeCSVFile("server/input.csv", self.generateCSVRows(0, 20))
+        self.writeCSVFile("secret.csv", self.generateCSVRows(20, 25))
+        self.writeCSVFile("rates.csv", [["USD", "EUR", "0", "0.5"]], ["Source", "Destination", "Timestamp", "Rate"])
+        self.outsideDirectory = tempfile.TemporaryDirectory()
+        self.writeCSVFile(os.path.join(self.outsideDirectory.name, "outside.csv"), self.generateCSVRows(25, 30))
+        os.symlink(self.getPath("secret.csv"), os.path.join(self.basePath, "link.csv"))
+
+        self.basePathPatch = mock.patch("utils.argUtils.csvFileBasePath", self.basePath)
+        self.basePathPatch.start()
+        self.startServer()
+
+    def tearDown(self):
+        self.stopServer()
+        self.basePathPatch.stop()
+        self.outsideDirectory.cleanup()
+        super().tearDown()
+
+    def startServer(self):
+        self.loop = asyncio.new_event_loop()
+        serverStarted = threading.Event()
+
+        async def runServer():
+            self.serverTask = asyncio.current_task()
+            self.server = await asyncio.start_server(partial(handleConnection, asyncio.Semaphore(4)), "127.0.0.1", 0)
+            serverStarted.set()
+            try:
+                await self.server.serve_forever()
+            except asyncio.CancelledError:
+                # Keep-alive connections are closed before loop is closed
+                connectionTasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+                for task in connectionTasks:
+                    task.cancel()
+                await asyncio.gather(*connectionTasks, return_exceptions=True)
+                await asyncio.sleep(0)
+
+        self.serverThread = threading.Thread(target=self.loop.run_until_complete, args=(runServer(),), daemon=True)
+        self.serverThread.start()
+        serverStarted.wait(5)
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    def stopServer(self):
+        self.loop.call_soon_threadsafe(self.serverTask.cancel)
+        self.serverThread.join(5)
+        self.loop.close()
+
+    def postConvert(self, **query) -> list:
+        connection = HTTPConnection("127.0.0.1", self.port, timeout=5)
+        try:
+            connection.request("POST", "/convert?" + urlencode({"field": "2", "symbol": "EUR", **query}), body=b"")
+            response = connection.getresponse()
+            return [response.status, response.read()]
+        finally:
+            connection.close()
+
+    def testInputFileInCurrentDirectory(self):
+        status, responseData = self.postConvert(multiplier="0.5", input="input.csv")
+        self.assertEqual(status, 200, responseData)
+        result = currencyConvertStreamOperation([1], [parseRate("0.5")], ["EUR"], os.path.join(self.basePath, "input.csv"), self.getPath("output.csv"))
+        self.assertTrue(result[0], result[1])
+        self.assertEqual(responseData.decode("utf-8-sig").splitlines()[1:], self.readFile("output.csv").decode("utf-8-sig").splitlines()[1:])
+
+    def testInputFileOutsideCurrentDirectoryIsRejected(self):
+        for input in [self.getPath("secret.csv"), "../secret.csv", "./../secret.csv", "link.csv", os.path.join(self.outsideDirectory.name, "outside.csv"),
+                      "../" * 20 + self.getPath("secret.csv").lstrip("/")]:
+            status, responseData = self.postConvert(multiplier="0.5", input=input)
+            self.assertEqual(status, 400, input)
+            self.assertIn(b"Input file does not exist", responseData)
+            self.assertNotIn(b"Feed Name", responseData)
+
+    def testRatesFileOutsideCurrentDirectoryIsRejected(self):
+        for ratesFile in [self.getPath("rates.csv"), "../rates.csv"]:
+            status, responseData = self.postConvert(**{"rates-file": ratesFile, "input": "input.csv"})
+            self.assertEqual(status, 400, ratesFile)
+            self.assertIn(b"Rates file does not exist in current directory", responseData)
+        # Rates file in current directory is used
+        self.writeCSVFile("server/rates.csv", [["USD", "EUR", "0", "0.5"]], ["Source", "Destination", "Timestamp", "Rate"])
+        status, responseData = self.postConvert(**{"rates-file": "rates.csv", "input": "input.csv"})
+        self.assertEqual(status, 200, responseData)
+        self.assertEqual(responseData, self.postConvert(multiplier="0.5", input="input.csv")[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
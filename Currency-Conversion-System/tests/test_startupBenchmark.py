@@ -0,0 +1,68 @@
+import os
+import codecs
+import shutil
+import unittest
+
+from constants.benchmarkConstants import startupDeferredModules
+
+from utils.vectorUtils import isVectorBackendAvailable
+
+from benchmarks.startupBenchmark import projectPath, startupScenarios, parseImportTime, runStartupScenario
+from tests.csvFixtures import CSVFileTestCase
+
+
+# python -X importtime lines of self time, cumulative time (microseconds) and module name, nested imports are indented
+importTimeOutput = """import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:       300 |        800 | utils.csvUtils
+import time:       500 |        500 |   constants.csvConstants
+import time:       200 |       1500 | constants
+import time:        90 |         90 | json
+"""
+
+
+class StartupBenchmarkTest(CSVFileTestCase):
+
+    def setUp(self):
+        super().setUp()
+        shutil.copy(os.path.join(projectPath, "data.csv"), self.directory.name)
+
+    def getDeferredModules(self, importedModules: list) -> list:
+        return sorted({deferred for moduleName in importedModules for deferred in startupDeferredModules
+                       if moduleName == deferred or moduleName.startswith(deferred + ".")})
+
+    def testParseImportTime(self):
+        # Only top-level project imports are added, their cumulative time includes nested imports
+        importMs, importedModules = parseImportTime(importTimeOutput)
+        self.assertAlmostEqual(importMs, 2.3)
+        self.assertEqual(importedModules, ["_io", "utils.csvUtils", "constants.csvConstants", "constants", "json"])
+
+    def testStartupDoesNotImportDeferredModules(self):
+        for scenarioName, args in startupScenarios.items():
+            wallMs, importMs, importedModules = runStartupScenario(args, self.directory.name)
+            self.assertIn("utils.argUtils", importedModules, scenarioName)
+            self.assertEqual(self.getDeferredModules(importedModules), [], scenarioName)
+        self.assertTrue(os.path.exists(self.getPath("output.csv")))
+
+    def testDeferredModulesAreImportedByTheirPaths(self):
+        csvRows = self.generateCSVRows(0, 200)
+        for csvRow in csvRows:
+            csvRow[2] = csvRow[2] + " Société Générale"
+        self.writeCSVFile("input.csv", csvRows)
+        with open(self.getPath("plain.csv"), "wb") as csvFile:
+            csvFile.write(self.readFile("input.csv")[len(codecs.BOM_UTF8):])
+        convertArgs = ["--field", "2", "--multiplier", "0.5", "--symbol", "inr"]
+        runStartupScenario(convertArgs + ["-i", "input.csv", "-o", "output.csv", "--encoding", "UTF-8-SIG"], self.directory.name)
+        # File without Byte Order Mark is detected with chardet and --workers uses process pool
+        scenarios = [(["-i", "plain.csv", "-o", "detected.csv"], "chardet"), (["-i", "input.csv", "-o", "workers.csv", "--workers", "2"], "concurrent.futures.process")]
+        if isVectorBackendAvailable():
+            scenarios.append((["-i", "input.csv", "-o", "numpy.csv", "--backend", "numpy"], "numpy"))
+        for args, deferredModule in scenarios:
+            wallMs, importMs, importedModules = runStartupScenario(convertArgs + args, self.directory.name)
+            self.assertEqual(self.getDeferredModules(importedModules), [deferredModule], args)
+            # Output of each path is same as default conversion
+            self.assertEqual(self.readFile(args[3]), self.readFile("output.csv"), args)
+
+
+if __name__ == "__main__":
+    unittest.main()
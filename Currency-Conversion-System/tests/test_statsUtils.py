@@ -0,0 +1,81 @@
+import os
+import sys
+import json
+import time
+import unittest
+import subprocess
+
+from utils.statsUtils import addStatsHook, removeStatsHook, startStats, finishStats, statsStage
+from utils.currencyUtils import currencyConvertOperation
+from utils.fixedPointUtils import parseRate
+
+from tests.csvFixtures import CSVFileTestCase
+
+
+class StatsTest(CSVFileTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.input = self.writeCSVFile("input.csv", self.generateCSVRows(0, 500) + self.generateCSVRows(0, 500))
+        self.stats = []
+        addStatsHook(self.stats.append)
+
+    def tearDown(self):
+        removeStatsHook(self.stats.append)
+        super().tearDown()
+
+    def testStatsOfEachMode(self):
+        removeStatsHook(self.stats.append)
+        expected = currencyConvertOperation([1], [parseRate("0.5")], ["EUR"], self.input, self.getPath("expected.csv"))
+        self.assertTrue(expected[0], expected[1])
+        addStatsHook(self.stats.append)
+        for options in [{}, {"stream": True}, {"stream": True, "pipeline": True}, {"workers": 2}]:
+            result = currencyConvertOperation([1], [parseRate("0.5")], ["EUR"], self.input, self.getPath("output.csv"), options)
+            self.assertTrue(result[0], result[1])
+            # Output is same as conversion without stats
+            self.assertEqual(self.readFile("output.csv"), self.readFile("expected.csv"), options)
+            stats = self.stats.pop()
+            self.assertEqual(stats["status"], True)
+            self.assertEqual(stats["rows"], 1000, options)
+            self.assertEqual(stats["bytesRead"], os.path.getsize(self.input), options)
+            self.assertEqual(stats["bytesWritten"], os.path.getsize(self.getPath("output.csv")), options)
+            self.assertGreater(stats["rowsPerSecond"], 0)
+            self.assertIn("convert", stats["stages"], options)
+            self.assertEqual(set(stats["memo"]), {"parse", "convert"})
+        self.assertEqual(self.stats, [])
+
+    def testFailedOperation(self):
+        self.writeCSVFile("input.csv", [["bad", "$1.0x ", "x", "1", "y", "z"]], mode="a")
+        result = currencyConvertOperation([1], [parseRate("0.5")], ["EUR"], self.input, self.getPath("output.csv"), {"stream": True})
+        self.assertFalse(result[0])
+        self.assertEqual(self.stats[-1]["status"], False)
+
+    def testStageTimesExcludeInnerStages(self):
+        startStats()
+        with statsStage("outer"):
+            time.sleep(0.02)
+            with statsStage("inner"):
+                time.sleep(0.05)
+        stats = finishStats()
+        self.assertGreaterEqual(stats["stages"]["inner"], 0.05)
+        self.assertLess(stats["stages"]["outer"], 0.05)
+        self.assertLessEqual(stats["stages"]["outer"] + stats["stages"]["inner"], stats["seconds"])
+
+    def testStatsOption(self):
+        # One JSON line is appended to stats file (or written to stderr) for each run, converted output is same as run without --stats
+        convertArgs = [sys.executable, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "currency_convert.py"),
+                       "--field", "2", "--multiplier", "0.5", "--symbol", "EUR", "-i", "input.csv"]
+        subprocess.run(convertArgs + ["-o", "expected.csv"], cwd=self.directory.name, stdout=subprocess.DEVNULL, check=True)
+        for run in range(2):
+            subprocess.run(convertArgs + ["-o", "output.csv", "--stats", "stats.jsonl"], cwd=self.directory.name, stdout=subprocess.DEVNULL, check=True)
+            self.assertEqual(self.readFile("output.csv"), self.readFile("expected.csv"))
+        statsLines = self.readFile("stats.jsonl").decode().splitlines()
+        self.assertEqual(len(statsLines), 2)
+        self.assertEqual([json.loads(statsLine)["rows"] for statsLine in statsLines], [1000, 1000])
+        self.assertIn("validateArgs", json.loads(statsLines[0])["stages"])
+        process = subprocess.run(convertArgs + ["-o", "-", "--stats"], cwd=self.directory.name, capture_output=True, check=True)
+        self.assertEqual(json.loads(process.stderr.decode().splitlines()[-1])["bytesWritten"], len(process.stdout))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+import random
+import unittest
+from unittest import mock
+
+from constants.currencyConstants import roundingModes, rateDigits, localeToCurrencyFormat
+
+from utils.vectorUtils import isVectorBackendAvailable, multiplyMinorUnitsVectorized, roundDivideVectorized, formatCurrencyMinorUnitsVectorized
+from utils.formatUtils import formatCurrencyMinorUnits
+from utils.fixedPointUtils import parseRate, multiplyMinorUnits
+from utils.memoUtils import clearConversionMemos
+from utils.currencyUtils import currencyConvertOperation
+
+from tests.csvFixtures import CSVFileTestCase
+
+
+def generateAmountText(randomValues: random.Random) -> str:
+    """
+    This function returns random USD price of a CSV row: negative, exact half, large or with more than 2 fraction digits
+
+    @type randomValues: Random
+    @param randomValues: Random Number Generator
+
+    @rtype: String
+    @returns: Price Per Month with currency symbol and trailing space
+    """
+    amountKind = randomValues.choices(["small", "half", "large", "fraction"], [5, 3, 2, 1])[0]
+    if amountKind == "half":
+        # Odd minor units multiplied by 0.5 are exact halves of a cent, odd whole units are exact halves of a won
+        minorUnits = randomValues.choice([randomValues.randint(0, 10 ** 4) * 2 + 1, randomValues.randint(0, 10 ** 3) * 200 + 100])
+    elif amountKind == "large":
+        # Products of large amounts may not fit in 64 bit integers, so their blocks are multiplied with python integers
+        minorUnits = randomValues.randint(10 ** 9, 10 ** 17)
+    else:
+        minorUnits = randomValues.randint(0, 10 ** 6)
+    fractionDigits = f"{minorUnits % 100:02d}" + (str(randomValues.randint(1, 999)) if amountKind == "fraction" else "")
+    sign = " -" if randomValues.random() < 0.3 else ""
+    return f"${sign}{minorUnits // 100:,}.{fractionDigits} "
+
+
+@unittest.skipUnless(isVectorBackendAvailable(), "NumPy is not installed")
+class VectorBackendTest(CSVFileTestCase):
+
+    def setUp(self):
+        super().setUp()
+        clearConversionMemos()
+        randomValues = random.Random(4)
+        self.csvRows = self.generateCSVRows(0, 600)
+        for csvRow in self.csvRows:
+            csvRow[1] = generateAmountText(randomValues)
+        self.input = self.writeCSVFile("input.csv", self.csvRows)
+
+    def tearDown(self):
+        clearConversionMemos()
+        super().tearDown()
+
+    def convertWithBackend(self, backend: str, multiplier: str, currencySymbol: str, roundingMode: str, stream: bool) -> bytes:
+        # Memo of converted amounts is not kept for each backend, so it is cleared before each conversion
+        clearConversionMemos()
+        output = self.getPath(f"output-{backend}.csv")
+        result = currencyConvertOperation([1], [parseRate(multiplier)], [currencySymbol], self.input, output,
+                                          {"stream": stream, "backend": backend, "roundingMode": roundingMode})
+        self.assertTrue(result[0], result[1])
+        return self.readFile(f"output-{backend}.csv")
+
+    def testNumpyBackendIsSameAsScalar(self):
+        # Small blocks of memory mapped file, so some blocks only have amounts whose products fit in 64 bit integers and are multiplied with NumPy
+        with mock.patch("utils.currencyUtils.csvMappedBlockSize", 1024), \
+                mock.patch("utils.vectorUtils.roundDivideVectorized", wraps=roundDivideVectorized) as roundDivide:
+            for roundingMode in roundingModes:
+                for multiplier, currencySymbol in [("0.5", "EUR"), ("0.5", "KRW"), ("83.2", "INR"), ("0.000712", "GBP")]:
+                    for stream in [False, True]:
+                        conversion = (roundingMode, multiplier, currencySymbol, stream)
+                        self.assertEqual(self.convertWithBackend("numpy", multiplier, currencySymbol, roundingMode, stream),
+                                         self.convertWithBackend("scalar", multiplier, currencySymbol, roundingMode, stream), conversion)
+        self.assertTrue(roundDivide.called)
+
+    def testNumpyMultiplyIsSameAsScalar(self):
+        randomValues = random.Random(40)
+        # Products around largest 64 bit integer are multiplied with python integers
+        maxAmount = 2 ** 62 // (10 ** rateDigits * 100)
+        for _ in range(200):
+            multiplier = randomValues.choice([parseRate("0.5"), parseRate("1330"), randomValues.randint(1, 10 ** 12)])
+            amounts = [randomValues.choice([randomValues.randint(-10 ** 6, 10 ** 6), randomValues.randint(-maxAmount, maxAmount), -maxAmount * 2, 50, -50, 150])
+                       for _ in range(randomValues.randint(0, 50))]
+            for roundingMode in roundingModes:
+                for fracDigits in [0, 2]:
+                    self.assertEqual(multiplyMinorUnitsVectorized(amounts, multiplier, fracDigits, roundingMode),
+                                     multiplyMinorUnits(amounts, multiplier, fracDigits, roundingMode), (multiplier, roundingMode, fracDigits))
+
+    def testNumpyFormatIsSameAsScalar(self):
+        randomValues = random.Random(41)
+        # Amounts of each number of digits, halves of a won, largest 64 bit integers and amounts which only fit in python integers
+        minorUnits = [randomValues.randint(-10 ** digits, 10 ** digits) for digits in range(19) for _ in range(50)]
+        minorUnits += [0, 50, -50, 150, -150, 250, 2 ** 63 - 1, -2 ** 63 + 1]
+        for localeOption in localeToCurrencyFormat:
+            expected = [formatCurrencyMinorUnits(minorUnit, localeOption) for minorUnit in minorUnits]
+            with mock.patch("utils.vectorUtils.vectorFormatBatchSize", 97):
+                self.assertEqual(formatCurrencyMinorUnitsVectorized(minorUnits, localeOption), expected, localeOption)
+            for largeMinorUnit in [2 ** 70, -2 ** 63]:
+                self.assertEqual(formatCurrencyMinorUnitsVectorized(minorUnits + [largeMinorUnit], localeOption),
+                                 expected + [formatCurrencyMinorUnits(largeMinorUnit, localeOption)], localeOption)
+
+
+if __name__ == "__main__":
+    unittest.main()
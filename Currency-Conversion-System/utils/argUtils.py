@@ -1,11 +1,60 @@
 import os
+import sys
+import glob
+import codecs
 import argparse
 
-from constants.currencyConstants import supportedCurrencies
-from constants.csvConstants import csvFileBasePath
+from constants.currencyConstants import supportedCurrencies, roundingModes, defaultRoundingMode
+from constants.csvConstants import csvFileBasePath, csvCompressionModules, csvDefaultMaxErrors
+from constants.cacheConstants import cacheDefaultDirectory, cacheDefaultMaxMegabytes
+from constants.providerConstants import providerDefaultTTL
 
-from utils.csvUtils import validateCSVFile, getTotalCSVFileColumns
+from utils.csvUtils import validateCSVFile, getTotalCSVFileColumns, getCSVFileCompression
 from utils.currencyUtils import getInputFileCurrencyName
+from utils.vectorUtils import isVectorBackendAvailable
+from utils.rateUtils import readRatesFile, readBaseRatesFile, getCrossRates
+from utils.providerUtils import getProviderRates
+from utils.statsUtils import statsStage
+from utils.fixedPointUtils import parseRate
+
+
+# Mode options of validateArgs (command line options other than field, multiplier, symbol, input and output), options which are not given keep these values
+defaultModeOptions = {
+    "stream": False,
+    "encoding": None,
+    "backend": "scalar",
+    "workers": "1",
+    "ratesFile": None,
+    "timestampField": None,
+    "roundingMode": defaultRoundingMode,
+    "incremental": False,
+    "watch": False,
+    "cacheDirectory": None,
+    "cacheSize": str(cacheDefaultMaxMegabytes),
+    "pipeline": False,
+    "baseRatesFile": None,
+    "onError": "abort",
+    "maxErrors": None,
+    "rateProvider": None,
+    "ratesTTL": str(providerDefaultTTL)
+}
+
+# Modes which can not be used together, checked in order: mode, modes it can not be used with and error message
+# pipe is standard input or output pipe (-), workers is more than 1 worker and parallel is more than 1 worker without batch mode
+modeConflicts = [
+    ("workers", ["pipe"], "Workers can not be used with standard input or output pipe (-)"),
+    ("incremental", ["stdin", "pipe", "batch", "stdout"], "Incremental mode needs input CSV file and output CSV file"),
+    ("incremental", ["workers"], "Workers can not be used with incremental mode"),
+    ("cache", ["stdin", "pipe", "batch", "incremental", "stream", "workers", "ratesFile"], "Cache can not be used with stdin, pipe (-), batch, incremental, --stream, --workers or --rates-file"),
+    ("compressedInput", ["workers", "incremental", "cache"], "Compressed input file can not be used with --workers, incremental mode or cache"),
+    ("compressedOutput", ["incremental"], "Compressed output file can not be used with incremental mode"),
+    ("pipeline", ["incremental", "cache"], "Pipeline mode can not be used with incremental mode or cache"),
+    ("quarantine", ["stdin", "incremental", "cache", "parallel"], "Quarantine mode can not be used with stdin, incremental mode, cache or --workers"),
+    ("ratesFile", ["stdin"], "Rates File can only be used with input CSV file"),
+    ("baseRates", ["stdin", "ratesFile", "incremental", "cache"], "Base Rates File can not be used with stdin, --rates-file, incremental mode or cache"),
+    ("rateProvider", ["baseRates"], "Rate Provider and Base Rates File can not be used together"),
+    ("rateProvider", ["stdin", "ratesFile", "incremental", "cache"], "Rate Provider can not be used with stdin, --rates-file, incremental mode or cache")
+]
 
 
 def parseArgs() -> dict:
@@ -19,36 +68,82 @@ def parseArgs() -> dict:
     parser = argparse.ArgumentParser(
         description="This program accepts CSV file ot standard input with one currency and coverts into another currency")
     parser.add_argument("--field", metavar="N", dest="field", type=str,
-                        required=True, help="Convert CSV field N")
+                        help="Convert CSV field N (comma seprated list for more than one currency column)")
     parser.add_argument("--multiplier", metavar="N", dest="multiplier", type=str,
-                        required=True, help="Multiply currency value by N for the current conversion rate")
+                        help="Multiply currency value by N for the current conversion rate (comma seprated list for more than one currency). Required when --rates-file, --base-rates or --rate-provider is not given")
     parser.add_argument("--symbol", metavar="currency", dest="currencySymbol", type=str,  # choices=supportedCurrencies,
-                        required=True, help="Conversion Currency Symbol in abbreviated form. Example: EUR for Euro")
+                        help="Conversion Currency Symbol in abbreviated form. Example: EUR for Euro or EUR,GBP,INR for more than one currency")
     parser.add_argument("-i", metavar="input", dest="input", type=str,
-                        required=True, help="Read from input file (or stdin)")
+                        help="Read from input file, .csv.gz, .csv.bz2 and .csv.xz files are decompressed (or stdin, - for CSV data piped to standard input, or a directory or glob pattern of CSV files for batch mode)")
     parser.add_argument("-o", metavar="output", dest="output", type=str,
-                        required=True, help="Write to output file (or stdout)")
+                        help="Write to output file, .csv.gz, .csv.bz2 and .csv.xz files are compressed (or stdout, - for CSV data to standard output pipe, or output directory for batch mode)")
+    parser.add_argument("--rounding", metavar="mode", dest="roundingMode", type=str, default=defaultRoundingMode,
+                        help=f"Rounding mode of converted amounts: {', '.join(roundingModes)} (default {defaultRoundingMode})")
+    parser.add_argument("--stream", dest="stream", action="store_true",
+                        help="Validate, convert and write input file row by row in a single pass")
+    parser.add_argument("--pipeline", dest="pipeline", action="store_true",
+                        help="Read input in a reader thread and write output in a writer thread while rows are converted (implies --stream)")
+    parser.add_argument("--on-error", metavar="mode", dest="onError", type=str, default="abort",
+                        help="abort (default) or quarantine: invalid rows are written with line number and reason to output-rejects.csv while valid rows are converted (implies --stream)")
+    parser.add_argument("--max-errors", metavar="N", dest="maxErrors", type=str,
+                        help=f"Abort quarantine mode when more than N rows are invalid (default {csvDefaultMaxErrors})")
+    parser.add_argument("--encoding", metavar="encoding", dest="encoding", type=str,
+                        help="Input file encoding. Example: UTF-8-SIG (detected from file when not given)")
+    parser.add_argument("--backend", metavar="backend", dest="backend", type=str, default="scalar",
+                        help="Conversion backend: scalar (default) or numpy (vectorized batch conversion)")
+    parser.add_argument("--workers", metavar="N", dest="workers", type=str, default="1",
+                        help="Convert input file in parallel chunks with N worker processes (in batch mode, convert N files at a time)")
+    parser.add_argument("--rates-file", metavar="rates", dest="ratesFile", type=str,
+                        help="Rates file with Source|Destination|Timestamp|Rate columns. Each row is converted with rate in effect at its timestamp")
+    parser.add_argument("--timestamp-field", metavar="N", dest="timestampField", type=str,
+                        help="CSV field N with epoch timestamp of row for --rates-file (Last Update column when not given)")
+    parser.add_argument("--base-rates", metavar="rates", dest="baseRatesFile", type=str,
+                        help="Base rates file with Currency|Rate columns. Rows of input file may be in different currencies and each is converted with cross rate from its currency")
+    parser.add_argument("--rate-provider", metavar="url", dest="rateProvider", type=str,
+                        help="Fetch base rates from rate provider URL (JSON with base and rates) instead of --multiplier, rows are converted with cross rate from their currency same as --base-rates")
+    parser.add_argument("--rates-ttl", metavar="seconds", dest="ratesTTL", type=str, default=str(providerDefaultTTL),
+                        help=f"Use rates of --rate-provider cached in {cacheDefaultDirectory} for seconds before fetching them again, last known rates are used when provider fails (default {providerDefaultTTL})")
+    parser.add_argument("--incremental", dest="incremental", action="store_true",
+                        help="Convert only rows appended to input file after previous run and append them to output file (checkpoint is kept next to output file)")
+    parser.add_argument("--watch", dest="watch", action="store_true",
+                        help="Incremental mode which keeps watching input file and converts appended rows as they arrive (stop with Ctrl+C)")
+    parser.add_argument("--cache", metavar="dir", dest="cacheDirectory", nargs="?", const=cacheDefaultDirectory,
+                        help=f"Cache parsed currency columns of input file in directory (default {cacheDefaultDirectory}), later runs of unchanged input file skip validation and parsing")
+    parser.add_argument("--cache-size", metavar="MB", dest="cacheSize", type=str, default=str(cacheDefaultMaxMegabytes),
+                        help=f"Maximum total size of cache directory in megabytes, least recently used entries are removed (default {cacheDefaultMaxMegabytes})")
+    parser.add_argument("--stats", metavar="file", dest="stats", nargs="?", const="stderr",
+                        help="Report time of each stage, rows/sec, bytes read and written and peak memory as a JSON line on stderr (or appended to file)")
+    parser.add_argument("--serve", metavar="address", dest="serve", type=str,
+                        help="Run conversion server on host:port, port or unix:/path/to/socket instead of one conversion")
     # Parse arguments from console
     args = parser.parse_args()
+    # Conversion arguments are given with each request in server mode
+    if not args.serve:
+        missingArgs = [flag for flag, value in [("--field", args.field), ("--symbol", args.currencySymbol), ("-i", args.input), ("-o", args.output)] if value is None]
+        if missingArgs:
+            parser.error(f"the following arguments are required: {', '.join(missingArgs)}")
     # Creating Dictionary of arguments and return
     argsDict = vars(args)
     return argsDict
 
 
-def validateArgs(field: str, multiplier: str, currencySymbol: str, input: str, output: str) -> list:
+def validateArgs(field: str, multiplier: str, currencySymbol: str, input: str, output: str, options: dict = None) -> list:
     """
     This function takes command line arguments object as an input & validate them
 
     @type field: String
-    @param field: CSV File Field Number (starts from 1)
+    @param field: CSV File Field Number (starts from 1, comma seprated for more than one currency column)
     @type multiplier: String
-    @param multiplier: The value to be multiplied to original currency
+    @param multiplier: The value to be multiplied to original currency (comma seprated, one for each destination currency)
     @type currencySymbol: String
-    @param currencySymbol: Destination Currency Symbol - an abbreviated form Example: EUR for Euro
+    @param currencySymbol: Destination Currency Symbol - an abbreviated form Example: EUR for Euro (comma seprated for more than one currency)
     @type input: String
-    @param input: Input CSV file name
+    @param input: Input CSV file name (or stdin, - for standard input pipe, or directory or glob pattern of CSV files)
     @type output: String
-    @param output: Output CSV file name
+    @param output: Output CSV file name (or stdout, - for standard output pipe, or output directory for batch input)
+    @type options: Dictionary
+    @param options: Mode Options of command line (keys of defaultModeOptions): stream, encoding, backend, workers, ratesFile, timestampField, roundingMode,
+                    incremental, watch, cacheDirectory, cacheSize, pipeline, baseRatesFile, onError, maxErrors, rateProvider and ratesTTL
 
     @rtype: List
     @returns: A List of Boolean, String Messages, and argsDict
@@ -58,6 +153,20 @@ def validateArgs(field: str, multiplier: str, currencySymbol: str, input: str, o
         status = True
         messages = []
         stdin = False
+        pipe = False
+        pipeOutput = output.strip() == "-"
+        batchFiles = None
+
+        # Mode options which are not given keep their default values
+        unknownOptions = [name for name in options or {} if name not in defaultModeOptions]
+        if unknownOptions:
+            status = False
+            messages = f"Unknown options: {', '.join(unknownOptions)}"
+            return [status, messages]
+        options = {**defaultModeOptions, **(options or {})}
+        stream, encoding, backend, workers = options["stream"], options["encoding"], options["backend"], options["workers"]
+        ratesFile, timestampField, baseRatesFile, rateProvider = options["ratesFile"], options["timestampField"], options["baseRatesFile"], options["rateProvider"]
+        roundingMode, pipeline, onError, maxErrors = options["roundingMode"], options["pipeline"], options["onError"], options["maxErrors"]
 
         # Argument: -i input
         # Option 1: Standard Input from Console (stdin)
@@ -65,14 +174,33 @@ def validateArgs(field: str, multiplier: str, currencySymbol: str, input: str, o
         if input.lower() == "stdin":
             stdin = True
             input = input.lower()
+        # Option 4: CSV data piped to Standard Input (-), read without prompts
+        elif input == "-":
+            pipe = True
+        # Option 3: Batch Input from directory or glob pattern of CSV files
+        elif os.path.isdir(input) or any(char in input for char in "*?["):
+            batchPattern = os.path.join(input, "*") if os.path.isdir(input) else input
+            batchFiles = sorted(filePath for filePath in glob.glob(batchPattern)
+                                if os.path.isfile(filePath) and (os.path.splitext(filePath)[1].lower() == ".csv" or getCSVFileCompression(filePath)))
+            if not batchFiles:
+                status = False
+                messages = "Input directory or pattern does not match any CSV file"
+                return [status, messages]
+            # Each input file is written to output directory with same name
+            fileNames = [os.path.basename(filePath) for filePath in batchFiles]
+            if len(set(fileNames)) != len(fileNames):
+                status = False
+                messages = "Input CSV files of batch must have different file names"
+                return [status, messages]
         # Option 2: Input from CSV file
         else:
             csvFilePath = os.path.join(csvFileBasePath, input)
-            # Checking File Name Convention: file-name.csv
+            # Checking File Name Convention: file-name.csv or compressed file-name.csv.gz, file-name.csv.bz2, file-name.csv.xz
             inputInfo = input.split(".")
-            if len(inputInfo) != 2 or len(inputInfo[0]) == 0:
+            compressedInput = len(inputInfo) == 3 and inputInfo[2].lower() in csvCompressionModules
+            if (len(inputInfo) != 2 and not compressedInput) or len(inputInfo[0]) == 0:
                 status = False
-                messages = "Invalid Input File name. It must be file-name.csv format or stdin"
+                messages = "Invalid Input File name. It must be file-name.csv (or file-name.csv.gz, file-name.csv.bz2, file-name.csv.xz) format or stdin"
                 return [status, messages]
             # File Extention is not CSV
             elif "csv" != inputInfo[1].lower():
@@ -81,77 +209,311 @@ def validateArgs(field: str, multiplier: str, currencySymbol: str, input: str, o
                 return [status, messages]
             # File Extention is CSV
             else:
-                # Sanitizing input file extention - .CSV / .csV to .csv
-                if "csv" != inputInfo[1]:
-                    extention = inputInfo[1]
-                    input = input.replace(extention, extention.lower())
+                # Sanitizing input file extention - .CSV / .csV to .csv and .GZ to .gz
+                for extention in inputInfo[1:]:
+                    if extention != extention.lower():
+                        input = input.replace(extention, extention.lower())
                 # Check Input File - does exist in outer directory or not
                 if input not in os.listdir():
                     status = False
                     messages = "Input file does not exist in current directory"
                     return [status, messages]
 
+        # Argument: --encoding Encoding
+        # Check Encoding - it must be known to python codecs, detection is skipped when given
+        if encoding:
+            encoding = encoding.strip()
+            try:
+                codecs.lookup(encoding)
+            except LookupError:
+                status = False
+                messages = "Encoding is not valid. It must be a python supported encoding. Example: UTF-8-SIG"
+                return [status, messages]
+
+        # Argument: --workers N
+        # Check Workers - it must be a valid integer greater than 0
+        workers = workers.strip()
+        if not workers.isdigit() or int(workers) <= 0:
+            status = False
+            messages = "Workers must be a valid integer greater than 0"
+            return [status, messages]
+        workers = int(workers)
+
+        # Argument: --cache dir and --cache-size MB
+        # Check Cache - directory must not be a file and size must be a valid integer greater than 0
+        cache = None
+        if options["cacheDirectory"] is not None:
+            cacheDirectory, cacheSize = options["cacheDirectory"].strip(), options["cacheSize"].strip()
+            if not cacheDirectory or (os.path.exists(cacheDirectory) and not os.path.isdir(cacheDirectory)):
+                status = False
+                messages = "Cache directory is not valid"
+                return [status, messages]
+            if not cacheSize.isdigit() or int(cacheSize) <= 0:
+                status = False
+                messages = "Cache size must be a valid integer greater than 0"
+                return [status, messages]
+            cache = {"cacheDirectory": cacheDirectory, "cacheMaxBytes": int(cacheSize) * 1024 * 1024}
+
+        # Argument: --on-error mode and --max-errors N
+        # Check Quarantine Mode - invalid rows are rejected while rows are converted in streaming mode, max errors must be a valid integer
+        onError = onError.strip().lower()
+        if onError not in ["abort", "quarantine"]:
+            status = False
+            messages = "On error mode is not valid. It must be abort or quarantine"
+            return [status, messages]
+        quarantine = None
+        if maxErrors is not None and onError != "quarantine":
+            status = False
+            messages = "Max errors can only be used with --on-error quarantine"
+            return [status, messages]
+        if onError == "quarantine":
+            maxErrors = maxErrors.strip() if maxErrors is not None else str(csvDefaultMaxErrors)
+            if not maxErrors.isdigit():
+                status = False
+                messages = "Max errors must be a valid integer"
+                return [status, messages]
+            quarantine = {"maxErrors": int(maxErrors)}
+
+        # Check Modes - modes used together are checked with table of incompatible modes
+        # Compressed input file is decompressed as a stream, so its byte offsets can not be split, memory-mapped or appended to
+        incremental = options["incremental"] or options["watch"]
+        compressedInput = not (stdin or pipe or batchFiles is not None) and getCSVFileCompression(input) is not None
+        modes = {
+            "stdin": stdin,
+            "pipe": pipe or pipeOutput,
+            "stdout": output.strip().lower() == "stdout",
+            "batch": batchFiles is not None,
+            "stream": stream,
+            "workers": workers > 1,
+            "parallel": workers > 1 and batchFiles is None,
+            "incremental": incremental,
+            "cache": cache is not None,
+            "compressedInput": compressedInput,
+            "compressedOutput": getCSVFileCompression(output.strip()) is not None,
+            "pipeline": pipeline,
+            "quarantine": quarantine is not None,
+            "ratesFile": bool(ratesFile),
+            "baseRates": bool(baseRatesFile),
+            "rateProvider": bool(rateProvider)
+        }
+        for mode, conflictingModes, conflictMessage in modeConflicts:
+            if modes[mode] and any(modes[conflictingMode] for conflictingMode in conflictingModes):
+                status = False
+                messages = conflictMessage
+                return [status, messages]
+
+        # Quarantine mode rejects invalid rows while they are converted, so rows are always streamed
+        stream = stream or quarantine is not None
+        # Streaming, pipe, parallel, batch, incremental, cached, pipeline, quarantine modes and compressed input validate rows while converting
+        deferValidation = stream or pipe or pipeOutput or workers > 1 or batchFiles is not None or incremental or cache is not None or compressedInput or pipeline
+
         # Argument: --field N
-        # Check Field Number - it must be a valid integer
-        field = field.strip()
-        if not field or not field.isdigit():
+        # Check Field Numbers - each must be a valid integer
+        fields = [field.strip() for field in field.split(",")]
+        if any(not field or not field.isdigit() for field in fields):
             status = False
             messages = "Field Must be a valid integer"
             return [status, messages]
-        field = int(field) - 1
-        if not stdin:
-            # Field number must be less then total csv file columns
-            totalColumns = getTotalCSVFileColumns(csvFilePath)
-            if field > totalColumns:
+        fields = [int(field) - 1 for field in fields]
+        if len(set(fields)) != len(fields):
+            status = False
+            messages = "Field Numbers must not be repeated"
+            return [status, messages]
+        if not stdin and not deferValidation:
+            # Field numbers must be less then total csv file columns
+            totalColumns = getTotalCSVFileColumns(csvFilePath, encoding)
+            if any(field > totalColumns for field in fields):
                 status = False
                 messages = "Field Number must be less than or equal to total number of columns in CSV file"
                 return [status, messages]
 
         # Argument: --symbol Currency
-        # Check if the destination currency is in supported currency list or not
-        currencySymbol = currencySymbol.strip().upper()
-        if currencySymbol not in supportedCurrencies:
+        # Check if each destination currency is in supported currency list or not
+        currencySymbols = [currencySymbol.strip().upper() for currencySymbol in currencySymbol.split(",")]
+        if any(currencySymbol not in supportedCurrencies for currencySymbol in currencySymbols):
             status = False
-            print(f"Supported Currencies: {supportedCurrencies}")
+            print(f"Supported Currencies: {supportedCurrencies}", file=sys.stderr)
             messages = "Currency Symbol is not valid. It must be from list of above supported options"
             return [status, messages]
+        if len(set(currencySymbols)) != len(currencySymbols):
+            status = False
+            messages = "Currency Symbols must not be repeated"
+            return [status, messages]
 
-        # Validating the Input file
-        if not stdin:
-            validateInfo = validateCSVFile(csvFilePath, field)
+        # Validating the Input file (streaming and parallel modes validate rows while converting)
+        if not stdin and not deferValidation:
+            with statsStage("validate"):
+                validateInfo = validateCSVFile(csvFilePath, fields, encoding, bool(baseRatesFile or rateProvider))
             status = validateInfo[0]
             messages = validateInfo[1]
             if not status:
                 return [status, messages]
 
+        # Argument: --rates-file Rates
+        # Check Rates File - it must exist in current directory and have valid rates
+        rates = None
+        if ratesFile:
+            ratesFile = ratesFile.strip()
+            if ratesFile not in os.listdir():
+                status = False
+                messages = "Rates file does not exist in current directory"
+                return [status, messages]
+            try:
+                readRatesFile(ratesFile)
+            except ValueError as e:
+                status = False
+                messages = str(e)
+                return [status, messages]
+            # Argument: --timestamp-field N
+            if timestampField:
+                timestampField = timestampField.strip()
+                if not timestampField.isdigit() or int(timestampField) <= 0:
+                    status = False
+                    messages = "Timestamp Field Must be a valid integer"
+                    return [status, messages]
+                timestampField = int(timestampField) - 1
+            rates = {"ratesFile": ratesFile, "timestampField": timestampField}
+
+        # Argument: --rounding Mode
+        # Check Rounding Mode - it must be from supported rounding modes
+        roundingMode = roundingMode.strip().lower()
+        if roundingMode not in roundingModes:
+            status = False
+            messages = f"Rounding Mode is not valid. It must be one of {', '.join(roundingModes)}"
+            return [status, messages]
+
+        # Argument: --base-rates Rates
+        # Check Base Rates File - it must exist in current directory and have rate of each destination currency
+        # Cross rates between its currencies are computed once and rows of each currency are converted with them
+        if baseRatesFile:
+            baseRatesFile = baseRatesFile.strip()
+            if baseRatesFile not in os.listdir():
+                status = False
+                messages = "Base rates file does not exist in current directory"
+                return [status, messages]
+            try:
+                baseRates = readBaseRatesFile(baseRatesFile)
+            except ValueError as e:
+                status = False
+                messages = str(e)
+                return [status, messages]
+            if any(currencySymbol not in baseRates for currencySymbol in currencySymbols):
+                status = False
+                messages = "Base Rates File does not contain rate of each Currency Symbol"
+                return [status, messages]
+            rates = {"crossRates": getCrossRates(baseRates)}
+
+        # Argument: --rate-provider URL and --rates-ttl seconds
+        # Check Rate Provider - its base rates are used same as base rates file, they are fetched once for all rows, files and workers
+        # and cached for rates TTL seconds, so back-to-back runs do not fetch them again
+        if rateProvider:
+            ratesTTL = options["ratesTTL"].strip()
+            if not ratesTTL.isdigit():
+                status = False
+                messages = "Rates TTL must be a valid integer"
+                return [status, messages]
+            try:
+                with statsStage("fetchRates"):
+                    baseRates = getProviderRates(rateProvider.strip(), int(ratesTTL))
+            except ValueError as e:
+                status = False
+                messages = str(e)
+                return [status, messages]
+            if any(currencySymbol not in baseRates for currencySymbol in currencySymbols):
+                status = False
+                messages = "Rate Provider does not have rate of each Currency Symbol"
+                return [status, messages]
+            rates = {"crossRates": getCrossRates(baseRates)}
+
         # Argument: --multiplier N
-        # Check Multiplier Value - it must be a valid float
-        multiplier = multiplier.strip()
-        if not any(value.isdigit() for value in multiplier.split(".")):
+        # Rates File (or Base Rates File or Rate Provider) gives rate of each row, multiplier is not used with it
+        if rates:
+            if multiplier:
+                status = False
+                if rateProvider:
+                    messages = "Multiplier and Rate Provider can not be used together"
+                else:
+                    messages = "Multiplier and Base Rates File can not be used together" if baseRatesFile else "Multiplier and Rates File can not be used together"
+                return [status, messages]
+            multiplier = ",".join(["1"] * len(currencySymbols))
+        elif not multiplier:
+            status = False
+            messages = "Multiplier is required when Rates File is not given"
+            return [status, messages]
+        # Check Multiplier Value - it must be an integer or float value (digits with one decimal point) for each destination currency
+        # Multiplier is kept as scaled integer with rateDigits fraction digits, so rates like 0.000712 are not rounded
+        multipliers = [multiplier.strip() for multiplier in multiplier.split(",")]
+        if any(not multiplier.replace(".", "", 1).isdigit() for multiplier in multipliers):
             status = False
             messages = "Multiplier must be an integer or float value"
             return [status, messages]
-        multiplier = round(float(multiplier), 2)
+        multipliers = [parseRate(multiplier, roundingMode) for multiplier in multipliers]
+        # Multiplier of 0 (or rounded to 0 with rateDigits fraction digits) would convert every amount to 0
+        if any(multiplier <= 0 for multiplier in multipliers):
+            status = False
+            messages = "Multiplier must be greater than 0"
+            return [status, messages]
+        if len(multipliers) != len(currencySymbols):
+            status = False
+            messages = "Number of Multipliers must be equal to number of Currency Symbols"
+            return [status, messages]
 
         # Argument: --symbol Currency
-        # Check if the destination currency is same as input file currency or not
-        if not stdin:
-            sourceCurrency = getInputFileCurrencyName(csvFilePath)  # change
-            if currencySymbol == sourceCurrency:
+        # Check if the destination currency is same as input file currency or not (rows of mixed currency file may be in destination currency)
+        if not stdin and not deferValidation and not (baseRatesFile or rateProvider):
+            sourceCurrency = getInputFileCurrencyName(csvFilePath, encoding)  # change
+            if sourceCurrency in currencySymbols:
                 status = False
                 messages = "Currency Symbol must be different then source currency"
                 return [status, messages]
+            # Rates File must have rates from source currency to each destination currency
+            if rates and any((sourceCurrency, currencySymbol) not in readRatesFile(ratesFile) for currencySymbol in currencySymbols):
+                status = False
+                messages = "Rates File does not contain rates from source currency to each Currency Symbol"
+                return [status, messages]
+
+        # Argument: --backend Backend
+        # Check Backend - numpy falls back to scalar if NumPy is not installed
+        backend = backend.strip().lower()
+        if backend not in ["scalar", "numpy"]:
+            status = False
+            messages = "Backend is not valid. It must be scalar or numpy"
+            return [status, messages]
+        if backend == "numpy" and not isVectorBackendAvailable():
+            print("Note: NumPy is not installed. scalar backend is used for conversion", file=sys.stderr)
+            backend = "scalar"
 
         # Argument: -o output
         # Option 1: Show Output in Console (stdout) -> handled by other function
         # Option 2: Output to CSV file
+        # Option 3: Output to directory for batch input
+        # Option 4: CSV data to Standard Output pipe (-)
         output = output.strip()
-        if output.lower() != "stdout":
-            # Checking File Name Convention: file-name.csv
+        if batchFiles is not None:
+            if output.lower() == "stdout" or output == "-" or os.path.splitext(output)[1].lower() == ".csv" or getCSVFileCompression(output):
+                status = False
+                messages = "Output must be a directory for batch input"
+                return [status, messages]
+            if os.path.exists(output) and not os.path.isdir(output):
+                status = False
+                messages = "Output directory is an existing file"
+                return [status, messages]
+        elif output == "-":
+            if stdin:
+                status = False
+                messages = "Standard Output pipe (-) can not be used with stdin prompts. Use -i - for CSV data piped to standard input"
+                return [status, messages]
+            if len(currencySymbols) > 1:
+                status = False
+                messages = "Only one Currency Symbol can be written to standard output pipe (-)"
+                return [status, messages]
+        elif output.lower() != "stdout":
+            # Checking File Name Convention: file-name.csv or compressed file-name.csv.gz, file-name.csv.bz2, file-name.csv.xz
             outputInfo = output.split(".")
-            if len(outputInfo) != 2 or len(outputInfo[0]) == 0:
+            compressedOutput = len(outputInfo) == 3 and outputInfo[2].lower() in csvCompressionModules
+            if (len(outputInfo) != 2 and not compressedOutput) or len(outputInfo[0]) == 0:
                 status = False
-                messages = "Invalid output File name. It must be file-name.csv format or stdout"
+                messages = "Invalid output File name. It must be file-name.csv (or file-name.csv.gz, file-name.csv.bz2, file-name.csv.xz) format or stdout"
                 return [status, messages]
             # File Extention is not CSV
             elif "csv" != outputInfo[1].lower():
@@ -160,23 +522,183 @@ def validateArgs(field: str, multiplier: str, currencySymbol: str, input: str, o
                 return [status, messages]
             # File Extention is CSV but not sanitized output
             else:
-                # Sanitizing output file extention - .CSV / .csV to .csv
-                if "csv" != outputInfo[1]:
-                    extention = outputInfo[1]
-                    output = output.replace(extention, extention.lower())
+                # Sanitizing output file extention - .CSV / .csV to .csv and .GZ to .gz
+                for extention in outputInfo[1:]:
+                    if extention != extention.lower():
+                        output = output.replace(extention, extention.lower())
         else:
             output = output.lower()
 
-        # return updated command-line arguments
+        # return updated command-line arguments, options of conversion modes are given to currencyConvertOperation together
         argsDict = {
-            "field": field,  # Integer
-            "multiplier": multiplier,  # Float
-            "currencySymbol": currencySymbol,  # String
+            "fields": fields,  # List of Integer
+            "multipliers": multipliers,  # List of Integer (scaled by 10 ** rateDigits)
+            "currencySymbols": currencySymbols,  # List of String
             "input": input,  # String
-            "output": output  # String
+            "output": output,  # String
+            "options": {
+                "stream": stream,  # Boolean
+                "encoding": encoding,  # String or None
+                "backend": backend,  # String
+                "workers": workers,  # Integer
+                "rates": rates,  # Dictionary or None
+                "batchFiles": batchFiles,  # List of String or None
+                "roundingMode": roundingMode,  # String
+                "incremental": incremental,  # Boolean
+                "watch": options["watch"],  # Boolean
+                "cache": cache,  # Dictionary or None
+                "pipeline": pipeline,  # Boolean
+                "quarantine": quarantine  # Dictionary or None
+            }
         }
 
         return [status, messages, argsDict]
 
     except Exception as e:
         return [False, e]
+
+
+def getServerFilePath(fileName: str) -> str:
+    """
+    This function resolves file name of a request in current directory of server, same as command line only reads files of current directory.
+    Symbolic links and .. are resolved first, so absolute paths and paths outside current directory are not accepted.
+
+    @type fileName: String
+    @param fileName: File Name (or path in current directory)
+
+    @rtype: String
+    @returns: Real File Path, or None if it is outside current directory or it is not a file
+    """
+    basePath = os.path.realpath(csvFileBasePath)
+    filePath = os.path.realpath(os.path.join(basePath, fileName))
+    if os.path.commonpath([basePath, filePath]) != basePath or not os.path.isfile(filePath):
+        return None
+    return filePath
+
+
+def validateRequestArgs(query: dict) -> list:
+    """
+    This function validates conversion parameters of a request, same as command line arguments of one conversion
+
+    @type query: Dictionary
+    @param query: Request Query Parameters - field, symbol, multiplier or rates-file, and optional timestamp-field, encoding, backend, rounding and input
+
+    @rtype: List
+    @returns: A List of Boolean, String Messages, and requestArgs
+    """
+
+    try:
+        status = True
+        messages = []
+
+        # Parameter: field - comma seprated field numbers (starts from 1)
+        fields = [field.strip() for field in query.get("field", "").split(",")]
+        if any(not field or not field.isdigit() or int(field) <= 0 for field in fields):
+            status = False
+            messages = "field parameter must be a valid integer"
+            return [status, messages]
+        fields = [int(field) - 1 for field in fields]
+        if len(set(fields)) != len(fields):
+            status = False
+            messages = "Field Numbers must not be repeated"
+            return [status, messages]
+
+        # Parameter: symbol - one destination currency, response is one CSV
+        currencySymbol = query.get("symbol", "").strip().upper()
+        if currencySymbol not in supportedCurrencies:
+            status = False
+            messages = f"symbol parameter is not valid. It must be one of {supportedCurrencies}"
+            return [status, messages]
+
+        # Parameter: encoding - detected from first bytes of CSV data when not given
+        encoding = query.get("encoding", "").strip() or None
+        if encoding:
+            try:
+                codecs.lookup(encoding)
+            except LookupError:
+                status = False
+                messages = "Encoding is not valid. It must be a python supported encoding. Example: UTF-8-SIG"
+                return [status, messages]
+
+        # Parameter: rates-file and timestamp-field - rates file is kept loaded between requests
+        rates = None
+        ratesFile = query.get("rates-file", "").strip()
+        if ratesFile:
+            ratesFile = getServerFilePath(ratesFile)
+            if ratesFile is None:
+                status = False
+                messages = "Rates file does not exist in current directory"
+                return [status, messages]
+            try:
+                readRatesFile(ratesFile)
+            except ValueError as e:
+                status = False
+                messages = str(e)
+                return [status, messages]
+            timestampField = query.get("timestamp-field", "").strip() or None
+            if timestampField:
+                if not timestampField.isdigit() or int(timestampField) <= 0:
+                    status = False
+                    messages = "Timestamp Field Must be a valid integer"
+                    return [status, messages]
+                timestampField = int(timestampField) - 1
+            rates = {"ratesFile": ratesFile, "timestampField": timestampField}
+
+        # Parameter: rounding - rounding mode of converted amounts
+        roundingMode = query.get("rounding", defaultRoundingMode).strip().lower()
+        if roundingMode not in roundingModes:
+            status = False
+            messages = f"rounding parameter is not valid. It must be one of {', '.join(roundingModes)}"
+            return [status, messages]
+
+        # Parameter: multiplier - required when rates file is not given
+        multiplier = query.get("multiplier", "").strip()
+        if rates:
+            if multiplier:
+                status = False
+                messages = "Multiplier and Rates File can not be used together"
+                return [status, messages]
+            multiplier = "1"
+        if not multiplier.replace(".", "", 1).isdigit():
+            status = False
+            messages = "multiplier parameter must be an integer or float value"
+            return [status, messages]
+        multiplier = parseRate(multiplier, roundingMode)
+        if multiplier <= 0:
+            status = False
+            messages = "multiplier parameter must be greater than 0"
+            return [status, messages]
+
+        # Parameter: backend - numpy falls back to scalar if NumPy is not installed
+        backend = query.get("backend", "scalar").strip().lower()
+        if backend not in ["scalar", "numpy"]:
+            status = False
+            messages = "Backend is not valid. It must be scalar or numpy"
+            return [status, messages]
+        if backend == "numpy" and not isVectorBackendAvailable():
+            backend = "scalar"
+
+        # Parameter: input - CSV file in current directory of server instead of request body
+        input = query.get("input", "").strip() or None
+        if input:
+            input = getServerFilePath(input) if input.lower().endswith(".csv") else None
+            if input is None:
+                status = False
+                messages = "Input file does not exist. It must be a CSV file in current directory of server"
+                return [status, messages]
+
+        requestArgs = {
+            "fields": fields,  # List of Integer
+            "multipliers": [multiplier],  # List of Integer (scaled by 10 ** rateDigits)
+            "currencySymbols": [currencySymbol],  # List of String
+            "encoding": encoding,  # String or None
+            "backend": backend,  # String
+            "rates": rates,  # Dictionary or None
+            "roundingMode": roundingMode,  # String
+            "input": input  # String (real file path) or None
+        }
+
+        return [status, messages, requestArgs]
+
+    except Exception as e:
+        return [False, e]
@@ -0,0 +1,180 @@
+import os
+import sys
+from array import array
+
+from constants.cacheConstants import cacheMetadataSuffix, cacheDataSuffix, cacheHashBlockSize
+
+
+def getCacheEntryPath(cacheDirectory: str, filePath: str, fields: list) -> str:
+    """
+    This function returns path of cache entry of currency columns of a CSV file, without file suffix
+
+    @type cacheDirectory: String
+    @param cacheDirectory: Cache Directory
+    @type filePath: String
+    @param filePath: Input CSV File Path
+    @type fields: List of Integer
+    @param fields: CSV File's Currency Column Numbers (starts from 0)
+
+    @rtype: String
+    @returns: Cache Entry Path, named by hash of input file path and currency column numbers
+    """
+    import hashlib
+    entryKey = f"{os.path.abspath(filePath)}|{','.join(str(field) for field in fields)}"
+    return os.path.join(cacheDirectory, hashlib.blake2b(entryKey.encode("utf-8"), digest_size=16).hexdigest())
+
+
+def getContentHash(filePath: str) -> str:
+    """
+    This function returns hash of CSV file content which is stored in cache entry. File is read in blocks of cacheHashBlockSize bytes
+
+    @type filePath: String
+    @param filePath: Input CSV File Path
+
+    @rtype: String
+    @returns: BLAKE2b hash of file data
+    """
+    import hashlib
+    contentHash = hashlib.blake2b()
+    with open(filePath, "rb") as dataFile:
+        for dataBlock in iter(lambda: dataFile.read(cacheHashBlockSize), b""):
+            contentHash.update(dataBlock)
+    return contentHash.hexdigest()
+
+
+def readCacheEntry(cacheDirectory: str, filePath: str, fields: list, encoding: str = None) -> list:
+    """
+    This function reads cache entry of a CSV file if it is created from same file content.
+    Binary data of entry is memory mapped, amounts and offsets are read from it without copying whole file.
+
+    @type cacheDirectory: String
+    @param cacheDirectory: Cache Directory
+    @type filePath: String
+    @param filePath: Input CSV File Path
+    @type fields: List of Integer
+    @param fields: CSV File's Currency Column Numbers (starts from 0)
+    @type encoding: String
+    @param encoding: Input CSV File Encoding given on command line (entry of another encoding is not used)
+
+    @rtype: List
+    @returns: Metadata, Memory Map, Memory View, Amounts and Offsets of cache entry (None if entry does not exist or is not valid for file)
+    """
+    import json
+    import mmap
+    entryPath = getCacheEntryPath(cacheDirectory, filePath, fields)
+    try:
+        with open(entryPath + cacheMetadataSuffix) as metadataFile:
+            metadata = json.load(metadataFile)
+        fileStat = os.stat(filePath)
+        # Entry is valid only for same file size, modified time and content
+        if (metadata["size"], metadata["modifiedTime"]) != (fileStat.st_size, fileStat.st_mtime_ns):
+            return None
+        if metadata["byteOrder"] != sys.byteorder or (encoding and metadata["encoding"] != encoding):
+            return None
+        if metadata["contentHash"] != getContentHash(filePath):
+            return None
+        with open(entryPath + cacheDataSuffix, "rb") as dataFile:
+            dataMap = mmap.mmap(dataFile.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError, KeyError):
+        return None
+
+    # Amounts of each row are followed by offsets of each row (row start, start and end of each currency field, row end)
+    totalAmounts = metadata["rows"] * len(fields)
+    totalOffsets = metadata["rows"] * (len(fields) * 2 + 2)
+    if len(dataMap) != (totalAmounts + totalOffsets) * 8:
+        dataMap.close()
+        return None
+    dataView = memoryview(dataMap).cast("q")
+    # Entry is used recently, it is evicted after entries which are not used
+    os.utime(entryPath + cacheMetadataSuffix)
+    return [metadata, dataMap, dataView, dataView[:totalAmounts], dataView[totalAmounts:]]
+
+
+def closeCacheEntry(cacheEntry: list):
+    """
+    This function releases amounts and offsets of cache entry and closes its memory map
+
+    @type cacheEntry: List
+    @param cacheEntry: Cache Entry returned by readCacheEntry
+    """
+    metadata, dataMap, dataView, amounts, offsets = cacheEntry
+    for view in [amounts, offsets, dataView]:
+        view.release()
+    dataMap.close()
+
+
+def writeCacheEntry(cacheDirectory: str, filePath: str, fields: list, metadata: dict, amounts: list, offsets: array, cacheMaxBytes: int) -> bool:
+    """
+    This function writes cache entry of a CSV file and removes least recently used entries when cache is larger than its maximum size
+
+    @type cacheDirectory: String
+    @param cacheDirectory: Cache Directory
+    @type filePath: String
+    @param filePath: Input CSV File Path
+    @type fields: List of Integer
+    @param fields: CSV File's Currency Column Numbers (starts from 0)
+    @type metadata: Dictionary
+    @param metadata: Encoding, Column Names, Source Currency Symbol and Rows of CSV file
+    @type amounts: List of Integer
+    @param amounts: Parsed Source Amount of each currency column of each row (row by row) in minor units
+    @type offsets: Array of Integer
+    @param offsets: Character Offsets of each row (row start, start and end of each currency field, row end)
+    @type cacheMaxBytes: Integer
+    @param cacheMaxBytes: Maximum total size of cache files
+
+    @rtype: Boolean
+    @returns: True if entry is written (amounts larger than 64 bit integers, amounts with more fraction digits than minor units or an entry larger than cache are not cached)
+    """
+    import json
+    try:
+        entryData = array("q", amounts).tobytes() + offsets.tobytes()
+    except (OverflowError, TypeError):
+        return False
+    if len(entryData) > cacheMaxBytes:
+        return False
+
+    fileStat = os.stat(filePath)
+    metadata = {**metadata, "input": os.path.abspath(filePath), "fields": fields, "size": fileStat.st_size,
+                "modifiedTime": fileStat.st_mtime_ns, "byteOrder": sys.byteorder}
+
+    os.makedirs(cacheDirectory, exist_ok=True)
+    entryPath = getCacheEntryPath(cacheDirectory, filePath, fields)
+    # Data is written before metadata, so metadata file never points to partial data
+    for suffix, data in [(cacheDataSuffix, entryData), (cacheMetadataSuffix, json.dumps(metadata).encode("utf-8"))]:
+        with open(entryPath + suffix + ".tmp", "wb") as entryFile:
+            entryFile.write(data)
+        os.replace(entryPath + suffix + ".tmp", entryPath + suffix)
+
+    evictCacheEntries(cacheDirectory, cacheMaxBytes)
+    return True
+
+
+def evictCacheEntries(cacheDirectory: str, cacheMaxBytes: int):
+    """
+    This function removes least recently used cache entries until total size of cache files is not larger than maximum size
+
+    @type cacheDirectory: String
+    @param cacheDirectory: Cache Directory
+    @type cacheMaxBytes: Integer
+    @param cacheMaxBytes: Maximum total size of cache files
+    """
+    entries = []
+    for fileName in os.listdir(cacheDirectory):
+        if not fileName.endswith(cacheMetadataSuffix):
+            continue
+        entryPath = os.path.join(cacheDirectory, fileName[:-len(cacheMetadataSuffix)])
+        try:
+            entrySize = sum(os.path.getsize(entryPath + suffix) for suffix in [cacheMetadataSuffix, cacheDataSuffix])
+            entries.append([os.path.getmtime(entryPath + cacheMetadataSuffix), entrySize, entryPath])
+        except OSError:
+            continue
+
+    # Oldest used entries are removed first
+    totalBytes = sum(entry[1] for entry in entries)
+    for usedTime, entrySize, entryPath in sorted(entries):
+        if totalBytes <= cacheMaxBytes:
+            break
+        for suffix in [cacheMetadataSuffix, cacheDataSuffix]:
+            if os.path.exists(entryPath + suffix):
+                os.remove(entryPath + suffix)
+        totalBytes -= entrySize
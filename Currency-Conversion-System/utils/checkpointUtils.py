@@ -0,0 +1,121 @@
+import os
+
+from constants.csvConstants import csvFileBasePath, csvCheckpointSuffix, csvEncodingDetectChunkSize
+
+
+def getCheckpointPath(output: str) -> str:
+    """
+    This function returns path of checkpoint file which is kept next to output file of incremental mode
+
+    @type output: String
+    @param output: Output CSV file name
+
+    @rtype: String
+    @returns: Checkpoint File Path. Example: output.csv.checkpoint.json
+    """
+    return os.path.join(csvFileBasePath, output + csvCheckpointSuffix)
+
+
+def readCheckpoint(checkpointPath: str) -> dict:
+    """
+    This function reads checkpoint of previous incremental run
+
+    @type checkpointPath: String
+    @param checkpointPath: Checkpoint File Path
+
+    @rtype: Dictionary
+    @returns: Checkpoint (None if checkpoint file does not exist or is not valid)
+    """
+    # json is only imported for incremental mode
+    import json
+    try:
+        with open(checkpointPath) as checkpointFile:
+            checkpoint = json.load(checkpointFile)
+        return checkpoint if isinstance(checkpoint, dict) else None
+    except (OSError, ValueError):
+        return None
+
+
+def writeCheckpoint(checkpointPath: str, checkpoint: dict):
+    """
+    This function writes checkpoint to a temporary file and renames it, so a checkpoint file is never partially written
+
+    @type checkpointPath: String
+    @param checkpointPath: Checkpoint File Path
+    @type checkpoint: Dictionary
+    @param checkpoint: Checkpoint of converted input prefix
+    """
+    import json
+    tempFilePath = checkpointPath + ".tmp"
+    with open(tempFilePath, "w") as checkpointFile:
+        json.dump(checkpoint, checkpointFile, indent=2)
+    os.replace(tempFilePath, checkpointPath)
+
+
+def removeCheckpoint(checkpointPath: str):
+    """
+    This function removes checkpoint file if it exists
+
+    @type checkpointPath: String
+    @param checkpointPath: Checkpoint File Path
+    """
+    if os.path.exists(checkpointPath):
+        os.remove(checkpointPath)
+
+
+def hashFileRange(filePath: str, start: int, end: int, fileHash=None):
+    """
+    This function adds bytes of a range of file to a hash
+
+    @type filePath: String
+    @param filePath: File Path
+    @type start: Integer
+    @param start: Start Byte Offset of range
+    @type end: Integer
+    @param end: End Byte Offset of range
+    @type fileHash: Hash Object
+    @param fileHash: Hash of bytes before range (new BLAKE2b hash when not given)
+
+    @rtype: Hash Object
+    @returns: Hash updated with bytes of range
+    """
+    import hashlib
+    fileHash = fileHash if fileHash is not None else hashlib.blake2b()
+    with open(filePath, 'rb') as dataFile:
+        dataFile.seek(start)
+        remaining = end - start
+        while remaining > 0:
+            data = dataFile.read(min(remaining, csvEncodingDetectChunkSize * 16))
+            if not data:
+                break
+            fileHash.update(data)
+            remaining -= len(data)
+    return fileHash
+
+
+def findLastRowEnd(filePath: str, start: int, end: int) -> int:
+    """
+    This function finds end of last complete row (\\r\\n) in a range of file. A row which is still being appended is not complete
+
+    @type filePath: String
+    @param filePath: Input CSV File Path
+    @type start: Integer
+    @param start: Start Byte Offset of range (at row boundary)
+    @type end: Integer
+    @param end: End Byte Offset of range
+
+    @rtype: Integer
+    @returns: Byte Offset after last row seprator in range (start if range has no complete row)
+    """
+    with open(filePath, 'rb') as csvFile:
+        position = end
+        while position > start:
+            # Read backwards, one byte of previous read is kept as row seprator may be split between two reads
+            readStart = max(start, position - csvEncodingDetectChunkSize)
+            csvFile.seek(readStart)
+            data = csvFile.read(min(end, position + 1) - readStart)
+            index = data.rfind(b"\r\n")
+            if index != -1:
+                return readStart + index + 2
+            position = readStart
+    return start
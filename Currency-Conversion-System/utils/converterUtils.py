@@ -0,0 +1,146 @@
+import io
+from itertools import chain
+
+from constants.currencyConstants import defaultRoundingMode
+from constants.csvConstants import csvSeprator, csvDefaultEncoding
+
+from utils.rateUtils import getTimestampField
+from utils.csvUtils import iterCSVStream, validateCSVColumns, formatCSVRows
+from utils.currencyUtils import iterConvertedCSVRows, currencyConvertStreamOperation
+from utils.argUtils import validateRequestArgs
+
+
+class CurrencyConverter:
+    """
+    This class converts CSV rows, CSV data and CSV files to one destination currency in process, so other python programs do not run currency_convert.py for each conversion.
+    Conversion parameters are validated once when converter is created and are not changed by conversions, and each conversion keeps its rows and memo lookups in its own call,
+    so one converter can be shared by threads, such as a ThreadPoolExecutor of a web service.
+
+    Example:
+        converter = CurrencyConverter("EUR", multiplier="0.93", field="2")
+        convertedData = converter.convertBytes(csvData)
+    """
+
+    def __init__(self, currencySymbol: str, multiplier: str = None, field: str = "2", ratesFile: str = None, timestampField: str = None,
+                 roundingMode: str = defaultRoundingMode, backend: str = "scalar", encoding: str = None):
+        """
+        This function validates conversion parameters, same as parameters of conversion server request. Raises ValueError if a parameter is not valid
+
+        @type currencySymbol: String
+        @param currencySymbol: Destination Currency Symbol - an abbreviated form Example: EUR for Euro
+        @type multiplier: String
+        @param multiplier: The value to be multiplied to original currency (not given with rates file)
+        @type field: String
+        @param field: CSV File Field Number (starts from 1, comma seprated for more than one currency column)
+        @type ratesFile: String
+        @param ratesFile: Rates file name to convert each row with rate in effect at its timestamp instead of multiplier
+        @type timestampField: String
+        @param timestampField: CSV File Timestamp Field Number (starts from 1) for rates file (Last Update column when not given)
+        @type roundingMode: String
+        @param roundingMode: Rounding Mode of converted amounts (constants/currencyConstants.py)
+        @type backend: String
+        @param backend: Conversion Backend - scalar or numpy
+        @type encoding: String
+        @param encoding: Encoding of CSV data and CSV files (detected from data when not given)
+        """
+        result = validateRequestArgs({"symbol": currencySymbol, "multiplier": "" if multiplier is None else str(multiplier), "field": str(field),
+                                      "rates-file": ratesFile or "", "timestamp-field": "" if timestampField is None else str(timestampField),
+                                      "rounding": roundingMode, "backend": backend, "encoding": encoding or ""})
+        if not result[0]:
+            raise ValueError(str(result[1]))
+        converterArgs = result[2]
+
+        # Converter is only read by conversions, so it is safe to share between threads
+        self.fields = tuple(converterArgs["fields"])
+        self.multipliers = tuple(converterArgs["multipliers"])
+        self.currencySymbols = tuple(converterArgs["currencySymbols"])
+        self.encoding = converterArgs["encoding"]
+        self.backend = converterArgs["backend"]
+        self.rates = converterArgs["rates"]
+        self.roundingMode = converterArgs["roundingMode"]
+
+    def getConversionColumns(self, csvColumns: list) -> list:
+        """
+        This function validates column names of CSV data and returns columns used by conversion
+
+        @type csvColumns: List
+        @param csvColumns: CSV Column Names
+
+        @rtype: List
+        @returns: Total number of columns and Rates with Timestamp Column Number (None without rates file). Raises ValueError if columns are not valid
+        """
+        # Case 1 & 2: Empty CSV data or no "price" column
+        result = validateCSVColumns(csvColumns)
+        if not result[0]:
+            raise ValueError(result[1])
+        totalColumns = len(csvColumns) if csvColumns[-1] else len(csvColumns) - 1
+        if any(field >= totalColumns for field in self.fields):
+            raise ValueError("Field Number must be less than or equal to total number of columns in CSV file")
+        rates = {**self.rates, "timestampField": getTimestampField(csvColumns, self.rates["timestampField"])} if self.rates else None
+        return [totalColumns, rates]
+
+    def convertRows(self, csvRows, csvColumns: list = None):
+        """
+        This function validates and converts CSV rows chunk by chunk as they are consumed. Rows of caller are not changed
+
+        @type csvRows: Iterable of List
+        @param csvRows: CSV Rows Data (without column names), each row is a list of column values
+        @type csvColumns: List
+        @param csvColumns: CSV Column Names (number of columns of first row is used when not given, timestamp field must be given with rates file)
+
+        @rtype: Generator of List
+        @returns: Each Converted CSV Row. Raises ValueError with validation message for invalid row
+        """
+        csvRows = iter(csvRows)
+        firstRow = next(csvRows, None)
+        if firstRow is None:
+            return
+        if csvColumns is not None:
+            totalColumns, rates = self.getConversionColumns(csvColumns)
+        else:
+            totalColumns = len(firstRow)
+            if any(field >= totalColumns for field in self.fields):
+                raise ValueError("Field Number must be less than or equal to total number of columns in CSV file")
+            rates = {**self.rates, "timestampField": getTimestampField(firstRow, self.rates["timestampField"])} if self.rates else None
+
+        # Rows are copied, as converted values are written in place
+        csvRows = (list(csvRow) for csvRow in chain([firstRow], csvRows))
+        for convertedChunks in iterConvertedCSVRows(csvRows, totalColumns, list(self.fields), list(self.multipliers), list(self.currencySymbols), [[]],
+                                                    self.backend, rates=rates, roundingMode=self.roundingMode):
+            yield from convertedChunks[0]
+
+    def convertBytes(self, data: bytes) -> bytes:
+        """
+        This function converts CSV data, such as body of a request, and returns converted CSV data in output file format
+
+        @type data: Bytes
+        @param data: CSV Data with column names in first row
+
+        @rtype: Bytes
+        @returns: Converted CSV Data (UTF-8). Raises ValueError with validation message if data is not valid
+        """
+        csvRows = iterCSVStream(io.BytesIO(data), self.encoding)
+        csvColumns = next(csvRows, None)
+        totalColumns, rates = self.getConversionColumns(csvColumns)
+
+        convertedTexts = [csvSeprator.join(csvColumns) + "\n"]
+        for convertedChunks in iterConvertedCSVRows(csvRows, totalColumns, list(self.fields), list(self.multipliers), list(self.currencySymbols), [[]],
+                                                    self.backend, rates=rates, roundingMode=self.roundingMode):
+            convertedTexts.append(formatCSVRows(convertedChunks[0]))
+        return "".join(convertedTexts).encode(csvDefaultEncoding)
+
+    def convertFile(self, input: str, output: str) -> list:
+        """
+        This function converts input CSV file to output CSV file in streaming mode, same as currency_convert.py with --stream.
+        Compressed files (.csv.gz, .csv.bz2, .csv.xz) are supported. Threads must not convert to same output file at a time
+
+        @type input: String
+        @param input: Input CSV File Path
+        @type output: String
+        @param output: Output CSV File Path
+
+        @rtype: List
+        @returns: A List of Boolean and String Messages
+        """
+        return currencyConvertStreamOperation(list(self.fields), list(self.multipliers), list(self.currencySymbols), input, output,
+                                              self.encoding, self.backend, self.rates, self.roundingMode)
@@ -1,15 +1,54 @@
-import chardet
+from contextlib import ExitStack, contextmanager
+import io
 import os
-import re
-import locale
+import codecs
+import sys
 
-from constants.currencyConstants import supportedCurrencies, supportedCurrencySymbols, currencySymbolToLocale, currencyNameToLocale
-from constants.csvConstants import csvFileBasePath, csvSeprator, csvDefaultEncoding
+from constants.currencyConstants import supportedCurrencies, supportedCurrencySymbols, currencySymbolToLocale, currencyNameToLocale, minorUnitDigits, defaultRoundingMode
+from constants.csvConstants import csvFileBasePath, csvSeprator, csvDefaultEncoding, csvEncodingBOMs, csvEncodingDetectChunkSize, csvEncodingDetectMaxBytes, csvPipeReadSize, csvCompressionModules, csvCompressedBufferSize, csvMappedBlockSize, csvRangeReadSize, csvTextBlockSize
 
+from utils.statsUtils import statsStage, addStatsCount
+from utils.formatUtils import currencySymbolPattern, currencySymbolMatcher, parseCurrencyMinorUnits, formatCurrencyMinorUnits
+from utils.fixedPointUtils import parseScaledInteger
 
-def getCSVFileEncoding(filePath: str) -> str:
+
+# Detected encoding of each CSV file for the whole process, keyed by (file path, size, modified time)
+csvFileEncodingCache = {}
+
+
+def getCSVFileEncoding(filePath: str, encoding: str = None) -> str:
     """
-    This function reads CSV file and find the encoding type
+    This function reads CSV file and find the encoding type.
+    Byte Order Mark is checked first, then file is detected incrementally and result is cached until file is modified.
+
+    @type filePath: String
+    @param filePath: Input CSV File Path
+    @type encoding: String
+    @param encoding: Explicit Encoding Type, detection is skipped when given
+
+    @rtype: String
+    @return: Encoding Type of CSV file
+    """
+    # Explicit encoding does not need detection
+    if encoding:
+        return encoding
+
+    # Return cached encoding if file is not changed after last detection
+    fileStat = os.stat(filePath)
+    cacheKey = (os.path.abspath(filePath), fileStat.st_size, fileStat.st_mtime_ns)
+    if cacheKey in csvFileEncodingCache:
+        return csvFileEncodingCache[cacheKey]
+
+    with statsStage("detectEncoding"):
+        encoding = detectCSVFileEncoding(filePath)
+
+    csvFileEncodingCache[cacheKey] = encoding
+    return encoding
+
+
+def detectCSVFileEncoding(filePath: str) -> str:
+    """
+    This function detects CSV file encoding from Byte Order Mark, or incrementally with chardet module
 
     @type filePath: String
     @param filePath: Input CSV File Path
@@ -19,28 +58,68 @@ def getCSVFileEncoding(filePath: str) -> str:
     """
     # Read CSV file in Byte format and use chardet module to detect encoding type
     with open(filePath, 'rb') as csvFile:
-        # Reading large chunk of file
-        data = csvFile.read(10000000)
-        # Detect encoding
-        encodingInfo = chardet.detect(data)
-        # If not detected encoding then return default CSV encoding
-        encoding = encodingInfo['encoding'] if encodingInfo['confidence'] > 0 else csvDefaultEncoding
+        data = csvFile.read(csvEncodingDetectChunkSize)
+        # Byte Order Mark gives encoding without detection
+        encoding = next((bomEncoding for bom, bomEncoding in csvEncodingBOMs if data.startswith(bom)), None)
+        if not encoding:
+            # Detect encoding chunk by chunk and stop early when detector is confident (chardet is imported only when detection is needed)
+            from chardet.universaldetector import UniversalDetector
+            detector = UniversalDetector()
+            totalBytes = 0
+            while data and not detector.done and totalBytes < csvEncodingDetectMaxBytes:
+                detector.feed(data)
+                totalBytes += len(data)
+                data = csvFile.read(csvEncodingDetectChunkSize)
+            encodingInfo = detector.close()
+            # If not detected encoding then return default CSV encoding
+            encoding = encodingInfo['encoding'] if encodingInfo['confidence'] > 0 else csvDefaultEncoding
+    return encoding
+
+
+def getCSVDataEncoding(data: bytes, encoding: str = None) -> str:
+    """
+    This function finds the encoding type of CSV data which is not read from a file, such as first chunk of uploaded CSV data.
+    Byte Order Mark is checked first, then data is detected with chardet module.
+
+    @type data: Bytes
+    @param data: First bytes of CSV data
+    @type encoding: String
+    @param encoding: Explicit Encoding Type, detection is skipped when given
+
+    @rtype: String
+    @return: Encoding Type of CSV data
+    """
+    # Explicit encoding does not need detection
+    if encoding:
         return encoding
 
+    # Byte Order Mark gives encoding without detection
+    encoding = next((bomEncoding for bom, bomEncoding in csvEncodingBOMs if data.startswith(bom)), None)
+    if not encoding:
+        from chardet.universaldetector import UniversalDetector
+        detector = UniversalDetector()
+        detector.feed(data[:csvEncodingDetectMaxBytes])
+        encodingInfo = detector.close()
+        # If not detected encoding then return default CSV encoding, ASCII data may be followed by non ASCII data in next chunks
+        encoding = encodingInfo['encoding'] if encodingInfo['confidence'] > 0 and encodingInfo['encoding'] != "ascii" else csvDefaultEncoding
+    return encoding
 
-def getTotalCSVFileColumns(filePath: str) -> int:
+
+def getTotalCSVFileColumns(filePath: str, encoding: str = None) -> int:
     """
     This function returns total number of columns in CSV file
 
     @type filePath: String
     @param filePath: Input CSV File Path
+    @type encoding: String
+    @param encoding: Input CSV File Encoding (detected from file when not given)
 
     @rtype: Integer
     @return: Total number of columns in CSV file
     """
 
     # Find CSV file encoding
-    encoding = getCSVFileEncoding(filePath)
+    encoding = getCSVFileEncoding(filePath, encoding)
 
     # Reading CSV file with custom parser and count total columns
     with open(filePath, 'r', newline="\r\n", encoding=encoding) as csvFile:
@@ -48,7 +127,7 @@ def getTotalCSVFileColumns(filePath: str) -> int:
     return totalColumns
 
 
-def readCSVFile(fileName: str, nrows: int = -1) -> list:
+def readCSVFile(fileName: str, nrows: int = -1, encoding: str = None) -> list:
     """
     This function reads CSV from given input file path
 
@@ -56,6 +135,8 @@ def readCSVFile(fileName: str, nrows: int = -1) -> list:
     @param fileName: Input CSV File Name
     @type nrows: Integer
     @param nrows: Number of Rows to read from CSV file (-1 means all rows, 0 to n represent n number of rows)
+    @type encoding: String
+    @param encoding: Input CSV File Encoding (detected from file when not given)
 
     @rtype: List
     @return: List of CSV Column Names and All Rows Data
@@ -65,7 +146,7 @@ def readCSVFile(fileName: str, nrows: int = -1) -> list:
     csvFilePath = os.path.join(csvFileBasePath, fileName)
 
     # Find CSV file encoding
-    encoding = getCSVFileEncoding(csvFilePath)
+    encoding = getCSVFileEncoding(csvFilePath, encoding)
 
     # Reading CSV file with custom parser
     with open(csvFilePath, 'r', newline="\r\n", encoding=encoding) as csvFile:
@@ -86,51 +167,569 @@ def readCSVFile(fileName: str, nrows: int = -1) -> list:
     return [csvFileColumns, csvFileRows]
 
 
-def writeCSVFile(csvData: list, fileName: str) -> list:
+def iterCSVFile(filePath: str, encoding: str = None):
     """
-    This function takes csv data as input and writes it into csv file
+    This function reads CSV file row by row and yields each row without keeping the file data in memory.
+    Compressed CSV file is decompressed while it is read and its encoding is detected from decompressed data.
+
+    @type filePath: String
+    @param filePath: Input CSV File Path
+    @type encoding: String
+    @param encoding: Input CSV File Encoding (detected from file when not given)
+
+    @rtype: Generator of List
+    @return: CSV Column Names as first item followed by each Row Data
+    """
+
+    # Compressed CSV file is read as a stream of decompressed data
+    compression = getCSVFileCompression(filePath)
+    if compression:
+        with openCSVFileStream(filePath, "rb", compression) as dataStream:
+            yield from iterCSVStream(dataStream, encoding, countBytesRead=False)
+        return
+
+    # Find CSV file encoding
+    encoding = getCSVFileEncoding(filePath, encoding)
+
+    # Reading CSV file with custom parser, one row at a time
+    with open(filePath, 'r', newline="\r\n", encoding=encoding) as csvFile:
+        for row in csvFile:
+            row = row.replace("\r\n", "")
+            csvRowData = row.split(csvSeprator)
+            if all(len(data) == 0 for data in csvRowData):
+                break
+            yield csvRowData
+
+
+def getCSVFileCompression(fileName: str) -> str:
+    """
+    This function returns compression of CSV file from its file name
 
-    @type csvData: List
-    @param csvData: List of CSV Columns and Rows
     @type fileName: String
     @param fileName: CSV File Name
 
+    @rtype: String
+    @return: Compression Extention - gz, bz2 or xz (None if file is not compressed). Example: gz for data.csv.gz
+    """
+    fileInfo = os.path.basename(fileName).lower().split(".")
+    if len(fileInfo) >= 3 and fileInfo[-2] == "csv" and fileInfo[-1] in csvCompressionModules:
+        return fileInfo[-1]
+    return None
+
+
+@contextmanager
+def openCSVFileStream(filePath: str, mode: str, compression: str = None, encoding: str = None):
+    """
+    This function opens CSV file as a binary stream which decompresses data while it is read or compresses data while it is written.
+    Compressed data and decompressed data are both buffered in csvCompressedBufferSize bytes, so compression module gets large blocks.
+
+    @type filePath: String
+    @param filePath: CSV File Path
+    @type mode: String
+    @param mode: rb to read or wb to write
+    @type compression: String
+    @param compression: Compression Extention - gz, bz2 or xz (None for plain CSV file)
+    @type encoding: String
+    @param encoding: Text Encoding of stream (None for binary stream)
+
+    @rtype: Binary Stream or Text Stream
+    @return: Buffered Stream of CSV data (Text Stream when encoding is given)
+    """
+    with open(filePath, mode, buffering=csvCompressedBufferSize) as rawFile:
+        if not compression:
+            yield rawFile
+            return
+        # Compression modules are only imported for compressed files
+        import importlib
+        compressionModule = importlib.import_module(csvCompressionModules[compression])
+        with compressionModule.open(rawFile, mode) as compressedFile:
+            bufferedStream = io.BufferedReader if mode.startswith("r") else io.BufferedWriter
+            with bufferedStream(compressedFile, csvCompressedBufferSize) as dataStream:
+                if not encoding:
+                    yield dataStream
+                    return
+                # Text stream is closed first, so its buffered text reaches compression module before it is closed
+                with io.TextIOWrapper(dataStream, encoding=encoding) as textStream:
+                    yield textStream
+
+
+def iterCSVStream(dataStream, encoding: str = None, countBytesRead: bool = True):
+    """
+    This function reads CSV data from a binary stream such as standard input pipe and yields each row as soon as it is received.
+    Data is read in chunks, so only one chunk and an incomplete last row are kept in memory.
+
+    @type dataStream: Binary Stream
+    @param dataStream: CSV Data Stream. Example: sys.stdin.buffer
+    @type encoding: String
+    @param encoding: CSV Data Encoding (detected from first chunk when not given)
+    @type countBytesRead: Boolean
+    @param countBytesRead: Whether bytes of stream are added to bytesRead stats (False when file size is already added)
+
+    @rtype: Generator of List
+    @return: CSV Column Names as first item followed by each Row Data, same as iterCSVFile. Raises ValueError if data can not be decoded
+    """
+    decoder = None
+    pendingText = ""
+    # read1 returns data already in pipe instead of waiting for whole chunk, so rows are converted as they arrive
+    readChunk = dataStream.read1 if hasattr(dataStream, "read1") else dataStream.read
+    data = readChunk(csvPipeReadSize)
+    while data:
+        if countBytesRead:
+            addStatsCount("bytesRead", len(data))
+        if decoder is None:
+            encoding = getCSVDataEncoding(data, encoding)
+            decoder = codecs.getincrementaldecoder(encoding)()
+        try:
+            pendingText += decoder.decode(data)
+        except UnicodeDecodeError:
+            raise ValueError(f"Invalid CSV data. It can not be decoded with {encoding} encoding")
+        rows = pendingText.split("\r\n")
+        pendingText = rows.pop()
+        for row in rows:
+            csvRowData = row.split(csvSeprator)
+            if all(len(data) == 0 for data in csvRowData):
+                return
+            yield csvRowData
+        data = readChunk(csvPipeReadSize)
+
+    # Last row without line seprator
+    if decoder is not None:
+        pendingText += decoder.decode(b"", final=True)
+    if pendingText:
+        yield pendingText.split(csvSeprator)
+
+
+def readCSVFileHeader(filePath: str, encoding: str = None) -> list:
+    """
+    This function reads column names of CSV file and returns byte offset where rows data starts
+
+    @type filePath: String
+    @param filePath: Input CSV File Path
+    @type encoding: String
+    @param encoding: Input CSV File Encoding (detected from file when not given)
+
+    @rtype: List
+    @return: CSV Column Names (None if file is empty) and Byte Offset of first row
+    """
+
+    # Find CSV file encoding
+    encoding = getCSVFileEncoding(filePath, encoding)
+
+    # Reading first row in Byte format till row seprator
+    with open(filePath, 'rb') as csvFile:
+        # Bytearray is extended in place, as a file without row seprator is read line by line till its end
+        firstRow = bytearray()
+        while True:
+            line = csvFile.readline()
+            firstRow += line
+            if not line or firstRow.endswith(b"\r\n"):
+                break
+        csvFileColumns = firstRow.decode(encoding).replace("\r\n", "").split(csvSeprator)
+        if all(len(data) == 0 for data in csvFileColumns):
+            csvFileColumns = None
+        return [csvFileColumns, len(firstRow)]
+
+
+def iterCSVFileBlocks(filePath: str, startOffset: int, blockSize: int = csvMappedBlockSize):
+    """
+    This function memory-maps CSV file and yields rows data in blocks of bytes, each block ends at row boundary (\r\n) or end of file.
+    Rows are not decoded or splitted, so caller only decodes fields it needs.
+
+    @type filePath: String
+    @param filePath: Input CSV File Path
+    @type startOffset: Integer
+    @param startOffset: Byte Offset of first row
+    @type blockSize: Integer
+    @param blockSize: Size of each block in bytes (a row longer than block is one block)
+
+    @rtype: Generator of Bytes
+    @return: Each block of rows data
+    """
+    import mmap
+    with open(filePath, "rb") as csvFile:
+        fileSize = os.fstat(csvFile.fileno()).st_size
+        if fileSize <= startOffset:
+            return
+        with mmap.mmap(csvFile.fileno(), 0, access=mmap.ACCESS_READ) as fileMap:
+            blockStart = startOffset
+            while blockStart < fileSize:
+                blockEnd = fileSize
+                if blockStart + blockSize < fileSize:
+                    rowEnd = fileMap.rfind(b"\r\n", blockStart, blockStart + blockSize)
+                    if rowEnd == -1:
+                        rowEnd = fileMap.find(b"\r\n", blockStart + blockSize - 1)
+                    blockEnd = rowEnd + 2 if rowEnd != -1 else fileSize
+                yield fileMap[blockStart:blockEnd]
+                blockStart = blockEnd
+
+
+def splitCSVFileRanges(filePath: str, startOffset: int, totalRanges: int, endOffset: int = None) -> list:
+    """
+    This function splits CSV file rows data into byte ranges of nearly equal size, each range starts and ends at row boundary (\\r\\n)
+
+    @type filePath: String
+    @param filePath: Input CSV File Path
+    @type startOffset: Integer
+    @param startOffset: Byte Offset of first row (after column names)
+    @type totalRanges: Integer
+    @param totalRanges: Number of ranges to split file into
+    @type endOffset: Integer
+    @param endOffset: Byte Offset after last row to split (end of file when not given)
+
+    @rtype: List of List
+    @return: Start and End Byte Offset of each range
+    """
+    fileSize = os.path.getsize(filePath) if endOffset is None else endOffset
+    rangeSize = max((fileSize - startOffset) // max(totalRanges, 1), 1)
+    boundaries = [startOffset]
+
+    with open(filePath, 'rb') as csvFile:
+        while boundaries[-1] < fileSize:
+            # Move each boundary forward to the end of row seprator
+            position = boundaries[-1] + rangeSize
+            if position >= fileSize:
+                boundaries.append(fileSize)
+                break
+            csvFile.seek(position - 1)
+            previousByte = b""
+            while True:
+                # Row seprator may be split between two reads, so last byte of previous read is searched again
+                data = previousByte + csvFile.read(csvRangeReadSize)
+                index = data.find(b"\r\n")
+                if index != -1:
+                    boundaries.append(csvFile.tell() - len(data) + index + 2)
+                    break
+                if len(data) - len(previousByte) < csvRangeReadSize:
+                    boundaries.append(fileSize)
+                    break
+                previousByte = data[-1:]
+
+    return [[start, end] for start, end in zip(boundaries, boundaries[1:]) if end > start]
+
+
+def readCSVFileRange(filePath: str, encoding: str, start: int, end: int) -> list:
+    """
+    This function reads CSV rows from a byte range of CSV file which starts and ends at row boundary
+
+    @type filePath: String
+    @param filePath: Input CSV File Path
+    @type encoding: String
+    @param encoding: Input CSV File Encoding
+    @type start: Integer
+    @param start: Start Byte Offset of range
+    @type end: Integer
+    @param end: End Byte Offset of range
+
+    @rtype: List
+    @return: CSV Rows Data of range and Boolean which is True if an empty row (end of CSV data) is found in range
+    """
+    with open(filePath, 'rb') as csvFile:
+        csvFile.seek(start)
+        data = csvFile.read(end - start).decode(encoding)
+
+    rows = data.split("\r\n")
+    if data.endswith("\r\n"):
+        rows.pop(-1)
+    csvRows = []
+    for row in rows:
+        csvRowData = row.split(csvSeprator)
+        if all(len(data) == 0 for data in csvRowData):
+            return [csvRows, True]
+        csvRows.append(csvRowData)
+    return [csvRows, False]
+
+
+def formatCSVRows(csvRows: list) -> str:
+    """
+    This function takes CSV rows as input and returns them as CSV text in output file format
+
+    @type csvRows: List of List
+    @param csvRows: CSV Rows Data
+
+    @rtype: String
+    @return: CSV Rows Text seprated by CSV seprator and line seprator
+    """
+    lineSeprator = "\n"
+    return "".join(csvSeprator.join(csvRow) + lineSeprator for csvRow in csvRows)
+
+
+def iterCSVTextBlocks(filePath: str, encoding: str):
+    """
+    This function reads decoded CSV text of a file in blocks of about csvTextBlockSize characters.
+    Each block ends with a whole row, so rows are never split between blocks and file is never read whole.
+
+    @type filePath: String
+    @param filePath: Input CSV File Path
+    @type encoding: String
+    @param encoding: Input CSV File Encoding
+
+    @rtype: Generator of String
+    @return: Decoded CSV Text of whole rows, last block has rest of file
+    """
+    remainder = ""
+    with open(filePath, "r", encoding=encoding, newline="") as csvFile:
+        for csvText in iter(lambda: csvFile.read(csvTextBlockSize), ""):
+            csvText = remainder + csvText
+            rowsEnd = csvText.rfind("\r\n")
+            if rowsEnd < 0:
+                remainder = csvText
+                continue
+            remainder = csvText[rowsEnd + 2:]
+            yield csvText[:rowsEnd + 2]
+    if remainder:
+        yield remainder
+
+
+def iterCSVTextRows(csvTextBlocks, fields: list, rowsOffsets):
+    """
+    This function splits decoded CSV text into rows and records character offsets of each row and its currency fields,
+    so converted rows can later be formatted from CSV text without splitting rows again
+
+    @type csvTextBlocks: Iterable of String
+    @param csvTextBlocks: Decoded CSV File Data in blocks of whole rows (iterCSVTextBlocks)
+    @type fields: List of Integer
+    @param fields: CSV File's Currency Column Numbers (starts from 0)
+    @type rowsOffsets: Array of Integer
+    @param rowsOffsets: Array which is extended with row start, start and end of each currency field and row end of each row
+
+    @rtype: Generator of List
+    @return: CSV Column Names as first item followed by each Row Data
+    """
+    lastField = max(fields)
+    position = 0
+    header = True
+    for row in iterCSVTextBlockRows(csvTextBlocks):
+        csvRowData = row.split(csvSeprator)
+        if all(len(data) == 0 for data in csvRowData):
+            break
+        if not header:
+            # Start of each column up to last currency column, a row with less columns is not valid and never cached
+            columnStarts = []
+            columnStart = position
+            for data in csvRowData[:lastField + 1]:
+                columnStarts.append(columnStart)
+                columnStart += len(data) + 1
+            rowsOffsets.append(position)
+            for field in fields:
+                if field < len(columnStarts):
+                    rowsOffsets.extend([columnStarts[field], columnStarts[field] + len(csvRowData[field])])
+                else:
+                    rowsOffsets.extend([position, position])
+            rowsOffsets.append(position + len(row))
+        header = False
+        yield csvRowData
+        position += len(row) + 2
+
+
+def iterCSVTextBlockRows(csvTextBlocks):
+    """
+    This function splits blocks of decoded CSV text into rows
+
+    @type csvTextBlocks: Iterable of String
+    @param csvTextBlocks: Decoded CSV File Data in blocks of whole rows (iterCSVTextBlocks)
+
+    @rtype: Generator of String
+    @return: Each Row Text without line seprator
+    """
+    for csvText in csvTextBlocks:
+        rows = csvText.split("\r\n")
+        # Block ends with line seprator of its last row
+        if csvText.endswith("\r\n"):
+            rows.pop()
+        yield from rows
+
+
+def formatCSVTextRows(csvText: str, rowsOffsets: list, convertedCurrencies: list, totalFields: int) -> str:
+    """
+    This function formats converted rows in output file format from CSV text, offsets of rows and converted currency fields
+
+    @type csvText: String
+    @param csvText: Decoded CSV File Data
+    @type rowsOffsets: List of Integer
+    @param rowsOffsets: Row start, start and end of each currency field and row end of each row (recorded by iterCSVTextRows)
+    @type convertedCurrencies: List of String
+    @param convertedCurrencies: Converted value of each currency field of each row (row by row)
+    @type totalFields: Integer
+    @param totalFields: Number of currency fields of each row
+
+    @rtype: String
+    @return: Converted CSV Rows Text seprated by line seprator
+    """
+    lineSeprator = "\n"
+    rowWidth = totalFields * 2 + 2
+    # Currency fields are joined in order of their position in row
+    fieldOrder = sorted(range(totalFields), key=lambda k: rowsOffsets[1 + 2 * k]) if rowsOffsets else []
+    pieces = []
+    for rowStart in range(0, len(rowsOffsets), rowWidth):
+        position = rowsOffsets[rowStart]
+        for k in fieldOrder:
+            pieces.append(csvText[position:rowsOffsets[rowStart + 1 + 2 * k]])
+            pieces.append(convertedCurrencies[rowStart // rowWidth * totalFields + k])
+            position = rowsOffsets[rowStart + 2 + 2 * k]
+        pieces.append(csvText[position:rowsOffsets[rowStart + rowWidth - 1]])
+        pieces.append(lineSeprator)
+    return "".join(pieces)
+
+
+def writeCSVFilesChunks(csvColumns: list, csvChunks, fileNames: list) -> list:
+    """
+    This function takes csv columns and an iterable of row chunks as input and writes them into one or more csv files chunk by chunk.
+    Data is written to temporary files first and renamed on success, so a failure while consuming chunks does not leave partial output files.
+    Output file with .csv.gz, .csv.bz2 or .csv.xz extention is compressed while it is written.
+
+    @type csvColumns: List
+    @param csvColumns: List of CSV Column Names
+    @type csvChunks: Iterable of List
+    @param csvChunks: Each item is a list with one chunk of CSV Rows (or already formatted rows text or UTF-8 bytes) for each output file
+    @type fileNames: List of String
+    @param fileNames: CSV File Names
+
     @rtype: List of Boolean and String
     @returns: List of Boolean Status and String Message of operation
     """
 
     result = [True, "Successfully Created Output CSV file"]
 
+    # Set CSV file paths
+    csvFilePaths = [os.path.join(csvFileBasePath, fileName) for fileName in fileNames]
+    tempFilePaths = [csvFilePath + ".tmp" for csvFilePath in csvFilePaths]
+
     try:
-        # Set CSV file path
-        csvFilePath = os.path.join(csvFileBasePath, fileName)
-        
-        # Writing CSV file with custom parser
-        with open(csvFilePath, "w", encoding=csvDefaultEncoding) as csvFile:
-            csvColmunNames, csvRowData = csvData
+        # Writing CSV files with custom parser
+        with ExitStack() as stack:
+            stack.enter_context(statsStage("write"))
+            csvFiles = [stack.enter_context(openCSVFileStream(tempFilePath, "wb", getCSVFileCompression(fileName), csvDefaultEncoding))
+                        if getCSVFileCompression(fileName) else stack.enter_context(open(tempFilePath, "w", encoding=csvDefaultEncoding))
+                        for tempFilePath, fileName in zip(tempFilePaths, fileNames)]
             lineSeprator = "\n"
-            csvColmunNames = csvSeprator.join(csvColmunNames) + lineSeprator
-            csvRowData = list(
-                map(lambda x: csvSeprator.join(x) + lineSeprator, csvRowData))
-            csvRowData.insert(0, csvColmunNames)
-            csvFile.writelines(csvRowData)
+            for csvFile in csvFiles:
+                csvFile.write(csvSeprator.join(csvColumns) + lineSeprator)
+            for csvChunk in csvChunks:
+                for csvFile, csvRows in zip(csvFiles, csvChunk):
+                    if isinstance(csvRows, str):
+                        csvFile.write(csvRows)
+                    elif isinstance(csvRows, bytes):
+                        # Formatted bytes are written after text written before them
+                        csvFile.flush()
+                        csvFile.buffer.write(csvRows)
+                    else:
+                        csvFile.writelines(csvSeprator.join(csvRow) + lineSeprator for csvRow in csvRows)
+        for tempFilePath, csvFilePath in zip(tempFilePaths, csvFilePaths):
+            os.replace(tempFilePath, csvFilePath)
+            addStatsCount("bytesWritten", os.path.getsize(csvFilePath))
 
         return result
 
     except Exception as e:
+        for tempFilePath in tempFilePaths:
+            if os.path.exists(tempFilePath):
+                os.remove(tempFilePath)
         result[0] = False
         result[1] = e
         return result
 
 
-def writeCSVFileFromStdin(currencySymbol: str, field: int) -> list:
+def writeCSVStreamChunks(csvColumns: list, csvChunks, dataStream) -> list:
+    """
+    This function takes csv columns and an iterable of row chunks as input and writes them to a binary stream such as standard output pipe.
+    Each chunk is flushed as soon as it is written, so next program in pipeline gets rows while input is still being read.
+    Unlike output files, rows written before a failure can not be removed, so exit status must be checked.
+
+    @type csvColumns: List
+    @param csvColumns: List of CSV Column Names
+    @type csvChunks: Iterable of List
+    @param csvChunks: Each item is a list with one chunk of CSV Rows (only first destination currency is written)
+    @type dataStream: Binary Stream
+    @param dataStream: Output Data Stream. Example: sys.stdout.buffer
+
+    @rtype: List of Boolean and String
+    @returns: List of Boolean Status and String Message of operation
+    """
+
+    result = [True, "Successfully Written Output CSV data to standard output"]
+
+    try:
+        with statsStage("write"):
+            # Output data has same encoding as output CSV file
+            encoder = codecs.getincrementalencoder(csvDefaultEncoding)()
+            lineSeprator = "\n"
+            csvText = csvSeprator.join(csvColumns) + lineSeprator
+            for csvChunk in csvChunks:
+                csvRows = csvChunk[0]
+                if isinstance(csvRows, bytes):
+                    data = encoder.encode(csvText) + csvRows
+                else:
+                    csvText += csvRows if isinstance(csvRows, str) else "".join(csvSeprator.join(csvRow) + lineSeprator for csvRow in csvRows)
+                    data = encoder.encode(csvText)
+                dataStream.write(data)
+                dataStream.flush()
+                addStatsCount("bytesWritten", len(data))
+                csvText = ""
+            # Column names are written even if there is no chunk
+            if csvText:
+                data = encoder.encode(csvText)
+                dataStream.write(data)
+                dataStream.flush()
+                addStatsCount("bytesWritten", len(data))
+
+        return result
+
+    except BrokenPipeError:
+        # Next program in pipeline has exited (Example: head), rest of output is discarded instead of failing again at exit
+        os.dup2(os.open(os.devnull, os.O_WRONLY), dataStream.fileno())
+        result[0] = False
+        result[1] = "Output pipe is closed before all rows are written"
+        return result
+
+    except Exception as e:
+        result[0] = False
+        result[1] = e
+        return result
+
+
+def writeCSVFileRows(csvColumns: list, csvRows, fileName: str) -> list:
+    """
+    This function takes csv columns and an iterable of rows as input and writes them into csv file row by row
+
+    @type csvColumns: List
+    @param csvColumns: List of CSV Column Names
+    @type csvRows: Iterable of List
+    @param csvRows: CSV Rows Data (list or generator)
+    @type fileName: String
+    @param fileName: CSV File Name
+
+    @rtype: List of Boolean and String
+    @returns: List of Boolean Status and String Message of operation
+    """
+    return writeCSVFilesChunks(csvColumns, [[csvRows]], [fileName])
+
+
+def writeCSVFile(csvData: list, fileName: str) -> list:
+    """
+    This function takes csv data as input and writes it into csv file
+
+    @type csvData: List
+    @param csvData: List of CSV Columns and Rows
+    @type fileName: String
+    @param fileName: CSV File Name
+
+    @rtype: List of Boolean and String
+    @returns: List of Boolean Status and String Message of operation
+    """
+
+    # Writing CSV file with custom parser
+    csvColmunNames, csvRowData = csvData
+    return writeCSVFileRows(csvColmunNames, csvRowData, fileName)
+
+
+def writeCSVFileFromStdin(currencySymbols: list, fields: list) -> list:
     """
     This function takes input from user in console and writes data in csv file 
 
-    @type currencySymbol: String
-    @param currencySymbol: Destination Currency Symbol
-    @type field: Integer
-    @param field: CSV File Currency Column Number
+    @type currencySymbols: List of String
+    @param currencySymbols: Destination Currency Symbols
+    @type fields: List of Integer
+    @param fields: CSV File Currency Column Numbers
 
     @rtype: List of Boolean and String
     @returns: List of Boolean Status and String Message of operation
@@ -145,7 +744,7 @@ def writeCSVFileFromStdin(currencySymbol: str, field: int) -> list:
         print(f"Supported Currencies: {supportedCurrencies}")
         sourceCurrency = input("Currency: ")
         sourceCurrency = sourceCurrency.strip().upper()
-        if not sourceCurrency or sourceCurrency not in supportedCurrencies or sourceCurrency == currencySymbol:
+        if not sourceCurrency or sourceCurrency not in supportedCurrencies or sourceCurrency in currencySymbols:
             result[0] = False
             result[1] = "Currency must be from above options only and not equal to destination currency symbol"
             return result
@@ -160,7 +759,7 @@ def writeCSVFileFromStdin(currencySymbol: str, field: int) -> list:
         columnCount = int(columnCount)
 
         print(f"\nEnter Column names seprated by {csvSeprator} and column name should not contain it. Example: name1|name2|name3|..")
-        print("Note: Currency Data Column name should contain 'price' keyword. field command line argument should be currency column")
+        print("Note: Currency Data Column names should contain 'price' keyword. field command line argument should be currency columns")
         csvColumns = input("Column Names: ")
         csvColumns = csvColumns.strip()
         csvColumnNames = csvColumns.split(csvSeprator)
@@ -168,12 +767,12 @@ def writeCSVFileFromStdin(currencySymbol: str, field: int) -> list:
             result[0] = False
             result[1] = f"Column Names must be seprated by {csvSeprator}, must be equal to column count and should not contain only digit"
             return result
-        elif not "price" in csvColumnNames[field].lower():
+        elif not all("price" in csvColumnNames[field].lower() for field in fields):
             result[0] = False
-            result[1] = "field command line argument column number should contain 'price' keyword"
+            result[1] = "field command line argument column numbers should contain 'price' keyword"
             return result
         csvColumnNames = list(map(lambda x: x.strip(), csvColumnNames))
-        if field > len(csvColumnNames):
+        if any(field > len(csvColumnNames) for field in fields):
             result[0] = False
             result[1] = "Currency Column should be less then total columns count"
             return result
@@ -205,12 +804,11 @@ def writeCSVFileFromStdin(currencySymbol: str, field: int) -> list:
                 return result
             else:
                 for i, columnData in enumerate(csvRowData):
-                    if i == field:
-                        amount = float(columnData)
+                    if i in fields:
+                        amount = parseScaledInteger(columnData, minorUnitDigits, defaultRoundingMode)
                         localeOption = currencyNameToLocale[sourceCurrency]
-                        locale.setlocale(locale.LC_ALL, localeOption)
-                        formattedAmount = locale.currency(
-                            amount, grouping=True)
+                        formattedAmount = formatCurrencyMinorUnits(
+                            amount, localeOption)
                         csvRowData[i] = formattedAmount
                 csvData[1].append(csvRowData)
 
@@ -222,7 +820,7 @@ def writeCSVFileFromStdin(currencySymbol: str, field: int) -> list:
 
         # Validate CSV file data
         csvFilePath = os.path.join(csvFileBasePath, fileName)
-        result = validateCSVFile(csvFilePath, field)
+        result = validateCSVFile(csvFilePath, fields)
         if not result[0]:
             return result
         # Append new file name and csv data
@@ -283,20 +881,137 @@ def printCSVFile(csvData: list):
     print("\n")
 
 
-def validateCSVFile(filePath: str, field: int) -> list:
+def validateCSVColumns(csvFileColumns: list) -> list:
+    """
+    This function takes CSV column names as input and check whether they are ready to process or not
+
+    @type csvFileColumns: List
+    @param csvFileColumns: CSV File Column Names (None or empty if file is empty)
+
+    @rtype: List of Boolean & String
+    @return: Boolean Status of Columns Validation & Error Message in String
+    """
+    validateInfo = [True, "Valid CSV File Columns"]
+
+    # Case 1: Empty CSV file
+    if not csvFileColumns:
+        validateInfo[0] = False
+        validateInfo[1] = "CSV File is Empty. It must be filled with Column Names and Matching number of rows data"
+        return validateInfo
+
+    # Case 2: Atleast one column should contain "price" keyword
+    if not any("price" in columnName.lower() for columnName in csvFileColumns):
+        validateInfo[0] = False
+        validateInfo[1] = "CSV File Columns are invalid. Atleast one column should contain price keyword"
+        return validateInfo
+
+    return validateInfo
+
+
+def validateCSVRow(csvRowData: list, totalColumns: int) -> list:
+    """
+    This function takes one CSV row as input and check whether it matches the CSV file structure
+
+    @type csvRowData: List
+    @param csvRowData: CSV Row Data splitted by CSV seprator
+    @type totalColumns: Integer
+    @param totalColumns: Total number of columns in CSV file
+
+    @rtype: List of Boolean & String
+    @return: Boolean Status of Row Validation & Error Message in String
+    """
+    validateInfo = [True, "Valid CSV Row"]
+
+    # Case 3: Row Data contains null
+    if any(len(data) == 0 for data in csvRowData):
+        validateInfo[0] = False
+        validateInfo[1] = "Invalid CSV File. Row Data containts null element"
+        return validateInfo
+    # Case 4: Row Data is not matching number of columns
+    if len(csvRowData) != totalColumns:
+        validateInfo[0] = False
+        validateInfo[1] = "Invalid CSV File. Row Data is not matching to total number of columns"
+        return validateInfo
+
+    return validateInfo
+
+
+def validateCSVCurrency(currencyData: str, sourceCurrencySymbol: str, mixedCurrency: bool = False) -> list:
+    """
+    This function takes currency data of one CSV row as input and check whether it is in supported currency and locale number formatting
+
+    @type currencyData: String
+    @param currencyData: Currency Symbol and Value from currency column
+    @type sourceCurrencySymbol: String
+    @param sourceCurrencySymbol: Currency Symbol found in previous rows (empty for first row)
+    @type mixedCurrency: Boolean
+    @param mixedCurrency: Rows may be in different currencies, symbol of each row is found with longest match of supported symbols
+
+    @rtype: List of Boolean, String, String & Float
+    @return: Boolean Status of Currency Validation, Error Message in String, Source Currency Symbol & Parsed Amount in minor units
+    """
+    validateInfo = [True, "Valid CSV Currency Data", sourceCurrencySymbol, None]
+
+    currencyData = currencyData.strip()
+    sourceCurrencyInfo = currencySymbolPattern.search(currencyData)
+    # Case: Currency Columns has no symbol
+    if not sourceCurrencyInfo:
+        validateInfo[0] = False
+        validateInfo[1] = "Invalid CSV File or Input. Currency data is not at proper column in CSV file. Check Command Line argument"
+        return validateInfo
+    # Case: input CSV file has symbol not supported in this currency conversion system
+    if mixedCurrency:
+        currencySymbolInfo = currencySymbolMatcher.search(currencyData)
+        sourceCurrencySymbol = currencySymbolInfo.group() if currencySymbolInfo else sourceCurrencyInfo.group()
+        validateInfo[2] = sourceCurrencySymbol
+    elif not sourceCurrencySymbol:
+        sourceCurrencySymbol = sourceCurrencyInfo.group()
+        validateInfo[2] = sourceCurrencySymbol
+    if sourceCurrencySymbol not in supportedCurrencySymbols:
+        validateInfo[0] = False
+        print(
+            f"Supported Currency Symbols: {supportedCurrencySymbols}", file=sys.stderr)
+        validateInfo[1] = "Invalid CSV File Currency. It should be from supported currency symbols as above"
+        return validateInfo
+    # Case: csv file has more than one currency symbols
+    elif sourceCurrencyInfo.group() != sourceCurrencySymbol and not mixedCurrency:
+        validateInfo[0] = False
+        validateInfo[1] = "Invalid CSV File. Multiple Currency Symbols Exist in CSV file. It should contain only one currency"
+        return validateInfo
+    # Case: Price Column Data is not according to locale number formatting
+    else:
+        localeOption = currencySymbolToLocale[sourceCurrencySymbol]
+        try:
+            currencyData = currencyData.replace(
+                sourceCurrencySymbol, "")
+            validateInfo[3] = parseCurrencyMinorUnits(currencyData, localeOption)
+        except Exception as e:
+            validateInfo[0] = False
+            validateInfo[1] = "Invalid CSV File. Currency Value Formatting is not according to locale number formatting"
+            validateInfo[1] += f"\n{e}"
+            return validateInfo
+
+    return validateInfo
+
+
+def validateCSVFile(filePath: str, fields: list, encoding: str = None, mixedCurrency: bool = False) -> list:
     """
     This function takes filePath as input, reads it and check whether the file is ready to process or not
 
     @type filePath: String
     @param filePath: Input CSV File Path
-    @type field: Integer
-    @param field: CSV File's Currency Column Number
+    @type fields: List of Integer
+    @param fields: CSV File's Currency Column Numbers
+    @type encoding: String
+    @param encoding: Input CSV File Encoding (detected from file when not given)
+    @type mixedCurrency: Boolean
+    @param mixedCurrency: Rows may be in different currencies (converted with cross rates of base rates file)
 
     @rtype: List of Boolean & String
     @return: Boolean Status of File Validation & Error Message in String
     """
     # Find CSV file encoding
-    encoding = getCSVFileEncoding(filePath)
+    encoding = getCSVFileEncoding(filePath, encoding)
 
     # Pair of Boolean Status and Error Message
     validateInfo = [True, "Valid CSV File. It is ready to be processed"]
@@ -306,38 +1021,24 @@ def validateCSVFile(filePath: str, field: int) -> list:
         csvFileColumns = []
         csvFileRows = []
 
-        # Case 1: Empty CSV file
+        # Case 1 & 2: Empty CSV file or no "price" column
         firstRow = csvFile.readline().replace("\r\n", "")
-        if not firstRow:
-            validateInfo[0] = False
-            validateInfo[1] = "CSV File is Empty. It must be filled with Column Names and Matching number of rows data"
-            return validateInfo
-        else:
-            csvFileColumns = firstRow.split(csvSeprator)
-            if not csvFileColumns[-1]:
-                csvFileColumns.pop(-1)
-
-        # Case 2: Atleast one column should contain "price" keyword
-        if not any("price" in columnName.lower() for columnName in csvFileColumns):
-            validateInfo[0] = False
-            validateInfo[1] = "CSV File Columns are invalid. Atleast one column should contain price keyword"
-            return validateInfo
+        csvFileColumns = firstRow.split(csvSeprator) if firstRow else []
+        columnsInfo = validateCSVColumns(csvFileColumns)
+        if not columnsInfo[0]:
+            return columnsInfo
+        if not csvFileColumns[-1]:
+            csvFileColumns.pop(-1)
 
         for row in csvFile:
             row = row.replace("\r\n", "")
             csvRowData = row.split(csvSeprator)  # change
             if all(len(data) == 0 for data in csvRowData):
                 break
-            # Case 3: Row Data contains null
-            if any(len(data) == 0 for data in csvRowData):
-                validateInfo[0] = False
-                validateInfo[1] = "Invalid CSV File. Row Data containts null element"
-                return validateInfo
-            # Case 4: Row Data is not matching number of columns
-            if len(csvRowData) != len(csvFileColumns):
-                validateInfo[0] = False
-                validateInfo[1] = "Invalid CSV File. Row Data is not matching to total number of columns"
-                return validateInfo
+            # Case 3 & 4: Row Data contains null or is not matching number of columns
+            rowInfo = validateCSVRow(csvRowData, len(csvFileColumns))
+            if not rowInfo[0]:
+                return rowInfo
             else:
                 csvFileRows.append(csvRowData)
 
@@ -347,44 +1048,13 @@ def validateCSVFile(filePath: str, field: int) -> list:
             validateInfo[1] = "Invalid CSV File. It only contains column names and does not contain rows data"
             return validateInfo
 
-        # Case 6: Currency data should be at proper column and in locale number formatting
+        # Case 6: Currency data should be at proper columns and in locale number formatting
         sourceCurrencySymbol = ""
         for csvFileRow in csvFileRows:
-            csvFileRow = list(map(lambda x: x.strip(), csvFileRow))
-            currencyData = csvFileRow[field]
-            sourceCurrencyInfo = re.search(r"[^0-9\s,.]+", currencyData)
-            # Case: Currency Columns has no symbol
-            if not sourceCurrencyInfo:
-                validateInfo[0] = False
-                validateInfo[1] = "Invalid CSV File or Input. Currency data is not at proper column in CSV file. Check Command Line argument"
-                return validateInfo
-            # Case: input CSV file has symbol not supported in this currency conversion system
-            if not sourceCurrencySymbol:
-                sourceCurrencySymbol = sourceCurrencyInfo.group()
-            if sourceCurrencySymbol not in supportedCurrencySymbols:
-                validateInfo[0] = False
-                print(
-                    f"Supported Currency Symbols: {supportedCurrencySymbols}")
-                validateInfo[1] = "Invalid CSV File Currency. It should be from supported currency symbols as above"
-                return validateInfo
-            # Case: csv file has more than one currency symbols
-            elif sourceCurrencyInfo.group() != sourceCurrencySymbol:
-                print(sourceCurrencyInfo.group(), sourceCurrencySymbol)
-                validateInfo[0] = False
-                validateInfo[1] = "Invalid CSV File. Multiple Currency Symbols Exist in CSV file. It should contain only one currency"
-                return validateInfo
-            # Case: Price Column Data is not according to locale number formatting
-            else:
-                localeOption = currencySymbolToLocale[sourceCurrencySymbol]
-                locale.setlocale(locale.LC_ALL, localeOption)
-                try:
-                    currencyData = currencyData.replace(
-                        sourceCurrencySymbol, "")
-                    amount = locale.atof(currencyData)
-                except Exception as e:
-                    validateInfo[0] = False
-                    validateInfo[1] = "Invalid CSV File. Currency Value Formatting is not according to locale number formatting"
-                    validateInfo[1] += f"\n{e}"
-                    return validateInfo
+            for field in fields:
+                currencyInfo = validateCSVCurrency(csvFileRow[field], sourceCurrencySymbol, mixedCurrency)
+                if not currencyInfo[0]:
+                    return currencyInfo[:2]
+                sourceCurrencySymbol = currencyInfo[2]
 
         return validateInfo
@@ -1,23 +1,60 @@
-import re
-import locale
+import os
+import sys
+import time
+import codecs
+from array import array
+from itertools import chain
+from functools import partial
+from collections import deque, OrderedDict
 
-from constants.currencyConstants import currencySymbolToName, currencySymbolToLocale, currencyNameToLocale
+from constants.currencyConstants import currencySymbolToName, currencySymbolToLocale, currencyNameToLocale, localeToCurrencyFormat, defaultRoundingMode, currencyMemoMaxEntries, currencyMemoProbeValues, currencyMemoMinHitRate
+from constants.csvConstants import csvFileBasePath, csvSeprator, csvDefaultEncoding, csvChunkRows, csvPipeChunkRows, csvIncrementalRangeSize, csvWatchInterval, csvPipelineQueueChunks, csvPipeReadSize, csvMappedEncodings, csvMappedBlockSize
 
-from utils.csvUtils import readCSVFile, writeCSVFile, writeCSVFileFromStdin, printCSVFile
+from utils.formatUtils import currencySymbolPattern, parseCurrencyMinorUnits, formatCurrencyMinorUnits
+from utils.fixedPointUtils import parseRate, multiplyMinorUnit, multiplyMinorUnits
+from utils.vectorUtils import isVectorBackendAvailable, convertCurrencyAmountsVectorized
+from utils.rateUtils import getTimestampField, getRowsRates, getAmountsCurrencies, getAmountsCrossRates
+from utils.statsUtils import statsStage, iterStatsStage, addStatsCount, collectStats
+from utils.memoUtils import getConversionMemo, convertMemoizedValues
+from utils.csvUtils import getCSVFileCompression, readCSVFile, iterCSVFile, iterCSVStream, writeCSVFile, writeCSVFilesChunks, writeCSVStreamChunks, writeCSVFileFromStdin, printCSVFile, validateCSVColumns, validateCSVRow, validateCSVCurrency
+from utils.csvUtils import getCSVFileEncoding, readCSVFileHeader, iterCSVFileBlocks, splitCSVFileRanges, readCSVFileRange, formatCSVRows, iterCSVTextBlocks, iterCSVTextRows, formatCSVTextRows
+from utils.checkpointUtils import getCheckpointPath, readCheckpoint, writeCheckpoint, removeCheckpoint, hashFileRange, findLastRowEnd
+from utils.cacheUtils import readCacheEntry, closeCacheEntry, writeCacheEntry, getContentHash
+from utils.pipelineUtils import iterCSVRowBlocks, iterThreadedItems, consumeThreadedItems
+from utils.quarantineUtils import getRejectFileName, rejectCSVRow, getQuarantineSummary, iterQuarantinedChunks
 
 
-def getInputFileCurrencyName(filePath: str) -> str:
+# Mode options of currencyConvertOperation (validated by validateArgs), options which are not given keep these values
+defaultConversionOptions = {
+    "stream": False,
+    "encoding": None,
+    "backend": "scalar",
+    "workers": 1,
+    "rates": None,
+    "batchFiles": None,
+    "roundingMode": defaultRoundingMode,
+    "incremental": False,
+    "watch": False,
+    "cache": None,
+    "pipeline": False,
+    "quarantine": None
+}
+
+
+def getInputFileCurrencyName(filePath: str, encoding: str = None) -> str:
     """
     This function reads input CSV file and return the source currency symbol in abbreviated form
 
     @type filePath: String
     @param filePath: Input CSV File Path
+    @type encoding: String
+    @param encoding: Input CSV File Encoding (detected from file when not given)
 
     @rtype: String
     @returns: Source File Currency Symbol Name
     """
     # Read CSV file and find currency column
-    csvFileInfo = readCSVFile(filePath, nrows=1)
+    csvFileInfo = readCSVFile(filePath, nrows=1, encoding=encoding)
     csvFileColumns = csvFileInfo[0]
     csvFilePriceColumn = list(
         filter(lambda x: "price" in x.lower(), csvFileColumns))[0]
@@ -26,12 +63,12 @@ def getInputFileCurrencyName(filePath: str) -> str:
     # Read one sample currency data from currency column of first line
     currencyData = csvFileFirstLine[csvFilePriceColumnIndex]
     # Regex to find Currency Symbol and return Abbreviated form
-    sourceCurrencySymbol = re.search(r"[^0-9\s,.]+", currencyData).group()
+    sourceCurrencySymbol = currencySymbolPattern.search(currencyData).group()
     sourceCurrencySymbolName = currencySymbolToName[sourceCurrencySymbol]
     return sourceCurrencySymbolName
 
 
-def convertCurrency(sourceCurrency: str, destinationCurrency: str, multiplier: float) -> str:
+def convertCurrency(sourceCurrency: str, destinationCurrency: str, multiplier, roundingMode: str = defaultRoundingMode) -> str:
     """
     This function takes source currency as an input and converts it into destination currency value with locale number formatting
 
@@ -39,47 +76,191 @@ def convertCurrency(sourceCurrency: str, destinationCurrency: str, multiplier: f
     @param sourceCurrency: Source Currency Symbol and Value
     @type destinationCurrency: String
     @param destinationCurrency: Destination Currency Symbol
-    @type multiplier: Float
-    @param multiplier: Float Value of Multiplier
+    @type multiplier: String or Float
+    @param multiplier: Value of Multiplier. Example: 0.000712
+    @type roundingMode: String
+    @param roundingMode: Rounding Mode of converted amounts (constants/currencyConstants.py)
 
     @rtype: String
     @returns: Destination Currency Symbol and Value
     """
 
     # Source Currency Processing
-    sourceCurrencySymbol = re.search(r"[^0-9\s,.]+", sourceCurrency).group()
+    amount = parseCurrency(sourceCurrency)
+
+    # Destination Currency Processing
+    return convertCurrencyAmount(amount, destinationCurrency, parseRate(str(multiplier), roundingMode), roundingMode)
+
+
+def parseCurrency(sourceCurrency: str) -> int:
+    """
+    This function takes source currency as an input and returns its amount parsed from locale number formatting of its symbol
+
+    @type sourceCurrency: String
+    @param sourceCurrency: Source Currency Symbol and Value
+
+    @rtype: Integer
+    @returns: Source Currency Amount in minor units (cents)
+    """
+    sourceCurrencySymbol = currencySymbolPattern.search(sourceCurrency).group()
     localeOption = currencySymbolToLocale[sourceCurrencySymbol]
-    locale.setlocale(locale.LC_ALL, localeOption)
     sourceValue = sourceCurrency.replace(sourceCurrencySymbol, "").strip()
-    amount = locale.atof(sourceValue)
+    return parseCurrencyMinorUnits(sourceValue, localeOption)
 
-    # Destination Currency Processing
-    destinationCurrency = destinationCurrency.strip().upper()
-    localeOption = currencyNameToLocale[destinationCurrency]
-    locale.setlocale(locale.LC_ALL, localeOption)
-    convertedAmount = round(amount * multiplier, 2)
-    formattedAmount = locale.currency(convertedAmount, grouping=True)
-    return formattedAmount
 
+def convertCurrencyAmount(amount: int, destinationCurrency: str, multiplier: int, roundingMode: str = defaultRoundingMode) -> str:
+    """
+    This function takes parsed source amount as an input and converts it into destination currency value with locale number formatting
+
+    @type amount: Integer
+    @param amount: Source Currency Amount in minor units
+    @type destinationCurrency: String
+    @param destinationCurrency: Destination Currency Symbol
+    @type multiplier: Integer
+    @param multiplier: Value of Multiplier scaled by 10 ** rateDigits
+    @type roundingMode: String
+    @param roundingMode: Rounding Mode of converted amounts (constants/currencyConstants.py)
 
-def currencyConvertOperation(field: int, multiplier: float, currencySymbol: str, input: str, output: str) -> list:
+    @rtype: String
+    @returns: Destination Currency Symbol and Value
     """
-    This function does main task of currency conversion according to command line arguments.
+    localeOption = currencyNameToLocale[destinationCurrency.strip().upper()]
+    minorUnits = multiplyMinorUnit(amount, multiplier, localeToCurrencyFormat[localeOption]["fracDigits"], roundingMode)
+    return formatCurrencyMinorUnits(minorUnits, localeOption)
 
-    @type field: Integer
-    @param field: CSV File Field Number (starts from 1)
-    @type multiplier: Float
-    @param multiplier: The value to be multiplied to original currency
+
+def convertCurrencyAmounts(amounts: list, destinationCurrency: str, multiplier: float, backend: str = "scalar", roundingMode: str = defaultRoundingMode) -> list:
+    """
+    This function takes a batch of parsed source amounts as an input and converts them into destination currency values.
+    Each distinct amount (or amount and rate pair) of batch is converted once and recently converted amounts are taken from memo of conversion.
+
+    @type amounts: List of Integer
+    @param amounts: Source Currency Amounts in minor units
+    @type destinationCurrency: String
+    @param destinationCurrency: Destination Currency Symbol
+    @type multiplier: Integer or List of Integer
+    @param multiplier: Value of Multiplier scaled by 10 ** rateDigits (or one multiplier for each amount)
+    @type backend: String
+    @param backend: Conversion Backend - scalar (python loop) or numpy (vectorized, scalar is used if NumPy is not installed)
+    @type roundingMode: String
+    @param roundingMode: Rounding Mode of converted amounts (constants/currencyConstants.py)
+
+    @rtype: List of String
+    @returns: Destination Currency Symbol and Value of each amount
+    """
+    # Rate of each row: amount and rate pairs are memoized
+    if isinstance(multiplier, list):
+        memo = getConversionMemo(destinationCurrency, None, roundingMode)
+        return convertMemoizedValues(memo, list(zip(amounts, multiplier)), lambda pairs: convertDistinctCurrencyAmounts(
+            [amount for amount, amountMultiplier in pairs], destinationCurrency, [amountMultiplier for amount, amountMultiplier in pairs], backend, roundingMode))
+    memo = getConversionMemo(destinationCurrency, multiplier, roundingMode)
+    return convertMemoizedValues(memo, amounts, lambda distinctAmounts: convertDistinctCurrencyAmounts(
+        distinctAmounts, destinationCurrency, multiplier, backend, roundingMode))
+
+
+def convertDistinctCurrencyAmounts(amounts: list, destinationCurrency: str, multiplier: float, backend: str = "scalar", roundingMode: str = defaultRoundingMode) -> list:
+    """
+    This function converts each source amount into destination currency value.
+    Amounts are multiplied with exact integer arithmetic and each converted amount is rounded once to fraction digits of destination currency.
+
+    @type amounts: List of Integer
+    @param amounts: Source Currency Amounts in minor units
+    @type destinationCurrency: String
+    @param destinationCurrency: Destination Currency Symbol
+    @type multiplier: Integer or List of Integer
+    @param multiplier: Value of Multiplier scaled by 10 ** rateDigits (or one multiplier for each amount)
+    @type backend: String
+    @param backend: Conversion Backend - scalar (python loop) or numpy (vectorized, scalar is used if NumPy is not installed)
+    @type roundingMode: String
+    @param roundingMode: Rounding Mode of converted amounts (constants/currencyConstants.py)
+
+    @rtype: List of String
+    @returns: Destination Currency Symbol and Value of each amount
+    """
+    if backend == "numpy" and isVectorBackendAvailable():
+        return convertCurrencyAmountsVectorized(amounts, destinationCurrency, multiplier, roundingMode)
+    localeOption = currencyNameToLocale[destinationCurrency.strip().upper()]
+    minorUnits = multiplyMinorUnits(amounts, multiplier, localeToCurrencyFormat[localeOption]["fracDigits"], roundingMode)
+    return [formatCurrencyMinorUnits(minorUnit, localeOption) for minorUnit in minorUnits]
+
+
+def getOutputFileName(output: str, currencySymbol: str, fanOut: bool) -> str:
+    """
+    This function returns output CSV file name for a destination currency
+
+    @type output: String
+    @param output: Output CSV file name or stdout
     @type currencySymbol: String
     @param currencySymbol: Destination Currency Symbol - an abbreviated form Example: EUR for Euro
+    @type fanOut: Boolean
+    @param fanOut: Whether input is converted to more than one destination currency
+
+    @rtype: String
+    @returns: Output CSV file name. Example: data-EUR.csv for stdout and output-EUR.csv for output.csv (output-EUR.csv.gz for output.csv.gz) with more than one currency
+    """
+    if output == "stdout":
+        return f"data-{currencySymbol}.csv"
+    if fanOut:
+        outputName, extention = os.path.splitext(output)
+        # Currency Symbol is added before .csv of compressed file
+        if getCSVFileCompression(output):
+            outputName, csvExtention = os.path.splitext(outputName)
+            extention = csvExtention + extention
+        return f"{outputName}-{currencySymbol}{extention}"
+    return output
+
+
+@collectStats
+def currencyConvertOperation(fields: list, multipliers: list, currencySymbols: list, input: str, output: str, options: dict = None) -> list:
+    """
+    This function does main task of currency conversion according to command line arguments.
+    Source amounts are parsed once and written to one output for each destination currency.
+
+    @type fields: List of Integer
+    @param fields: CSV File's Currency Column Numbers (starts from 0)
+    @type multipliers: List of Integer
+    @param multipliers: The value to be multiplied to original currency for each destination currency, scaled by 10 ** rateDigits
+    @type currencySymbols: List of String
+    @param currencySymbols: Destination Currency Symbols - an abbreviated form Example: EUR for Euro
     @type input: String
-    @param input: Input CSV file name
+    @param input: Input CSV file name, stdin or - for CSV data from standard input pipe
     @type output: String
-    @param output: Output CSV file name
+    @param output: Output CSV file name, stdout or - for CSV data to standard output pipe
+    @type options: Dictionary
+    @param options: Mode Options validated by validateArgs (keys of defaultConversionOptions):
+                    stream (Boolean) - streaming mode, input file is validated, converted and written in a single pass
+                    encoding (String) - input CSV file encoding (detected from file when not given)
+                    backend (String) - conversion backend, scalar (python loop) or numpy (vectorized)
+                    workers (Integer) - number of worker processes to convert input CSV file in parallel chunks (or batch files at a time)
+                    rates (Dictionary) - rates file name (ratesFile) and timestamp column number (timestampField) to use rate of each row instead of multipliers
+                                         (or cross rates (crossRates) of mixed currency rows)
+                    batchFiles (List of String) - input CSV file paths of batch mode (output is a directory)
+                    roundingMode (String) - rounding mode of converted amounts (constants/currencyConstants.py)
+                    incremental (Boolean) - only rows appended to input file after previous run are converted and appended to output file
+                    watch (Boolean) - watch input file and convert appended rows as they arrive (incremental mode)
+                    cache (Dictionary) - cache directory (cacheDirectory) and maximum total size of cache files in bytes (cacheMaxBytes) to reuse parsed currency columns
+                    pipeline (Boolean) - input rows are read by reader thread and output is written by writer thread while rows are converted
+                    quarantine (Dictionary) - maximum number of invalid rows (maxErrors), invalid rows are written to reject file instead of failing conversion
 
     @rtype: List
     @returns: A List of Boolean and String Messages
     """
+    options = {**defaultConversionOptions, **(options or {})}
+    stream, encoding, backend, workers = options["stream"], options["encoding"], options["backend"], options["workers"]
+    rates, batchFiles, roundingMode, pipeline = options["rates"], options["batchFiles"], options["roundingMode"], options["pipeline"]
+    incremental, watch, cache, quarantine = options["incremental"], options["watch"], options["cache"], options["quarantine"]
+
+    # Input Case 5: input is a batch of csv files converted by a pool of worker processes
+    if batchFiles:
+        return currencyConvertBatchOperation(fields, multipliers, currencySymbols, batchFiles, output, encoding, backend, workers, rates, roundingMode, pipeline, quarantine)
+
+    # Input Case 6: input is csv file whose appended rows are converted from checkpoint of previous run
+    if incremental:
+        return currencyConvertIncrementalOperation(fields, multipliers, currencySymbols, input, output, encoding, backend, rates, roundingMode, watch)
+
+    # Input Case 7: input is csv file whose parsed currency columns are read from (or written to) cache
+    if cache:
+        return currencyConvertCachedOperation(fields, multipliers, currencySymbols, input, output, encoding, backend, cache, roundingMode)
 
     # Setting stdin and stdout flags according to command line arguments
     stdin = True if input == "stdin" else False
@@ -87,40 +268,979 @@ def currencyConvertOperation(field: int, multiplier: float, currencySymbol: str,
 
     result = [True, "Currency Conversion Operation is successfully completed"]
 
+    # Input Case 4: input is csv file processed in parallel chunks by worker processes
+    if workers > 1 and not stdin:
+        return currencyConvertParallelOperation(fields, multipliers, currencySymbols, input, output, encoding, backend, workers, rates, roundingMode, pipeline)
+
+    # Input Case 3: input is csv file (or standard input pipe) processed in streaming mode, pipes, pipeline mode and compressed input files are always streamed
+    if (stream or pipeline or input == "-" or output == "-" or getCSVFileCompression(input)) and not stdin:
+        return currencyConvertStreamOperation(fields, multipliers, currencySymbols, input, output, encoding, backend, rates, roundingMode, pipeline, quarantine)
+
     try:
         # Input Case 1: input is stdin
         if stdin:
-            result = writeCSVFileFromStdin(currencySymbol, field)
+            result = writeCSVFileFromStdin(currencySymbols, fields)
             if not result[0]:
                 return result
             input, csvData = result[2], result[3]
         # Input Case 2: input is csv file
         else:
-            csvData = readCSVFile(input)
+            with statsStage("parse"):
+                csvData = readCSVFile(input, encoding=encoding)
+            addStatsCount("bytesRead", os.path.getsize(os.path.join(csvFileBasePath, input)))
 
-        # Read Data and Convert Currency in each row in CSV file
+        # Read Data, parse currency columns once and convert them for each destination currency
         csvColumns, csvRows = csvData
+        with statsStage("parse"):
+            amounts = [parseCurrency(csvRow[field]) for csvRow in csvRows for field in fields]
+        addStatsCount("rows", len(csvRows))
+        if rates and "ratesFile" in rates:
+            sourceCurrencySymbol = currencySymbolPattern.search(csvRows[0][fields[0]]).group()
+            rates = {**rates, "timestampField": getTimestampField(csvColumns, rates["timestampField"]),
+                     "sourceCurrency": currencySymbolToName[sourceCurrencySymbol]}
+        convertedChunks = convertCSVRowsChunk(
+            csvRows, amounts, fields, multipliers, currencySymbols, backend, rates, roundingMode)
+
+        fileNames = []
+        for currencySymbol, convertedRows in zip(currencySymbols, convertedChunks):
+            # Output Case 1: output is CSV file
+            fileName = getOutputFileName(output, currencySymbol, len(currencySymbols) > 1)
+            result = writeCSVFile([csvColumns, convertedRows], fileName)
+            if not result[0]:
+                return result
+            fileNames.append(fileName)
+
+            # Output Case 2: output is stdout (in this case CSV is still created)
+            if stdout:
+                printCSVFile([csvColumns, convertedRows])
+
+        result[1] = result[1] + f": {', '.join(fileNames)}"
+        return result
+
+    except Exception as e:
+        result[0] = False
+        result[1] = e
+        return result
+
+
+class CSVCurrencyParser:
+    """
+    This class validates rows and parses their currency fields for iterConvertedCSVRows (decoded rows) and iterConvertedCSVFileBlocks (rows bytes),
+    so both keep same validation, parse memo and quarantine of invalid rows.
+    Each distinct currency string of recently seen strings is validated and parsed once (oldest is evicted first), memo is turned off when most of first
+    currencyMemoProbeValues strings are distinct.
+    """
+
+    def __init__(self, fields: list, currencySymbols: list, sourceCurrencySymbol: str = "", mixedCurrency: bool = False, quarantine: dict = None, fieldEncoding: str = None):
+        """
+        This function creates parser of rows of one conversion
+
+        @type fields: List of Integer
+        @param fields: CSV File's Currency Column Numbers (starts from 0)
+        @type currencySymbols: List of String
+        @param currencySymbols: Destination Currency Symbols - an abbreviated form Example: EUR for Euro
+        @type sourceCurrencySymbol: String
+        @param sourceCurrencySymbol: Currency Symbol of input file if already known (empty means symbol of first row)
+        @type mixedCurrency: Boolean
+        @param mixedCurrency: Rows may be in different currencies, so there is no source currency of file
+        @type quarantine: Dictionary
+        @param quarantine: Quarantine state of --on-error quarantine, invalid rows are rejected into it instead of raising ValueError
+        @type fieldEncoding: String
+        @param fieldEncoding: Encoding of rows bytes, only currency fields and rejected rows are decoded (None for decoded rows)
+        """
+        self.fields = fields
+        self.currencySymbols = currencySymbols
+        self.sourceCurrencySymbol = sourceCurrencySymbol
+        self.mixedCurrency = mixedCurrency
+        self.quarantine = quarantine
+        self.fieldEncoding = fieldEncoding
+        self.totalRows = 0
+        self.parseMemo = OrderedDict()
+        self.parseMisses = 0
+        self.parseLookups = 0
+
+    def rejectRow(self, row, rowError: str):
+        """
+        This function raises ValueError for invalid row, or writes it to quarantine state in quarantine mode
+
+        @type row: List or Bytes
+        @param row: Invalid CSV Row Data (splitted decoded row or row bytes)
+        @type rowError: String
+        @param rowError: Validation Message of row
+        """
+        if self.quarantine is None:
+            raise ValueError(rowError)
+        rowText = row.decode(self.fieldEncoding) if self.fieldEncoding else csvSeprator.join(row)
+        rejectCSVRow(self.quarantine, self.totalRows, rowText, rowError)
+
+    def parseRow(self, row, rowData: list, amounts: list) -> bool:
+        """
+        This function validates currency fields of one row and appends their parsed amounts
+
+        @type row: List or Bytes
+        @param row: CSV Row Data (splitted decoded row or row bytes), written to reject file if it is invalid
+        @type rowData: List
+        @param rowData: CSV Row Data splitted by CSV seprator (at least up to last currency column)
+        @type amounts: List
+        @param amounts: Parsed Amounts of chunk which are extended with amounts of this row
+
+        @rtype: Boolean
+        @returns: True if row is valid, False if it is rejected in quarantine mode. Raises ValueError with validation message for invalid row
+        """
+        parseMemo = self.parseMemo
+        # Case 6: Currency data should be at proper columns and in locale number formatting
+        for fieldIndex, field in enumerate(self.fields):
+            if parseMemo is not None:
+                amount = parseMemo.get(rowData[field])
+                if amount is not None:
+                    amounts.append(amount)
+                    continue
+            currencyData = rowData[field].decode(self.fieldEncoding) if self.fieldEncoding else rowData[field]
+            currencyInfo = validateCSVCurrency(currencyData, self.sourceCurrencySymbol, self.mixedCurrency)
+            if not currencyInfo[0]:
+                # Quarantine mode: amounts of currency columns before invalid column are removed with the row
+                del amounts[len(amounts) - fieldIndex:]
+                self.rejectRow(row, currencyInfo[1])
+                return False
+            if not self.sourceCurrencySymbol and not self.mixedCurrency:
+                self.sourceCurrencySymbol = currencyInfo[2]
+                if currencySymbolToName[self.sourceCurrencySymbol] in self.currencySymbols:
+                    raise ValueError("Currency Symbol must be different then source currency")
+            amounts.append(currencyInfo[3])
+            if parseMemo is not None:
+                parseMemo[rowData[field]] = currencyInfo[3]
+                if len(parseMemo) > currencyMemoMaxEntries:
+                    parseMemo.popitem(last=False)
+                self.parseMisses += 1
+
+        self.totalRows += 1
+        if self.totalRows == currencyMemoProbeValues and self.parseMisses > self.totalRows * len(self.fields) * (1 - currencyMemoMinHitRate):
+            self.parseMemo = None
+            self.parseLookups = self.totalRows * len(self.fields)
+        return True
+
+    def finish(self):
+        """
+        This function adds numbers of rows and memo lookups to stats and sets converted rows of quarantine state at end of data
+        Raises ValueError if there are no rows data
+        """
+        totalLookups = self.parseLookups or self.totalRows * len(self.fields)
+        addStatsCount("rows", self.totalRows)
+        addStatsCount("parseMemoHits", totalLookups - self.parseMisses)
+        addStatsCount("parseMemoMisses", self.parseMisses)
+        if self.quarantine is not None:
+            self.quarantine["convertedRows"] = self.totalRows
+        # Case 5: Only Column names in CSV, rows data does not exist (all rows may be rejected in quarantine mode)
+        if self.totalRows == 0 and not (self.quarantine and self.quarantine["rejectedRows"]):
+            raise ValueError("Invalid CSV File. It only contains column names and does not contain rows data")
+
+
+def iterConvertedCSVRows(csvRows, totalColumns: int, fields: list, multipliers: list, currencySymbols: list, previewRows: list, backend: str = "scalar", sourceCurrencySymbol: str = "", rates: dict = None, maxChunkRows: int = csvChunkRows, roundingMode: str = defaultRoundingMode, parsedAmounts: list = None, quarantine: dict = None):
+    """
+    This function takes CSV rows as input and validates & converts them chunk by chunk as they are consumed
+
+    @type csvRows: Iterable of List
+    @param csvRows: CSV Rows Data (without column names)
+    @type totalColumns: Integer
+    @param totalColumns: Total number of columns in CSV file
+    @type fields: List of Integer
+    @param fields: CSV File's Currency Column Numbers (starts from 0)
+    @type multipliers: List of Integer
+    @param multipliers: The value to be multiplied to original currency for each destination currency, scaled by 10 ** rateDigits
+    @type currencySymbols: List of String
+    @param currencySymbols: Destination Currency Symbols - an abbreviated form Example: EUR for Euro
+    @type previewRows: List of List
+    @param previewRows: List for each destination currency which is filled with first few converted rows to print on console
+    @type backend: String
+    @param backend: Conversion Backend - scalar (python loop) or numpy (vectorized)
+    @type sourceCurrencySymbol: String
+    @param sourceCurrencySymbol: Currency Symbol of input file if already known (empty means symbol of first row)
+    @type rates: Dictionary
+    @param rates: Rates File Name (ratesFile) and Timestamp Column Number (timestampField) to use rate of each row instead of multipliers (or Cross Rates (crossRates), rows may be in different currencies)
+    @type maxChunkRows: Integer
+    @param maxChunkRows: Number of rows validated and converted together
+    @type roundingMode: String
+    @param roundingMode: Rounding Mode of converted amounts (constants/currencyConstants.py)
+    @type parsedAmounts: List
+    @param parsedAmounts: List which is extended with parsed source amount of each currency column of each row (row by row), to cache them
+    @type quarantine: Dictionary
+    @param quarantine: Quarantine state of --on-error quarantine, invalid rows are rejected into it instead of raising ValueError (convertedRows is set at end)
+
+    @rtype: Generator of List
+    @returns: List of Converted CSV Rows chunk for each destination currency. Raises ValueError with validation message for invalid row
+    """
+
+    # Max Rows kept for stdout preview
+    maxRowsPrint = 5
+    chunkRows = []
+    chunkAmounts = []
+    # Mixed currency rows are converted with cross rate from currency of each row, so there is no source currency of file
+    mixedCurrency = bool(rates) and "crossRates" in rates
+    csvParser = CSVCurrencyParser(fields, currencySymbols, sourceCurrencySymbol, mixedCurrency, quarantine)
+
+    for csvRow in csvRows:
+        # Case 3 & 4: Row Data contains null or is not matching number of columns
+        rowInfo = validateCSVRow(csvRow, totalColumns)
+        if not rowInfo[0]:
+            csvParser.rejectRow(csvRow, rowInfo[1])
+            continue
+        if not csvParser.parseRow(csvRow, csvRow, chunkAmounts):
+            continue
+        if rates and not mixedCurrency and "sourceCurrency" not in rates:
+            rates = {**rates, "sourceCurrency": currencySymbolToName[csvParser.sourceCurrencySymbol]}
+        chunkRows.append(csvRow)
+
+        # Currency Conversion of chunk and add first rows to preview
+        if len(chunkRows) == maxChunkRows:
+            if parsedAmounts is not None:
+                parsedAmounts.extend(chunkAmounts)
+            convertedChunks = convertCSVRowsChunk(
+                chunkRows, chunkAmounts, fields, multipliers, currencySymbols, backend, rates, roundingMode)
+            yield convertedChunks
+            for preview, convertedRows in zip(previewRows, convertedChunks):
+                preview.extend(convertedRows[:maxRowsPrint - len(preview)])
+            chunkRows, chunkAmounts = [], []
+
+    if parsedAmounts is not None:
+        parsedAmounts.extend(chunkAmounts)
+    convertedChunks = convertCSVRowsChunk(
+        chunkRows, chunkAmounts, fields, multipliers, currencySymbols, backend, rates, roundingMode)
+    yield convertedChunks
+    for preview, convertedRows in zip(previewRows, convertedChunks):
+        preview.extend(convertedRows[:maxRowsPrint - len(preview)])
+
+    csvParser.finish()
+
+
+def convertCSVRowsChunk(csvRows: list, amounts: list, fields: list, multipliers: list, currencySymbols: list, backend: str = "scalar", rates: dict = None, roundingMode: str = defaultRoundingMode) -> list:
+    """
+    This function takes a chunk of validated CSV rows with their parsed amounts and converts currency columns for each destination currency
+
+    @type csvRows: List of List
+    @param csvRows: Validated CSV Rows Data
+    @type amounts: List of Float
+    @param amounts: Parsed Source Amount of each currency column of each row (row by row)
+    @type fields: List of Integer
+    @param fields: CSV File's Currency Column Numbers (starts from 0)
+    @type multipliers: List of Integer
+    @param multipliers: The value to be multiplied to original currency for each destination currency, scaled by 10 ** rateDigits
+    @type currencySymbols: List of String
+    @param currencySymbols: Destination Currency Symbols - an abbreviated form Example: EUR for Euro
+    @type backend: String
+    @param backend: Conversion Backend - scalar (python loop) or numpy (vectorized)
+    @type rates: Dictionary
+    @param rates: Rates File Name (ratesFile), Timestamp Column Number (timestampField) and Source Currency (sourceCurrency) to use rate of each row instead of multipliers
+                  (or Cross Rates (crossRates) to use rate from currency of each amount of mixed currency rows)
+    @type roundingMode: String
+    @param roundingMode: Rounding Mode of converted amounts (constants/currencyConstants.py)
+
+    @rtype: List of List
+    @returns: Converted CSV Rows for each destination currency
+    """
+    convertedChunks = []
+    with statsStage("convert"):
+        # Currency of each amount of mixed currency rows is found once for all destination currencies
+        sourceCurrencies = getAmountsCurrencies(csvRows, fields) if rates and "crossRates" in rates else None
+        for i, (currencySymbol, multiplier) in enumerate(zip(currencySymbols, multipliers)):
+            # Cross rate from currency of each amount, or rate in effect at timestamp of each row for all currency columns of the row
+            if sourceCurrencies is not None:
+                multiplier = getAmountsCrossRates(sourceCurrencies, rates["crossRates"], currencySymbol)
+            elif rates:
+                multiplier = getRowsRates(csvRows, rates, rates["sourceCurrency"], currencySymbol, len(fields))
+            convertedCurrencies = convertCurrencyAmounts(
+                amounts, currencySymbol, multiplier, backend, roundingMode)
+            # Last destination currency reuses input rows, others get a copy of rows
+            convertedRows = csvRows if i == len(currencySymbols) - 1 else [list(csvRow) for csvRow in csvRows]
+            convertedCurrencies = iter(convertedCurrencies)
+            for csvRow in convertedRows:
+                for field in fields:
+                    csvRow[field] = next(convertedCurrencies)
+            convertedChunks.append(convertedRows)
+    return convertedChunks
+
+
+def iterConvertedCSVFileBlocks(csvBlocks, encoding: str, totalColumns: int, fields: list, multipliers: list, currencySymbols: list, previewRows: list, backend: str = "scalar", roundingMode: str = defaultRoundingMode, quarantine: dict = None):
+    """
+    This function validates and converts blocks of CSV rows bytes of a UTF-8 (or ASCII) file, same as iterConvertedCSVRows for decoded rows.
+    Rows are splitted only up to last currency column and only currency fields (and rejected rows) are parsed from decoded text, other columns are copied to output as bytes
+    without encoding. Each block is still checked with file encoding by an incremental decoder whose text is not kept, so invalid bytes fail same as decoded rows.
+
+    @type csvBlocks: Iterable of Bytes
+    @param csvBlocks: Blocks of CSV rows data, each block ends at row boundary (iterCSVFileBlocks)
+    @type encoding: String
+    @param encoding: Input CSV File Encoding - UTF-8, UTF-8-SIG or ASCII
+    @type totalColumns: Integer
+    @param totalColumns: Total number of columns in CSV file
+    @type fields: List of Integer
+    @param fields: CSV File's Currency Column Numbers (starts from 0)
+    @type multipliers: List of Integer
+    @param multipliers: The value to be multiplied to original currency for each destination currency, scaled by 10 ** rateDigits
+    @type currencySymbols: List of String
+    @param currencySymbols: Destination Currency Symbols - an abbreviated form Example: EUR for Euro
+    @type previewRows: List of List
+    @param previewRows: List for each destination currency which is filled with first few converted rows to print on console
+    @type backend: String
+    @param backend: Conversion Backend - scalar (python loop) or numpy (vectorized)
+    @type roundingMode: String
+    @param roundingMode: Rounding Mode of converted amounts (constants/currencyConstants.py)
+    @type quarantine: Dictionary
+    @param quarantine: Quarantine state of --on-error quarantine, invalid rows are rejected into it instead of raising ValueError (convertedRows is set at end)
+
+    @rtype: Generator of List
+    @returns: Converted CSV Rows bytes of each block for each destination currency. Raises ValueError with validation message for invalid row
+    """
+
+    # Max Rows kept for stdout preview
+    maxRowsPrint = 5
+    seprator = csvSeprator.encode()
+    totalSeprators = totalColumns - 1
+    maxSplit = max(fields) + 1
+    # Byte Order Mark is only at start of file, so fields are decoded with UTF-8 codec
+    fieldEncoding = "utf-8" if codecs.lookup(encoding).name == "utf-8-sig" else encoding
+    csvParser = CSVCurrencyParser(fields, currencySymbols, quarantine=quarantine, fieldEncoding=fieldEncoding)
+    blockDecoder = codecs.getincrementaldecoder(fieldEncoding)()
+    endOfData = False
+
+    for csvBlock in csvBlocks:
+        # Raises UnicodeDecodeError for invalid bytes in any column, decoded text of block is discarded
+        blockDecoder.decode(csvBlock)
+        blockRows = csvBlock.split(b"\r\n")
+        if not blockRows[-1]:
+            blockRows.pop()
+        splittedRows = []
+        amounts = []
+        for row in blockRows:
+            # Rows after an empty row are not part of CSV data
+            if not row.strip(seprator):
+                endOfData = True
+                break
+            # Case 3: Row Data contains null
+            # Case 4: Row Data is not matching number of columns
+            if row.startswith(seprator) or row.endswith(seprator) or seprator * 2 in row:
+                csvParser.rejectRow(row, "Invalid CSV File. Row Data containts null element")
+                continue
+            if row.count(seprator) != totalSeprators:
+                csvParser.rejectRow(row, "Invalid CSV File. Row Data is not matching to total number of columns")
+                continue
+            rowData = row.split(seprator, maxSplit)
+            if csvParser.parseRow(row, rowData, amounts):
+                splittedRows.append(rowData)
+
+        # Currency Conversion of block, converted fields are encoded together and put in place of source fields
+        convertedChunks = []
+        with statsStage("convert"):
+            for multiplier, currencySymbol in zip(multipliers, currencySymbols):
+                convertedCurrencies = convertCurrencyAmounts(amounts, currencySymbol, multiplier, backend, roundingMode)
+                convertedCurrencies = iter(csvSeprator.join(convertedCurrencies).encode("utf-8").split(seprator))
+                convertedRows = []
+                for rowData in splittedRows:
+                    for field in fields:
+                        rowData[field] = next(convertedCurrencies)
+                    convertedRows.append(seprator.join(rowData))
+                convertedRows.append(b"")
+                convertedChunks.append(b"\n".join(convertedRows) if splittedRows else b"")
+        yield convertedChunks
+        for preview, convertedRows in zip(previewRows, convertedChunks):
+            if len(preview) < maxRowsPrint:
+                preview.extend(row.decode("utf-8").split(csvSeprator) for row in convertedRows.split(b"\n", maxRowsPrint)[:maxRowsPrint - len(preview)] if row)
+        if endOfData:
+            break
+
+    blockDecoder.decode(b"", True)
+    csvParser.finish()
+
+
+def currencyConvertStreamOperation(fields: list, multipliers: list, currencySymbols: list, input: str, output: str, encoding: str = None, backend: str = "scalar", rates: dict = None, roundingMode: str = defaultRoundingMode, pipeline: bool = False, quarantine: dict = None) -> list:
+    """
+    This function does currency conversion of input CSV file in a single streaming pass.
+    Each row is validated, converted and written before next row is read, so input file is decoded only once and memory usage does not grow with file size.
+    Pipe mode (input or output -) reads CSV data from standard input and writes it to standard output in small chunks without temporary files.
+    Pipeline mode reads and decodes blocks of rows in reader thread and writes converted chunks in writer thread, connected to this thread with bounded queues,
+    so waiting for disk (or pipe) is overlapped with validation and conversion.
+    Plain UTF-8 and ASCII input files are memory-mapped and converted as bytes, only currency fields are decoded and other columns are copied to output.
+    Quarantine mode writes invalid rows to reject file while valid rows are converted, and fails only when more than maximum number of rows are invalid.
+
+    @type fields: List of Integer
+    @param fields: CSV File's Currency Column Numbers (starts from 0)
+    @type multipliers: List of Integer
+    @param multipliers: The value to be multiplied to original currency for each destination currency, scaled by 10 ** rateDigits
+    @type currencySymbols: List of String
+    @param currencySymbols: Destination Currency Symbols - an abbreviated form Example: EUR for Euro
+    @type input: String
+    @param input: Input CSV file name or - for standard input pipe
+    @type output: String
+    @param output: Output CSV file name or - for standard output pipe
+    @type encoding: String
+    @param encoding: Input CSV File Encoding (detected from file when not given)
+    @type backend: String
+    @param backend: Conversion Backend - scalar (python loop) or numpy (vectorized)
+    @type rates: Dictionary
+    @param rates: Rates File Name (ratesFile) and Timestamp Column Number (timestampField) to use rate of each row instead of multipliers
+    @type roundingMode: String
+    @param roundingMode: Rounding Mode of converted amounts (constants/currencyConstants.py)
+    @type pipeline: Boolean
+    @param pipeline: Pipeline mode - input rows are read by reader thread and output is written by writer thread while rows are converted
+    @type quarantine: Dictionary
+    @param quarantine: Maximum number of invalid rows (maxErrors) of quarantine mode - invalid rows are written to reject file instead of failing conversion
+
+    @rtype: List
+    @returns: A List of Boolean and String Messages
+    """
+
+    stdout = True if output == "stdout" else False
+    pipe = input == "-" or output == "-"
+
+    result = [True, "Currency Conversion Operation is successfully completed"]
+
+    try:
+        # Read Column Names from first row of CSV file (or standard input pipe)
+        mapped = False
+        if input == "-":
+            csvRows = iterCSVStream(sys.stdin.buffer, encoding)
+        else:
+            csvFilePath = os.path.join(csvFileBasePath, input)
+            addStatsCount("bytesRead", os.path.getsize(csvFilePath))
+            # Plain UTF-8 and ASCII files are memory-mapped, rates file and pipeline mode use decoded rows
+            if not (rates or pipeline or getCSVFileCompression(input)):
+                encoding = getCSVFileEncoding(csvFilePath, encoding)
+                mapped = codecs.lookup(encoding).name in csvMappedEncodings
+            if not mapped:
+                csvRows = iterCSVFile(csvFilePath, encoding)
+        if mapped:
+            csvColumns, rowsOffset = readCSVFileHeader(csvFilePath, encoding)
+        else:
+            csvColumns = next(csvRows, None)
+
+        # Case 1 & 2: Empty CSV file or no "price" column
+        result = validateCSVColumns(csvColumns)
+        if not result[0]:
+            return result
+        totalColumns = len(csvColumns) if csvColumns[-1] else len(csvColumns) - 1
+        if any(field >= totalColumns for field in fields):
+            return [False, "Field Number must be less than or equal to total number of columns in CSV file"]
+        if rates and "ratesFile" in rates:
+            rates = {**rates, "timestampField": getTimestampField(csvColumns, rates["timestampField"])}
+
+        # Plain UTF-8 or ASCII file: blocks of rows bytes are read from memory-mapped file
+        # Pipeline mode: blocks of rows are read and decoded by reader thread while rows of previous blocks are converted
+        chunkRows = csvPipeChunkRows if pipe else csvChunkRows
+        if mapped:
+            csvRows = iterCSVFileBlocks(csvFilePath, rowsOffset, csvPipeReadSize if pipe else csvMappedBlockSize)
+        elif pipeline:
+            csvRowsBlocks = iterThreadedItems(iterCSVRowBlocks(csvRows, chunkRows), csvPipelineQueueChunks)
+            convertRows = chain.from_iterable(csvRowsBlocks)
+        else:
+            convertRows = csvRows
+
+        # Quarantine mode: invalid rows of this conversion are kept in its own state until they are written to reject file
+        if quarantine is not None:
+            quarantine = {**quarantine, "rejects": [], "rejectedRows": 0, "convertedRows": 0}
+
+        # Validate, Convert and Write each row in one pass
+        previewRows = [[] for currencySymbol in currencySymbols]
+        if mapped:
+            convertedChunks = iterConvertedCSVFileBlocks(
+                csvRows, encoding, totalColumns, fields, multipliers, currencySymbols, previewRows, backend, roundingMode, quarantine)
+        else:
+            convertedChunks = iterConvertedCSVRows(
+                convertRows, totalColumns, fields, multipliers, currencySymbols, previewRows, backend, rates=rates,
+                maxChunkRows=chunkRows, roundingMode=roundingMode, quarantine=quarantine)
+        # Output Case 3: output is standard output pipe
+        if output == "-":
+            writeOutput = partial(writeCSVStreamChunks, csvColumns, dataStream=sys.stdout.buffer)
+        else:
+            fileNames = [getOutputFileName(output, currencySymbol, len(currencySymbols) > 1)
+                         for currencySymbol in currencySymbols]
+            writeOutput = partial(writeCSVFilesChunks, csvColumns, fileNames=fileNames)
+        # Rows are read, validated and parsed while output is written (by writer thread in pipeline mode)
+        convertedChunks = iterStatsStage(convertedChunks, "parse")
+        if quarantine is not None:
+            rejectFileName = getRejectFileName(output)
+            convertedChunks = iterQuarantinedChunks(convertedChunks, quarantine, csvColumns, rejectFileName)
+        if pipeline:
+            result = consumeThreadedItems(writeOutput, convertedChunks, csvPipelineQueueChunks)
+            csvRowsBlocks.close()
+        else:
+            result = writeOutput(convertedChunks)
+            csvRows.close()
+        if quarantine is not None:
+            convertedChunks.close()
+            addStatsCount("rejectedRows", quarantine["rejectedRows"])
+        if output == "-" or not result[0]:
+            # Standard output pipe only has converted CSV data, so numbers of rows of quarantine mode are written to stderr
+            if output == "-" and result[0] and quarantine is not None:
+                print(getQuarantineSummary(quarantine, rejectFileName), file=sys.stderr)
+            return result
+        else:
+            result[1] = result[1] + f": {', '.join(fileNames)}"
+            if quarantine is not None:
+                result[1] += f". {getQuarantineSummary(quarantine, rejectFileName)}"
+
+        # Output Case 2: output is stdout (in this case CSV is still created)
+        if stdout:
+            for preview in previewRows:
+                printCSVFile([csvColumns, preview])
+
+        return result
+
+    except Exception as e:
+        result[0] = False
+        result[1] = e
+        return result
+
+
+def convertCSVFileRange(filePath: str, encoding: str, start: int, end: int, totalColumns: int, fields: list, multipliers: list, currencySymbols: list, backend: str, sourceCurrencySymbol: str, rates: dict = None, roundingMode: str = defaultRoundingMode) -> list:
+    """
+    This function validates and converts CSV rows of one byte range of input file. It runs in a worker process.
+
+    @type filePath: String
+    @param filePath: Input CSV File Path
+    @type encoding: String
+    @param encoding: Input CSV File Encoding
+    @type start: Integer
+    @param start: Start Byte Offset of range
+    @type end: Integer
+    @param end: End Byte Offset of range
+    @type totalColumns: Integer
+    @param totalColumns: Total number of columns in CSV file
+    @type fields: List of Integer
+    @param fields: CSV File's Currency Column Numbers (starts from 0)
+    @type multipliers: List of Integer
+    @param multipliers: The value to be multiplied to original currency for each destination currency, scaled by 10 ** rateDigits
+    @type currencySymbols: List of String
+    @param currencySymbols: Destination Currency Symbols - an abbreviated form Example: EUR for Euro
+    @type backend: String
+    @param backend: Conversion Backend - scalar (python loop) or numpy (vectorized)
+    @type sourceCurrencySymbol: String
+    @param sourceCurrencySymbol: Currency Symbol of first row of input file
+    @type rates: Dictionary
+    @param rates: Rates File Name (ratesFile) and Timestamp Column Number (timestampField) to use rate of each row instead of multipliers
+    @type roundingMode: String
+    @param roundingMode: Rounding Mode of converted amounts (constants/currencyConstants.py)
+
+    @rtype: List
+    @returns: Converted Rows Text for each destination currency, Preview Rows for each destination currency, Number of Rows and Boolean which is True if end of CSV data is found in range
+    """
+    csvRows, endOfData = readCSVFileRange(filePath, encoding, start, end)
+    convertedTexts, previewRows = convertCSVRowsText(csvRows, totalColumns, fields, multipliers, currencySymbols, backend, sourceCurrencySymbol, rates, roundingMode)
+    return [convertedTexts, previewRows, len(csvRows), endOfData]
+
+
+def convertCSVRowsText(csvRows: list, totalColumns: int, fields: list, multipliers: list, currencySymbols: list, backend: str, sourceCurrencySymbol: str, rates: dict = None, roundingMode: str = defaultRoundingMode) -> list:
+    """
+    This function validates and converts a block of CSV rows and returns converted rows as CSV text in output file format
+
+    @type csvRows: List of List
+    @param csvRows: CSV Rows Data (without column names)
+    @type totalColumns: Integer
+    @param totalColumns: Total number of columns in CSV file
+    @type fields: List of Integer
+    @param fields: CSV File's Currency Column Numbers (starts from 0)
+    @type multipliers: List of Integer
+    @param multipliers: The value to be multiplied to original currency for each destination currency, scaled by 10 ** rateDigits
+    @type currencySymbols: List of String
+    @param currencySymbols: Destination Currency Symbols - an abbreviated form Example: EUR for Euro
+    @type backend: String
+    @param backend: Conversion Backend - scalar (python loop) or numpy (vectorized)
+    @type sourceCurrencySymbol: String
+    @param sourceCurrencySymbol: Currency Symbol of first row of input file (empty means symbol of first row of block)
+    @type rates: Dictionary
+    @param rates: Rates File Name (ratesFile) and Timestamp Column Number (timestampField) to use rate of each row instead of multipliers
+    @type roundingMode: String
+    @param roundingMode: Rounding Mode of converted amounts (constants/currencyConstants.py)
+
+    @rtype: List
+    @returns: Converted Rows Text for each destination currency and Preview Rows for each destination currency. Raises ValueError with validation message for invalid row
+    """
+    previewRows = [[] for currencySymbol in currencySymbols]
+    convertedTexts = [[] for currencySymbol in currencySymbols]
+    if csvRows:
+        for convertedChunks in iterConvertedCSVRows(csvRows, totalColumns, fields, multipliers, currencySymbols, previewRows, backend, sourceCurrencySymbol, rates, roundingMode=roundingMode):
+            for convertedText, convertedRows in zip(convertedTexts, convertedChunks):
+                convertedText.append(formatCSVRows(convertedRows))
+
+    return [["".join(convertedText) for convertedText in convertedTexts], previewRows]
+
+
+def iterConvertedCSVFileRanges(executor, workers: int, filePath: str, encoding: str, csvRanges: list, totalColumns: int, fields: list, multipliers: list, currencySymbols: list, backend: str, sourceCurrencySymbol: str, previewRows: list, rates: dict = None, roundingMode: str = defaultRoundingMode):
+    """
+    This function submits byte ranges of input file to worker processes and yields their converted rows text in input order.
+    At most two ranges per worker are in progress at a time, so memory usage does not grow with file size.
+
+    @type executor: ProcessPoolExecutor
+    @param executor: Pool of Worker Processes
+    @type workers: Integer
+    @param workers: Number of worker processes
+    @type filePath: String
+    @param filePath: Input CSV File Path
+    @type encoding: String
+    @param encoding: Input CSV File Encoding
+    @type csvRanges: List of List
+    @param csvRanges: Start and End Byte Offset of each range
+    @type totalColumns: Integer
+    @param totalColumns: Total number of columns in CSV file
+    @type fields: List of Integer
+    @param fields: CSV File's Currency Column Numbers (starts from 0)
+    @type multipliers: List of Integer
+    @param multipliers: The value to be multiplied to original currency for each destination currency, scaled by 10 ** rateDigits
+    @type currencySymbols: List of String
+    @param currencySymbols: Destination Currency Symbols - an abbreviated form Example: EUR for Euro
+    @type backend: String
+    @param backend: Conversion Backend - scalar (python loop) or numpy (vectorized)
+    @type sourceCurrencySymbol: String
+    @param sourceCurrencySymbol: Currency Symbol of first row of input file
+    @type previewRows: List of List
+    @param previewRows: List for each destination currency which is filled with first few converted rows to print on console
+    @type rates: Dictionary
+    @param rates: Rates File Name (ratesFile) and Timestamp Column Number (timestampField) to use rate of each row instead of multipliers
+    @type roundingMode: String
+    @param roundingMode: Rounding Mode of converted amounts (constants/currencyConstants.py)
+
+    @rtype: Generator of List
+    @returns: Converted Rows Text for each destination currency. Raises ValueError with validation message for invalid row
+    """
+
+    # Max Rows kept for stdout preview
+    maxRowsPrint = 5
+    totalRows = 0
+    csvRanges = iter(csvRanges)
+    pendingRanges = deque()
+
+    def submitNextRange():
+        nextRange = next(csvRanges, None)
+        if nextRange:
+            pendingRanges.append(executor.submit(convertCSVFileRange, filePath, encoding, nextRange[0], nextRange[1], totalColumns,
+                                                 fields, multipliers, currencySymbols, backend, sourceCurrencySymbol, rates, roundingMode))
+
+    for i in range(workers * 2):
+        submitNextRange()
+
+    while pendingRanges:
+        convertedTexts, rangePreviewRows, rangeRows, endOfData = pendingRanges.popleft().result()
+        totalRows += rangeRows
+        addStatsCount("rows", rangeRows)
+        for preview, rangePreview in zip(previewRows, rangePreviewRows):
+            preview.extend(rangePreview[:maxRowsPrint - len(preview)])
+        yield convertedTexts
+
+        # Rows after an empty row are not part of CSV data
+        if endOfData:
+            for pendingRange in pendingRanges:
+                pendingRange.cancel()
+            break
+        submitNextRange()
+
+    # Case 5: Only Column names in CSV, rows data does not exist
+    if totalRows == 0:
+        raise ValueError("Invalid CSV File. It only contains column names and does not contain rows data")
+
+
+def currencyConvertParallelOperation(fields: list, multipliers: list, currencySymbols: list, input: str, output: str, encoding: str = None, backend: str = "scalar", workers: int = 2, rates: dict = None, roundingMode: str = defaultRoundingMode, pipeline: bool = False) -> list:
+    """
+    This function does currency conversion of input CSV file with a pool of worker processes.
+    Input rows are split into byte ranges at row boundaries, each range is validated and converted by a worker and results are written in input order, so output is same as a single process run.
+
+    @type fields: List of Integer
+    @param fields: CSV File's Currency Column Numbers (starts from 0)
+    @type multipliers: List of Integer
+    @param multipliers: The value to be multiplied to original currency for each destination currency, scaled by 10 ** rateDigits
+    @type currencySymbols: List of String
+    @param currencySymbols: Destination Currency Symbols - an abbreviated form Example: EUR for Euro
+    @type input: String
+    @param input: Input CSV file name
+    @type output: String
+    @param output: Output CSV file name
+    @type encoding: String
+    @param encoding: Input CSV File Encoding (detected from file when not given)
+    @type backend: String
+    @param backend: Conversion Backend - scalar (python loop) or numpy (vectorized)
+    @type workers: Integer
+    @param workers: Number of worker processes
+    @type rates: Dictionary
+    @param rates: Rates File Name (ratesFile) and Timestamp Column Number (timestampField) to use rate of each row instead of multipliers
+    @type roundingMode: String
+    @param roundingMode: Rounding Mode of converted amounts (constants/currencyConstants.py)
+    @type pipeline: Boolean
+    @param pipeline: Pipeline mode - output is written by writer thread while rows are converted
 
-        for i, csvRow in enumerate(csvRows):
-            sourceCurrency = csvRow[field]
-            # Currency Conversion function
-            convertedCurrency = convertCurrency(
-                sourceCurrency, currencySymbol, multiplier)
-            csvRow[field] = convertedCurrency
-            csvRows[i] = csvRow
-        csvData = [csvColumns, csvRows]
-
-        # Output Case 1: output is CSV file
-        fileName = f"data-{currencySymbol}.csv" if stdout else output
-        result = writeCSVFile(csvData, fileName)
+    @rtype: List
+    @returns: A List of Boolean and String Messages
+    """
+
+    stdout = True if output == "stdout" else False
+
+    result = [True, "Currency Conversion Operation is successfully completed"]
+
+    try:
+        # UTF-16 and UTF-32 rows can not be split at byte boundaries, they are processed in streaming mode
+        csvFilePath = os.path.join(csvFileBasePath, input)
+        encoding = getCSVFileEncoding(csvFilePath, encoding)
+        if codecs.lookup(encoding).name.startswith(("utf-16", "utf-32")):
+            print(f"Note: {encoding} file can not be split into chunks. streaming mode is used for conversion", file=sys.stderr)
+            return currencyConvertStreamOperation(fields, multipliers, currencySymbols, input, output, encoding, backend, rates, roundingMode, pipeline)
+
+        # Read Column Names once, workers only get rows data
+        addStatsCount("bytesRead", os.path.getsize(csvFilePath))
+        csvColumns, rowsOffset = readCSVFileHeader(csvFilePath, encoding)
+
+        # Case 1 & 2: Empty CSV file or no "price" column
+        result = validateCSVColumns(csvColumns)
         if not result[0]:
             return result
+        totalColumns = len(csvColumns) if csvColumns[-1] else len(csvColumns) - 1
+        if any(field >= totalColumns for field in fields):
+            return [False, "Field Number must be less than or equal to total number of columns in CSV file"]
+
+        if rates and "ratesFile" in rates:
+            rates = {**rates, "timestampField": getTimestampField(csvColumns, rates["timestampField"])}
+
+        # Source Currency Symbol of first row is shared with all workers to validate one currency in whole file (mixed currency files have no source currency)
+        csvRanges = splitCSVFileRanges(csvFilePath, rowsOffset, workers * 4)
+        sourceCurrencySymbol = ""
+        if csvRanges and not (rates and "crossRates" in rates):
+            firstRows = readCSVFileRange(csvFilePath, encoding, csvRanges[0][0], csvRanges[0][1])[0]
+            sourceCurrencyInfo = currencySymbolPattern.search(firstRows[0][fields[0]].strip()) if firstRows and len(firstRows[0]) > fields[0] else None
+            sourceCurrencySymbol = sourceCurrencyInfo.group() if sourceCurrencyInfo else ""
+            if currencySymbolToName.get(sourceCurrencySymbol) in currencySymbols:
+                return [False, "Currency Symbol must be different then source currency"]
+
+        previewRows = [[] for currencySymbol in currencySymbols]
+
+        # Convert ranges in worker processes and write them in order
+        fileNames = [getOutputFileName(output, currencySymbol, len(currencySymbols) > 1)
+                     for currencySymbol in currencySymbols]
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            convertedRanges = iterConvertedCSVFileRanges(executor, workers, csvFilePath, encoding, csvRanges, totalColumns,
+                                                         fields, multipliers, currencySymbols, backend, sourceCurrencySymbol, previewRows, rates, roundingMode)
+            # Rows are read, validated, parsed and converted by workers while output is written (by writer thread in pipeline mode)
+            convertedRanges = iterStatsStage(convertedRanges, "convert")
+            if pipeline:
+                result = consumeThreadedItems(partial(writeCSVFilesChunks, csvColumns, fileNames=fileNames), convertedRanges, csvPipelineQueueChunks)
+            else:
+                result = writeCSVFilesChunks(csvColumns, convertedRanges, fileNames)
+        if not result[0]:
+            return result
+        else:
+            result[1] = result[1] + f": {', '.join(fileNames)}"
+
+        # Output Case 2: output is stdout (in this case CSV is still created)
+        if stdout:
+            for preview in previewRows:
+                printCSVFile([csvColumns, preview])
+
+        return result
+
+    except Exception as e:
+        result[0] = False
+        result[1] = e
+        return result
+
+
+def convertBatchFile(fields: list, multipliers: list, currencySymbols: list, input: str, output: str, encoding: str = None, backend: str = "scalar", rates: dict = None, roundingMode: str = defaultRoundingMode, pipeline: bool = False, quarantine: dict = None) -> list:
+    """
+    This function converts one CSV file of batch in streaming mode. It runs in a worker process.
+
+    @type fields: List of Integer
+    @param fields: CSV File's Currency Column Numbers (starts from 0)
+    @type multipliers: List of Integer
+    @param multipliers: The value to be multiplied to original currency for each destination currency, scaled by 10 ** rateDigits
+    @type currencySymbols: List of String
+    @param currencySymbols: Destination Currency Symbols - an abbreviated form Example: EUR for Euro
+    @type input: String
+    @param input: Input CSV file path
+    @type output: String
+    @param output: Output CSV file path
+    @type encoding: String
+    @param encoding: Input CSV File Encoding (detected from file when not given)
+    @type backend: String
+    @param backend: Conversion Backend - scalar (python loop) or numpy (vectorized)
+    @type rates: Dictionary
+    @param rates: Rates File Name (ratesFile) and Timestamp Column Number (timestampField) to use rate of each row instead of multipliers
+    @type roundingMode: String
+    @param roundingMode: Rounding Mode of converted amounts (constants/currencyConstants.py)
+    @type pipeline: Boolean
+    @param pipeline: Pipeline mode - input rows are read by reader thread and output is written by writer thread while rows are converted
+    @type quarantine: Dictionary
+    @param quarantine: Maximum number of invalid rows (maxErrors) of quarantine mode, each file has its own reject file in output directory
+
+    @rtype: List
+    @returns: A List of Boolean and String Messages
+    """
+    result = currencyConvertStreamOperation(fields, multipliers, currencySymbols, input, output, encoding, backend, rates, roundingMode, pipeline, quarantine)
+    # Messages are returned as string, so exceptions of worker process are sent back as text
+    return [result[0], str(result[1])]
+
+
+def currencyConvertBatchOperation(fields: list, multipliers: list, currencySymbols: list, batchFiles: list, output: str, encoding: str = None, backend: str = "scalar", workers: int = 1, rates: dict = None, roundingMode: str = defaultRoundingMode, pipeline: bool = False, quarantine: dict = None) -> list:
+    """
+    This function converts a batch of CSV files into output directory and returns summary of each file.
+    Files are converted in streaming mode, N files at a time with a pool of worker processes. Worker processes are forked after
+    format tables, encoding detector and rates file are loaded, so they are loaded once for whole batch instead of once for each file.
+
+    @type fields: List of Integer
+    @param fields: CSV File's Currency Column Numbers (starts from 0)
+    @type multipliers: List of Integer
+    @param multipliers: The value to be multiplied to original currency for each destination currency, scaled by 10 ** rateDigits
+    @type currencySymbols: List of String
+    @param currencySymbols: Destination Currency Symbols - an abbreviated form Example: EUR for Euro
+    @type batchFiles: List of String
+    @param batchFiles: Input CSV file paths
+    @type output: String
+    @param output: Output directory
+    @type encoding: String
+    @param encoding: Input CSV File Encoding (detected from each file when not given)
+    @type backend: String
+    @param backend: Conversion Backend - scalar (python loop) or numpy (vectorized)
+    @type workers: Integer
+    @param workers: Number of files converted at a time
+    @type rates: Dictionary
+    @param rates: Rates File Name (ratesFile) and Timestamp Column Number (timestampField) to use rate of each row instead of multipliers
+    @type roundingMode: String
+    @param roundingMode: Rounding Mode of converted amounts (constants/currencyConstants.py)
+    @type pipeline: Boolean
+    @param pipeline: Pipeline mode - input rows are read by reader thread and output is written by writer thread while rows are converted
+    @type quarantine: Dictionary
+    @param quarantine: Maximum number of invalid rows (maxErrors) of quarantine mode, each file has its own reject file in output directory
+
+    @rtype: List
+    @returns: A List of Boolean (True if all files are converted) and String Summary of each file
+    """
+
+    result = [True, "Batch Currency Conversion Operation is completed"]
+
+    try:
+        os.makedirs(output, exist_ok=True)
+        outputFiles = [os.path.join(output, os.path.basename(filePath)) for filePath in batchFiles]
+
+        # One file at a time does not need worker processes
+        if workers == 1:
+            fileResults = [convertBatchFile(fields, multipliers, currencySymbols, filePath, outputFile, encoding, backend, rates, roundingMode, pipeline, quarantine)
+                           for filePath, outputFile in zip(batchFiles, outputFiles)]
+        else:
+            from concurrent.futures import ProcessPoolExecutor
+            with ProcessPoolExecutor(max_workers=min(workers, len(batchFiles))) as executor:
+                fileResults = list(executor.map(convertBatchFile, *zip(*[
+                    [fields, multipliers, currencySymbols, filePath, outputFile, encoding, backend, rates, roundingMode, pipeline, quarantine]
+                    for filePath, outputFile in zip(batchFiles, outputFiles)])))
+
+        # Summary of each file
+        summary = []
+        for filePath, fileResult in zip(batchFiles, fileResults):
+            summary.append(f"{'Success' if fileResult[0] else 'Failure'}: {filePath}: {fileResult[1]}")
+        totalFailed = sum(1 for fileResult in fileResults if not fileResult[0])
+        result[0] = totalFailed == 0
+        result[1] = "\n".join(summary + [f"{result[1]}: {len(batchFiles) - totalFailed} of {len(batchFiles)} files converted to {output}"])
+        return result
+
+    except Exception as e:
+        result[0] = False
+        result[1] = e
+        return result
+
+
+def currencyConvertCachedOperation(fields: list, multipliers: list, currencySymbols: list, input: str, output: str, encoding: str = None, backend: str = "scalar", cache: dict = None, roundingMode: str = defaultRoundingMode) -> list:
+    """
+    This function does currency conversion of input CSV file with parsed column cache.
+    First run validates and parses input file and stores parsed amounts (int64 minor units) and offsets of rows and currency fields in cache directory.
+    Later runs of same file content skip encoding detection, validation and parsing, and only multiply amounts and format output rows from cached offsets.
+
+    @type fields: List of Integer
+    @param fields: CSV File's Currency Column Numbers (starts from 0)
+    @type multipliers: List of Integer
+    @param multipliers: The value to be multiplied to original currency for each destination currency, scaled by 10 ** rateDigits
+    @type currencySymbols: List of String
+    @param currencySymbols: Destination Currency Symbols - an abbreviated form Example: EUR for Euro
+    @type input: String
+    @param input: Input CSV file name
+    @type output: String
+    @param output: Output CSV file name or stdout
+    @type encoding: String
+    @param encoding: Input CSV File Encoding (detected from file when not given)
+    @type backend: String
+    @param backend: Conversion Backend - scalar (python loop) or numpy (vectorized)
+    @type cache: Dictionary
+    @param cache: Cache Directory (cacheDirectory) and Maximum total size of cache files in bytes (cacheMaxBytes)
+    @type roundingMode: String
+    @param roundingMode: Rounding Mode of converted amounts (constants/currencyConstants.py)
+
+    @rtype: List
+    @returns: A List of Boolean and String Messages
+    """
+
+    stdout = True if output == "stdout" else False
+
+    result = [True, "Currency Conversion Operation is successfully completed"]
+
+    try:
+        csvFilePath = os.path.join(csvFileBasePath, input)
+        addStatsCount("bytesRead", os.path.getsize(csvFilePath))
+        fileNames = [getOutputFileName(output, currencySymbol, len(currencySymbols) > 1)
+                     for currencySymbol in currencySymbols]
+        previewRows = [[] for currencySymbol in currencySymbols]
+
+        with statsStage("cache"):
+            cacheEntry = readCacheEntry(cache["cacheDirectory"], csvFilePath, fields, encoding)
+
+        # Case 1: Cache Hit - amounts and offsets of rows are read from cache, rows are not validated and parsed again
+        if cacheEntry:
+            try:
+                metadata, amounts, rowsOffsets = cacheEntry[0], cacheEntry[3], cacheEntry[4]
+                if currencySymbolToName[metadata["sourceCurrencySymbol"]] in currencySymbols:
+                    return [False, "Currency Symbol must be different then source currency"]
+                csvColumns = metadata["columns"]
+                addStatsCount("rows", metadata["rows"])
+                result = writeCSVFilesChunks(csvColumns, iterCachedCSVRowsText(
+                    iterCSVTextBlocks(csvFilePath, metadata["encoding"]), amounts, rowsOffsets, len(fields), multipliers, currencySymbols,
+                    previewRows, backend, roundingMode), fileNames)
+            finally:
+                closeCacheEntry(cacheEntry)
+            cacheMessage = "parsed columns are read from cache"
+
+        # Case 2: Cache Miss - rows are validated and parsed, parsed amounts and offsets of rows are written to cache
         else:
-            result[1] = result[1] + f": {fileName}"
+            encoding = getCSVFileEncoding(csvFilePath, encoding)
+            # Hash is computed before rows are read, so entry of a file changed while it is converted is never used
+            with statsStage("cache"):
+                contentHash = getContentHash(csvFilePath)
+            rowsOffsets = array("q")
+            csvRows = iterCSVTextRows(iterCSVTextBlocks(csvFilePath, encoding), fields, rowsOffsets)
+            csvColumns = next(csvRows, None)
+
+            # Case 1 & 2: Empty CSV file or no "price" column
+            result = validateCSVColumns(csvColumns)
+            if not result[0]:
+                return result
+            totalColumns = len(csvColumns) if csvColumns[-1] else len(csvColumns) - 1
+            if any(field >= totalColumns for field in fields):
+                return [False, "Field Number must be less than or equal to total number of columns in CSV file"]
+
+            # Currency field of first row is kept for source currency of cache entry, rows are converted in place
+            firstRow = next(csvRows, None)
+            sourceCurrencyField = firstRow[fields[0]] if firstRow is not None and fields[0] < len(firstRow) else ""
+            csvRows = chain([firstRow] if firstRow is not None else [], csvRows)
+            amounts = []
+            convertedChunks = iterConvertedCSVRows(csvRows, totalColumns, fields, multipliers, currencySymbols, previewRows, backend,
+                                                   roundingMode=roundingMode, parsedAmounts=amounts)
+            result = writeCSVFilesChunks(csvColumns, iterStatsStage(convertedChunks, "parse"), fileNames)
+            if not result[0]:
+                return result
+
+            sourceCurrencySymbol = currencySymbolPattern.search(sourceCurrencyField.strip()).group()
+            metadata = {"encoding": encoding, "columns": csvColumns, "sourceCurrencySymbol": sourceCurrencySymbol,
+                        "rows": len(amounts) // len(fields), "contentHash": contentHash}
+            with statsStage("cache"):
+                cached = writeCacheEntry(cache["cacheDirectory"], csvFilePath, fields, metadata, amounts, rowsOffsets, cache["cacheMaxBytes"])
+            cacheMessage = "parsed columns are written to cache" if cached else "parsed columns are too large to cache"
+
+        if not result[0]:
+            return result
+        result[1] = result[1] + f": {', '.join(fileNames)} ({cacheMessage})"
 
         # Output Case 2: output is stdout (in this case CSV is still created)
         if stdout:
-            printCSVFile(csvData)
+            for preview in previewRows:
+                printCSVFile([csvColumns, preview])
 
         return result
 
@@ -128,3 +1248,304 @@ def currencyConvertOperation(field: int, multiplier: float, currencySymbol: str,
         result[0] = False
         result[1] = e
         return result
+
+
+def iterCachedCSVRowsText(csvTextBlocks, amounts, rowsOffsets, totalFields: int, multipliers: list, currencySymbols: list, previewRows: list, backend: str = "scalar", roundingMode: str = defaultRoundingMode):
+    """
+    This function converts cached amounts chunk by chunk and formats converted rows from CSV text and cached offsets.
+    Only CSV text of rows of current chunk is kept in memory.
+
+    @type csvTextBlocks: Iterator of String
+    @param csvTextBlocks: Decoded CSV File Data in blocks of whole rows (iterCSVTextBlocks)
+    @type amounts: Memory View of Integer
+    @param amounts: Parsed Source Amount of each currency column of each row (row by row) in minor units
+    @type rowsOffsets: Memory View of Integer
+    @param rowsOffsets: Row start, start and end of each currency field and row end of each row
+    @type totalFields: Integer
+    @param totalFields: Number of currency fields of each row
+    @type multipliers: List of Integer
+    @param multipliers: The value to be multiplied to original currency for each destination currency, scaled by 10 ** rateDigits
+    @type currencySymbols: List of String
+    @param currencySymbols: Destination Currency Symbols - an abbreviated form Example: EUR for Euro
+    @type previewRows: List of List
+    @param previewRows: List for each destination currency which is filled with first few converted rows to print on console
+    @type backend: String
+    @param backend: Conversion Backend - scalar (python loop) or numpy (vectorized)
+    @type roundingMode: String
+    @param roundingMode: Rounding Mode of converted amounts (constants/currencyConstants.py)
+
+    @rtype: Generator of List
+    @returns: Converted Rows Text of chunk for each destination currency
+    """
+
+    # Max Rows kept for stdout preview
+    maxRowsPrint = 5
+    rowWidth = totalFields * 2 + 2
+    totalRows = len(amounts) // totalFields
+    # CSV text read so far which is not formatted yet, and its character offset in file
+    csvText = ""
+    textStart = 0
+
+    for chunkStart in range(0, totalRows, csvChunkRows):
+        chunkEnd = min(chunkStart + csvChunkRows, totalRows)
+        chunkAmounts = amounts[chunkStart * totalFields:chunkEnd * totalFields].tolist()
+        chunkOffsets = rowsOffsets[chunkStart * rowWidth:chunkEnd * rowWidth].tolist()
+        while textStart + len(csvText) < chunkOffsets[-1]:
+            csvTextBlock = next(csvTextBlocks, None)
+            if csvTextBlock is None:
+                raise ValueError("Input CSV file is changed while it is converted")
+            csvText += csvTextBlock
+        # Offsets of chunk are made relative to CSV text kept in memory
+        chunkOffsets = [offset - textStart for offset in chunkOffsets]
+        convertedTexts = []
+        for currencySymbol, multiplier in zip(currencySymbols, multipliers):
+            with statsStage("convert"):
+                convertedCurrencies = convertCurrencyAmounts(chunkAmounts, currencySymbol, multiplier, backend, roundingMode)
+                convertedTexts.append(formatCSVTextRows(csvText, chunkOffsets, convertedCurrencies, totalFields))
+        csvText = csvText[chunkOffsets[-1]:]
+        textStart += chunkOffsets[-1]
+        yield convertedTexts
+        for preview, convertedText in zip(previewRows, convertedTexts):
+            if len(preview) < maxRowsPrint:
+                preview.extend(row.split(csvSeprator) for row in convertedText.split("\n", maxRowsPrint)[:maxRowsPrint - len(preview)])
+
+
+def getIncrementalParameters(fields: list, multipliers: list, currencySymbols: list, input: str, fileNames: list, rates: dict = None, roundingMode: str = defaultRoundingMode) -> dict:
+    """
+    This function returns parameters of incremental conversion which are stored in checkpoint. Appended rows are only converted
+    and appended to output files of previous run when these parameters are not changed.
+
+    @type fields: List of Integer
+    @param fields: CSV File's Currency Column Numbers (starts from 0)
+    @type multipliers: List of Integer
+    @param multipliers: The value to be multiplied to original currency for each destination currency, scaled by 10 ** rateDigits
+    @type currencySymbols: List of String
+    @param currencySymbols: Destination Currency Symbols - an abbreviated form Example: EUR for Euro
+    @type input: String
+    @param input: Input CSV file name
+    @type fileNames: List of String
+    @param fileNames: Output CSV file names
+    @type rates: Dictionary
+    @param rates: Rates File Name (ratesFile) and Timestamp Column Number (timestampField) to use rate of each row instead of multipliers
+    @type roundingMode: String
+    @param roundingMode: Rounding Mode of converted amounts (constants/currencyConstants.py)
+
+    @rtype: Dictionary
+    @returns: Parameters of conversion (rates file is identified by its size and modified time)
+    """
+    ratesInfo = None
+    if rates:
+        ratesStat = os.stat(rates["ratesFile"])
+        ratesInfo = {"ratesFile": os.path.abspath(rates["ratesFile"]), "timestampField": rates["timestampField"],
+                     "size": ratesStat.st_size, "modifiedTime": ratesStat.st_mtime_ns}
+    return {"input": os.path.abspath(os.path.join(csvFileBasePath, input)), "fields": fields, "multipliers": multipliers,
+            "currencySymbols": currencySymbols, "outputs": fileNames, "rates": ratesInfo, "roundingMode": roundingMode}
+
+
+def convertCSVFileIncrement(fields: list, multipliers: list, currencySymbols: list, input: str, output: str, encoding: str = None, backend: str = "scalar", rates: dict = None, roundingMode: str = defaultRoundingMode) -> list:
+    """
+    This function converts rows appended to input CSV file after previous run and appends them to output files.
+    Checkpoint next to output file has input byte offset, number of rows and hash of converted input prefix. When there is no checkpoint,
+    parameters are changed, converted prefix of input is changed or output files are changed after checkpoint, whole input file is converted again.
+    Only complete rows (ending with \\r\\n) are converted, a row which is still being appended is converted by next run.
+
+    @type fields: List of Integer
+    @param fields: CSV File's Currency Column Numbers (starts from 0)
+    @type multipliers: List of Integer
+    @param multipliers: The value to be multiplied to original currency for each destination currency, scaled by 10 ** rateDigits
+    @type currencySymbols: List of String
+    @param currencySymbols: Destination Currency Symbols - an abbreviated form Example: EUR for Euro
+    @type input: String
+    @param input: Input CSV file name
+    @type output: String
+    @param output: Output CSV file name
+    @type encoding: String
+    @param encoding: Input CSV File Encoding (detected from file when not given)
+    @type backend: String
+    @param backend: Conversion Backend - scalar (python loop) or numpy (vectorized)
+    @type rates: Dictionary
+    @param rates: Rates File Name (ratesFile) and Timestamp Column Number (timestampField) to use rate of each row instead of multipliers
+    @type roundingMode: String
+    @param roundingMode: Rounding Mode of converted amounts (constants/currencyConstants.py)
+
+    @rtype: List
+    @returns: A List of Boolean and String Messages
+    """
+
+    result = [True, "Currency Conversion Operation is successfully completed"]
+    csvFilePath = os.path.join(csvFileBasePath, input)
+    fileNames = [getOutputFileName(output, currencySymbol, len(currencySymbols) > 1)
+                 for currencySymbol in currencySymbols]
+    outputFilePaths = [os.path.join(csvFileBasePath, fileName) for fileName in fileNames]
+    checkpointPath = getCheckpointPath(output)
+    fullRun = True
+    outputFiles = []
+
+    try:
+        parameters = getIncrementalParameters(fields, multipliers, currencySymbols, input, fileNames, rates, roundingMode)
+        fileSize = os.path.getsize(csvFilePath)
+
+        # Case 1: Checkpoint of previous run is used if nothing before its input offset is changed
+        checkpoint = readCheckpoint(checkpointPath)
+        if checkpoint is None:
+            reason = "no checkpoint of previous run"
+        elif checkpoint.get("parameters") != parameters or (encoding and checkpoint["encoding"] != encoding):
+            reason = "conversion parameters are changed"
+        elif any(not os.path.exists(outputFilePath) or os.path.getsize(outputFilePath) != outputSize
+                 for outputFilePath, outputSize in zip(outputFilePaths, checkpoint["outputSizes"])):
+            reason = "output file is changed after previous run"
+        elif checkpoint["inputOffset"] > fileSize:
+            reason = "input file is truncated"
+        else:
+            with statsStage("hash"):
+                fileHash = hashFileRange(csvFilePath, 0, checkpoint["inputOffset"])
+            if fileHash.hexdigest() != checkpoint["prefixHash"]:
+                reason = "converted rows of input file are changed"
+            else:
+                fullRun = False
+
+        # Case 2: Column Names, Encoding and Source Currency Symbol are known from checkpoint
+        if not fullRun:
+            encoding, csvColumns = checkpoint["encoding"], checkpoint["columns"]
+            rowsOffset, totalRows = checkpoint["inputOffset"], checkpoint["rows"]
+            sourceCurrencySymbol, endOfData = checkpoint["sourceCurrencySymbol"], checkpoint["endOfData"]
+        # Case 3: Whole input file is converted, Column Names are read from first row
+        else:
+            # UTF-16 and UTF-32 rows can not be split at byte boundaries
+            encoding = getCSVFileEncoding(csvFilePath, encoding)
+            if codecs.lookup(encoding).name.startswith(("utf-16", "utf-32")):
+                return [False, f"{encoding} file can not be converted incrementally"]
+            csvColumns, rowsOffset = readCSVFileHeader(csvFilePath, encoding)
+            columnsInfo = validateCSVColumns(csvColumns)
+            if not columnsInfo[0]:
+                return columnsInfo
+            with statsStage("hash"):
+                fileHash = hashFileRange(csvFilePath, 0, rowsOffset)
+            totalRows, sourceCurrencySymbol, endOfData = 0, "", False
+
+        totalColumns = len(csvColumns) if csvColumns[-1] else len(csvColumns) - 1
+        if any(field >= totalColumns for field in fields):
+            return [False, "Field Number must be less than or equal to total number of columns in CSV file"]
+        if rates:
+            rates = {**rates, "timestampField": getTimestampField(csvColumns, rates["timestampField"])}
+
+        # Full run writes temporary files which replace output files on success, appended rows are written to output files
+        if fullRun:
+            removeCheckpoint(checkpointPath)
+            for outputFilePath in outputFilePaths:
+                outputFile = open(outputFilePath + ".tmp", "w", encoding=csvDefaultEncoding)
+                outputFiles.append(outputFile)
+                outputFile.write(csvSeprator.join(csvColumns) + "\n")
+        else:
+            outputFiles = [open(outputFilePath, "a", encoding=csvDefaultEncoding) for outputFilePath in outputFilePaths]
+
+        # Convert complete rows after input offset in ranges, data ends at first empty row
+        newRows = 0
+        rowsEnd = rowsOffset if endOfData else findLastRowEnd(csvFilePath, rowsOffset, fileSize)
+        totalRanges = -(-(rowsEnd - rowsOffset) // csvIncrementalRangeSize)
+        for start, end in splitCSVFileRanges(csvFilePath, rowsOffset, totalRanges, rowsEnd):
+            with statsStage("parse"):
+                csvRows, endOfData = readCSVFileRange(csvFilePath, encoding, start, end)
+            addStatsCount("bytesRead", end - start)
+            # Source Currency Symbol of first row is used to validate appended rows
+            if not sourceCurrencySymbol and csvRows and len(csvRows[0]) > fields[0]:
+                sourceCurrencyInfo = currencySymbolPattern.search(csvRows[0][fields[0]].strip())
+                sourceCurrencySymbol = sourceCurrencyInfo.group() if sourceCurrencyInfo else ""
+                if currencySymbolToName.get(sourceCurrencySymbol) in currencySymbols:
+                    raise ValueError("Currency Symbol must be different then source currency")
+            convertedTexts = convertCSVRowsText(csvRows, totalColumns, fields, multipliers, currencySymbols, backend,
+                                                sourceCurrencySymbol, rates, roundingMode)[0]
+            with statsStage("write"):
+                for outputFile, convertedText in zip(outputFiles, convertedTexts):
+                    outputFile.write(convertedText)
+            with statsStage("hash"):
+                hashFileRange(csvFilePath, start, end, fileHash)
+            newRows += len(csvRows)
+            rowsOffset = end
+            if endOfData:
+                break
+
+        for outputFile in outputFiles:
+            outputFile.close()
+        if fullRun:
+            for outputFilePath in outputFilePaths:
+                os.replace(outputFilePath + ".tmp", outputFilePath)
+        outputSizes = [os.path.getsize(outputFilePath) for outputFilePath in outputFilePaths]
+        addStatsCount("bytesWritten", sum(outputSizes) - (0 if fullRun else sum(checkpoint["outputSizes"])))
+
+        # Checkpoint is written after output files, an interrupted run leaves output sizes which do not match checkpoint
+        writeCheckpoint(checkpointPath, {
+            "encoding": encoding, "columns": csvColumns, "sourceCurrencySymbol": sourceCurrencySymbol,
+            "inputOffset": rowsOffset, "rows": totalRows + newRows, "prefixHash": fileHash.hexdigest(),
+            "endOfData": endOfData, "outputSizes": outputSizes, "parameters": parameters})
+
+        if fullRun:
+            result[1] = result[1] + f": {newRows} rows converted from start of input file ({reason}): {', '.join(fileNames)}"
+        else:
+            result[1] = result[1] + f": {newRows} new rows appended ({totalRows + newRows} rows converted): {', '.join(fileNames)}"
+        return result
+
+    except Exception as e:
+        # Output files are restored to their size at checkpoint
+        for outputFile in outputFiles:
+            outputFile.close()
+        for i, outputFilePath in enumerate(outputFilePaths):
+            if fullRun and os.path.exists(outputFilePath + ".tmp"):
+                os.remove(outputFilePath + ".tmp")
+            elif not fullRun and i < len(outputFiles):
+                os.truncate(outputFilePath, checkpoint["outputSizes"][i])
+        result[0] = False
+        result[1] = e
+        return result
+
+
+def currencyConvertIncrementalOperation(fields: list, multipliers: list, currencySymbols: list, input: str, output: str, encoding: str = None, backend: str = "scalar", rates: dict = None, roundingMode: str = defaultRoundingMode, watch: bool = False) -> list:
+    """
+    This function does incremental currency conversion of input CSV file whose rows are only appended.
+    In watch mode input file is checked every csvWatchInterval seconds and rows appended to it are converted as they arrive, until interrupted (Ctrl+C).
+
+    @type fields: List of Integer
+    @param fields: CSV File's Currency Column Numbers (starts from 0)
+    @type multipliers: List of Integer
+    @param multipliers: The value to be multiplied to original currency for each destination currency, scaled by 10 ** rateDigits
+    @type currencySymbols: List of String
+    @param currencySymbols: Destination Currency Symbols - an abbreviated form Example: EUR for Euro
+    @type input: String
+    @param input: Input CSV file name
+    @type output: String
+    @param output: Output CSV file name
+    @type encoding: String
+    @param encoding: Input CSV File Encoding (detected from file when not given)
+    @type backend: String
+    @param backend: Conversion Backend - scalar (python loop) or numpy (vectorized)
+    @type rates: Dictionary
+    @param rates: Rates File Name (ratesFile) and Timestamp Column Number (timestampField) to use rate of each row instead of multipliers
+    @type roundingMode: String
+    @param roundingMode: Rounding Mode of converted amounts (constants/currencyConstants.py)
+    @type watch: Boolean
+    @param watch: Watch input file and convert appended rows as they arrive
+
+    @rtype: List
+    @returns: A List of Boolean and String Messages
+    """
+    result = convertCSVFileIncrement(fields, multipliers, currencySymbols, input, output, encoding, backend, rates, roundingMode)
+    if not watch or not result[0]:
+        return result
+
+    csvFilePath = os.path.join(csvFileBasePath, input)
+    print(result[1])
+    try:
+        fileStat = os.stat(csvFilePath)
+        while True:
+            time.sleep(csvWatchInterval)
+            # Input file is converted again only when its size or modified time is changed
+            lastStat, fileStat = fileStat, os.stat(csvFilePath)
+            if (fileStat.st_size, fileStat.st_mtime_ns) == (lastStat.st_size, lastStat.st_mtime_ns):
+                continue
+            result = convertCSVFileIncrement(fields, multipliers, currencySymbols, input, output, encoding, backend, rates, roundingMode)
+            if not result[0]:
+                return result
+            print(result[1])
+            sys.stdout.flush()
+    except KeyboardInterrupt:
+        return [True, f"Stopped watching input file: {input}"]
@@ -0,0 +1,280 @@
+from functools import lru_cache
+
+from constants.currencyConstants import minorUnitDigits, rateDigits, defaultRoundingMode
+
+
+def roundHalfEven(value: int, divisor: int) -> int:
+    """
+    This function divides integer value by divisor and rounds result half to even
+
+    @type value: Integer
+    @param value: Scaled Integer Value
+    @type divisor: Integer
+    @param divisor: Positive Divisor
+
+    @rtype: Integer
+    @returns: Rounded Quotient
+    """
+    quotient, remainder = divmod(value, divisor)
+    remainder *= 2
+    return quotient + (remainder > divisor or (remainder == divisor and quotient & 1))
+
+
+def roundHalfUp(value: int, divisor: int) -> int:
+    """
+    This function divides integer value by divisor and rounds result half away from zero
+
+    @type value: Integer
+    @param value: Scaled Integer Value
+    @type divisor: Integer
+    @param divisor: Positive Divisor
+
+    @rtype: Integer
+    @returns: Rounded Quotient
+    """
+    quotient, remainder = divmod(value, divisor)
+    remainder *= 2
+    return quotient + (remainder > divisor or (remainder == divisor and value >= 0))
+
+
+def roundHalfDown(value: int, divisor: int) -> int:
+    """
+    This function divides integer value by divisor and rounds result half towards zero
+
+    @type value: Integer
+    @param value: Scaled Integer Value
+    @type divisor: Integer
+    @param divisor: Positive Divisor
+
+    @rtype: Integer
+    @returns: Rounded Quotient
+    """
+    quotient, remainder = divmod(value, divisor)
+    remainder *= 2
+    return quotient + (remainder > divisor or (remainder == divisor and value < 0))
+
+
+def roundUp(value: int, divisor: int) -> int:
+    """
+    This function divides integer value by divisor and rounds result away from zero
+
+    @type value: Integer
+    @param value: Scaled Integer Value
+    @type divisor: Integer
+    @param divisor: Positive Divisor
+
+    @rtype: Integer
+    @returns: Rounded Quotient
+    """
+    quotient, remainder = divmod(value, divisor)
+    return quotient + (remainder > 0 and value >= 0)
+
+
+def roundDown(value: int, divisor: int) -> int:
+    """
+    This function divides integer value by divisor and rounds result towards zero
+
+    @type value: Integer
+    @param value: Scaled Integer Value
+    @type divisor: Integer
+    @param divisor: Positive Divisor
+
+    @rtype: Integer
+    @returns: Rounded Quotient
+    """
+    quotient, remainder = divmod(value, divisor)
+    return quotient + (remainder > 0 and value < 0)
+
+
+def roundFloor(value: int, divisor: int) -> int:
+    """
+    This function divides integer value by divisor and rounds result towards negative infinity
+
+    @type value: Integer
+    @param value: Scaled Integer Value
+    @type divisor: Integer
+    @param divisor: Positive Divisor
+
+    @rtype: Integer
+    @returns: Rounded Quotient
+    """
+    return value // divisor
+
+
+def roundCeiling(value: int, divisor: int) -> int:
+    """
+    This function divides integer value by divisor and rounds result towards positive infinity
+
+    @type value: Integer
+    @param value: Scaled Integer Value
+    @type divisor: Integer
+    @param divisor: Positive Divisor
+
+    @rtype: Integer
+    @returns: Rounded Quotient
+    """
+    return -(-value // divisor)
+
+
+# Rounding function of each rounding mode (constants/currencyConstants.py)
+roundingFunctions = {
+    "half-even": roundHalfEven,
+    "half-up": roundHalfUp,
+    "half-down": roundHalfDown,
+    "up": roundUp,
+    "down": roundDown,
+    "floor": roundFloor,
+    "ceiling": roundCeiling
+}
+
+
+def parseDecimalDigits(value: str) -> list:
+    """
+    This function parses decimal value without converting it to float and returns its digits and scale
+
+    @type value: String
+    @param value: Decimal Value with period as decimal point. Example: 0.000712, -12.5 or 7.12e-4
+
+    @rtype: List
+    @returns: Integer of digits with sign and scale, value is digits * 10 ** -scale. Example: [-125, 1] for -12.5. Raises ValueError if value is not a valid decimal value
+    """
+    mantissa, exponentSign, exponent = value.strip().lower().partition("e")
+    integerPart, _, fractionPart = mantissa.partition(".")
+    sign = -1 if integerPart.startswith("-") else 1
+    if integerPart[:1] in "+-":
+        integerPart = integerPart[1:]
+    if not (integerPart or fractionPart) or not (integerPart.isdigit() or not integerPart) or not (fractionPart.isdigit() or not fractionPart):
+        raise ValueError(f"Invalid decimal value: {value}")
+    # Exponent must have digits after e and optional sign
+    exponentDigits = exponent[1:] if exponent[:1] in "+-" else exponent
+    if exponentSign and not exponentDigits.isdigit():
+        raise ValueError(f"Invalid decimal value: {value}")
+    return [sign * int(integerPart + fractionPart), len(fractionPart) - (int(exponent) if exponent else 0)]
+
+
+def parseScaledInteger(value: str, digits: int, roundingMode: str = None) -> int:
+    """
+    This function parses decimal value without converting it to float and returns it as integer scaled by 10 ** digits
+
+    @type value: String
+    @param value: Decimal Value with period as decimal point. Example: 0.000712, -12.5 or 7.12e-4
+    @type digits: Integer
+    @param digits: Fraction Digits kept in scaled integer
+    @type roundingMode: String
+    @param roundingMode: Rounding Mode for value with more fraction digits (None means such value is not valid)
+
+    @rtype: Integer
+    @returns: Scaled Integer. Example: 71200 for 0.000712 with 8 digits. Raises ValueError if value is not a valid decimal value
+    """
+    scaledValue, scale = parseDecimalDigits(value)
+    if scale <= digits:
+        return scaledValue * 10 ** (digits - scale)
+    divisor = 10 ** (scale - digits)
+    if roundingMode is None:
+        if scaledValue % divisor:
+            raise ValueError(f"Decimal value has more than {digits} fraction digits: {value}")
+        return scaledValue // divisor
+    return roundingFunctions[roundingMode](scaledValue, divisor)
+
+
+def parseMinorUnits(value: str):
+    """
+    This function parses currency value with period as decimal point into minor units (cents).
+    Value with more fraction digits than minor units is kept exact at its own precision as Fraction of minor units,
+    so it is rounded only once with rounding mode when it is converted.
+
+    @type value: String
+    @param value: Currency Value. Example: 1234.56 or 7.999
+
+    @rtype: Integer or Fraction
+    @returns: Minor Units. Example: 123456 for 1234.56, Fraction(7999, 10) for 7.999. Raises ValueError if value is not valid
+    """
+    # Common case of exactly minorUnitDigits fraction digits, int raises ValueError for anything else than sign and digits around decimal point
+    if value[-minorUnitDigits - 1:-minorUnitDigits] == ".":
+        return int(value.replace(".", "", 1))
+    scaledValue, scale = parseDecimalDigits(value)
+    if scale <= minorUnitDigits:
+        return scaledValue * 10 ** (minorUnitDigits - scale)
+    divisor = 10 ** (scale - minorUnitDigits)
+    if scaledValue % divisor == 0:
+        return scaledValue // divisor
+    # Fraction is only imported for values with more fraction digits, rounding functions divide it same as integer
+    from fractions import Fraction
+    return Fraction(scaledValue, divisor)
+
+
+@lru_cache(maxsize=1024)
+def parseRate(value: str, roundingMode: str = defaultRoundingMode) -> int:
+    """
+    This function parses multiplier or conversion rate into integer scaled by 10 ** rateDigits. Recently parsed rates are cached.
+
+    @type value: String
+    @param value: Multiplier or Rate. Example: 0.000712
+    @type roundingMode: String
+    @param roundingMode: Rounding Mode for rate with more than rateDigits fraction digits
+
+    @rtype: Integer
+    @returns: Scaled Rate. Raises ValueError if rate is not a valid decimal value
+    """
+    return parseScaledInteger(value, rateDigits, roundingMode)
+
+
+def getRoundingDivisor(fracDigits: int) -> int:
+    """
+    This function returns divisor of product of minor units and scaled rate which gives amount in fraction digits of destination currency
+
+    @type fracDigits: Integer
+    @param fracDigits: Fraction Digits of destination currency. Example: 2 for EUR, 0 for KRW
+
+    @rtype: Integer
+    @returns: Divisor of product
+    """
+    return 10 ** (rateDigits + minorUnitDigits - fracDigits)
+
+
+def multiplyMinorUnit(amount: int, multiplier: int, fracDigits: int = minorUnitDigits, roundingMode: str = defaultRoundingMode) -> int:
+    """
+    This function multiplies one amount in minor units by scaled rate with exact integer arithmetic and rounds product to fraction digits of destination currency
+
+    @type amount: Integer or Fraction
+    @param amount: Source Currency Amount in minor units
+    @type multiplier: Integer
+    @param multiplier: Scaled Rate
+    @type fracDigits: Integer
+    @param fracDigits: Fraction Digits of destination currency
+    @type roundingMode: String
+    @param roundingMode: Rounding Mode of converted amount
+
+    @rtype: Integer
+    @returns: Converted Amount in minor units
+    """
+    return roundingFunctions[roundingMode](amount * multiplier, getRoundingDivisor(fracDigits)) * 10 ** (minorUnitDigits - fracDigits)
+
+
+def multiplyMinorUnits(amounts: list, multiplier, fracDigits: int = minorUnitDigits, roundingMode: str = defaultRoundingMode) -> list:
+    """
+    This function multiplies minor units by scaled rate with exact integer arithmetic and rounds each product once to fraction digits of destination currency
+
+    @type amounts: List of Integer (or Fraction for amounts with more fraction digits than minor units)
+    @param amounts: Source Currency Amounts in minor units
+    @type multiplier: Integer or List of Integer
+    @param multiplier: Scaled Rate (or one scaled rate for each amount, exact cross rates which are not integers are (Numerator, Denominator) pairs)
+    @type fracDigits: Integer
+    @param fracDigits: Fraction Digits of destination currency
+    @type roundingMode: String
+    @param roundingMode: Rounding Mode of converted amounts
+
+    @rtype: List of Integer
+    @returns: Converted Amounts in minor units (multiple of 10 ** (minorUnitDigits - fracDigits))
+    """
+    roundingFunction = roundingFunctions[roundingMode]
+    divisor = getRoundingDivisor(fracDigits)
+    unitScale = 10 ** (minorUnitDigits - fracDigits)
+    if isinstance(multiplier, list):
+        if all(type(amountMultiplier) is int for amountMultiplier in multiplier):
+            return [roundingFunction(amount * amountMultiplier, divisor) * unitScale for amount, amountMultiplier in zip(amounts, multiplier)]
+        # Denominator of exact cross rate is moved to divisor, so product is still rounded once with integers
+        return [roundingFunction(amount * amountMultiplier, divisor) * unitScale if type(amountMultiplier) is int
+                else roundingFunction(amount * amountMultiplier[0], divisor * amountMultiplier[1]) * unitScale
+                for amount, amountMultiplier in zip(amounts, multiplier)]
+    return [roundingFunction(amount * multiplier, divisor) * unitScale for amount in amounts]
@@ -0,0 +1,171 @@
+import re
+
+from constants.currencyConstants import localeToCurrencyFormat, supportedCurrencySymbols
+
+from utils.fixedPointUtils import parseMinorUnits
+
+
+# Regex to find Currency Symbol in currency data
+currencySymbolPattern = re.compile(r"[^0-9\s,.]+")
+
+# Precompiled Regex to find supported Currency Symbol in currency data of mixed currency files
+# Longer symbols are tried first and a symbol must not be part of longer symbol characters, so HK$ and R$ are not matched as $ (and C$ is not matched at all)
+currencySymbolMatcher = re.compile(r"(?<![^0-9\s,.])(?:" + "|".join(re.escape(symbol) for symbol in sorted(supportedCurrencySymbols, key=len, reverse=True)) + r")(?![^0-9\s,.])")
+
+
+def compileCurrencyFormat(currencyFormat: dict) -> dict:
+    """
+    This function takes currency formatting rules of a locale as input and precompiles the regex used for digit grouping
+
+    @type currencyFormat: Dictionary
+    @param currencyFormat: Currency Formatting Rules from localeToCurrencyFormat
+
+    @rtype: Dictionary
+    @returns: Currency Formatting Rules with grouping regex and replacement
+    """
+    # Separator is inserted after a digit which is followed by repeating groups and the first group till end of integer part
+    firstGroup, repeatGroup = currencyFormat["grouping"][0], currencyFormat["grouping"][-1]
+    groupingPattern = re.compile(
+        rf"(\d)(?=(?:\d{{{repeatGroup}}})*\d{{{firstGroup}}}$)")
+    groupingReplacement = r"\1" + currencyFormat["thousandsSep"].replace("\\", "\\\\")
+    return {**currencyFormat, "groupingPattern": groupingPattern, "groupingReplacement": groupingReplacement}
+
+
+# Precompiled Currency Formatting Rules of each locale
+compiledCurrencyFormats = {localeOption: compileCurrencyFormat(currencyFormat)
+                           for localeOption, currencyFormat in localeToCurrencyFormat.items()}
+
+
+def parseCurrencyAmount(currencyValue: str, localeOption: str) -> float:
+    """
+    This function takes currency value in locale number formatting as input and returns its float value (same as locale.atof)
+
+    @type currencyValue: String
+    @param currencyValue: Currency Value without Currency Symbol. Example: 1 234,56 for fr_FR
+    @type localeOption: String
+    @param localeOption: Locale of Currency Value. Example: fr_FR
+
+    @rtype: Float
+    @returns: Float Value of Currency. Raises ValueError if value is not in locale number formatting
+    """
+    currencyFormat = compiledCurrencyFormats[localeOption]
+    if currencyFormat["numericThousandsSep"]:
+        currencyValue = currencyValue.replace(
+            currencyFormat["numericThousandsSep"], "")
+    currencyValue = currencyValue.replace(
+        currencyFormat["numericDecimalPoint"], ".")
+    return float(currencyValue)
+
+
+def parseCurrencyMinorUnits(currencyValue: str, localeOption: str) -> int:
+    """
+    This function takes currency value in locale number formatting as input and returns it as integer minor units (cents) without float rounding
+
+    @type currencyValue: String
+    @param currencyValue: Currency Value without Currency Symbol. Example: 1 234,56 for fr_FR
+    @type localeOption: String
+    @param localeOption: Locale of Currency Value. Example: fr_FR
+
+    @rtype: Integer
+    @returns: Currency Amount in minor units. Example: 123456. Raises ValueError if value is not in locale number formatting
+    """
+    currencyFormat = compiledCurrencyFormats[localeOption]
+    if currencyFormat["numericThousandsSep"]:
+        currencyValue = currencyValue.replace(
+            currencyFormat["numericThousandsSep"], "")
+    currencyValue = currencyValue.replace(
+        currencyFormat["numericDecimalPoint"], ".")
+    return parseMinorUnits(currencyValue)
+
+
+def applyCurrencyFormat(formattedValue: str, negative: bool, currencyFormat: dict) -> str:
+    """
+    This function takes unsigned value with fraction digits as input and applies grouping, decimal point, currency symbol and sign of a locale
+
+    @type formattedValue: String
+    @param formattedValue: Unsigned Value with fraction digits and period as decimal point. Example: 1234.56
+    @type negative: Boolean
+    @param negative: Whether value is negative
+    @type currencyFormat: Dictionary
+    @param currencyFormat: Precompiled Currency Formatting Rules of a locale
+
+    @rtype: String
+    @returns: Currency Symbol and Value in locale number formatting
+    """
+    # Digits and Grouping of value
+    integerPart, _, fractionPart = formattedValue.partition(".")
+    integerPart = currencyFormat["groupingPattern"].sub(
+        currencyFormat["groupingReplacement"], integerPart)
+    formattedValue = integerPart + \
+        (currencyFormat["decimalPoint"] + fractionPart if fractionPart else "")
+
+    # Position of Currency Symbol, '<' and '>' mark place of sign between symbol and value
+    formattedAmount = "<" + formattedValue + ">"
+    symbolSeprator = " " if currencyFormat["symbolSpace"] else ""
+    if currencyFormat["symbolPrecedes"]:
+        formattedAmount = currencyFormat["symbol"] + symbolSeprator + formattedAmount
+    else:
+        formattedAmount = formattedAmount + symbolSeprator + currencyFormat["symbol"]
+
+    # Position of Sign, positive values has no sign
+    sign = "-" if negative else ""
+    signPosition = currencyFormat["signPosition"][1 if negative else 0]
+    if signPosition == 0:
+        formattedAmount = "(" + formattedAmount + ")"
+    elif signPosition == 2:
+        formattedAmount = formattedAmount + sign
+    elif signPosition == 3:
+        formattedAmount = formattedAmount.replace("<", sign)
+    elif signPosition == 4:
+        formattedAmount = formattedAmount.replace(">", sign)
+    else:
+        formattedAmount = sign + formattedAmount
+    return formattedAmount.replace("<", "").replace(">", "")
+
+
+def formatCurrencyAmount(amount: float, localeOption: str) -> str:
+    """
+    This function takes float amount as input and returns it with currency symbol in locale number formatting (same as locale.currency with grouping)
+
+    @type amount: Float
+    @param amount: Currency Amount
+    @type localeOption: String
+    @param localeOption: Locale of Currency Value. Example: fr_FR
+
+    @rtype: String
+    @returns: Currency Symbol and Value in locale number formatting. Example: 1 234,56 € for fr_FR
+    """
+    currencyFormat = compiledCurrencyFormats[localeOption]
+    formattedValue = f"{abs(amount):.{currencyFormat['fracDigits']}f}"
+    return applyCurrencyFormat(formattedValue, amount < 0, currencyFormat)
+
+
+def formatCurrencyMinorUnits(minorUnits: int, localeOption: str) -> str:
+    """
+    This function takes amount in minor units (cents) as input and returns it with currency symbol in locale number formatting.
+    Output is same as formatCurrencyAmount of minorUnits / 100, locales with less fraction digits are rounded half to even.
+
+    @type minorUnits: Integer
+    @param minorUnits: Currency Amount in minor units. Example: 123456 for 1234.56
+    @type localeOption: String
+    @param localeOption: Locale of Currency Value. Example: fr_FR
+
+    @rtype: String
+    @returns: Currency Symbol and Value in locale number formatting. Example: 1 234,56 € for fr_FR
+    """
+    currencyFormat = compiledCurrencyFormats[localeOption]
+    fracDigits = currencyFormat["fracDigits"]
+
+    # Round minor units to fraction digits of locale (half to even, same as float formatting of exact halves)
+    scale = 10 ** max(2 - fracDigits, 0)
+    value, remainder = divmod(abs(minorUnits), scale)
+    if remainder * 2 > scale or (remainder * 2 == scale and value % 2 == 1):
+        value += 1
+
+    # Split integer and fraction digits
+    if fracDigits > 0:
+        units, fraction = divmod(value, 10 ** min(fracDigits, 2))
+        formattedValue = f"{units}.{fraction:0{min(fracDigits, 2)}d}" + "0" * max(fracDigits - 2, 0)
+    else:
+        formattedValue = str(value)
+    return applyCurrencyFormat(formattedValue, minorUnits < 0, currencyFormat)
@@ -0,0 +1,89 @@
+from _thread import allocate_lock
+from collections import OrderedDict
+from itertools import islice
+
+from constants.currencyConstants import currencyMemoMaxEntries, currencyMemoMaxTables
+
+from utils.statsUtils import addStatsCount
+
+
+# Converted value of amounts for each (destination currency, multiplier, rounding mode), least recently used last to be evicted
+conversionMemos = OrderedDict()
+
+# Memos are shared by threads of pipeline and conversion server, they are read and changed only while this lock is held
+memoLock = allocate_lock()
+
+
+def getConversionMemo(destinationCurrency: str, multiplier: int, roundingMode: str) -> dict:
+    """
+    This function returns memo of converted values of a conversion, memo of least recently used conversion is evicted when there are too many
+
+    @type destinationCurrency: String
+    @param destinationCurrency: Destination Currency Symbol
+    @type multiplier: Integer
+    @param multiplier: Value of Multiplier scaled by 10 ** rateDigits
+    @type roundingMode: String
+    @param roundingMode: Rounding Mode of converted amounts
+
+    @rtype: Dictionary
+    @returns: Converted Value of each memoized amount (in order of conversion)
+    """
+    memoKey = (destinationCurrency, multiplier, roundingMode)
+    with memoLock:
+        memo = conversionMemos.get(memoKey)
+        if memo is None:
+            memo = conversionMemos[memoKey] = {}
+            while len(conversionMemos) > currencyMemoMaxTables:
+                conversionMemos.popitem(last=False)
+        else:
+            conversionMemos.move_to_end(memoKey)
+    return memo
+
+
+def clearConversionMemos():
+    """
+    This function removes all memoized converted values
+    """
+    with memoLock:
+        conversionMemos.clear()
+
+
+def convertMemoizedValues(memo: dict, values: list, convertValues) -> list:
+    """
+    This function converts each distinct value of a chunk once and maps converted values back to each row.
+    Values converted by previous chunks are taken from memo and values converted by this chunk are added to it.
+    When memo has more than currencyMemoMaxEntries values, oldest values are evicted together until it is 3/4 full, so eviction does not cost each conversion.
+
+    @type memo: Dictionary
+    @param memo: Converted Value of each memoized value (in order of conversion)
+    @type values: List
+    @param values: Values of chunk (repeated values are converted once)
+    @type convertValues: Function
+    @param convertValues: Function which takes a list of distinct values and returns list of their converted values
+
+    @rtype: List
+    @returns: Converted Value of each value of chunk
+    """
+    # Converted values of chunk are copied from memo, so values evicted by another thread are still mapped back to rows
+    with memoLock:
+        chunkValues = {value: memo.get(value, memo) for value in dict.fromkeys(values)}
+    missingValues = [value for value, convertedValue in chunkValues.items() if convertedValue is memo]
+    # Distinct values which are not in memo are converted together, without holding lock
+    if missingValues:
+        chunkValues.update(zip(missingValues, convertValues(missingValues)))
+    convertedValues = list(map(chunkValues.__getitem__, values))
+
+    evictions = 0
+    if missingValues:
+        with memoLock:
+            memo.update((value, chunkValues[value]) for value in missingValues)
+            if len(memo) > currencyMemoMaxEntries:
+                evictValues = list(islice(memo, len(memo) - currencyMemoMaxEntries * 3 // 4))
+                for value in evictValues:
+                    del memo[value]
+                evictions = len(evictValues)
+
+    addStatsCount("convertMemoHits", len(values) - len(missingValues))
+    addStatsCount("convertMemoMisses", len(missingValues))
+    addStatsCount("memoEvictions", evictions)
+    return convertedValues
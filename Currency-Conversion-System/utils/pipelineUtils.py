@@ -0,0 +1,148 @@
+from itertools import islice
+
+from utils.statsUtils import statsStage
+
+
+def iterCSVRowBlocks(csvRows, blockRows: int):
+    """
+    This function groups CSV rows into blocks, so rows are passed between pipeline threads one block at a time instead of one row at a time
+
+    @type csvRows: Generator of List
+    @param csvRows: CSV Rows Data
+    @type blockRows: Integer
+    @param blockRows: Number of Rows in each block
+
+    @rtype: Generator of List
+    @returns: Each block of CSV Rows Data. CSV rows generator is closed when blocks are finished or closed
+    """
+    try:
+        while True:
+            with statsStage("read"):
+                csvRowsBlock = list(islice(csvRows, blockRows))
+            if not csvRowsBlock:
+                return
+            yield csvRowsBlock
+    finally:
+        csvRows.close()
+
+
+def iterThreadedItems(items, maxItems: int, threadName: str = "reader"):
+    """
+    This function produces items of an iterable in a thread, such as CSV row blocks read and decoded from input file, and yields them through a bounded queue.
+    Producer thread waits when queue has maxItems items, so memory usage is limited when it is faster than consumer.
+    An exception of producer thread is raised in consumer when its item is reached. Time of waiting for items is timed as wait stage.
+
+    @type items: Iterable
+    @param items: Items produced lazily
+    @type maxItems: Integer
+    @param maxItems: Maximum number of items waiting in queue
+    @type threadName: String
+    @param threadName: Name of producer thread
+
+    @rtype: Generator
+    @returns: Each item of iterable, in same order
+    """
+    # Threads are only imported for pipeline mode
+    import queue
+    import threading
+
+    itemsQueue = queue.Queue(maxItems)
+    stopped = threading.Event()
+
+    def produceItems():
+        try:
+            for item in items:
+                itemsQueue.put([True, item])
+                if stopped.is_set():
+                    return
+            itemsQueue.put([False, None])
+        except Exception as e:
+            itemsQueue.put([False, e])
+        finally:
+            if hasattr(items, "close"):
+                items.close()
+
+    threading.Thread(target=produceItems, name=threadName, daemon=True).start()
+    try:
+        while True:
+            with statsStage("wait"):
+                status, item = itemsQueue.get()
+            if status:
+                yield item
+            elif item is None:
+                return
+            else:
+                raise item
+    finally:
+        # Consumer is stopped early: producer thread stops after its next item, queue is emptied so it is not blocked on a full queue
+        stopped.set()
+        while not itemsQueue.empty():
+            itemsQueue.get_nowait()
+
+
+def consumeThreadedItems(consumeItems, items, maxItems: int, threadName: str = "writer") -> list:
+    """
+    This function consumes items of an iterable in a thread, such as converted chunks written to output files, while items are produced in calling thread.
+    Items are passed through a bounded queue, so calling thread waits when consumer thread has maxItems items to consume.
+    An exception while producing items is raised in consumer thread, so it can remove partial output files and return failure.
+    Time of waiting for items in consumer thread is timed as wait stage.
+
+    @type consumeItems: Function
+    @param consumeItems: Function which takes an iterable of items and returns a List of Boolean Status and Message. Example: writeCSVFilesChunks
+    @type items: Iterable
+    @param items: Items produced lazily in calling thread
+    @type maxItems: Integer
+    @param maxItems: Maximum number of items waiting in queue
+    @type threadName: String
+    @param threadName: Name of consumer thread
+
+    @rtype: List
+    @returns: A List of Boolean and String Messages of consumeItems
+    """
+    # Threads are only imported for pipeline mode
+    import queue
+    import threading
+
+    itemsQueue = queue.Queue(maxItems)
+    result = [False, "Consumer thread is not completed"]
+
+    def iterQueueItems():
+        while True:
+            with statsStage("wait"):
+                status, item = itemsQueue.get()
+            if status:
+                yield item
+            elif item is None:
+                return
+            else:
+                raise item
+
+    def runConsumer():
+        try:
+            result[:] = consumeItems(iterQueueItems())
+        except Exception as e:
+            result[:] = [False, e]
+
+    consumerThread = threading.Thread(target=runConsumer, name=threadName, daemon=True)
+
+    def putItem(item) -> bool:
+        # Consumer thread may stop early on failure, so a full queue is checked again until it is not running
+        while consumerThread.is_alive():
+            try:
+                itemsQueue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    consumerThread.start()
+    try:
+        for item in items:
+            if not putItem([True, item]):
+                break
+        else:
+            putItem([False, None])
+    except Exception as e:
+        putItem([False, e])
+    consumerThread.join()
+    return result
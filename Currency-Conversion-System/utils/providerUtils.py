@@ -0,0 +1,184 @@
+import os
+import sys
+import time
+
+from constants.cacheConstants import cacheDefaultDirectory
+from constants.providerConstants import providerCachePrefix, providerCacheSuffix, providerTimeout, providerRequestHeaders
+
+from utils.rateUtils import parseBaseRates
+
+
+# Open connection of each rate provider host for the whole process, keyed by (scheme, host:port), so later requests reuse it
+providerConnections = {}
+
+
+def getProviderCachePath(cacheDirectory: str, provider: str) -> str:
+    """
+    This function returns path of cached rates file of a rate provider
+
+    @type cacheDirectory: String
+    @param cacheDirectory: Cache Directory
+    @type provider: String
+    @param provider: Rate Provider URL
+
+    @rtype: String
+    @returns: Cached Rates File Path. Example: .currency-cache/rates-1f3a9c0d2b7e4a65.json
+    """
+    import hashlib
+    providerHash = hashlib.sha256(provider.encode("utf-8")).hexdigest()[:16]
+    return os.path.join(cacheDirectory, providerCachePrefix + providerHash + providerCacheSuffix)
+
+
+def readProviderCache(cachePath: str, provider: str) -> dict:
+    """
+    This function reads last known rates of a rate provider from cache directory
+
+    @type cachePath: String
+    @param cachePath: Cached Rates File Path
+    @type provider: String
+    @param provider: Rate Provider URL
+
+    @rtype: Dictionary
+    @returns: Rate Provider URL (provider), Epoch Time of fetch (fetchedTime) and Currency and Rate text of each currency (rates), or None if rates are not cached
+    """
+    import json
+    try:
+        with open(cachePath, "r", encoding="utf-8") as cacheFile:
+            cacheEntry = json.load(cacheFile)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cacheEntry, dict) or cacheEntry.get("provider") != provider or not isinstance(cacheEntry.get("rates"), list) \
+            or not isinstance(cacheEntry.get("fetchedTime"), (int, float)):
+        return None
+    return cacheEntry
+
+
+def writeProviderCache(cachePath: str, provider: str, ratesRows: list):
+    """
+    This function writes rates fetched from a rate provider to cache directory, so later runs use them until they expire
+
+    @type cachePath: String
+    @param cachePath: Cached Rates File Path
+    @type provider: String
+    @param provider: Rate Provider URL
+    @type ratesRows: List of List
+    @param ratesRows: Currency and Rate text of each currency
+    """
+    import json
+    cacheEntry = {"provider": provider, "fetchedTime": time.time(), "rates": ratesRows}
+    # Cache is only an optimization, rates are still used when cache directory can not be written
+    try:
+        os.makedirs(os.path.dirname(cachePath), exist_ok=True)
+        with open(cachePath + ".tmp", "w", encoding="utf-8") as cacheFile:
+            json.dump(cacheEntry, cacheFile)
+        os.replace(cachePath + ".tmp", cachePath)
+    except OSError:
+        pass
+
+
+def fetchHTTPRates(provider: str) -> list:
+    """
+    This function fetches base rates from HTTP rate provider with a keep-alive connection which is reused by later requests to same host.
+    Response is JSON object with base currency and rate of each currency. Example: {"base": "USD", "rates": {"EUR": 0.92, "INR": 83.2}}
+
+    @type provider: String
+    @param provider: Rate Provider URL. Example: http://127.0.0.1:8000/rates.json
+
+    @rtype: List of List
+    @returns: Currency and Rate text of each currency. Raises OSError or ValueError if rates can not be fetched
+    """
+    import json
+    import http.client
+    from urllib.parse import urlsplit
+
+    providerURL = urlsplit(provider)
+    requestPath = (providerURL.path or "/") + (f"?{providerURL.query}" if providerURL.query else "")
+    connectionKey = (providerURL.scheme.lower(), providerURL.netloc)
+    if not providerURL.hostname:
+        raise ValueError("Rate Provider URL must have host name")
+
+    # Connection kept open from previous request may have been closed by server, then request is sent again on a new connection
+    for attempt in range(2):
+        connection = providerConnections.pop(connectionKey, None)
+        reusedConnection = connection is not None
+        if connection is None:
+            connectionClass = http.client.HTTPSConnection if connectionKey[0] == "https" else http.client.HTTPConnection
+            connection = connectionClass(providerURL.hostname, providerURL.port, timeout=providerTimeout)
+        try:
+            connection.request("GET", requestPath, headers=providerRequestHeaders)
+            response = connection.getresponse()
+            responseData = response.read()
+        except (http.client.HTTPException, OSError) as e:
+            connection.close()
+            if reusedConnection:
+                continue
+            if isinstance(e, http.client.HTTPException):
+                raise ValueError(f"Rate Provider response is not valid HTTP: {e}")
+            raise
+        if response.will_close:
+            connection.close()
+        else:
+            providerConnections[connectionKey] = connection
+        break
+
+    if response.status != 200:
+        raise ValueError(f"Rate Provider responded with status {response.status} {response.reason}")
+    # Rates are kept as text, so they are parsed as exact decimal values
+    try:
+        ratesData = json.loads(responseData, parse_float=str, parse_int=str)
+    except ValueError:
+        raise ValueError("Invalid Rate Provider Response. It must be JSON object")
+    if not isinstance(ratesData, dict) or not isinstance(ratesData.get("base"), str) or not isinstance(ratesData.get("rates"), dict):
+        raise ValueError("Invalid Rate Provider Response. It must have base currency and rates of currencies")
+    ratesRows = [[currency, str(rate)] for currency, rate in ratesData["rates"].items()]
+    # Base currency has rate 1, providers may leave it out of rates
+    if ratesData["base"].strip().upper() not in [currency.strip().upper() for currency in ratesData["rates"]]:
+        ratesRows.insert(0, [ratesData["base"], "1"])
+    return ratesRows
+
+
+# Rate provider backend of each URL scheme, each returns Currency and Rate text of each currency for provider URL
+rateProviders = {
+    "http": fetchHTTPRates,
+    "https": fetchHTTPRates
+}
+
+
+def getProviderRates(provider: str, ratesTTL: int, cacheDirectory: str = cacheDefaultDirectory) -> dict:
+    """
+    This function returns base rates of a rate provider. Rates fetched within last ratesTTL seconds are read from cache directory
+    without a request, so back-to-back runs do not fetch them again. If rates can not be fetched, last known rates are used.
+
+    @type provider: String
+    @param provider: Rate Provider URL
+    @type ratesTTL: Integer
+    @param ratesTTL: Seconds cached rates are used before they are fetched again (0 to fetch on each run)
+    @type cacheDirectory: String
+    @param cacheDirectory: Directory of cached rates of each provider
+
+    @rtype: Dictionary
+    @returns: Currency to Rate scaled by 10 ** rateDigits. Raises ValueError if rates can not be fetched and are not cached
+    """
+    providerScheme = provider.split("://", 1)[0].lower() if "://" in provider else ""
+    if providerScheme not in rateProviders:
+        raise ValueError(f"Rate Provider is not valid. It must be an URL with scheme {' or '.join(rateProviders)}")
+
+    # Case 1: Rates fetched within TTL are used from cache
+    cachePath = getProviderCachePath(cacheDirectory, provider)
+    cacheEntry = readProviderCache(cachePath, provider)
+    if cacheEntry is not None and 0 <= time.time() - cacheEntry["fetchedTime"] < ratesTTL:
+        return parseBaseRates(cacheEntry["rates"], "Rate Provider Cache")
+
+    # Case 2: Rates are fetched from provider and cached
+    try:
+        ratesRows = rateProviders[providerScheme](provider)
+        baseRates = parseBaseRates(ratesRows, "Rate Provider Response")
+    except (OSError, ValueError) as e:
+        # Case 3: Provider is not reachable or its response is invalid, last known rates are used
+        if cacheEntry is None:
+            raise ValueError(f"Rate Provider failed and no last known rates are cached: {e}")
+        fetchedTime = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(cacheEntry["fetchedTime"]))
+        print(f"Note: Rate Provider failed ({e}). Last known rates fetched at {fetchedTime} are used", file=sys.stderr)
+        return parseBaseRates(cacheEntry["rates"], "Rate Provider Cache")
+    writeProviderCache(cachePath, provider, ratesRows)
+    return baseRates
@@ -0,0 +1,114 @@
+import os
+
+from constants.csvConstants import csvFileBasePath, csvSeprator, csvDefaultEncoding, csvRejectSuffix
+
+from utils.csvUtils import getCSVFileCompression
+
+
+def getRejectFileName(output: str) -> str:
+    """
+    This function returns reject file name of quarantine mode for output CSV file
+
+    @type output: String
+    @param output: Output CSV file name, stdout or - for standard output pipe
+
+    @rtype: String
+    @returns: Reject file name. Example: output-rejects.csv for output.csv (and output.csv.gz), data-rejects.csv for stdout and standard output pipe
+    """
+    if output in ["stdout", "-"]:
+        return f"data{csvRejectSuffix}"
+    outputName = os.path.splitext(output)[0]
+    # Reject file of compressed output file is not compressed
+    if getCSVFileCompression(output):
+        outputName = os.path.splitext(outputName)[0]
+    return outputName + csvRejectSuffix
+
+
+def rejectCSVRow(quarantine: dict, convertedRows: int, csvRowText: str, message: str):
+    """
+    This function quarantines an invalid CSV row with its line number and reason, instead of failing whole conversion
+
+    @type quarantine: Dictionary
+    @param quarantine: Quarantine state - Maximum invalid rows (maxErrors), Rejected row lines waiting to be written (rejects) and Number of rejected rows (rejectedRows)
+    @type convertedRows: Integer
+    @param convertedRows: Number of valid rows before invalid row
+    @type csvRowText: String
+    @param csvRowText: Invalid CSV Row as in input file
+    @type message: String
+    @param message: Validation Message of invalid row
+
+    Raises ValueError when more than maxErrors rows are invalid
+    """
+    # Line number in input file, column names are line 1
+    lineNumber = convertedRows + quarantine["rejectedRows"] + 2
+    # Reason is kept in one column of reject file
+    reason = " ".join(str(message).replace(csvSeprator, " ").split())
+    quarantine["rejects"].append(csvSeprator.join([str(lineNumber), reason, csvRowText]))
+    quarantine["rejectedRows"] += 1
+    if quarantine["rejectedRows"] > quarantine["maxErrors"]:
+        raise ValueError(f"Invalid CSV File. More than {quarantine['maxErrors']} rows are invalid (--max-errors), last invalid row is at line {lineNumber}: {reason}")
+
+
+def getQuarantineSummary(quarantine: dict, rejectFileName: str) -> str:
+    """
+    This function returns numbers of converted and rejected rows of quarantine mode
+
+    @type quarantine: Dictionary
+    @param quarantine: Quarantine state - Number of converted rows (convertedRows) and rejected rows (rejectedRows)
+    @type rejectFileName: String
+    @param rejectFileName: Reject File Name
+
+    @rtype: String
+    @returns: Summary Message. Example: Converted Rows: 998, Rejected Rows: 2 (output-rejects.csv)
+    """
+    summary = f"Converted Rows: {quarantine['convertedRows']}, Rejected Rows: {quarantine['rejectedRows']}"
+    if quarantine["rejectedRows"]:
+        summary += f" ({rejectFileName})"
+    return summary
+
+
+def iterQuarantinedChunks(convertedChunks, quarantine: dict, csvColumns: list, rejectFileName: str):
+    """
+    This function writes rows rejected while each chunk is converted to reject file and yields converted chunks.
+    Reject file has Line and Reason columns before columns of input file, and is only created when a row is rejected.
+    Rejected rows are written even if conversion fails, so they can be fixed together.
+
+    @type convertedChunks: Iterable of List
+    @param convertedChunks: Converted CSV Rows chunks for each destination currency, rows are rejected into quarantine state while they are produced
+    @type quarantine: Dictionary
+    @param quarantine: Quarantine state - Rejected row lines waiting to be written (rejects)
+    @type csvColumns: List
+    @param csvColumns: CSV Column Names of input file
+    @type rejectFileName: String
+    @param rejectFileName: Reject File Name
+
+    @rtype: Generator of List
+    @returns: Each converted chunk
+    """
+    rejectFilePath = os.path.join(csvFileBasePath, rejectFileName)
+    # Reject file of previous run is removed, so it only has rows of this run
+    if os.path.exists(rejectFilePath):
+        os.remove(rejectFilePath)
+    rejectFile = None
+
+    def writeRejects():
+        nonlocal rejectFile
+        if not quarantine["rejects"]:
+            return
+        # Rows are seprated with \r\n as in input files, so fixed rows can be copied back to input file
+        if rejectFile is None:
+            rejectFile = open(rejectFilePath, "w", encoding=csvDefaultEncoding, newline="")
+            rejectFile.write(csvSeprator.join(["Line", "Reason"] + csvColumns) + "\r\n")
+        rejectFile.write("\r\n".join(quarantine["rejects"]) + "\r\n")
+        quarantine["rejects"].clear()
+
+    try:
+        for convertedChunk in convertedChunks:
+            writeRejects()
+            yield convertedChunk
+    finally:
+        writeRejects()
+        if rejectFile is not None:
+            rejectFile.close()
+        if hasattr(convertedChunks, "close"):
+            convertedChunks.close()
@@ -0,0 +1,296 @@
+import os
+from _thread import allocate_lock
+from array import array
+from bisect import bisect_right
+from collections import OrderedDict
+from itertools import islice
+from math import gcd
+
+from constants.currencyConstants import supportedCurrencies, currencySymbolToName, ratesLookupCacheSize, rateDigits
+from constants.csvConstants import csvFileBasePath, csvTimestampColumnName
+
+from utils.csvUtils import iterCSVFile
+from utils.formatUtils import currencySymbolMatcher
+from utils.fixedPointUtils import parseRate
+
+
+# Latest rates table of each rates file for the whole process, keyed by file path with its (file path, size, modified time) key
+ratesTableCache = {}
+
+# Rate of recently looked up (rates file key, source currency, destination currency) and timestamp, least recently used first to be evicted
+rateLookups = OrderedDict()
+
+# Lookups are shared by threads of pipeline and conversion server, they are read and changed only while this lock is held
+rateLookupsLock = allocate_lock()
+
+
+def getRatesFileKey(fileName: str) -> tuple:
+    """
+    This function returns key of current content of rates file, it changes when rates file is edited
+
+    @type fileName: String
+    @param fileName: Rates File Name
+
+    @rtype: Tuple
+    @returns: Rates File Path, Size and Modified Time in nanoseconds
+    """
+    ratesFilePath = os.path.abspath(os.path.join(csvFileBasePath, fileName))
+    fileStat = os.stat(ratesFilePath)
+    return (ratesFilePath, fileStat.st_size, fileStat.st_mtime_ns)
+
+
+def getRatesTable(fileName: str) -> list:
+    """
+    This function reads rates file and returns rates time series of each currency pair sorted by timestamp, with key of rates file content they are read from.
+    Rates file is CSV file with columns Source|Destination|Timestamp|Rate where Timestamp is epoch time from which Rate is in effect.
+    Rates are kept as integers scaled by 10 ** rateDigits, so they are not rounded by float conversion.
+
+    @type fileName: String
+    @param fileName: Rates File Name
+
+    @rtype: List
+    @returns: Rates File Key (getRatesFileKey) and Rates Table - (Source Currency, Destination Currency) to pair of Timestamps array and Rates array. Raises ValueError if rates file is invalid
+    """
+    # Return cached rates table if file is not changed after last read
+    cacheKey = getRatesFileKey(fileName)
+    ratesFilePath = cacheKey[0]
+    cachedTable = ratesTableCache.get(ratesFilePath)
+    if cachedTable is not None and cachedTable[0] == cacheKey:
+        return list(cachedTable)
+
+    # Collect rates of each currency pair
+    ratesRows = iterCSVFile(ratesFilePath)
+    ratesColumns = next(ratesRows, None)
+    if not ratesColumns or len(ratesColumns) != 4:
+        raise ValueError("Invalid Rates File. It must have Source|Destination|Timestamp|Rate columns")
+    ratesPoints = {}
+    for ratesRow in ratesRows:
+        if len(ratesRow) != 4:
+            raise ValueError("Invalid Rates File. Row Data is not matching to total number of columns")
+        sourceCurrency, destinationCurrency = ratesRow[0].strip().upper(), ratesRow[1].strip().upper()
+        if sourceCurrency not in supportedCurrencies or destinationCurrency not in supportedCurrencies:
+            raise ValueError("Invalid Rates File. Currencies must be from supported currencies")
+        try:
+            timestamp, rate = int(ratesRow[2]), parseRate(ratesRow[3])
+        except ValueError:
+            raise ValueError("Invalid Rates File. Timestamp must be epoch time integer and Rate must be decimal value")
+        ratesPoints.setdefault((sourceCurrency, destinationCurrency), []).append((timestamp, rate))
+
+    # Sorted compact arrays of each currency pair for binary search
+    ratesTable = {}
+    for currencyPair, points in ratesPoints.items():
+        points.sort(key=lambda point: point[0])
+        ratesTable[currencyPair] = (array("q", (point[0] for point in points)), array("q", (point[1] for point in points)))
+
+    # Only latest table of each rates file is kept, table of edited file is replaced
+    ratesTableCache[ratesFilePath] = (cacheKey, ratesTable)
+    return [cacheKey, ratesTable]
+
+
+def readRatesFile(fileName: str) -> dict:
+    """
+    This function reads rates file and returns rates time series of each currency pair sorted by timestamp (see getRatesTable)
+
+    @type fileName: String
+    @param fileName: Rates File Name
+
+    @rtype: Dictionary
+    @returns: (Source Currency, Destination Currency) to pair of Timestamps array and Rates array. Raises ValueError if rates file is invalid
+    """
+    return getRatesTable(fileName)[1]
+
+
+def getRate(ratesTable: dict, sourceCurrency: str, destinationCurrency: str, timestamp: int) -> int:
+    """
+    This function returns conversion rate of currency pair in effect at given timestamp with binary search over rates time series
+
+    @type ratesTable: Dictionary
+    @param ratesTable: (Source Currency, Destination Currency) to pair of Timestamps array and Rates array (getRatesTable)
+    @type sourceCurrency: String
+    @param sourceCurrency: Source Currency Symbol - an abbreviated form Example: USD for US Dollar
+    @type destinationCurrency: String
+    @param destinationCurrency: Destination Currency Symbol - an abbreviated form Example: EUR for Euro
+    @type timestamp: Integer
+    @param timestamp: Epoch Time of row
+
+    @rtype: Integer
+    @returns: Conversion Rate scaled by 10 ** rateDigits. Raises ValueError if rates file does not have rate for currency pair at timestamp
+    """
+    if (sourceCurrency, destinationCurrency) not in ratesTable:
+        raise ValueError(f"Rates File does not contain rates from {sourceCurrency} to {destinationCurrency}")
+    timestamps, rates = ratesTable[(sourceCurrency, destinationCurrency)]
+    index = bisect_right(timestamps, timestamp) - 1
+    if index < 0:
+        raise ValueError(f"Rates File does not contain rate from {sourceCurrency} to {destinationCurrency} at timestamp {timestamp}")
+    return rates[index]
+
+
+def getTimestampField(csvColumns: list, timestampField: int = None) -> int:
+    """
+    This function returns timestamp column number of CSV file
+
+    @type csvColumns: List
+    @param csvColumns: CSV File Column Names
+    @type timestampField: Integer
+    @param timestampField: Timestamp Column Number (starts from 0), column named Last Update is used when not given
+
+    @rtype: Integer
+    @returns: Timestamp Column Number. Raises ValueError if timestamp column does not exist
+    """
+    if timestampField is None:
+        columnNames = [columnName.strip().lower() for columnName in csvColumns]
+        if csvTimestampColumnName.lower() not in columnNames:
+            raise ValueError(f"Invalid CSV File. {csvTimestampColumnName} column is required to use rates file")
+        return columnNames.index(csvTimestampColumnName.lower())
+    if timestampField >= len(csvColumns):
+        raise ValueError("Timestamp Field Number must be less than or equal to total number of columns in CSV file")
+    return timestampField
+
+
+def getRowsRates(csvRows: list, rates: dict, sourceCurrency: str, destinationCurrency: str, ratesPerRow: int = 1) -> list:
+    """
+    This function returns conversion rate in effect at timestamp of each CSV row
+
+    @type csvRows: List of List
+    @param csvRows: CSV Rows Data
+    @type rates: Dictionary
+    @param rates: Rates File Name (ratesFile) and Timestamp Column Number (timestampField)
+    @type sourceCurrency: String
+    @param sourceCurrency: Source Currency Symbol - an abbreviated form Example: USD for US Dollar
+    @type destinationCurrency: String
+    @param destinationCurrency: Destination Currency Symbol - an abbreviated form Example: EUR for Euro
+    @type ratesPerRow: Integer
+    @param ratesPerRow: Number of times rate of each row is repeated (one for each currency column)
+
+    @rtype: List of Integer
+    @returns: Conversion Rates scaled by 10 ** rateDigits. Raises ValueError for invalid timestamp or missing rate
+    """
+    # Rates file is checked for changes once for each chunk of rows, and rates of chunk are looked up in the table of that check
+    ratesFileKey, ratesTable = getRatesTable(rates["ratesFile"])
+    lookupKey = (ratesFileKey, sourceCurrency, destinationCurrency)
+    rowsRates = []
+    with rateLookupsLock:
+        for csvRow in csvRows:
+            timestamp = csvRow[rates["timestampField"]].strip()
+            if not timestamp.isdigit():
+                raise ValueError("Invalid CSV File. Timestamp column must contain epoch time integer")
+            rateKey = (lookupKey, int(timestamp))
+            rate = rateLookups.get(rateKey)
+            if rate is None:
+                rate = rateLookups[rateKey] = getRate(ratesTable, sourceCurrency, destinationCurrency, rateKey[1])
+            else:
+                rateLookups.move_to_end(rateKey)
+            rowsRates.extend([rate] * ratesPerRow)
+
+        # Least recently used lookups are evicted together until lookups are 3/4 full, lookups of edited rates file are never used again and are evicted with them
+        if len(rateLookups) > ratesLookupCacheSize:
+            for rateKey in list(islice(rateLookups, len(rateLookups) - ratesLookupCacheSize * 3 // 4)):
+                del rateLookups[rateKey]
+    return rowsRates
+
+
+def readBaseRatesFile(fileName: str) -> dict:
+    """
+    This function reads base rates file of mixed currency files and returns rate of each currency.
+    Base rates file is CSV file with columns Currency|Rate where Rate is value of one unit of base currency in Currency (base currency has rate 1).
+
+    @type fileName: String
+    @param fileName: Base Rates File Name
+
+    @rtype: Dictionary
+    @returns: Currency to Rate scaled by 10 ** rateDigits. Raises ValueError if base rates file is invalid
+    """
+    ratesRows = iterCSVFile(os.path.join(csvFileBasePath, fileName))
+    ratesColumns = next(ratesRows, None)
+    if not ratesColumns or len(ratesColumns) != 2:
+        raise ValueError("Invalid Base Rates File. It must have Currency|Rate columns")
+    return parseBaseRates(ratesRows, "Base Rates File")
+
+
+def parseBaseRates(ratesRows, ratesName: str) -> dict:
+    """
+    This function validates Currency and Rate of each row of base rates (of base rates file or rate provider)
+
+    @type ratesRows: Iterable of List
+    @param ratesRows: Currency and Rate text of each currency
+    @type ratesName: String
+    @param ratesName: Name of base rates in validation messages. Example: Base Rates File
+
+    @rtype: Dictionary
+    @returns: Currency to Rate scaled by 10 ** rateDigits. Raises ValueError if base rates are invalid
+    """
+    baseRates = {}
+    for ratesRow in ratesRows:
+        if len(ratesRow) != 2:
+            raise ValueError(f"Invalid {ratesName}. Row Data is not matching to total number of columns")
+        currency = ratesRow[0].strip().upper()
+        if currency not in supportedCurrencies:
+            raise ValueError(f"Invalid {ratesName}. Currencies must be from supported currencies")
+        if currency in baseRates:
+            raise ValueError(f"Invalid {ratesName}. Currencies must not be repeated")
+        try:
+            rate = parseRate(ratesRow[1])
+        except ValueError:
+            rate = 0
+        if rate <= 0:
+            raise ValueError(f"Invalid {ratesName}. Rate must be decimal value greater than 0")
+        baseRates[currency] = rate
+    return baseRates
+
+
+def getCrossRates(baseRates: dict) -> dict:
+    """
+    This function computes cross rate of each pair of supported currencies from rates of base currency, so rows are converted without dividing rates.
+    Cross rate is kept exact as numerator and denominator pair when it has more than rateDigits fraction digits,
+    so converted amount is rounded only once and not after rounding of cross rate.
+
+    @type baseRates: Dictionary
+    @param baseRates: Currency to Rate of base currency scaled by 10 ** rateDigits
+
+    @rtype: Dictionary
+    @returns: (Source Currency, Destination Currency) to Cross Rate scaled by 10 ** rateDigits, Integer or (Numerator, Denominator) if it is not exact, for currencies of base rates
+    """
+    crossRates = {}
+    for sourceCurrency in supportedCurrencies:
+        for destinationCurrency in supportedCurrencies:
+            if sourceCurrency in baseRates and destinationCurrency in baseRates:
+                numerator, denominator = baseRates[destinationCurrency] * 10 ** rateDigits, baseRates[sourceCurrency]
+                commonDivisor = gcd(numerator, denominator)
+                numerator, denominator = numerator // commonDivisor, denominator // commonDivisor
+                crossRates[(sourceCurrency, destinationCurrency)] = numerator if denominator == 1 else (numerator, denominator)
+    return crossRates
+
+
+def getAmountsCurrencies(csvRows: list, fields: list) -> list:
+    """
+    This function returns source currency of each currency column of each validated CSV row of mixed currency file
+
+    @type csvRows: List of List
+    @param csvRows: Validated CSV Rows Data
+    @type fields: List of Integer
+    @param fields: CSV File's Currency Column Numbers (starts from 0)
+
+    @rtype: List of String
+    @returns: Source Currency of each amount (row by row). Example: HKD for HK$ 12.00
+    """
+    return [currencySymbolToName[currencySymbolMatcher.search(csvRow[field]).group()] for csvRow in csvRows for field in fields]
+
+
+def getAmountsCrossRates(sourceCurrencies: list, crossRates: dict, destinationCurrency: str) -> list:
+    """
+    This function returns cross rate from source currency of each amount to destination currency
+
+    @type sourceCurrencies: List of String
+    @param sourceCurrencies: Source Currency of each amount
+    @type crossRates: Dictionary
+    @param crossRates: (Source Currency, Destination Currency) to Cross Rate scaled by 10 ** rateDigits
+    @type destinationCurrency: String
+    @param destinationCurrency: Destination Currency Symbol - an abbreviated form Example: EUR for Euro
+
+    @rtype: List of Integer
+    @returns: Cross Rates scaled by 10 ** rateDigits (Integer or (Numerator, Denominator) pair). Raises ValueError if base rates (file or rate provider) do not have rate of a source currency
+    """
+    try:
+        return [crossRates[(sourceCurrency, destinationCurrency)] for sourceCurrency in sourceCurrencies]
+    except KeyError as e:
+        raise ValueError(f"Base Rates do not contain rate of {e.args[0][0]}")
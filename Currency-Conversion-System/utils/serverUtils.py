@@ -0,0 +1,458 @@
+import codecs
+import asyncio
+import tempfile
+from functools import partial
+from urllib.parse import urlsplit, parse_qs
+
+from constants.csvConstants import csvSeprator, csvDefaultEncoding
+from constants.serverConstants import serverDefaultHost, serverReadChunkSize, serverMaxHeaderBytes, serverChunkRows, serverSpoolMaxBytes, serverMaxConcurrentConversions, serverKeepAliveTimeout
+
+from utils.formatUtils import currencySymbolPattern
+from utils.rateUtils import getTimestampField
+from utils.argUtils import validateRequestArgs
+from utils.csvUtils import getCSVDataEncoding, validateCSVColumns
+from utils.currencyUtils import convertCSVRowsText
+
+
+def parseServerAddress(address: str) -> list:
+    """
+    This function takes server address from command line and returns address to listen on
+
+    @type address: String
+    @param address: unix:/path/to/socket for Unix socket, or host:port or port for HTTP over TCP
+
+    @rtype: List
+    @returns: A List of Boolean, String Message and Server Address (Unix socket path, or host and port)
+    """
+    address = address.strip()
+    # Option 1: Unix socket
+    if address.startswith("unix:"):
+        socketPath = address[len("unix:"):]
+        if not socketPath:
+            return [False, "Unix socket path is required. Example: unix:/tmp/currency.sock"]
+        return [True, "Valid Server Address", {"unixPath": socketPath}]
+    # Option 2: TCP host and port
+    host, port = address.rsplit(":", 1) if ":" in address else (serverDefaultHost, address)
+    if not port.isdigit() or not 0 < int(port) < 65536:
+        return [False, "Server Address is not valid. Example: 127.0.0.1:8080, 8080 or unix:/tmp/currency.sock"]
+    return [True, "Valid Server Address", {"host": host or serverDefaultHost, "port": int(port)}]
+
+
+async def readRequestHead(reader: asyncio.StreamReader) -> list:
+    """
+    This function reads request line and headers of a HTTP request
+
+    @type reader: StreamReader
+    @param reader: Connection Reader
+
+    @rtype: List
+    @returns: Method, Target, HTTP Version and Headers Dictionary (lower case names), or None if client closed connection
+    """
+    try:
+        requestHead = await reader.readuntil(b"\r\n\r\n")
+    except asyncio.IncompleteReadError as e:
+        if e.partial.strip():
+            raise ValueError("Incomplete request head")
+        return None
+    except asyncio.LimitOverrunError:
+        raise ValueError("Request head is too large")
+
+    requestLines = requestHead.decode("latin-1").split("\r\n")
+    requestLine = requestLines[0].split(" ")
+    if len(requestLine) != 3:
+        raise ValueError("Invalid request line")
+    headers = {}
+    for headerLine in requestLines[1:]:
+        if ":" in headerLine:
+            name, value = headerLine.split(":", 1)
+            headers[name.strip().lower()] = value.strip()
+    return requestLine + [headers]
+
+
+async def iterRequestBody(reader: asyncio.StreamReader, writer: asyncio.StreamWriter, headers: dict):
+    """
+    This function reads request body chunk by chunk (Content-Length or chunked transfer encoding).
+    Next chunk is read only when previous chunk is consumed, so a large upload waits in socket buffers instead of server memory.
+
+    @type reader: StreamReader
+    @param reader: Connection Reader
+    @type writer: StreamWriter
+    @param writer: Connection Writer, used to accept "Expect: 100-continue" uploads once body is read
+    @type headers: Dictionary
+    @param headers: Request Headers (lower case names)
+
+    @rtype: Async Generator of Bytes
+    @returns: Request Body Chunks
+    """
+    # Client waits for server before sending a large body
+    if headers.get("expect", "").lower() == "100-continue":
+        writer.write(b"HTTP/1.1 100 Continue\r\n\r\n")
+        await writer.drain()
+
+    # Case 1: Chunked Transfer Encoding
+    if "chunked" in headers.get("transfer-encoding", "").lower():
+        while True:
+            chunkSize = int((await reader.readline()).split(b";")[0].strip() or b"0", 16)
+            if chunkSize == 0:
+                # Skip trailer headers
+                while (await reader.readline()).strip():
+                    pass
+                break
+            while chunkSize > 0:
+                data = await reader.readexactly(min(chunkSize, serverReadChunkSize))
+                chunkSize -= len(data)
+                yield data
+            await reader.readexactly(2)
+        return
+
+    # Case 2: Content-Length (no body when not given)
+    remainingBytes = int(headers.get("content-length", "0"))
+    while remainingBytes > 0:
+        data = await reader.read(min(remainingBytes, serverReadChunkSize))
+        if not data:
+            raise ConnectionError("Connection is closed before request body is received")
+        remainingBytes -= len(data)
+        yield data
+
+
+async def iterInputFile(filePath: str):
+    """
+    This function reads CSV file on server chunk by chunk
+
+    @type filePath: String
+    @param filePath: Input CSV File Path
+
+    @rtype: Async Generator of Bytes
+    @returns: Input File Chunks
+    """
+    with open(filePath, "rb") as csvFile:
+        data = csvFile.read(serverReadChunkSize)
+        while data:
+            yield data
+            await asyncio.sleep(0)
+            data = csvFile.read(serverReadChunkSize)
+
+
+async def iterRequestCSVRows(dataChunks, encoding: str = None):
+    """
+    This function decodes CSV data chunks and yields each row, same as CSV file reader (rows seprated by CRLF and data ends at first empty row)
+
+    @type dataChunks: Async Iterable of Bytes
+    @param dataChunks: CSV Data Chunks
+    @type encoding: String
+    @param encoding: CSV Data Encoding (detected from first chunk when not given)
+
+    @rtype: Async Generator of List
+    @returns: CSV Column Names as first item followed by each Row Data. Raises ValueError if data can not be decoded
+    """
+    decoder = None
+    pendingText = ""
+    endOfData = False
+    async for data in dataChunks:
+        if decoder is None:
+            encoding = getCSVDataEncoding(data, encoding)
+            decoder = codecs.getincrementaldecoder(encoding)()
+        try:
+            pendingText += decoder.decode(data)
+        except UnicodeDecodeError:
+            raise ValueError(f"Invalid CSV data. It can not be decoded with {encoding} encoding")
+        rows = pendingText.split("\r\n")
+        pendingText = rows.pop()
+        for row in rows:
+            csvRowData = row.split(csvSeprator)
+            if all(len(data) == 0 for data in csvRowData):
+                endOfData = True
+                break
+            yield csvRowData
+        if endOfData:
+            return
+
+    # Last row without line seprator
+    if decoder is not None:
+        pendingText += decoder.decode(b"", final=True)
+    if pendingText:
+        yield pendingText.split(csvSeprator)
+
+
+async def iterCSVRowsBlocks(csvRows):
+    """
+    This function groups CSV rows into blocks of rows converted together
+
+    @type csvRows: Async Iterable of List
+    @param csvRows: CSV Rows Data
+
+    @rtype: Async Generator of List of List
+    @returns: Blocks of at most serverChunkRows rows
+    """
+    csvRowsBlock = []
+    async for csvRow in csvRows:
+        csvRowsBlock.append(csvRow)
+        if len(csvRowsBlock) == serverChunkRows:
+            yield csvRowsBlock
+            csvRowsBlock = []
+    if csvRowsBlock:
+        yield csvRowsBlock
+
+
+def writeResponseHead(writer: asyncio.StreamWriter, status: int, reason: str, headers: dict):
+    """
+    This function writes status line and headers of a HTTP response
+
+    @type writer: StreamWriter
+    @param writer: Connection Writer
+    @type status: Integer
+    @param status: HTTP Status Code
+    @type reason: String
+    @param reason: HTTP Reason Phrase
+    @type headers: Dictionary
+    @param headers: Response Headers
+    """
+    responseHead = f"HTTP/1.1 {status} {reason}\r\n" + "".join(f"{name}: {value}\r\n" for name, value in headers.items()) + "\r\n"
+    writer.write(responseHead.encode("latin-1"))
+
+
+async def writeErrorResponse(writer: asyncio.StreamWriter, status: int, reason: str, message: str, body=None):
+    """
+    This function writes error message response and asks client to close connection.
+    Rest of request body is received and skipped first, as most clients do not read response before whole request is sent.
+
+    @type writer: StreamWriter
+    @param writer: Connection Writer
+    @type status: Integer
+    @param status: HTTP Status Code
+    @type reason: String
+    @param reason: HTTP Reason Phrase
+    @type message: String
+    @param message: Error Message
+    @type body: Async Iterable of Bytes
+    @param body: Request Body Chunks not received yet (None if client waits for "100 Continue" or body is already received)
+    """
+    if body is not None:
+        async for data in body:
+            pass
+    body = f"{message}\n".encode("utf-8")
+    writeResponseHead(writer, status, reason, {"Content-Type": "text/plain; charset=utf-8", "Content-Length": len(body), "Connection": "close"})
+    writer.write(body)
+    await writer.drain()
+
+
+async def writeResponseChunk(writer: asyncio.StreamWriter, data: bytes):
+    """
+    This function sends one chunk of chunked transfer encoding response and waits until it is accepted by client connection
+
+    @type writer: StreamWriter
+    @param writer: Connection Writer
+    @type data: Bytes
+    @param data: Response Data (empty data ends response)
+    """
+    writer.write(f"{len(data):X}\r\n".encode("latin-1") + data + b"\r\n")
+    await writer.drain()
+
+
+async def convertRequest(writer: asyncio.StreamWriter, body, requestArgs: dict, keepAlive: bool) -> bool:
+    """
+    This function converts CSV data of one request and sends back converted CSV in output file format (chunked transfer encoding).
+    Rows are converted block by block in a thread, so other connections are served while a block is converted, and next block is read only after previous block is converted.
+    Most clients do not read response before whole request is sent, so converted data of an upload is spooled (in memory, then temporary file) and sent once upload is received.
+    Converted data of a CSV file on server is sent block by block as it is converted.
+
+    @type writer: StreamWriter
+    @param writer: Connection Writer
+    @type body: Async Iterable of Bytes
+    @param body: Request Body Chunks
+    @type requestArgs: Dictionary
+    @param requestArgs: Validated Conversion Parameters
+    @type keepAlive: Boolean
+    @param keepAlive: Whether client keeps connection open for next request
+
+    @rtype: Boolean
+    @returns: True if connection can be used for next request
+    """
+    loop = asyncio.get_running_loop()
+    fields, multipliers, currencySymbols = requestArgs["fields"], requestArgs["multipliers"], requestArgs["currencySymbols"]
+    backend, rates, roundingMode = requestArgs["backend"], requestArgs["rates"], requestArgs["roundingMode"]
+    responseHead = {"Content-Type": "text/csv; charset=utf-8", "Transfer-Encoding": "chunked", "Connection": "keep-alive" if keepAlive else "close"}
+    responseStarted = False
+
+    try:
+        with tempfile.SpooledTemporaryFile(max_size=serverSpoolMaxBytes) as spoolFile:
+            # Read Column Names from first row of CSV data
+            if requestArgs["input"]:
+                csvRows = iterRequestCSVRows(iterInputFile(requestArgs["input"]), requestArgs["encoding"])
+            else:
+                csvRows = iterRequestCSVRows(body, requestArgs["encoding"])
+            csvColumns = None
+            async for csvColumns in csvRows:
+                break
+
+            # Case 1 & 2: Empty CSV data or no "price" column
+            result = validateCSVColumns(csvColumns)
+            if not result[0]:
+                raise ValueError(result[1])
+            totalColumns = len(csvColumns) if csvColumns[-1] else len(csvColumns) - 1
+            if any(field >= totalColumns for field in fields):
+                raise ValueError("Field Number must be less than or equal to total number of columns in CSV file")
+            if rates:
+                rates = {**rates, "timestampField": getTimestampField(csvColumns, rates["timestampField"])}
+
+            # Validate and convert each block of rows
+            encoder = codecs.getincrementalencoder(csvDefaultEncoding)()
+            responseText = csvSeprator.join(csvColumns) + "\n"
+            sourceCurrencySymbol = ""
+            totalRows = 0
+            async for csvRowsBlock in iterCSVRowsBlocks(csvRows):
+                # Source Currency Symbol of first row is used to validate one currency in whole CSV data (rows are converted in place)
+                firstRowSymbol = sourceCurrencySymbol
+                if not sourceCurrencySymbol and len(csvRowsBlock[0]) > fields[0]:
+                    sourceCurrencyInfo = currencySymbolPattern.search(csvRowsBlock[0][fields[0]].strip())
+                    sourceCurrencySymbol = sourceCurrencyInfo.group() if sourceCurrencyInfo else ""
+                convertedTexts = (await loop.run_in_executor(None, convertCSVRowsText, csvRowsBlock, totalColumns, fields, multipliers,
+                                                             currencySymbols, backend, firstRowSymbol, rates, roundingMode))[0]
+                totalRows += len(csvRowsBlock)
+                responseData = encoder.encode(responseText + convertedTexts[0])
+                responseText = ""
+
+                # Case 1: Upload is spooled until it is received
+                if not requestArgs["input"]:
+                    spoolFile.write(responseData)
+                # Case 2: CSV file on server is sent as it is converted, validation errors of first block are sent as error response
+                else:
+                    if not responseStarted:
+                        writeResponseHead(writer, 200, "OK", responseHead)
+                        responseStarted = True
+                    await writeResponseChunk(writer, responseData)
+
+            # Case 5: Only Column names in CSV, rows data does not exist
+            if totalRows == 0:
+                raise ValueError("Invalid CSV File. It only contains column names and does not contain rows data")
+
+            # Rows after an empty row are not part of CSV data, rest of body is skipped for next request
+            async for data in body:
+                pass
+
+            # Send spooled response of upload
+            if not responseStarted:
+                writeResponseHead(writer, 200, "OK", responseHead)
+                responseStarted = True
+                spoolFile.seek(0)
+                responseData = spoolFile.read(serverReadChunkSize)
+                while responseData:
+                    await writeResponseChunk(writer, responseData)
+                    responseData = spoolFile.read(serverReadChunkSize)
+            await writeResponseChunk(writer, b"")
+            return keepAlive
+
+    except (ValueError, KeyError, AttributeError, IndexError) as e:
+        # Error after response is started can not change status, connection is closed without last chunk so client sees incomplete response
+        if not responseStarted:
+            await writeErrorResponse(writer, 400, "Bad Request", str(e), body)
+        return False
+
+
+async def handleRequest(reader: asyncio.StreamReader, writer: asyncio.StreamWriter, requestHead: list, conversionLimit: asyncio.Semaphore) -> bool:
+    """
+    This function handles one HTTP request: POST /convert?field=N&symbol=Currency&multiplier=N with CSV data as body (or input=name of CSV file in current directory of server)
+
+    @type reader: StreamReader
+    @param reader: Connection Reader
+    @type writer: StreamWriter
+    @param writer: Connection Writer
+    @type requestHead: List
+    @param requestHead: Method, Target, HTTP Version and Headers Dictionary
+    @type conversionLimit: Semaphore
+    @param conversionLimit: Limit of requests converted at a time
+
+    @rtype: Boolean
+    @returns: True if connection can be used for next request
+    """
+    method, target, version, headers = requestHead
+    keepAlive = version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+    url = urlsplit(target)
+    body = iterRequestBody(reader, writer, headers)
+    # Client waiting for "100 Continue" does not send body of rejected request
+    unreadBody = None if headers.get("expect", "").lower() == "100-continue" else body
+
+    if url.path != "/convert":
+        await writeErrorResponse(writer, 404, "Not Found", "Only /convert path is supported", unreadBody)
+        return False
+    if method != "POST":
+        await writeErrorResponse(writer, 405, "Method Not Allowed", "Only POST method is supported", unreadBody)
+        return False
+
+    query = {name: values[-1] for name, values in parse_qs(url.query).items()}
+    result = validateRequestArgs(query)
+    if not result[0]:
+        await writeErrorResponse(writer, 400, "Bad Request", str(result[1]), unreadBody)
+        return False
+
+    # Requests over the limit wait here and their body is not read until a conversion is finished
+    async with conversionLimit:
+        return await convertRequest(writer, body, result[2], keepAlive)
+
+
+async def handleConnection(conversionLimit: asyncio.Semaphore, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+    """
+    This function handles requests of one client connection until client or server closes it
+
+    @type conversionLimit: Semaphore
+    @param conversionLimit: Limit of requests converted at a time
+    @type reader: StreamReader
+    @param reader: Connection Reader
+    @type writer: StreamWriter
+    @param writer: Connection Writer
+    """
+    try:
+        keepAlive = True
+        while keepAlive:
+            requestHead = await asyncio.wait_for(readRequestHead(reader), serverKeepAliveTimeout)
+            if requestHead is None:
+                break
+            keepAlive = await handleRequest(reader, writer, requestHead, conversionLimit)
+    except ValueError as e:
+        await writeErrorResponse(writer, 400, "Bad Request", str(e))
+    except (asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+
+
+async def runServer(serverAddress: dict):
+    """
+    This function starts conversion server and serves connections until it is stopped
+
+    @type serverAddress: Dictionary
+    @param serverAddress: Unix socket path (unixPath), or host and port
+    """
+    conversionLimit = asyncio.Semaphore(serverMaxConcurrentConversions)
+    connectionHandler = partial(handleConnection, conversionLimit)
+    if "unixPath" in serverAddress:
+        server = await asyncio.start_unix_server(connectionHandler, path=serverAddress["unixPath"], limit=serverMaxHeaderBytes)
+        print(f"Currency Conversion Server is listening on unix:{serverAddress['unixPath']}")
+    else:
+        server = await asyncio.start_server(connectionHandler, serverAddress["host"], serverAddress["port"], limit=serverMaxHeaderBytes)
+        print(f"Currency Conversion Server is listening on http://{serverAddress['host']}:{serverAddress['port']}")
+    async with server:
+        await server.serve_forever()
+
+
+def serveCurrencyConversion(address: str) -> list:
+    """
+    This function runs currency conversion server. Imports, format tables, encoding detector and rates files stay loaded between requests.
+
+    @type address: String
+    @param address: unix:/path/to/socket for Unix socket, or host:port or port for HTTP over TCP
+
+    @rtype: List
+    @returns: A List of Boolean and String Messages
+    """
+    result = parseServerAddress(address)
+    if not result[0]:
+        return result
+
+    try:
+        asyncio.run(runServer(result[2]))
+    except KeyboardInterrupt:
+        pass
+    except Exception as e:
+        return [False, e]
+    return [True, "Currency Conversion Server is stopped"]
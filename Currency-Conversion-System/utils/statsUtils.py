@@ -0,0 +1,236 @@
+import sys
+import time
+from _thread import get_ident, allocate_lock
+from functools import wraps
+from contextlib import contextmanager
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+
+# Functions called with stats of each finished operation
+statsHooks = []
+
+# Stats of running operation (None when stats are not collected) and stages being timed by each thread, innermost last
+activeStats = None
+activeStages = {}
+
+# Counts and stage times are added by threads of pipeline and conversion server, they are added only while this lock is held
+statsLock = allocate_lock()
+
+
+def addStatsHook(hook):
+    """
+    This function adds a function which is called with stats dictionary when a currency conversion operation is finished.
+    Stats are collected only while a hook is added (or --stats is given), so conversion does not pay for timing otherwise.
+
+    @type hook: Function
+    @param hook: Function which takes stats dictionary
+    """
+    statsHooks.append(hook)
+
+
+def removeStatsHook(hook):
+    """
+    This function removes a stats hook added by addStatsHook
+
+    @type hook: Function
+    @param hook: Function which takes stats dictionary
+    """
+    statsHooks.remove(hook)
+
+
+def isStatsActive() -> bool:
+    """
+    This function checks whether stats of an operation are being collected
+
+    @rtype: Boolean
+    @returns: True if stats are being collected
+    """
+    return activeStats is not None
+
+
+def startStats() -> dict:
+    """
+    This function starts collecting stats of an operation
+
+    @rtype: Dictionary
+    @returns: Stats Dictionary which is filled while operation runs
+    """
+    global activeStats
+    activeStats = {"startTime": time.perf_counter(), "stages": {}, "rows": 0, "rejectedRows": 0, "bytesRead": 0, "bytesWritten": 0,
+                   "parseMemoHits": 0, "parseMemoMisses": 0, "convertMemoHits": 0, "convertMemoMisses": 0, "memoEvictions": 0}
+    activeStages.clear()
+    return activeStats
+
+
+def finishStats(status: bool = True) -> dict:
+    """
+    This function stops collecting stats, adds totals and calls each stats hook
+
+    @type status: Boolean
+    @param status: Whether operation is successful
+
+    @rtype: Dictionary
+    @returns: Stats - status, seconds, exclusive seconds of each stage, rows, rowsPerSecond, rejectedRows, bytesRead, bytesWritten, memo hits, misses and hit rate of parse and convert, memo evictions and peakRSSBytes
+    """
+    global activeStats
+    stats = activeStats
+    activeStats = None
+    if stats is None:
+        return None
+
+    seconds = time.perf_counter() - stats.pop("startTime")
+    stats = {"status": bool(status), "seconds": round(seconds, 6),
+             "stages": {stageName: round(stageSeconds, 6) for stageName, stageSeconds in stats["stages"].items()},
+             "rows": stats["rows"], "rowsPerSecond": round(stats["rows"] / seconds, 1) if seconds > 0 else 0.0, "rejectedRows": stats["rejectedRows"],
+             "bytesRead": stats["bytesRead"], "bytesWritten": stats["bytesWritten"],
+             "memo": {memoName: {"hits": stats[f"{memoName}MemoHits"], "misses": stats[f"{memoName}MemoMisses"],
+                                 "hitRate": getHitRate(stats[f"{memoName}MemoHits"], stats[f"{memoName}MemoMisses"])}
+                      for memoName in ["parse", "convert"]},
+             "memoEvictions": stats["memoEvictions"], "peakRSSBytes": getPeakRSS()}
+    for hook in list(statsHooks):
+        hook(stats)
+    return stats
+
+
+@contextmanager
+def statsStage(stageName: str):
+    """
+    This function times a stage of operation when stats are collected.
+    Time of a stage does not include time of stages started inside it, so stage times add up to operation time.
+    Stages of pipeline threads are timed separately and run at the same time, so their stage times add up to more than operation time.
+
+    @type stageName: String
+    @param stageName: Stage Name. Example: parse, convert, write
+    """
+    if activeStats is None:
+        yield
+        return
+
+    with statsLock:
+        threadStages = activeStages.setdefault(get_ident(), [])
+    stage = [stageName, time.perf_counter(), 0.0]
+    threadStages.append(stage)
+    try:
+        yield
+    finally:
+        threadStages.pop()
+        stageSeconds = time.perf_counter() - stage[1]
+        stats = activeStats
+        if stats is not None:
+            stages = stats["stages"]
+            with statsLock:
+                stages[stageName] = stages.get(stageName, 0.0) + stageSeconds - stage[2]
+            # Parent stage time excludes this stage
+            if threadStages:
+                threadStages[-1][2] += stageSeconds
+
+
+def iterStatsStage(iterable, stageName: str):
+    """
+    This function times producing each item of an iterable as a stage, such as rows read and validated while output is written
+
+    @type iterable: Iterable
+    @param iterable: Items produced lazily
+    @type stageName: String
+    @param stageName: Stage Name
+
+    @rtype: Generator
+    @returns: Each item of iterable
+    """
+    iterator = iter(iterable)
+    while True:
+        with statsStage(stageName):
+            item = next(iterator, StopIteration)
+        if item is StopIteration:
+            return
+        yield item
+
+
+def addStatsCount(countName: str, value: int):
+    """
+    This function adds to a count of operation stats when stats are collected
+
+    @type countName: String
+    @param countName: rows, rejectedRows, bytesRead, bytesWritten, parseMemoHits, parseMemoMisses, convertMemoHits, convertMemoMisses or memoEvictions
+    @type value: Integer
+    @param value: Value to add
+    """
+    stats = activeStats
+    if stats is not None:
+        with statsLock:
+            stats[countName] += value
+
+
+def collectStats(operation):
+    """
+    This function is a decorator which collects stats of whole operation when a stats hook is added and stats are not already being collected
+
+    @type operation: Function
+    @param operation: Operation returning a List of Boolean Status and Message
+
+    @rtype: Function
+    @returns: Operation which collects stats
+    """
+    @wraps(operation)
+    def statsOperation(*args, **kwargs):
+        if not statsHooks or isStatsActive():
+            return operation(*args, **kwargs)
+        startStats()
+        result = [False, "Operation is not completed"]
+        try:
+            result = operation(*args, **kwargs)
+            return result
+        finally:
+            finishStats(result[0])
+    return statsOperation
+
+
+def getHitRate(hits: int, misses: int) -> float:
+    """
+    This function returns ratio of memo lookups which are found in memo
+
+    @type hits: Integer
+    @param hits: Number of values found in memo
+    @type misses: Integer
+    @param misses: Number of values which are not found in memo
+
+    @rtype: Float
+    @returns: Hit Rate from 0 to 1 (0 when there are no lookups)
+    """
+    return round(hits / (hits + misses), 4) if hits + misses else 0.0
+
+
+def getPeakRSS() -> int:
+    """
+    This function returns peak resident memory of this process or its worker processes, whichever is larger
+
+    @rtype: Integer
+    @returns: Peak RSS in bytes (None if it is not available on operating system)
+    """
+    if resource is None:
+        return None
+    peakRSS = max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss, resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+    # Linux reports kilobytes and macOS reports bytes
+    return peakRSS if sys.platform == "darwin" else peakRSS * 1024
+
+
+def writeStats(statsOutput: str, stats: dict):
+    """
+    This function writes stats as one JSON line to standard error or appends it to a file
+
+    @type statsOutput: String
+    @param statsOutput: stderr or Stats File name
+    @type stats: Dictionary
+    @param stats: Stats of operation
+    """
+    import json
+    statsLine = json.dumps(stats)
+    if statsOutput == "stderr":
+        print(statsLine, file=sys.stderr)
+    else:
+        with open(statsOutput, "a") as statsFile:
+            statsFile.write(statsLine + "\n")
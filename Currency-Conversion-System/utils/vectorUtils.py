@@ -0,0 +1,261 @@
+from importlib.util import find_spec
+
+from constants.currencyConstants import currencyNameToLocale, localeToCurrencyFormat, minorUnitDigits, defaultRoundingMode, vectorFormatBatchSize
+
+from utils.formatUtils import compiledCurrencyFormats, applyCurrencyFormat, formatCurrencyMinorUnits
+from utils.fixedPointUtils import getRoundingDivisor, multiplyMinorUnits
+
+
+# Integer part of 64 bit integer amounts has at most 19 digits
+vectorMaxDigits = 19
+
+
+def getCurrencyLayout(currencyFormat: dict) -> dict:
+    """
+    This function takes currency formatting rules of a locale as input and precomputes where digits, grouping separators and currency symbol with sign are placed,
+    so a batch of amounts is formatted by writing digits to columns of a character array instead of a python call for each amount
+
+    @type currencyFormat: Dictionary
+    @param currencyFormat: Precompiled Currency Formatting Rules of a locale
+
+    @rtype: Dictionary
+    @returns: Column of each integer digit and of each separator from right of integer part, and text before and after value for positive and negative values.
+              None if separator or decimal point is not one character
+    """
+    if len(currencyFormat["thousandsSep"]) != 1 or len(currencyFormat["decimalPoint"]) != 1:
+        return None
+    # Separator is placed before digit which starts each group, first group from right and then repeating groups
+    firstGroup, repeatGroup = currencyFormat["grouping"][0], currencyFormat["grouping"][-1]
+    digitColumns, separatorColumns = [], []
+    column = 0
+    for digit in range(vectorMaxDigits):
+        if digit >= firstGroup and (digit - firstGroup) % repeatGroup == 0:
+            separatorColumns.append((column, digit))
+            column += 1
+        digitColumns.append(column)
+        column += 1
+    # Currency symbol, sign and parentheses are text before and after value (value 0 has no grouping and symbols have no digits)
+    signTemplates = [applyCurrencyFormat("0", negative, currencyFormat).split("0") for negative in [False, True]]
+    return {"digitColumns": digitColumns, "separatorColumns": separatorColumns, "signTemplates": signTemplates}
+
+
+# Precomputed Layout of formatted values of each locale
+currencyLayouts = {localeOption: getCurrencyLayout(currencyFormat) for localeOption, currencyFormat in compiledCurrencyFormats.items()}
+
+
+def isVectorBackendAvailable() -> bool:
+    """
+    This function checks whether NumPy is installed for vectorized currency conversion.
+    NumPy is only found here, it is imported when first batch is converted, so runs with scalar backend do not pay its import time.
+
+    @rtype: Boolean
+    @returns: True if NumPy is installed else False
+    """
+    return find_spec("numpy") is not None
+
+
+def roundDivideVectorized(values, divisor: int, roundingMode: str):
+    """
+    This function divides NumPy array of integer values by divisor and rounds each result with rounding mode, same as rounding functions of fixedPointUtils.py
+
+    @type values: NumPy Array of Integer
+    @param values: Scaled Integer Values
+    @type divisor: Integer
+    @param divisor: Positive Divisor
+    @type roundingMode: String
+    @param roundingMode: Rounding Mode of converted amounts
+
+    @rtype: NumPy Array of Integer
+    @returns: Rounded Quotients
+    """
+
+    import numpy
+
+    # Floor division, remainder is 0 or more
+    quotients, remainders = numpy.divmod(values, divisor)
+    if roundingMode == "floor":
+        return quotients
+    if roundingMode == "ceiling":
+        return quotients + (remainders > 0)
+    if roundingMode == "up":
+        return quotients + ((remainders > 0) & (values >= 0))
+    if roundingMode == "down":
+        return quotients + ((remainders > 0) & (values < 0))
+    remainders = remainders * 2
+    if roundingMode == "half-up":
+        halves = values >= 0
+    elif roundingMode == "half-down":
+        halves = values < 0
+    else:
+        halves = (quotients & 1) == 1
+    return quotients + ((remainders > divisor) | ((remainders == divisor) & halves))
+
+
+def multiplyMinorUnitsVectorized(amounts: list, multiplier, fracDigits: int = minorUnitDigits, roundingMode: str = defaultRoundingMode) -> list:
+    """
+    This function multiplies minor units by scaled rate with vectorized NumPy 64 bit integer operations, same as multiplyMinorUnits of fixedPointUtils.py.
+    Batches whose products do not fit in 64 bit integers, or with amounts of more fraction digits than minor units or exact cross rates ((Numerator, Denominator) pairs), are multiplied with python integers.
+
+    @type amounts: List of Integer
+    @param amounts: Source Currency Amounts in minor units
+    @type multiplier: Integer or List of Integer
+    @param multiplier: Rate scaled by 10 ** rateDigits (or one scaled rate for each amount)
+    @type fracDigits: Integer
+    @param fracDigits: Fraction Digits of destination currency
+    @type roundingMode: String
+    @param roundingMode: Rounding Mode of converted amounts
+
+    @rtype: List of Integer
+    @returns: Converted Amounts in minor units
+    """
+
+    import numpy
+
+    if not amounts:
+        return []
+    # Arrays of integers which do not fit in 64 bits, Fractions or (Numerator, Denominator) pairs are object arrays (or not 1 dimensional),
+    # so batch is checked by array conversion instead of a python loop over amounts
+    try:
+        amountsArray, multipliersArray = numpy.asarray(amounts), numpy.asarray(multiplier)
+    except ValueError:
+        return multiplyMinorUnits(amounts, multiplier, fracDigits, roundingMode)
+    if amountsArray.dtype.kind != "i" or multipliersArray.dtype.kind != "i" or multipliersArray.ndim > 1:
+        return multiplyMinorUnits(amounts, multiplier, fracDigits, roundingMode)
+    # Largest product must fit in 64 bit integer (remainder is doubled for half rounding modes)
+    amountsArray, multipliersArray = amountsArray.astype(numpy.int64, copy=False), multipliersArray.astype(numpy.int64, copy=False)
+    if int(numpy.abs(amountsArray).max()) * int(numpy.abs(multipliersArray).max()) * 2 >= 2 ** 63:
+        return multiplyMinorUnits(amounts, multiplier, fracDigits, roundingMode)
+
+    # Multiply all amounts by scaled rates and round each product once to fraction digits of destination currency
+    products = amountsArray * multipliersArray
+    minorUnits = roundDivideVectorized(products, getRoundingDivisor(fracDigits), roundingMode) * 10 ** (minorUnitDigits - fracDigits)
+    return minorUnits.tolist()
+
+
+def formatCurrencyBatchVectorized(minorUnits, localeOption: str) -> list:
+    """
+    This function formats a batch of 64 bit integer amounts with NumPy array operations, same as formatCurrencyMinorUnits of formatUtils.py for each amount.
+    Digits are split with integer division and written with separators, decimal point and sign templates of locale to precomputed columns of a character array,
+    then each row is moved left past its unused integer columns and read as a string.
+
+    @type minorUnits: NumPy Array of Integer
+    @param minorUnits: Currency Amounts in minor units
+    @type localeOption: String
+    @param localeOption: Locale of Currency Values. Example: fr_FR
+
+    @rtype: List of String
+    @returns: Currency Symbol and Value of each amount in locale number formatting
+    """
+
+    import numpy
+
+    currencyFormat, currencyLayout = compiledCurrencyFormats[localeOption], currencyLayouts[localeOption]
+    digitColumns, fracDigits = currencyLayout["digitColumns"], currencyFormat["fracDigits"]
+    negatives = minorUnits < 0
+
+    # Round minor units to fraction digits of locale (half to even) and split integer and shown fraction digits
+    scale = 10 ** max(minorUnitDigits - fracDigits, 0)
+    values, remainders = numpy.divmod(numpy.abs(minorUnits), scale)
+    values += (remainders * 2 > scale) | ((remainders * 2 == scale) & (values % 2 == 1))
+    shownFracDigits = min(fracDigits, minorUnitDigits)
+    units, fractions = numpy.divmod(values, 10 ** shownFracDigits)
+    digitCounts = numpy.maximum(numpy.searchsorted(10 ** numpy.arange(vectorMaxDigits, dtype=numpy.int64), units, side="right"), 1)
+    maxDigits = int(digitCounts.max())
+
+    # Value is right aligned in first valueWidth columns (integer digits, separators, decimal point and fraction digits), text after value follows it
+    prefixes, suffixes = [template[0] for template in currencyLayout["signTemplates"]], [template[1] for template in currencyLayout["signTemplates"]]
+    fractionWidth = fracDigits + 1 if fracDigits > 0 else 0
+    integerWidth = digitColumns[maxDigits - 1] + 1
+    valueWidth = integerWidth + fractionWidth
+    coreWidth = valueWidth + max(len(suffix) for suffix in suffixes)
+    characters = numpy.zeros((len(minorUnits), coreWidth), dtype=numpy.uint32)
+    for digit in range(maxDigits):
+        digitCodes = (units // 10 ** digit) % 10 + ord("0")
+        characters[:, integerWidth - 1 - digitColumns[digit]] = numpy.where(digitCounts > digit, digitCodes, 0)
+    separatorCode = ord(currencyFormat["thousandsSep"])
+    for column, digit in currencyLayout["separatorColumns"]:
+        if digit >= maxDigits:
+            break
+        characters[:, integerWidth - 1 - column] = numpy.where(digitCounts > digit, separatorCode, 0)
+    if fracDigits > 0:
+        characters[:, integerWidth] = ord(currencyFormat["decimalPoint"])
+        for fractionDigit in range(fracDigits):
+            if fractionDigit < shownFracDigits:
+                characters[:, integerWidth + 1 + fractionDigit] = (fractions // 10 ** (shownFracDigits - 1 - fractionDigit)) % 10 + ord("0")
+            else:
+                characters[:, integerWidth + 1 + fractionDigit] = ord("0")
+    for negative, suffix in enumerate(suffixes):
+        rows = negatives if negative else ~negatives
+        for i, character in enumerate(suffix):
+            characters[rows, valueWidth + i] = ord(character)
+
+    # Each row starts with text before value, then value from its first used column
+    valueWidths = numpy.array([column + 1 for column in digitColumns], dtype=numpy.int64)[digitCounts - 1] + fractionWidth
+    prefixLengths = numpy.where(negatives, len(prefixes[1]), len(prefixes[0]))
+    columns = numpy.arange(max(len(prefix) for prefix in prefixes) + coreWidth)
+    coreColumns = columns[numpy.newaxis, :] + (valueWidth - valueWidths - prefixLengths)[:, numpy.newaxis]
+    formatted = numpy.take_along_axis(characters, numpy.clip(coreColumns, 0, coreWidth - 1), axis=1)
+    formatted[coreColumns >= coreWidth] = 0
+    for negative, prefix in enumerate(prefixes):
+        rows = negatives if negative else ~negatives
+        for i, character in enumerate(prefix):
+            formatted[rows, i] = ord(character)
+
+    # Each row is a fixed width string, unused columns at end are NUL characters which are removed by tolist
+    return numpy.ascontiguousarray(formatted).view(f"U{len(columns)}").ravel().tolist()
+
+
+def formatCurrencyMinorUnitsVectorized(minorUnits: list, localeOption: str) -> list:
+    """
+    This function formats converted amounts in minor units in batches of vectorFormatBatchSize amounts with formatCurrencyBatchVectorized.
+    Amounts which do not fit in 64 bit integers (or locales whose separators are not one character) are formatted with formatCurrencyMinorUnits.
+
+    @type minorUnits: List of Integer
+    @param minorUnits: Currency Amounts in minor units
+    @type localeOption: String
+    @param localeOption: Locale of Currency Values. Example: fr_FR
+
+    @rtype: List of String
+    @returns: Currency Symbol and Value of each amount in locale number formatting
+    """
+
+    import numpy
+
+    if not minorUnits:
+        return []
+    try:
+        minorUnitsArray = numpy.asarray(minorUnits)
+    except (ValueError, OverflowError):
+        minorUnitsArray = None
+    if (currencyLayouts[localeOption] is None or minorUnitsArray is None or minorUnitsArray.dtype.kind != "i"
+            or int(minorUnitsArray.min()) == numpy.iinfo(numpy.int64).min):
+        return [formatCurrencyMinorUnits(minorUnit, localeOption) for minorUnit in minorUnits]
+    minorUnitsArray = minorUnitsArray.astype(numpy.int64, copy=False)
+    formattedAmounts = []
+    for start in range(0, len(minorUnitsArray), vectorFormatBatchSize):
+        formattedAmounts.extend(formatCurrencyBatchVectorized(minorUnitsArray[start:start + vectorFormatBatchSize], localeOption))
+    return formattedAmounts
+
+
+def convertCurrencyAmountsVectorized(amounts: list, destinationCurrency: str, multiplier, roundingMode: str = defaultRoundingMode) -> list:
+    """
+    This function takes a batch of source amounts as input and converts them into destination currency with vectorized NumPy integer operations.
+    Amounts are parsed before (once for each distinct value), then multiply, round and locale formatting of the batch are array operations. Output is same as scalar fixed point conversion.
+
+    @type amounts: List of Integer
+    @param amounts: Source Currency Amounts in minor units
+    @type destinationCurrency: String
+    @param destinationCurrency: Destination Currency Symbol - an abbreviated form Example: EUR for Euro
+    @type multiplier: Integer or List of Integer
+    @param multiplier: Rate scaled by 10 ** rateDigits (or one scaled rate for each amount)
+    @type roundingMode: String
+    @param roundingMode: Rounding Mode of converted amounts
+
+    @rtype: List of String
+    @returns: Destination Currency Symbol and Value of each amount
+    """
+    localeOption = currencyNameToLocale[destinationCurrency.strip().upper()]
+    minorUnits = multiplyMinorUnitsVectorized(amounts, multiplier, localeToCurrencyFormat[localeOption]["fracDigits"], roundingMode)
+
+    # Format all amounts in locale number formatting
+    return formatCurrencyMinorUnitsVectorized(minorUnits, localeOption)